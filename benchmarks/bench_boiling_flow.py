@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+'''Per-call latency of flow boiling heat transfer.'''
+from __future__ import division
+import ht
+
+Thome_kwargs = dict(m=1, x=0.4, D=0.3, rhol=567., rhog=18.09, kl=0.086,
+                    kg=0.2, mul=156E-6, mug=1E-5, Cpl=2300, Cpg=1400,
+                    sigma=0.02, Hvap=9E5, Psat=1E5, Pc=22E6)
+
+
+class TimeBoilingFlow(object):
+    def time_Thome_q(self):
+        ht.Thome(q=1E5, **Thome_kwargs)
+
+    def time_Thome_Te(self):
+        # Solved iteratively for the heat flux
+        ht.Thome(Te=61.2, **Thome_kwargs)
+
+
+if __name__ == '__main__':
+    from benchmarks.common import print_timings
+    print_timings(TimeBoilingFlow)
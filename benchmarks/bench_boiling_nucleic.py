@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+'''Per-call latency of nucleate boiling heat transfer.'''
+from __future__ import division
+import ht
+
+h_nucleic_cases = {
+    'CAS': dict(P=3E5, Pc=22048320., q=2E4, CAS='7732-18-5'),
+    'properties': dict(rhol=957.854, rhog=0.595593, mul=2.79E-4, kl=0.680,
+                       Cpl=4217, Hvap=2.257E6, sigma=0.0589, Te=4.9),
+}
+
+
+class TimeHNucleic(object):
+    params = sorted(h_nucleic_cases.keys())
+    param_names = ['inputs']
+
+    def setup(self, inputs):
+        self.kwargs = h_nucleic_cases[inputs]
+
+    def time_h_nucleic(self, inputs):
+        ht.h_nucleic(**self.kwargs)
+
+
+if __name__ == '__main__':
+    from benchmarks.common import print_timings
+    print_timings(TimeHNucleic)
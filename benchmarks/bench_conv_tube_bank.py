@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+'''Per-call latency of the Bell-Delaware correction factors.'''
+from __future__ import division
+import numpy as np
+import ht
+
+
+class TimeBaffleCorrectionBell(object):
+    params = ['spline', 'chebyshev', 'HEDH']
+    param_names = ['method']
+
+    def time_baffle_correction_Bell(self, method):
+        ht.baffle_correction_Bell(0.82, method=method)
+
+
+class TimeBaffleLeakageBell(object):
+    params = ['spline', 'chebyshev', 'HEDH']
+    param_names = ['method']
+
+    def setup(self, method):
+        self.Stbs = np.linspace(0.1, 3., 1000)
+
+    def time_baffle_leakage_Bell(self, method):
+        ht.baffle_leakage_Bell(1, 1, 4, method=method)
+
+    def time_baffle_leakage_Bell_array(self, method):
+        ht.baffle_leakage_Bell(1., self.Stbs, 8., method=method)
+
+
+class TimeBundleBypassingBell(object):
+    params = ['spline', 'chebyshev', 'HEDH']
+    param_names = ['method']
+
+    def setup(self, method):
+        self.fractions = np.linspace(0., 0.7, 1000)
+
+    def time_bundle_bypassing_Bell(self, method):
+        ht.bundle_bypassing_Bell(0.5, 5, 25, method=method)
+
+    def time_bundle_bypassing_Bell_array(self, method):
+        ht.bundle_bypassing_Bell(self.fractions, 5, 25, method=method)
+
+
+class TimeTubeBank(object):
+    def setup(self):
+        self.Res = np.logspace(2, 5, 1000)
+
+    def time_dP_Zukauskas(self):
+        ht.dP_Zukauskas(Re=13943., n=7, ST=0.0313, SL=0.0343, D=0.0164,
+                        rho=1.217, Vmax=12.6)
+
+    def time_dP_Zukauskas_array(self):
+        ht.dP_Zukauskas(Re=self.Res, n=7, ST=0.0313, SL=0.0343, D=0.0164,
+                        rho=1.217, Vmax=12.6)
+
+
+class TimeTubeBankNusselt(object):
+    def setup(self):
+        # Every row of 20 modules of 3 geometries, at varying Re and Pr
+        self.Res = np.logspace(3, 5, 600)
+        self.Prs = np.linspace(0.7, 0.8, 600)
+        self.rows = np.tile(np.arange(1, 31), 20)
+        self.pitch_normals = np.repeat([0.05, 0.06, 0.075], 200)
+
+    def time_Nu_Grimison_tube_bank(self):
+        ht.Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=11,
+                                 pitch_normal=.07, pitch_parallel=.05, Do=.025)
+
+    def time_Nu_Grimison_tube_bank_array(self):
+        ht.Nu_Grimison_tube_bank(Re=self.Res, Pr=self.Prs, tube_rows=self.rows,
+                                 pitch_normal=self.pitch_normals,
+                                 pitch_parallel=.05, Do=.025)
+
+    def time_Nu_Zukauskas_Bejan(self):
+        ht.Nu_Zukauskas_Bejan(Re=1E4, Pr=7., tube_rows=10, pitch_parallel=.05,
+                              pitch_normal=.07)
+
+    def time_Nu_Zukauskas_Bejan_array(self):
+        ht.Nu_Zukauskas_Bejan(Re=self.Res, Pr=self.Prs, tube_rows=self.rows,
+                              pitch_parallel=.05, pitch_normal=self.pitch_normals)
+
+    def time_Zukauskas_tube_row_correction_array(self):
+        ht.Zukauskas_tube_row_correction(self.rows, staggered=True, Re=self.Res)
+
+
+class TimeBellDelawareShell(object):
+    '''Rating one operating point, and an envelope of 1000 flow rates.'''
+    def setup(self):
+        self.shell = ht.BellDelawareShell(DShell=0.489, Do=0.01905, pitch=0.0254,
+                                          Ntubes=224, baffle_cut=0.25,
+                                          baffle_spacing=0.127, baffles=30,
+                                          seal_strips=1)
+        self.ms = np.linspace(0.05, 10., 1000)
+
+    def time_BellDelawareShell(self):
+        ht.BellDelawareShell(DShell=0.489, Do=0.01905, pitch=0.0254, Ntubes=224,
+                             baffle_cut=0.25, baffle_spacing=0.127, baffles=30,
+                             seal_strips=1)
+
+    def time_rate(self):
+        self.shell.rate(m=5.2, rho=850., Cp=2100., k=0.13, mu=1.2E-3)
+
+    def time_rate_envelope(self):
+        self.shell.rate(m=self.ms, rho=850., Cp=2100., k=0.13, mu=1.2E-3)
+
+
+class TimeTubeBankMarch(object):
+    '''Marching 20 rows of one bank, and of 1000 banks at once.'''
+    params = ['Zukauskas', 'ESDU']
+    param_names = ['method']
+
+    def setup(self, method):
+        self.ms = np.linspace(1., 10., 1000)
+        self.kwargs = dict(T_in=700., T_tubes=450., rows=20, A_row=10., A_min=2.5,
+                           Do=0.0508, pitch_parallel=0.0889, pitch_normal=0.1016,
+                           rho=lambda T: 101325.*0.029/(8.314*T),
+                           Cp=lambda T: 940. + 0.2*T,
+                           k=lambda T: 0.0241*(T/273.)**0.81,
+                           mu=lambda T: 1.716E-5*(T/273.)**0.7, method=method)
+
+    def time_tube_bank_march(self, method):
+        ht.tube_bank_march(m=5., **self.kwargs)
+
+    def time_tube_bank_march_batch(self, method):
+        ht.tube_bank_march(m=self.ms, **self.kwargs)
+
+
+if __name__ == '__main__':
+    from benchmarks.common import print_timings
+    print_timings(TimeBaffleCorrectionBell)
+    print_timings(TimeBaffleLeakageBell)
+    print_timings(TimeBundleBypassingBell)
+    print_timings(TimeTubeBank)
+    print_timings(TimeTubeBankNusselt)
+    print_timings(TimeBellDelawareShell)
+    print_timings(TimeTubeBankMarch)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+'''Overhead of the method selecting functions, compared with the functions
+returned for the same inputs by :obj:`ht.dispatch.resolve` and with calling
+the selected correlation directly. Runs with asv, or standalone as a script
+to print a table.
+'''
+from __future__ import division
+import ht
+from ht import resolve
+
+cases = {
+    'Nu_conv_internal': (ht.Nu_conv_internal, ht.turbulent_Churchill_Zajic,
+                         dict(Re=1E5, Pr=.7, fd=0.0185),
+                         dict(Re=1E5, Pr=.7, fd=0.0185)),
+    'h_nucleic': (ht.h_nucleic, ht.Gorenflo,
+                  dict(P=3E5, Pc=22048320., q=2E4, CAS='7732-18-5'),
+                  dict(P=3E5, Pc=22048320., q=2E4, CASRN='7732-18-5')),
+    'h_two_phase': (ht.h_two_phase, ht.Knott,
+                    dict(m=1, x=.9, D=.3, rhol=1000, rhog=2.5, Cpl=2300, kl=.6, 
+                         mu_b=1E-3, mu_w=1.2E-3, L=5),
+                    dict(m=1, x=.9, D=.3, rhol=1000, rhog=2.5, Cpl=2300, kl=.6, 
+                         mu_b=1E-3, mu_w=1.2E-3, L=5)),
+    'Nu_external_cylinder': (ht.Nu_external_cylinder, ht.Nu_cylinder_Sanitjai_Goldstein,
+                             dict(Re=6071, Pr=0.7), dict(Re=6071, Pr=0.7)),
+    'Nu_vertical_cylinder': (ht.Nu_vertical_cylinder, ht.Nu_vertical_cylinder_Popiel_Churchill,
+                             dict(Pr=.7, Gr=1E8, L=1.5, D=.1),
+                             dict(Pr=.7, Gr=1E8, L=1.5, D=.1)),
+    'Nu_horizontal_cylinder': (ht.Nu_horizontal_cylinder, ht.Nu_horizontal_cylinder_Morgan,
+                               dict(Pr=.7, Gr=1E8), dict(Pr=.7, Gr=1E8)),
+}
+
+
+class TimeDispatch(object):
+    params = sorted(cases.keys())
+    param_names = ['function']
+
+    def setup(self, name):
+        self.function, self.correlation, self.kwargs, self.correlation_kwargs = cases[name]
+        self.resolved = resolve(name, **self.kwargs)
+
+    def time_selecting_function(self, name):
+        self.function(**self.kwargs)
+
+    def time_resolved(self, name):
+        self.resolved(**self.kwargs)
+
+    def time_resolve_cached(self, name):
+        resolve(name, **self.kwargs)
+
+    def time_correlation(self, name):
+        self.correlation(**self.correlation_kwargs)
+
+
+if __name__ == '__main__':
+    from timeit import Timer
+    bench = TimeDispatch()
+    print('%-24s %12s %12s %12s' %('function [us/call]', 'selecting', 'resolved', 'direct'))
+    for name in TimeDispatch.params:
+        bench.setup(name)
+        times = []
+        for f in (bench.time_selecting_function, bench.time_resolved, bench.time_correlation):
+            t = Timer(lambda: f(name))
+            number, _ = t.autorange()
+            times.append(min(t.repeat(5, number))/number*1E6)
+        print('%-24s %12.2f %12.2f %12.2f' %((name,) + tuple(times)))
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+'''Per-call latency of the heat exchanger rating and sizing functions.'''
+from __future__ import division
+import ht
+
+P_NTU_cases = {
+    'UA': dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900, subtype='E', Ntp=4,
+               T2i=15, T1i=130, UA=3041.75),
+    'T2o': dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900, subtype='E', Ntp=4,
+                T1i=130, T2i=15, T2o=84.87829918042112),
+    'plate': dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., UA=300, T1o=126.7,
+                  T2o=26.7, subtype='2/2p', optimal=False),
+}
+
+
+class TimePNTUMethod(object):
+    params = sorted(P_NTU_cases.keys())
+    param_names = ['known']
+
+    def setup(self, known):
+        self.kwargs = P_NTU_cases[known]
+
+    def time_P_NTU_method(self, known):
+        ht.P_NTU_method(**self.kwargs)
+
+
+class TimeHx(object):
+    def time_Ntubes_Phadkeb(self):
+        ht.Ntubes_Phadkeb(DBundle=1.200-.008*2, Do=.028, pitch=.036, Ntp=2, angle=45.)
+
+    def time_Ntubes_Phadkeb_triangular(self):
+        ht.Ntubes_Phadkeb(DBundle=1.2, Do=.025, pitch=.03125, Ntp=4, angle=30.)
+
+    def time_effectiveness_from_NTU_crossflow(self):
+        ht.effectiveness_from_NTU(NTU=5, Cr=0.7, subtype='crossflow')
+
+    def time_NTU_from_effectiveness_crossflow(self):
+        ht.NTU_from_effectiveness(effectiveness=0.8, Cr=0.7, subtype='crossflow')
+
+    def time_temperature_effectiveness_air_cooler_20_rows(self):
+        ht.temperature_effectiveness_air_cooler(R1=0.9, NTU1=15., rows=20, passes=1)
+
+
+class TimeBundleScan(object):
+    '''Tube counts of many bundle diameters, and bundle diameters of many tube
+    counts, as in a tube layout study.'''
+    def setup(self):
+        import ht.vectorized
+        self.vectorized = ht.vectorized
+        self.DBundles = [0.2 + 0.001*i for i in range(2000)]
+        self.Ntubes = list(range(10, 4010, 2))
+        # Build the cached tube count index outside of the timing
+        ht.DBundle_for_Ntubes_Phadkeb(100, Do=.025, pitch=.03125, Ntp=4, angle=30.)
+
+    def time_Ntubes_Phadkeb(self):
+        for DBundle in self.DBundles:
+            ht.Ntubes_Phadkeb(DBundle, Do=.025, pitch=.03125, Ntp=4, angle=30.)
+
+    def time_Ntubes_Phadkeb_vectorized(self):
+        self.vectorized.Ntubes_Phadkeb(self.DBundles, Do=.025, pitch=.03125, Ntp=4, angle=30.)
+
+    def time_DBundle_for_Ntubes_Phadkeb(self):
+        for N in self.Ntubes:
+            ht.DBundle_for_Ntubes_Phadkeb(N, Do=.025, pitch=.03125, Ntp=4, angle=30.)
+
+    def time_DBundle_for_Ntubes_Phadkeb_vectorized(self):
+        self.vectorized.DBundle_for_Ntubes_Phadkeb(self.Ntubes, Do=.025, pitch=.03125, Ntp=4, angle=30.)
+
+
+class TimeTubeCatalog(object):
+    '''Tube lookups of every TEMA nominal size, as a design enumeration
+    would make them.'''
+    def setup(self):
+        self.NPSs = sorted(ht.TEMA_tube_catalog.sizes.tolist())*50
+
+    def time_get_tube_TEMA_tmin(self):
+        for NPS in self.NPSs:
+            ht.get_tube_TEMA(NPS=NPS, tmin=0.0007)
+
+    def time_thinnest_many(self):
+        ht.TEMA_tube_catalog.thinnest_many(self.NPSs, 0.0007)
+
+
+class TimePlateArrangements(object):
+    '''Every supported plate exchanger arrangement, as a plate exchanger
+    selection tool would evaluate them.'''
+    def setup(self):
+        self.arrangements = [(Np1, Np2, counterflow, passes_counterflow)
+                             for Np1 in range(1, 5) for Np2 in range(1, 5)
+                             for counterflow in (True, False)
+                             for passes_counterflow in (True, False)
+                             if Np1 <= 2 or Np2 <= 2]
+        self.kernels = [ht.plate_effectiveness_kernel(*a) for a in self.arrangements]
+
+    def time_temperature_effectiveness_plate(self):
+        for Np1, Np2, counterflow, passes_counterflow in self.arrangements:
+            ht.temperature_effectiveness_plate(0.5, 1.5, Np1, Np2, counterflow,
+                                               passes_counterflow)
+
+    def time_plate_effectiveness_kernel(self):
+        for kernel in self.kernels:
+            kernel(0.5, 1.5)
+
+    def time_NTU_from_P_plate(self):
+        for Np1, Np2, counterflow, passes_counterflow in self.arrangements:
+            ht.NTU_from_P_plate(0.5, 0.5, Np1, Np2, counterflow, passes_counterflow)
+
+
+if __name__ == '__main__':
+    from benchmarks.common import print_timings
+    print_timings(TimePNTUMethod)
+    print_timings(TimeHx)
+    print_timings(TimeBundleScan)
+    print_timings(TimePlateArrangements)
+
+
+class TimeDesignEnumeration(object):
+    '''The default shell-and-tube design space, for one duty.'''
+    def setup(self):
+        self.kwargs = dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., T1i=130.,
+                           T2i=15., Q=2E5, U=300.)
+        # Import the array kernels outside of the timing
+        ht.shell_and_tube_designs(NPSs=[0.75], tmin=1E-3, Ntps=[2], **self.kwargs)
+
+    def time_shell_and_tube_designs(self):
+        ht.shell_and_tube_designs(**self.kwargs)
+
+
+class TimeLMTDTrend(object):
+    '''Log-mean temperature difference and correction factor of one exchanger
+    over a day of one minute measurements.'''
+    def setup(self):
+        import ht.vectorized
+        import numpy as np
+        self.vectorized = ht.vectorized
+        self.Tcos = 85. + 5.*np.sin(np.linspace(0., 6.283, 1440))
+        self.Tcos_list = self.Tcos.tolist()
+
+    def time_LMTD_F_LMTD_Fakheri(self):
+        for Tco in self.Tcos_list:
+            ht.LMTD(130., 110., 15., Tco)
+            ht.F_LMTD_Fakheri(130., 110., 15., Tco, shells=2)
+
+    def time_LMTD_and_F_LMTD_Fakheri_vectorized(self):
+        self.vectorized.LMTD_and_F_LMTD_Fakheri(130., 110., 15., self.Tcos, shells=2)
+
+
+class TimeSensitivities(object):
+    '''Gradient of a rated exchanger's duty with respect to UA, m1 and m2,
+    analytically and by central differences.'''
+    def setup(self):
+        self.kwargs = P_NTU_cases['UA']
+        # Copy the functions for dual numbers outside of the timing
+        ht.P_NTU_method(derivatives=True, **self.kwargs)
+
+    def time_P_NTU_method_derivatives(self):
+        ht.P_NTU_method(derivatives=True, **self.kwargs)
+
+    def time_P_NTU_method_central_differences(self):
+        for name in ('UA', 'm1', 'm2'):
+            for step in (1E-6, -1E-6):
+                kwargs = dict(self.kwargs)
+                kwargs[name] *= 1. + step
+                ht.P_NTU_method(**kwargs)
+
+
+class TimePNTUZoned(object):
+    '''A counterflow exchanger with a temperature dependent heat capacity,
+    divided into increasing numbers of zones.'''
+    params = [10, 100, 1000]
+    param_names = ['zones']
+
+    def setup(self, zones):
+        self.kwargs = dict(m1=5.2, m2=1.45, Cp1=lambda T: 1500. + 3.*T,
+                           Cp2=4180., T1i=130., T2i=15., UA=3041.75, zones=zones)
+        ht.P_NTU_zoned(**self.kwargs)
+
+    def time_P_NTU_zoned(self, zones):
+        ht.P_NTU_zoned(**self.kwargs)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+'''Time to import ht and its optional numpy and pint interfaces, each in a
+fresh interpreter.
+'''
+from __future__ import division
+
+
+class TimeImport(object):
+    timeout = 120.0
+
+    def timeraw_import_ht(self):
+        return 'import ht'
+
+    def timeraw_import_ht_LMTD(self):
+        return 'import ht; ht.LMTD'
+
+    def timeraw_import_ht_all(self):
+        return 'from ht import *'
+
+    def timeraw_import_vectorized(self):
+        return 'import ht.vectorized'
+
+    def timeraw_import_units(self):
+        return 'import ht.units'
+
+
+if __name__ == '__main__':
+    from benchmarks.common import print_timings
+    print_timings(TimeImport)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+'''Per-call latency of the radiation functions.'''
+from __future__ import division
+import ht
+
+
+class TimeRadiation(object):
+    def time_solar_spectrum(self):
+        ht.solar_spectrum()
+
+    def time_blackbody_spectral_radiance(self):
+        ht.blackbody_spectral_radiance(T=800., wavelength=4E-6)
+
+    def time_q_rad(self):
+        ht.q_rad(emissivity=1., T=400., T2=305.)
+
+
+if __name__ == '__main__':
+    from benchmarks.common import print_timings
+    print_timings(TimeRadiation)
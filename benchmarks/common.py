@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+'''Helpers for running the benchmark classes without asv, as in
+``python -m benchmarks.bench_hx``.
+'''
+from __future__ import division
+import subprocess
+import sys
+from timeit import Timer, default_timer
+
+__all__ = ['time_call', 'time_raw', 'print_timings']
+
+
+def time_call(f, *args):
+    '''Best time of a call of `f(*args)`, in seconds.'''
+    t = Timer(lambda: f(*args))
+    number, _ = t.autorange()
+    return min(t.repeat(5, number))/number
+
+
+def time_raw(code, repeat=5):
+    '''Best time of running `code` in a fresh interpreter, less the time to
+    start an interpreter which does nothing, in seconds.'''
+    def run(source):
+        start = default_timer()
+        subprocess.check_call([sys.executable, '-c', source])
+        return default_timer() - start
+    base = min(run('pass') for _ in range(repeat))
+    return min(run(code) for _ in range(repeat)) - base
+
+
+def print_timings(cls):
+    '''Print the time of every `time_*` and `timeraw_*` benchmark of `cls`
+    for each of its parameters, in microseconds.'''
+    params = getattr(cls, 'params', [None])
+    names = sorted(k for k in dir(cls) if k.startswith(('time_', 'timeraw_')))
+    for param in params:
+        bench = cls()
+        args = () if param is None else (param,)
+        if hasattr(bench, 'setup'):
+            bench.setup(*args)
+        for name in names:
+            f = getattr(bench, name)
+            if name.startswith('timeraw_'):
+                t = time_raw(f(*args))
+            else:
+                t = time_call(f, *args)
+            label = name if param is None else '%s(%s)' %(name, param)
+            print('%-50s %12.2f us' %(label, t*1E6))
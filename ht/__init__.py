@@ -21,78 +21,179 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 
-from . import core
-from . import hx
-from . import conv_internal
-from . import boiling_flow
-from . import boiling_nucleic
-from . import conv_tube_bank
-from . import air_cooler
-from . import radiation
-from . import condensation
-from . import conduction
-from . import conv_jacket
-from . import insulation
-from . import conv_free_immersed
-from . import conv_free_enclosed
-from . import conv_packed_bed
-from . import conv_external
-from . import conv_supercritical
-from . import conv_two_phase
-from . import conv_plate
-from . import boiling_plate
+import sys
 
-
-
-from .core import *
-from .hx import *
-from .conv_internal import *
-from .conv_plate import *
-from .boiling_flow import *
-from .boiling_nucleic import *
-from .air_cooler import *
-from .radiation import *
-from .condensation import *
-from .conduction import *
-from .conv_jacket import *
-from .insulation import *
-from .conv_free_immersed import *
-from .conv_free_enclosed import *
-from .conv_tube_bank import *
-from .conv_packed_bed import *
-from .conv_external import *
-from .conv_supercritical import *
-from .conv_two_phase import *
-from .boiling_plate import *
-
-__all__ = ['core', 'hx', 'conv_internal', 'boiling_nucleic', 'air_cooler',
+# Submodules are imported on first attribute access (PEP 562) so that
+# `import ht` only pays for the correlations which are actually used.
+# The public names of each submodule are listed here so they can be found
+# without importing it; tests/test_init.py checks this matches each `__all__`.
+_submodules = ['core', 'hx', 'conv_internal', 'boiling_nucleic', 'air_cooler',
 'radiation', 'condensation', 'conduction', 'conv_jacket', 'conv_free_immersed',
 'conv_tube_bank', 'insulation', 'conv_packed_bed', 'conv_external', 
 'conv_supercritical', 'conv_two_phase', 'boiling_flow', 'boiling_plate',
-'conv_plate', 'conv_free_enclosed']
+'conv_plate', 'conv_free_enclosed', 'dispatch', 'hx_design', 'hx_zoned']
 
+_submodule_names = {
+    'core': ['LMTD', 'wall_factor', 'is_heating_property', 'is_heating_temperature',
+        'wall_factor_fd', 'wall_factor_Nu', 'Kays_Crawford_turbulent_gas_Nu',
+        'Kays_Crawford_turbulent_gas_fd', 'Kays_Crawford_turbulent_liquid_Nu',
+        'Kays_Crawford_turbulent_liquid_fd', 'Kays_Crawford_laminar_gas_Nu',
+        'Kays_Crawford_laminar_gas_fd', 'Kays_Crawford_laminar_liquid_fd',
+        'Kays_Crawford_laminar_liquid_Nu', 'fin_efficiency_Kern_Kraus'],
+    'hx': ['effectiveness_from_NTU', 'NTU_from_effectiveness', 'calc_Cmin',
+        'calc_Cmax', 'calc_Cr', 'NTU_from_UA', 'UA_from_NTU',
+        'effectiveness_NTU_method', 'F_LMTD_Fakheri',
+        'temperature_effectiveness_basic', 'temperature_effectiveness_TEMA_J',
+        'temperature_effectiveness_TEMA_H', 'temperature_effectiveness_TEMA_G',
+        'temperature_effectiveness_TEMA_E', 'temperature_effectiveness_plate',
+        'temperature_effectiveness_air_cooler', 'P_NTU_method',
+        'NTU_from_P_basic', 'NTU_from_P_J', 'NTU_from_P_G', 'NTU_from_P_E',
+        'NTU_from_P_H', 'NTU_from_P_plate', 'plate_effectiveness_kernel',
+        'check_tubing_TEMA', 'get_tube_TEMA', 'TEMATubeCatalog',
+        'TEMA_tube_catalog', 'DBundle_min', 'shell_clearance',
+        'baffle_thickness', 'D_baffle_holes', 'L_unsupported_max', 'Ntubes',
+        'size_bundle_from_tubecount', 'Ntubes_Perrys', 'Ntubes_VDI',
+        'Ntubes_Phadkeb', 'DBundle_for_Ntubes_Phadkeb', 'Ntubes_HEDH',
+        'DBundle_for_Ntubes_HEDH', 'D_for_Ntubes_VDI', 'TEMA_heads',
+        'TEMA_shells', 'TEMA_rears', 'TEMA_services', 'baffle_types',
+        'triangular_Ns', 'triangular_C1s', 'square_Ns', 'square_C1s', 'R_value'],
+    'conv_internal': ['laminar_T_const', 'laminar_Q_const', 'laminar_entry_thermal_Hausen',
+        'laminar_entry_Seider_Tate', 'laminar_entry_Baehr_Stephan',
+        'turbulent_Dittus_Boelter', 'turbulent_Sieder_Tate',
+        'turbulent_entry_Hausen', 'turbulent_Colburn',
+        'turbulent_Drexel_McAdams', 'turbulent_von_Karman', 'turbulent_Prandtl',
+        'turbulent_Friend_Metzner', 'turbulent_Petukhov_Kirillov_Popov',
+        'turbulent_Webb', 'turbulent_Sandall', 'turbulent_Gnielinski',
+        'turbulent_Gnielinski_smooth_1', 'turbulent_Gnielinski_smooth_2',
+        'turbulent_Churchill_Zajic', 'turbulent_ESDU', 'turbulent_Martinelli',
+        'turbulent_Nunner', 'turbulent_Dipprey_Sabersky',
+        'turbulent_Gowen_Smith', 'turbulent_Kawase_Ulbrecht',
+        'turbulent_Kawase_De', 'turbulent_Bhatti_Shah', 'Nu_conv_internal',
+        'Morimoto_Hotta', 'helical_turbulent_Nu_Mori_Nakayama',
+        'helical_turbulent_Nu_Schmidt', 'helical_turbulent_Nu_Xin_Ebadian',
+        'Nu_laminar_rectangular_Shan_London', 'conv_tube_methods',
+        'conv_tube_laminar_methods', 'conv_tube_turbulent_methods'],
+    'boiling_nucleic': ['Rohsenow', 'McNelly', 'Forster_Zuber', 'Montinsky',
+        'Stephan_Abdelsalam', 'HEDH_Taborek', 'Bier', 'Cooper', 'Gorenflo',
+        'h_nucleic', 'Zuber', 'Serth_HEDH', 'HEDH_Montinsky', 'qmax_boiling',
+        'h0_VDI_2e', 'h0_Gorenflow_1993', 'qmax_boiling_methods',
+        'h_nucleic_methods'],
+    'air_cooler': ['Ft_aircooler', 'air_cooler_noise_GPSA', 'air_cooler_noise_Mukherjee',
+        'h_Briggs_Young', 'h_ESDU_high_fin', 'h_ESDU_low_fin', 'h_Ganguli_VDI',
+        'dP_ESDU_high_fin', 'dP_ESDU_low_fin'],
+    'radiation': ['blackbody_spectral_radiance', 'blackbody_fraction', 'q_rad',
+        'grey_transmittance', 'solar_spectrum', 'blackbody_weighted_property',
+        'spectrum_weighted_property', 'solar_absorbed_flux'],
+    'condensation': ['Boyko_Kruzhilin', 'Nusselt_laminar', 'h_kinetic',
+        'Akers_Deans_Crosser', 'Cavallini_Smith_Zecchin', 'Shah'],
+    'conduction': ['R_to_k', 'k_to_R', 'k_to_thermal_resistivity',
+        'thermal_resistivity_to_k', 'R_value_to_k', 'k_to_R_value',
+        'R_cylinder', 'S_isothermal_sphere_to_plane',
+        'S_isothermal_pipe_to_plane', 'S_isothermal_pipe_normal_to_plane',
+        'S_isothermal_pipe_to_isothermal_pipe',
+        'S_isothermal_pipe_to_two_planes',
+        'S_isothermal_pipe_eccentric_to_isothermal_pipe',
+        'cylindrical_heat_transfer'],
+    'conv_jacket': ['Lehrer', 'Stein_Schmidt'],
+    'conv_free_immersed': ['Nu_vertical_plate_Churchill', 'Nu_horizontal_plate_McAdams',
+        'Nu_horizontal_plate_VDI', 'Nu_horizontal_plate_Rohsenow',
+        'Nu_free_horizontal_plate', 'Nu_sphere_Churchill',
+        'Nu_vertical_cylinder_Griffiths_Davis_Morgan',
+        'Nu_vertical_cylinder_Jakob_Linke_Morgan',
+        'Nu_vertical_cylinder_Carne_Morgan',
+        'Nu_vertical_cylinder_Eigenson_Morgan',
+        'Nu_vertical_cylinder_Touloukian_Morgan',
+        'Nu_vertical_cylinder_McAdams_Weiss_Saunders',
+        'Nu_vertical_cylinder_Kreith_Eckert',
+        'Nu_vertical_cylinder_Hanesian_Kalish_Morgan',
+        'Nu_vertical_cylinder_Al_Arabi_Khamis',
+        'Nu_vertical_cylinder_Popiel_Churchill', 'Nu_vertical_cylinder',
+        'Nu_horizontal_cylinder_Churchill_Chu',
+        'Nu_horizontal_cylinder_Kuehn_Goldstein',
+        'Nu_horizontal_cylinder_Morgan', 'Nu_horizontal_cylinder',
+        'Nu_coil_Xin_Ebadian'],
+    'conv_tube_bank': ['dP_Kern', 'dP_Zukauskas', 'dP_staggered_f', 'dP_staggered_correction',
+        'dP_inline_f', 'dP_inline_correction', 'dP_staggered_f_interp',
+        'dP_staggered_correction_interp', 'dP_inline_f_interp',
+        'dP_inline_correction_interp', 'Nu_ESDU_73031', 'Nu_Zukauskas_Bejan',
+        'Nu_HEDH_tube_bank', 'Nu_Grimison_tube_bank',
+        'Zukauskas_tube_row_correction', 'ESDU_tube_row_correction',
+        'ESDU_tube_angle_correction', 'baffle_correction_Bell',
+        'baffle_leakage_Bell', 'bundle_bypassing_Bell',
+        'unequal_baffle_spacing_Bell', 'laminar_correction_Bell',
+        'BellDelawareShell', 'tube_bank_march'],
+    'insulation': ['nearest_material', 'k_material', 'rho_material', 'Cp_material',
+        'building_materials', 'refractories', 'ASHRAE', 'ASHRAE_k',
+        'refractory_VDI_k', 'refractory_VDI_Cp', 'materials_dict'],
+    'conv_packed_bed': ['Nu_packed_bed_Gnielinski', 'Nu_Wakao_Kagei', 'Nu_Achenbach', 'Nu_KTA'],
+    'conv_external': ['Nu_cylinder_Zukauskas', 'Nu_cylinder_Churchill_Bernstein',
+        'Nu_cylinder_Sanitjai_Goldstein', 'Nu_cylinder_Fand',
+        'Nu_cylinder_Perkins_Leppert_1964', 'Nu_cylinder_Perkins_Leppert_1962',
+        'Nu_cylinder_Whitaker', 'Nu_cylinder_McAdams',
+        'conv_external_cylinder_methods', 'Nu_external_cylinder',
+        'Nu_horizontal_plate_laminar_Baehr',
+        'Nu_horizontal_plate_laminar_Churchill_Ozoe',
+        'Nu_horizontal_plate_turbulent_Schlichting',
+        'Nu_horizontal_plate_turbulent_Kreith', 'Nu_external_horizontal_plate',
+        'conv_horizontal_plate_laminar_methods',
+        'conv_horizontal_plate_turbulent_methods',
+        'LAMINAR_TRANSITION_HORIZONTAL_PLATE', 'conv_horizontal_plate_methods'],
+    'conv_supercritical': ['Nu_McAdams', 'Nu_Shitsman', 'Nu_Griem', 'Nu_Jackson', 'Nu_Gupta',
+        'Nu_Swenson', 'Nu_Xu', 'Nu_Mokry', 'Nu_Bringer_Smith', 'Nu_Ornatsky',
+        'Nu_Gorban', 'Nu_Zhu', 'Nu_Bishop', 'Nu_Yamagata', 'Nu_Kitoh',
+        'Nu_Krasnoshchekov_Protopopov', 'Nu_Petukhov', 'Nu_Krasnoshchekov'],
+    'conv_two_phase': ['Davis_David', 'Elamvaluthi_Srinivas', 'Groothuis_Hendal', 'Hughmark',
+        'Knott', 'Kudirka_Grosh_McFadden', 'Martin_Sims', 'Ravipudi_Godbold',
+        'Aggour', 'conv_two_phase_methods', 'h_two_phase'],
+    'boiling_flow': ['Thome', 'Liu_Winterton', 'Chen_Edelstein', 'Chen_Bennett',
+        'Lazarek_Black', 'Li_Wu', 'Sun_Mishima', 'Yun_Heo_Kim'],
+    'boiling_plate': ['h_boiling_Amalfi', 'h_boiling_Lee_Kang_Kim', 'h_boiling_Han_Lee_Kim',
+        'h_boiling_Huang_Sheer', 'h_boiling_Yan_Lin'],
+    'conv_plate': ['Nu_plate_Kumar', 'Nu_plate_Martin', 'Nu_plate_Muley_Manglik',
+        'Nu_plate_Khan_Khan'],
+    'conv_free_enclosed': ['Nu_Nusselt_Rayleigh_Holling_Herwig', 'Nu_Nusselt_Rayleigh_Probert',
+        'Nu_Nusselt_Rayleigh_Hollands', 'Rac_Nusselt_Rayleigh',
+        'Rac_Nusselt_Rayleigh_disk', 'Nu_vertical_helical_coil_Ali',
+        'Nu_vertical_helical_coil_Prabhanjan_Rennie_Raghavan'],
+    'dispatch': ['resolve'],
+    'hx_design': ['shell_and_tube_designs', 'design_dtype'],
+    'hx_zoned': ['P_NTU_zoned'],
+}
 
-__all__.extend(core.__all__)
-__all__.extend(hx.__all__)
-__all__.extend(conv_internal.__all__)
-__all__.extend(boiling_flow.__all__)
-__all__.extend(boiling_nucleic.__all__)
-__all__.extend(air_cooler.__all__)
-__all__.extend(radiation.__all__)
-__all__.extend(condensation.__all__)
-__all__.extend(conduction.__all__)
-__all__.extend(conv_jacket.__all__)
-__all__.extend(conv_free_immersed.__all__)
-__all__.extend(conv_tube_bank.__all__)
-__all__.extend(insulation.__all__)
-__all__.extend(conv_packed_bed.__all__)
-__all__.extend(conv_external.__all__)
-__all__.extend(conv_supercritical.__all__)
-__all__.extend(conv_two_phase.__all__)
-__all__.extend(boiling_plate.__all__)
-__all__.extend(conv_plate.__all__)
-__all__.extend(conv_free_enclosed.__all__)
+__all__ = list(_submodules)
+_name_modules = {}
+for _module in _submodules:
+    __all__.extend(_submodule_names[_module])
+    for _name in _submodule_names[_module]:
+        _name_modules[_name] = _module
 
 
-__version__ = '0.1.53'
+def _load(module_name):
+    from importlib import import_module
+    module = import_module('.' + module_name, __name__)
+    g = globals()
+    g[module_name] = module
+    for name in _submodule_names[module_name]:
+        g[name] = getattr(module, name)
+    return module
+
 
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _submodule_names:
+            return _load(name)
+        try:
+            module_name = _name_modules[name]
+        except KeyError:
+            raise AttributeError("module %r has no attribute %r" %(__name__, name))
+        _load(module_name)
+        return globals()[name]
+
+    def __dir__():
+        return sorted(__all__ + ['__version__'])
+else:
+    for _module in _submodules:
+        _load(_module)
+
+
+__version__ = '0.1.53'
@@ -943,75 +943,108 @@ def h_nucleic(Te=None, q=None, Tsat=None, P=None, dPsat=None, Cpl=None,
     ... Method='Rohsenow')
     3723.655267067467
     '''
-    def list_methods():
-        methods = []
-        if all((P, Pc)):
-            if CAS and CAS in h0_Gorenflow_1993:
-                methods.append('Gorenflo (1993)')
-        if all((Te, Tsat, Cpl, kl, mul, sigma, Hvap, rhol, rhog)):
-            if CAS and CAS == '7732-18-5':
-                methods.append('Stephan-Abdelsalam water')
-            if CAS and CAS in cryogenics:
-                methods.append('Stephan-Abdelsalam cryogenic')
-            methods.append('Stephan-Abdelsalam')
-        if all((Te, P, Pc)):
-            methods.append('HEDH-Taborek')
-        if all((Te, dPsat, Cpl, kl, mul, sigma, Hvap, rhol, rhog)):
-            methods.append('Forster-Zuber')
-        if all((Te, Cpl, kl, mul, sigma, Hvap, rhol, rhog)):
-            methods.append('Rohsenow')
-        if all((Te, P, Pc, MW)):
-            methods.append('Cooper')
-        if all((Te, P, Pc)):
-            methods.append('Bier')
-        if all((Te, P, Pc)):
-            methods.append('Montinsky')
-        if all((Te, P, Cpl, kl, sigma, Hvap, rhol, rhog)):
-            methods.append('McNelly')
-        return methods
-
     if AvailableMethods:
-        return list_methods()
+        return _h_nucleic_methods(Te, Tsat, P, dPsat, Cpl, kl, mul, rhol, 
+                                  sigma, Hvap, rhog, MW, Pc, CAS)
     if not Method:
-        methods = list_methods()
+        methods = _h_nucleic_methods(Te, Tsat, P, dPsat, Cpl, kl, mul, rhol, 
+                                     sigma, Hvap, rhog, MW, Pc, CAS)
         if methods == []:
             raise Exception('Insufficient property data for any method.')
         Method = methods[0]
-
-    if Method == 'Stephan-Abdelsalam':
-        return Stephan_Abdelsalam(Te=Te, q=q, Tsat=Tsat, Cpl=Cpl, kl=kl, mul=mul,
-                               sigma=sigma, Hvap=Hvap, rhol=rhol, rhog=rhog,
-                               correlation='general', **kwargs)
-    elif Method == 'Stephan-Abdelsalam water':
-        return Stephan_Abdelsalam(Te=Te, q=q, Tsat=Tsat, Cpl=Cpl, kl=kl, mul=mul,
-                               sigma=sigma, Hvap=Hvap, rhol=rhol, rhog=rhog,
-                               correlation='water', **kwargs)
-    elif Method == 'Stephan-Abdelsalam cryogenic':
-        return Stephan_Abdelsalam(Te=Te, q=q, Tsat=Tsat, Cpl=Cpl, kl=kl, mul=mul,
-                               sigma=sigma, Hvap=Hvap, rhol=rhol, rhog=rhog,
-                               correlation='cryogenic', **kwargs)
-    elif Method == 'HEDH-Taborek':
-        return HEDH_Taborek(Te=Te, q=q, P=P, Pc=Pc)
-    elif Method == 'Forster-Zuber':
-        return Forster_Zuber(Te=Te, q=q, dPsat=dPsat, Cpl=Cpl, kl=kl, mul=mul,
-                          sigma=sigma, Hvap=Hvap, rhol=rhol, rhog=rhog, **kwargs)
-    elif Method == 'Rohsenow':
-        return Rohsenow(Te=Te, q=q, Cpl=Cpl, kl=kl, mul=mul, sigma=sigma, Hvap=Hvap,
-                     rhol=rhol, rhog=rhog, **kwargs)
-    elif Method == 'Cooper':
-        return Cooper(Te=Te, q=q, P=P, Pc=Pc, MW=MW, **kwargs)
-    elif Method == 'Bier':
-        return Bier(Te=Te, q=q, P=P, Pc=Pc, **kwargs)
-    elif Method == 'Montinsky':
-        return Montinsky(Te=Te, q=q, P=P, Pc=Pc, **kwargs)
-    elif Method == 'McNelly':
-        return McNelly(Te=Te, q=q, P=P, Cpl=Cpl, kl=kl, sigma=sigma, Hvap=Hvap,
-                    rhol=rhol, rhog=rhog, **kwargs)
-    elif Method == 'Gorenflo (1993)':
-        return Gorenflo(P=P, q=q, Pc=Pc, Te=Te, CASRN=CAS, **kwargs)
-    else:
+    return _h_nucleic_bind(Method)(Te, q, Tsat, P, dPsat, Cpl, kl, mul, rhol, 
+                                   sigma, Hvap, rhog, MW, Pc, CAS, **kwargs)
+
+
+def _h_nucleic_methods(Te=None, Tsat=None, P=None, dPsat=None, Cpl=None, 
+                       kl=None, mul=None, rhol=None, sigma=None, Hvap=None, 
+                       rhog=None, MW=None, Pc=None, CAS=None, **kwargs):
+    methods = []
+    if all((P, Pc)):
+        if CAS and CAS in h0_Gorenflow_1993:
+            methods.append('Gorenflo (1993)')
+    if all((Te, Tsat, Cpl, kl, mul, sigma, Hvap, rhol, rhog)):
+        if CAS and CAS == '7732-18-5':
+            methods.append('Stephan-Abdelsalam water')
+        if CAS and CAS in cryogenics:
+            methods.append('Stephan-Abdelsalam cryogenic')
+        methods.append('Stephan-Abdelsalam')
+    if all((Te, P, Pc)):
+        methods.append('HEDH-Taborek')
+    if all((Te, dPsat, Cpl, kl, mul, sigma, Hvap, rhol, rhog)):
+        methods.append('Forster-Zuber')
+    if all((Te, Cpl, kl, mul, sigma, Hvap, rhol, rhog)):
+        methods.append('Rohsenow')
+    if all((Te, P, Pc, MW)):
+        methods.append('Cooper')
+    if all((Te, P, Pc)):
+        methods.append('Bier')
+    if all((Te, P, Pc)):
+        methods.append('Montinsky')
+    if all((Te, P, Cpl, kl, sigma, Hvap, rhol, rhog)):
+        methods.append('McNelly')
+    return methods
+
+
+# Each method's correlation, the arguments of h_nucleic it takes (`CASRN` is
+# `CAS`), its fixed keyword arguments, and whether further keyword arguments
+# are passed on to it
+_Stephan_Abdelsalam_args = ('Te', 'q', 'Tsat', 'Cpl', 'kl', 'mul', 'sigma', 'Hvap',
+                            'rhol', 'rhog')
+_h_nucleic_correlations = {
+    'Stephan-Abdelsalam': (Stephan_Abdelsalam, _Stephan_Abdelsalam_args, {'correlation': 'general'}, True),
+    'Stephan-Abdelsalam water': (Stephan_Abdelsalam, _Stephan_Abdelsalam_args, {'correlation': 'water'}, True),
+    'Stephan-Abdelsalam cryogenic': (Stephan_Abdelsalam, _Stephan_Abdelsalam_args, {'correlation': 'cryogenic'}, True),
+    'HEDH-Taborek': (HEDH_Taborek, ('Te', 'q', 'P', 'Pc'), {}, False),
+    'Forster-Zuber': (Forster_Zuber, ('Te', 'q', 'dPsat', 'Cpl', 'kl', 'mul', 'sigma',
+                                      'Hvap', 'rhol', 'rhog'), {}, True),
+    'Rohsenow': (Rohsenow, ('Te', 'q', 'Cpl', 'kl', 'mul', 'sigma', 'Hvap', 'rhol',
+                            'rhog'), {}, True),
+    'Cooper': (Cooper, ('Te', 'q', 'P', 'Pc', 'MW'), {}, True),
+    'Bier': (Bier, ('Te', 'q', 'P', 'Pc'), {}, True),
+    'Montinsky': (Montinsky, ('Te', 'q', 'P', 'Pc'), {}, True),
+    'McNelly': (McNelly, ('Te', 'q', 'P', 'Cpl', 'kl', 'sigma', 'Hvap', 'rhol',
+                          'rhog'), {}, True),
+    'Gorenflo (1993)': (Gorenflo, ('P', 'q', 'Pc', 'Te', 'CASRN'), {}, True),
+}
+
+_h_nucleic_bound = {}
+
+def _h_nucleic_bind(Method):
+    '''Returns a function with the arguments of :obj:`h_nucleic` which
+    evaluates the correlation `Method` directly.
+    '''
+    if Method in _h_nucleic_bound:
+        return _h_nucleic_bound[Method]
+    if Method not in _h_nucleic_correlations:
         raise Exception("Correlation name not recognized; see the "
                         "documentation for the available options.")
+    f, args, options, pass_kwargs = _h_nucleic_correlations[Method]
+    names = ('Te', 'q', 'Tsat', 'P', 'dPsat', 'Cpl', 'kl', 'mul', 'rhol',
+             'sigma', 'Hvap', 'rhog', 'MW', 'Pc', 'CAS')
+    indexes = [names.index('CAS' if arg == 'CASRN' else arg) for arg in args]
+
+    def h(Te=None, q=None, Tsat=None, P=None, dPsat=None, Cpl=None, kl=None,
+          mul=None, rhol=None, sigma=None, Hvap=None, rhog=None, MW=None,
+          Pc=None, CAS=None, **kwargs):
+        values = (Te, q, Tsat, P, dPsat, Cpl, kl, mul, rhol, sigma, Hvap,
+                  rhog, MW, Pc, CAS)
+        call = {arg: values[i] for arg, i in zip(args, indexes)}
+        call.update(options)
+        if pass_kwargs:
+            call.update(kwargs)
+        return f(**call)
+    _h_nucleic_bound[Method] = h
+    return h
+
+
+def _h_nucleic_resolve(Method=None, **inputs):
+    if not Method:
+        methods = _h_nucleic_methods(**inputs)
+        if methods == []:
+            raise Exception('Insufficient property data for any method.')
+        Method = methods[0]
+    return _h_nucleic_bind(Method)
 
 
 ### Critical Heat Flux
@@ -22,6 +22,7 @@ SOFTWARE.'''
 
 from __future__ import division
 from math import exp
+from ht.conv_internal import _tuple_getter
 
 __all__ = ['Nu_cylinder_Zukauskas', 'Nu_cylinder_Churchill_Bernstein',
            'Nu_cylinder_Sanitjai_Goldstein', 'Nu_cylinder_Fand',
@@ -553,29 +554,38 @@ def Nu_external_cylinder(Re, Pr, Prw=None, mu=None, muw=None, Method=None,
     >>> Nu_external_cylinder(6071, 0.7)
     40.38327083519522
     '''
-    def list_methods():
-        methods = []
-        methods.extend(conv_external_cylinder_turbulent_methods_ranked)
-        return methods
-    
     if AvailableMethods:
-        return list_methods()
+        return list(conv_external_cylinder_turbulent_methods_ranked)
     if not Method:
-        Method = list_methods()[0]
+        Method = conv_external_cylinder_turbulent_methods_ranked[0]
+    return _Nu_external_cylinder_bind(Method)(Re, Pr, Prw, mu, muw)
 
-    if Method in conv_external_cylinder_methods:
-        f, args = conv_external_cylinder_methods[Method]
-        
-        kwargs = {}
-        for arg in args:
-            kwargs[arg] = locals()[arg]
-        return f(**kwargs)
-    else:
+
+_Nu_external_cylinder_bound = {}
+
+def _Nu_external_cylinder_bind(Method):
+    '''Returns a function with the arguments of :obj:`Nu_external_cylinder`
+    which evaluates the correlation `Method` directly.
+    '''
+    if Method in _Nu_external_cylinder_bound:
+        return _Nu_external_cylinder_bound[Method]
+    if Method not in conv_external_cylinder_methods:
         raise Exception("Correlation name not recognized; the availble methods "
                         "are %s." %(list(conv_external_cylinder_methods.keys())))
+    f, args = conv_external_cylinder_methods[Method]
+    get = _tuple_getter([('Re', 'Pr', 'Prw', 'mu', 'muw').index(arg) for arg in args])
+    # The correlations take their arguments in the same order
+    def Nu(Re, Pr, Prw=None, mu=None, muw=None):
+        return f(*get((Re, Pr, Prw, mu, muw)))
+    _Nu_external_cylinder_bound[Method] = Nu
     return Nu
 
 
+def _Nu_external_cylinder_resolve(Method=None, **inputs):
+    # All correlations are available for every input
+    return _Nu_external_cylinder_bind(Method or conv_external_cylinder_turbulent_methods_ranked[0])
+
+
 # Horizontal Plate in crossflow
 
 def Nu_horizontal_plate_laminar_Baehr(Re, Pr):
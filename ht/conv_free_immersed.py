@@ -1116,32 +1116,43 @@ def Nu_vertical_cylinder(Pr, Gr, L=None, D=None, Method=None,
         If True, function will consider which methods which can be used to
         calculate Nu with the given inputs
     '''
-    def list_methods():
-        methods = []
-        for key, values in vertical_cylinder_correlations.items():
-            if values[4] or all((L, D)):
-                methods.append(key)
-        if 'Popiel & Churchill' in methods:
-            methods.remove('Popiel & Churchill')
-            methods.insert(0, 'Popiel & Churchill')
-        elif 'McAdams, Weiss & Saunders' in methods:
-            methods.remove('McAdams, Weiss & Saunders')
-            methods.insert(0, 'McAdams, Weiss & Saunders')
-        return methods
-
     if AvailableMethods:
-        return list_methods()
+        return _Nu_vertical_cylinder_methods(L, D)
     if not Method:
-        Method = list_methods()[0]
-
-    if Method in vertical_cylinder_correlations:
-        if vertical_cylinder_correlations[Method][4]:
-            return vertical_cylinder_correlations[Method][0](Pr=Pr, Gr=Gr)
-        else:
-            return vertical_cylinder_correlations[Method][0](Pr=Pr, Gr=Gr, L=L, D=D)
-    else:
+        Method = _Nu_vertical_cylinder_methods(L, D)[0]
+    return _Nu_vertical_cylinder_bind(Method)(Pr, Gr, L, D)
+
+
+def _Nu_vertical_cylinder_methods(L=None, D=None):
+    methods = []
+    for key, values in vertical_cylinder_correlations.items():
+        if values[4] or all((L, D)):
+            methods.append(key)
+    if 'Popiel & Churchill' in methods:
+        methods.remove('Popiel & Churchill')
+        methods.insert(0, 'Popiel & Churchill')
+    elif 'McAdams, Weiss & Saunders' in methods:
+        methods.remove('McAdams, Weiss & Saunders')
+        methods.insert(0, 'McAdams, Weiss & Saunders')
+    return methods
+
+
+def _Nu_vertical_cylinder_bind(Method):
+    '''Returns a function with the arguments of :obj:`Nu_vertical_cylinder`
+    which evaluates the correlation `Method` directly.
+    '''
+    if Method not in vertical_cylinder_correlations:
         raise Exception("Correlation name not recognized; see the "
                         "documentation for the available options.")
+    f = vertical_cylinder_correlations[Method][0]
+    if vertical_cylinder_correlations[Method][4]:
+        return lambda Pr, Gr, L=None, D=None: f(Pr=Pr, Gr=Gr)
+    return lambda Pr, Gr, L=None, D=None: f(Pr=Pr, Gr=Gr, L=L, D=D)
+
+
+def _Nu_vertical_cylinder_resolve(Method=None, L=None, D=None, **inputs):
+    return _Nu_vertical_cylinder_bind(Method or _Nu_vertical_cylinder_methods(L, D)[0])
+
 
 #import matplotlib.pyplot as plt
 #import numpy as np
@@ -1382,25 +1393,35 @@ def Nu_horizontal_cylinder(Pr, Gr, Method=None, AvailableMethods=False):
     >>> Nu_horizontal_cylinder(0.72, 1E7)
     24.864192615468973
     '''
-    def list_methods():
-        methods = []
-        for key, values in horizontal_cylinder_correlations.items():
-                methods.append(key)
-        if 'Morgan' in methods:
-            methods.remove('Morgan')
-            methods.insert(0, 'Morgan')
-        return methods
-
     if AvailableMethods:
-        return list_methods()
+        return _Nu_horizontal_cylinder_methods()
     if not Method:
-        Method = list_methods()[0]
+        Method = 'Morgan'
+    return _Nu_horizontal_cylinder_bind(Method)(Pr, Gr)
 
-    if Method in horizontal_cylinder_correlations:
-        return horizontal_cylinder_correlations[Method](Pr=Pr, Gr=Gr)
-    else:
+
+def _Nu_horizontal_cylinder_methods():
+    methods = []
+    for key, values in horizontal_cylinder_correlations.items():
+            methods.append(key)
+    if 'Morgan' in methods:
+        methods.remove('Morgan')
+        methods.insert(0, 'Morgan')
+    return methods
+
+
+def _Nu_horizontal_cylinder_bind(Method):
+    '''Returns a function with the arguments of :obj:`Nu_horizontal_cylinder`
+    which evaluates the correlation `Method` directly.
+    '''
+    if Method not in horizontal_cylinder_correlations:
         raise Exception("Correlation name not recognized; see the "
                         "documentation for the available options.")
+    return horizontal_cylinder_correlations[Method]
+
+
+def _Nu_horizontal_cylinder_resolve(Method=None, **inputs):
+    return _Nu_horizontal_cylinder_bind(Method or 'Morgan')
 
 
 #import matplotlib.pyplot as plt
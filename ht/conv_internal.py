@@ -39,6 +39,7 @@ __all__ = ['laminar_T_const', 'laminar_Q_const',
 'conv_tube_methods', 'conv_tube_laminar_methods', 'conv_tube_turbulent_methods']
 
 from math import log, log10, exp, tanh
+from operator import itemgetter
 from fluids.friction import friction_factor, LAMINAR_TRANSITION_PIPE
 
 ### Laminar
@@ -1394,70 +1395,118 @@ def Nu_conv_internal(Re, Pr, eD=0, Di=None, x=None, fd=None, Method=None,
     >>> Nu_conv_internal(Re=1E2, Pr=.7, x=.01, Di=.1)
     14.91799128769779
     '''
-    def list_methods():
-        methods = []
-        if Re < LAMINAR_TRANSITION_PIPE:
-            # Laminar!
-            if all((Re, Pr, x, Di)):
-                methods.append('Baehr-Stephan laminar thermal/velocity entry')
-                methods.append('Hausen laminar thermal entry')
-                methods.append('Seider-Tate laminar thermal entry')
-
-            methods.append('Laminar - constant T')
-            methods.append('Laminar - constant Q')
-        else:
-            if all((Re, Pr)) and Pr < 0.03:
-                # Liquid metals
-                methods.append('Martinelli')
-            if all((Re, Pr, Di, x)):
-                methods.append('Hausen')
-            if Re and Pr and (eD is not None or fd is not None):
-                # handle correlations with roughness
-                methods.append('Churchill-Zajic')
-                methods.append('Petukhov-Kirillov-Popov')
-                methods.append('Gnielinski')
-                methods.append('Bhatti-Shah')
-                methods.append('Dipprey-Sabersky')
-                methods.append('Sandall')
-                methods.append('Webb')
-                methods.append('Friend-Metzner')
-                methods.append('Prandtl')
-                methods.append('von-Karman')
-                methods.append('Gowen-Smith')
-                methods.append('Kawase-Ulbrecht')
-                methods.append('Kawase-De')
-                methods.append('Nunner')
-            if Re and Pr:
-                methods.append('Dittus-Boelter')
-                methods.append('Sieder-Tate')
-                methods.append('Drexel-McAdams')
-                methods.append('Colburn')
-                methods.append('ESDU')
-                methods.append('Gnielinski smooth low Pr') # 1
-                methods.append('Gnielinski smooth high Pr') # 2
-        return methods
-
     if AvailableMethods:
-        return list_methods()
+        return _Nu_conv_internal_methods(Re, Pr, eD, Di, x, fd)
     if not Method:
-        Method = list_methods()[0]
-        
-    L = x
-    if eD is not None and fd is None:
-        fd = friction_factor(Re=Re, eD=eD)
-
-    if Method in conv_tube_methods:
-        f, args = conv_tube_methods[Method]
-        if f is turbulent_Nunner:
-            fd_smooth = friction_factor(Re, eD=0)
-        
-        kwargs = {}
-        for arg in args:
-            kwargs[arg] = locals()[arg]
-        return f(**kwargs)
+        Method = _Nu_conv_internal_methods(Re, Pr, eD, Di, x, fd)[0]
+    return _Nu_conv_internal_bind(Method)(Re, Pr, eD, Di, x, fd)
+
+
+def _Nu_conv_internal_methods(Re, Pr, eD=0, Di=None, x=None, fd=None):
+    methods = []
+    if Re < LAMINAR_TRANSITION_PIPE:
+        # Laminar!
+        if all((Re, Pr, x, Di)):
+            methods.append('Baehr-Stephan laminar thermal/velocity entry')
+            methods.append('Hausen laminar thermal entry')
+            methods.append('Seider-Tate laminar thermal entry')
+
+        methods.append('Laminar - constant T')
+        methods.append('Laminar - constant Q')
     else:
+        if all((Re, Pr)) and Pr < 0.03:
+            # Liquid metals
+            methods.append('Martinelli')
+        if all((Re, Pr, Di, x)):
+            methods.append('Hausen')
+        if Re and Pr and (eD is not None or fd is not None):
+            # handle correlations with roughness
+            methods.append('Churchill-Zajic')
+            methods.append('Petukhov-Kirillov-Popov')
+            methods.append('Gnielinski')
+            methods.append('Bhatti-Shah')
+            methods.append('Dipprey-Sabersky')
+            methods.append('Sandall')
+            methods.append('Webb')
+            methods.append('Friend-Metzner')
+            methods.append('Prandtl')
+            methods.append('von-Karman')
+            methods.append('Gowen-Smith')
+            methods.append('Kawase-Ulbrecht')
+            methods.append('Kawase-De')
+            methods.append('Nunner')
+        if Re and Pr:
+            methods.append('Dittus-Boelter')
+            methods.append('Sieder-Tate')
+            methods.append('Drexel-McAdams')
+            methods.append('Colburn')
+            methods.append('ESDU')
+            methods.append('Gnielinski smooth low Pr') # 1
+            methods.append('Gnielinski smooth high Pr') # 2
+    return methods
+
+
+def _tuple_getter(indexes):
+    '''Returns a function taking the values at `indexes` of a sequence as a
+    tuple; unlike `itemgetter`, also for a single index.
+    '''
+    if len(indexes) > 1:
+        return itemgetter(*indexes)
+    return lambda values: tuple([values[i] for i in indexes])
+
+
+_Nu_conv_internal_bound = {}
+
+def _Nu_conv_internal_bind(Method):
+    '''Returns a function with the arguments of :obj:`Nu_conv_internal` which
+    evaluates the correlation `Method` directly. The friction factor is only
+    calculated when the correlation uses it and it is not provided.
+    '''
+    if Method in _Nu_conv_internal_bound:
+        return _Nu_conv_internal_bound[Method]
+    if Method not in conv_tube_methods:
         raise Exception("Correlation name not recognized; see the "
                         "documentation for the available options.")
+    f, args = conv_tube_methods[Method]
+    # `L` in the correlations is `x`
+    names = ('Re', 'Pr', 'eD', 'Di', 'x', 'fd', 'fd_smooth')
+    indexes = [names.index('x' if arg == 'L' else arg) for arg in args]
+    needs_fd, needs_fd_smooth = 'fd' in args, 'fd_smooth' in args
+    if f.__code__.co_varnames[:len(args)] == args:
+        get = _tuple_getter(indexes)
+        call = lambda values: f(*get(values))
+    else:
+        call = lambda values: f(**{arg: values[i] for arg, i in zip(args, indexes)})
+
+    def Nu(Re, Pr, eD=0, Di=None, x=None, fd=None):
+        if needs_fd and fd is None and eD is not None:
+            fd = friction_factor(Re=Re, eD=eD)
+        fd_smooth = friction_factor(Re, eD=0) if needs_fd_smooth else None
+        return call((Re, Pr, eD, Di, x, fd, fd_smooth))
+    _Nu_conv_internal_bound[Method] = Nu
+    return Nu
+
+
+def _Nu_conv_internal_resolve(Method=None, Re=None, Pr=None, eD=0, Di=None,
+                              x=None, fd=None):
+    '''Returns a function with the arguments of :obj:`Nu_conv_internal` for
+    inputs given like the example ones. If `Method` is not given, the
+    default laminar and turbulent correlations for these inputs are chosen
+    now, and only the flow regime is checked on each call.
+    '''
+    if Method:
+        return _Nu_conv_internal_bind(Method)
+    def choose(Re, Pr):
+        return _Nu_conv_internal_bind(_Nu_conv_internal_methods(Re, Pr, eD, Di, x, fd)[0])
+    Re_turbulent = 2.*LAMINAR_TRANSITION_PIPE
+    laminar, turbulent, metal = choose(1., 1.), choose(Re_turbulent, 1.), choose(Re_turbulent, 0.01)
+
+    def Nu(Re, Pr, eD=0, Di=None, x=None, fd=None):
+        if Re < LAMINAR_TRANSITION_PIPE:
+            return laminar(Re, Pr, eD, Di, x, fd)
+        elif Pr < 0.03:
+            return metal(Re, Pr, eD, Di, x, fd)
+        return turbulent(Re, Pr, eD, Di, x, fd)
     return Nu
 
 
@@ -21,15 +21,17 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
-from math import pi, sin, acos, radians, exp
+import sys
+from math import pi, sin, acos, radians, exp, sqrt
 from fluids.constants import g
 from fluids.numerics import horner, splev, bisplev, implementation_optimize_tck, tck_interp2d_linear
 from ht.core import wall_factor, WALL_FACTOR_PRANDTL
 import numpy as np
-from scipy.interpolate import RectBivariateSpline
 
 __all__ = ['dP_Kern', 'dP_Zukauskas', 'dP_staggered_f',
            'dP_staggered_correction', 'dP_inline_f', 'dP_inline_correction',
+           'dP_staggered_f_interp', 'dP_staggered_correction_interp',
+           'dP_inline_f_interp', 'dP_inline_correction_interp',
            'Nu_ESDU_73031', 'Nu_Zukauskas_Bejan','Nu_HEDH_tube_bank',
            'Nu_Grimison_tube_bank',
            'Zukauskas_tube_row_correction', 
@@ -37,12 +39,61 @@ __all__ = ['dP_Kern', 'dP_Zukauskas', 'dP_staggered_f',
            'ESDU_tube_angle_correction',
 	   'baffle_correction_Bell', 'baffle_leakage_Bell',
            'bundle_bypassing_Bell', 'unequal_baffle_spacing_Bell',
-           'laminar_correction_Bell']
+           'laminar_correction_Bell', 'BellDelawareShell',
+           'tube_bank_march']
+
+
+def _bspline_basis(t, k, x):
+    '''Returns the index of the last of the k + 1 B-splines of degree `k`
+    on the knots `t` which are nonzero at each point of the array `x`, and
+    their values there, by the recurrence of de Boor. Points outside the
+    knots are moved to the nearest end, as in FITPACK.
+    '''
+    n = len(t) - k - 1
+    x = np.clip(x, t[k], t[n])
+    span = np.clip(np.searchsorted(t, x, side='right') - 1, k, n - 1)
+    B = [np.ones_like(x)] + [None]*k
+    left, right = [None]*(k + 1), [None]*(k + 1)
+    for j in range(1, k + 1):
+        left[j] = x - t[span + 1 - j]
+        right[j] = t[span + j] - x
+        saved = 0.0
+        for r in range(j):
+            temp = B[r]/(right[r + 1] + left[j - r])
+            B[r] = saved + right[r + 1]*temp
+            saved = left[j - r]*temp
+        B[j] = saved
+    return span, B
+
+
+def _bisplev_points(x, y, tck):
+    '''Evaluates the bivariate spline `tck` at each of the points (x, y),
+    which may be arrays broadcast against each other, rather than on the grid
+    of them as `bisplev` does. Scalars are evaluated with `bisplev`, and a
+    float returned.
+    '''
+    if not isinstance(x, (np.ndarray, list, tuple)) and not isinstance(y, (np.ndarray, list, tuple)):
+        return float(bisplev(x, y, tck))
+    tx, ty, c, kx, ky = tck
+    tx, ty, c = np.asarray(tx), np.asarray(ty), np.asarray(c)
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    span_x, Bx = _bspline_basis(tx, kx, x)
+    span_y, By = _bspline_basis(ty, ky, y)
+    ny = len(ty) - ky - 1
+    value = 0.0
+    for i in range(kx + 1):
+        row = (span_x - kx + i)*ny + span_y - ky
+        value += Bx[i]*sum([c[row + j]*By[j] for j in range(ky + 1)])
+    return value
 
 
 # Applies for row 1-9.
 Grimson_Nl_aligned = [0.64, 0.8, 0.87, 0.9, 0.92, 0.94, 0.96, 0.98, 0.99]
 Grimson_Nl_staggered = [0.68, 0.75, 0.83, 0.89, 0.92, 0.95, 0.97, 0.98, 0.99]
+# Lookup table of the above indexed by [staggered, tube_rows - 1], with 1 for
+# 10 rows or more
+Grimson_Nl_table = np.array([Grimson_Nl_aligned + [1.0],
+                             Grimson_Nl_staggered + [1.0]])
 
 
 Grimison_SL_aligned = [1.25, 1.5, 2, 3]
@@ -119,6 +170,37 @@ Grimson_m_staggered_interp = lambda x, y: float(bisplev(x, y, tck_Grimson_m_stag
 Grimson_C1_staggered_interp = lambda x, y: float(bisplev(x, y, tck_Grimson_C1_staggered))
 
 
+def _Grimison_coefficients(b, a, staggered):
+    '''Returns the coefficients `C1` and `m` of the Grimison correlation for
+    arrays of the parallel and normal pitch ratios `b` and `a`, evaluating
+    the splines only once for each unique geometry.
+    '''
+    b, a, staggered = np.broadcast_arrays(b, a, staggered)
+    # Each geometry as one complex number is much faster to find the unique
+    # values of than the pairs of pitch ratios
+    geometries, index, inverse = np.unique((b + 1j*a).ravel(), return_index=True,
+                                           return_inverse=True)
+    bs, as_ = geometries.real, geometries.imag
+    staggered_unique = staggered.ravel()[index]
+    C1, m = np.empty(len(bs)), np.empty(len(bs))
+    if len(bs) <= 32:
+        # Evaluating a few points one by one avoids the fixed cost of the
+        # array evaluation of the splines
+        for i, (bi, ai, staggered_i) in enumerate(zip(bs.tolist(), as_.tolist(), staggered_unique.tolist())):
+            if staggered_i:
+                C1[i], m[i] = Grimson_C1_staggered_interp(bi, ai), Grimson_m_staggered_interp(bi, ai)
+            else:
+                C1[i], m[i] = Grimison_C1_aligned_interp(bi, ai), Grimison_m_aligned_interp(bi, ai)
+    else:
+        for mask, C1_tck, m_tck in ((staggered_unique, tck_Grimson_C1_staggered, tck_Grimson_m_staggered),
+                                    (~staggered_unique, Grimison_C1_aligned_tck, Grimison_m_aligned_tck)):
+            if np.any(mask):
+                C1[mask] = _bisplev_points(bs[mask], as_[mask], C1_tck)
+                m[mask] = _bisplev_points(bs[mask], as_[mask], m_tck)
+    inverse = inverse.reshape(-1)
+    return C1[inverse].reshape(b.shape), m[inverse].reshape(b.shape)
+
+
 
 def Nu_Grimison_tube_bank(Re, Pr, Do, tube_rows, pitch_parallel, pitch_normal):
     r'''Calculates Nusselt number for crossflow across a tube bank
@@ -156,6 +238,11 @@ def Nu_Grimison_tube_bank(Re, Pr, Do, tube_rows, pitch_parallel, pitch_normal):
     Tube row correction factors are applied for tube row counts less than 10,
     also published in [1]_.
 
+    All of the inputs may also be arrays, which are broadcast against each
+    other; the splines are then evaluated only once for each unique
+    geometry, the row corrections looked up in a table, and an array
+    returned.
+
     Examples
     --------
     >>> Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=11, 
@@ -166,32 +253,47 @@ def Nu_Grimison_tube_bank(Re, Pr, Do, tube_rows, pitch_parallel, pitch_normal):
     ... pitch_normal=.07, pitch_parallel=.05, Do=.025)
     79.92721078571385
 
+    >>> import numpy as np
+    >>> Nu_Grimison_tube_bank(Re=np.array([5000., 10263.37]), Pr=.708,
+    ... tube_rows=11, pitch_normal=np.array([[.05], [.07]]), pitch_parallel=.05,
+    ... Do=.025)
+    array([[50.19657141, 79.07883866],
+           [53.41637741, 79.92721079]])
+
     References
     ----------
     .. [1] Grimson, E. D. (1937) Correlation and Utilisation of New Data on
        Flow Resistance and Heat Transfer for Cross Flow of Gases over Tube 
        Banks. Trans. ASME. 59 583-594
     '''
-    staggered = abs(1 - pitch_normal/pitch_parallel) > 0.05
     a = pitch_normal/Do # sT
     b = pitch_parallel/Do
-    if not staggered:
-        C1 = float(Grimison_C1_aligned_interp(b, a))
-        m = float(Grimison_m_aligned_interp(b, a))
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        staggered = np.abs(1 - pitch_normal/pitch_parallel) > 0.05
+        C1, m = _Grimison_coefficients(b, a, staggered)
     else:
-        C1 = float(Grimson_C1_staggered_interp(b, a))
-        m = float(Grimson_m_staggered_interp(b, a))
-        
-    tube_rows = int(tube_rows)
-    if tube_rows < 10:
-        if tube_rows < 1:
-            tube_rows = 1
-        if staggered:
-            C2 = Grimson_Nl_staggered[tube_rows]
+        staggered = abs(1 - pitch_normal/pitch_parallel) > 0.05
+        if not staggered:
+            C1 = float(Grimison_C1_aligned_interp(b, a))
+            m = float(Grimison_m_aligned_interp(b, a))
         else:
-            C2 = Grimson_Nl_aligned[tube_rows]
+            C1 = float(Grimson_C1_staggered_interp(b, a))
+            m = float(Grimson_m_staggered_interp(b, a))
+
+    if isinstance(tube_rows, np.ndarray) or isinstance(staggered, np.ndarray):
+        rows = np.clip(np.asarray(tube_rows).astype(int), 1, 10)
+        C2 = Grimson_Nl_table[np.asarray(staggered, dtype=int), rows - 1]
     else:
-        C2 = 1.0
+        tube_rows = int(tube_rows)
+        if tube_rows < 10:
+            if tube_rows < 1:
+                tube_rows = 1
+            if staggered:
+                C2 = Grimson_Nl_staggered[tube_rows-1]
+            else:
+                C2 = Grimson_Nl_aligned[tube_rows-1]
+        else:
+            C2 = 1.0
     Nu = 1.13*Re**m*Pr**(1.0/3.0)*C2*C1
     return Nu
 
@@ -205,6 +307,11 @@ Zukauskas_Czs_high_Re_staggered = [0.6273, 0.7689, 0.8473, 0.8942, 0.9254,
 Zukauskas_Czs_inline = [0.6768, 0.8089, 0.8687, 0.9054, 0.9303, 0.9465, 0.9569,
     0.9647, 0.9712, 0.9766, 0.9811, 0.9847, 0.9877, 0.99, 0.992, 0.9937,
     0.9953, 0.9969, 0.9986]
+# Lookup table of the above for 1 to 20 rows, indexed by [configuration,
+# tube_rows - 1]: inline, staggered at Re < 1000, and staggered otherwise
+Zukauskas_Czs_table = np.array([Zukauskas_Czs_inline + [1.0],
+                                Zukauskas_Czs_low_Re_staggered + [1.0],
+                                Zukauskas_Czs_high_Re_staggered + [1.0]])
 
 def Zukauskas_tube_row_correction(tube_rows, staggered=True, Re=1E4):
     r'''Calculates the tube row correction factor according to a graph
@@ -235,13 +342,19 @@ def Zukauskas_tube_row_correction(tube_rows, staggered=True, Re=1E4):
     -----
     The basis for this method is that an infinitely long tube bank has a 
     factor of 1; in practice the factor is reached at 20 rows.
-    
+
+    All of the inputs may also be arrays, which are broadcast against each
+    other; the factors are then looked up in a table all at once.
+
     Examples
     --------
     >>> Zukauskas_tube_row_correction(4, staggered=True)
     0.8942
     >>> Zukauskas_tube_row_correction(6, staggered=False)
     0.9465
+    >>> import numpy as np
+    >>> Zukauskas_tube_row_correction(np.array([1, 4, 25]), staggered=True)
+    array([0.6273, 0.8942, 1.    ])
 
     References
     ----------
@@ -249,6 +362,12 @@ def Zukauskas_tube_row_correction(tube_rows, staggered=True, Re=1E4):
        Jr. and J. P. Hartnett, editors, Advances in Heat Transfer, volume 8,
        pages 93-160. Academic Press, Inc., New York, 1972.
     '''
+    if (isinstance(tube_rows, np.ndarray) or isinstance(staggered, np.ndarray)
+            or isinstance(Re, np.ndarray)):
+        rows = np.clip(np.asarray(tube_rows).astype(int), 1, 20)
+        configuration = np.where(staggered, np.where(Re < 1000, 1, 2), 0)
+        return Zukauskas_Czs_table[configuration, rows - 1]
+
     tube_rows = int(tube_rows) # sanity for indexing
     if tube_rows < 1:
         tube_rows = 1
@@ -266,6 +385,13 @@ def Zukauskas_tube_row_correction(tube_rows, staggered=True, Re=1E4):
     return correction
 
 
+# Upper limits of the Re ranges of the Zukauskas correlation, and its leading
+# coefficient and Re exponent in each, for inline [0] and staggered [1] banks
+Zukauskas_Bejan_Re_limits = np.array([[100., 1000., 2E5], [500., 1000., 2E5]])
+Zukauskas_Bejan_coeffs = np.array([[0.9, 0.52, 0.27, 0.033], [1.04, 0.71, 0.35, 0.031]])
+Zukauskas_Bejan_exponents = np.array([[0.4, 0.5, 0.63, 0.8], [0.4, 0.5, 0.6, 0.8]])
+
+
 def Nu_Zukauskas_Bejan(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
                        Pr_wall=None):
     r'''Calculates Nusselt number for crossflow across a tube bank
@@ -346,10 +472,19 @@ def Nu_Zukauskas_Bejan(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
     0.25 is recommended in [1]_ for heating and cooling for both liquids and
     gases.
 
+    All of the inputs may also be arrays, which are broadcast against each
+    other; the coefficients and row corrections of every point are then
+    looked up in tables all at once, and an array returned.
+
     Examples
     --------
     >>> Nu_Zukauskas_Bejan(Re=1E4, Pr=7., tube_rows=10, pitch_parallel=.05, pitch_normal=.05)
     175.9202277145248
+    >>> import numpy as np
+    >>> Nu_Zukauskas_Bejan(Re=np.array([300., 1E4]), Pr=7., tube_rows=10,
+    ... pitch_parallel=.05, pitch_normal=np.array([[.05], [.07]]))
+    array([[ 17.72213275, 175.92022771],
+           [ 20.15400118, 185.01255192]])
 
     References
     ----------
@@ -359,6 +494,24 @@ def Nu_Zukauskas_Bejan(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
     .. [2] Bejan, Adrian. "Convection Heat Transfer", 4E. Hoboken,
        New Jersey: Wiley, 2013.
     '''
+    if (isinstance(Re, np.ndarray) or isinstance(pitch_parallel, np.ndarray)
+            or isinstance(pitch_normal, np.ndarray) or isinstance(tube_rows, np.ndarray)):
+        ratio = pitch_normal/pitch_parallel
+        staggered = np.abs(1 - ratio) > 0.05
+        Re, staggered, ratio = np.broadcast_arrays(Re, staggered, ratio)
+        configuration = staggered.astype(int)
+        # Index of the Re range of each point
+        ranges = ((Re >= Zukauskas_Bejan_Re_limits[configuration, 0]).astype(int)
+                  + (Re >= Zukauskas_Bejan_Re_limits[configuration, 1])
+                  + (Re >= Zukauskas_Bejan_Re_limits[configuration, 2]))
+        c = Zukauskas_Bejan_coeffs[configuration, ranges]
+        m = Zukauskas_Bejan_exponents[configuration, ranges]
+        f = np.where(staggered & (ranges >= 2), ratio**0.2, 1.0)
+        Nu = c*Re**m*Pr**0.36*f
+        if Pr_wall is not None:
+            Nu = Nu*(Pr/Pr_wall)**0.25
+        return Nu*Zukauskas_tube_row_correction(tube_rows, staggered=staggered, Re=Re)
+
     staggered = abs(1 - pitch_normal/pitch_parallel) > 0.05
 
     f = 1.0
@@ -366,7 +519,7 @@ def Nu_Zukauskas_Bejan(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
         if Re < 100:
             c, m = 0.9, 0.4
         elif Re < 1000:
-            c, m = 0.52, 0.05
+            c, m = 0.52, 0.5
         elif Re < 2E5:
             c, m = 0.27, 0.63
         else:
@@ -395,6 +548,10 @@ def Nu_Zukauskas_Bejan(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
 # tube banks. 10 is 1.
 ESDU_73031_F2_inline = [0.8479, 0.8957, 0.9306, 0.9551, 0.9724, 0.9839, 0.9902]
 ESDU_73031_F2_staggered = [0.8593, 0.8984, 0.9268, 0.9482, 0.965, 0.9777, 0.9868]
+# Lookup table of the above for 1 to 10 rows, indexed by [staggered,
+# tube_rows - 1]
+ESDU_73031_F2_table = np.array([ESDU_73031_F2_inline[:1]*2 + ESDU_73031_F2_inline + [1.0],
+                                ESDU_73031_F2_staggered[:1]*2 + ESDU_73031_F2_staggered + [1.0]])
 
 def ESDU_tube_row_correction(tube_rows, staggered=True, Re=3000, method='Hewitt'):
     r'''Calculates the tube row correction factor according to [1]_ as shown in
@@ -431,13 +588,20 @@ def ESDU_tube_row_correction(tube_rows, staggered=True, Re=3000, method='Hewitt'
     
     For tube counts 1-7, [3]_ claims the factors from [1]_ are on average:
     [0.65, 0.77, 0.84, 0.9, 0.94, 0.97, 0.99].
-    
+
+    `tube_rows` and `staggered` may also be arrays, which are broadcast
+    against each other; the factors are then looked up in a table all at
+    once.
+
     Examples
     --------
     >>> ESDU_tube_row_correction(4, staggered=True)
     0.8984
     >>> ESDU_tube_row_correction(6, staggered=False)
     0.9551
+    >>> import numpy as np
+    >>> ESDU_tube_row_correction(np.array([2, 4, 12]), staggered=True)
+    array([0.8593, 0.8984, 1.    ])
 
     References
     ----------
@@ -452,6 +616,9 @@ def ESDU_tube_row_correction(tube_rows, staggered=True, Re=3000, method='Hewitt'
        49-62.
     '''
     if method == 'Hewitt':
+        if isinstance(tube_rows, np.ndarray) or isinstance(staggered, np.ndarray):
+            rows = np.clip(np.asarray(tube_rows).astype(int), 1, 10)
+            return ESDU_73031_F2_table[np.asarray(staggered, dtype=int), rows - 1]
         if staggered: # in-line, with a tolerance of 0.05 proximity
             if tube_rows <= 2:
                 correction = ESDU_73031_F2_staggered[0]
@@ -509,6 +676,13 @@ def ESDU_tube_angle_correction(angle):
     return sin(radians(angle))**0.6
 
 
+# Upper limits of the Re ranges of the ESDU 73031 correlation, and its leading
+# coefficient and Re exponent in each, for inline [0] and staggered [1] banks
+ESDU_73031_Re_limits = [300., 2E5]
+ESDU_73031_coeffs = np.array([[0.742, 0.211, 0.116], [1.309, 0.273, 0.124]])
+ESDU_73031_exponents = np.array([[0.431, 0.651, 0.700], [0.360, 0.635, 0.700]])
+
+
 def Nu_ESDU_73031(Re, Pr, tube_rows, pitch_parallel, pitch_normal, 
                   Pr_wall=None, angle=90.0):
     r'''Calculates the Nusselt number for crossflow across a tube bank
@@ -585,6 +759,10 @@ def Nu_ESDU_73031(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
     The inline coefficients are valid for a normal pitch to tube diameter ratio
     from 1.2 to 4; and the staggered ones from 1 to 4. 
     The overall accuracy of this method is claimed to be 15%.
+
+    All of the inputs may also be arrays, which are broadcast against each
+    other; the coefficients and row corrections of every point are then
+    looked up in tables all at once, and an array returned.
     
     See Also
     --------
@@ -605,6 +783,20 @@ def Nu_ESDU_73031(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
        R. Bott. Process Heat Transfer. 1st edition. Boca Raton: CRC Press, 
        1994.
     '''
+    if (isinstance(Re, np.ndarray) or isinstance(pitch_parallel, np.ndarray)
+            or isinstance(pitch_normal, np.ndarray) or isinstance(tube_rows, np.ndarray)
+            or isinstance(angle, np.ndarray)):
+        staggered = np.abs(1 - pitch_normal/pitch_parallel) > 0.05
+        configuration = staggered.astype(int)
+        # Index of the Re range of each point; the ranges include their limits
+        ranges = np.searchsorted(ESDU_73031_Re_limits, Re, side='left')
+        a = ESDU_73031_coeffs[configuration, ranges]
+        m = ESDU_73031_exponents[configuration, ranges]
+        F2 = ESDU_tube_row_correction(tube_rows=tube_rows, staggered=staggered)
+        F3 = np.sin(np.radians(angle))**0.6
+        F1 = 1.0 if Pr_wall is None else (Pr/Pr_wall)**0.26
+        return a*Re**m*Pr**0.34*F1*F2*F3
+
     staggered = abs(1 - pitch_normal/pitch_parallel) > 0.05
     if staggered:
         if Re <= 300:
@@ -914,7 +1106,6 @@ _dP_staggered_Re_25 = np.array([1.79994, 1.76013, 1.72122, 1.65648, 1.61986, 1.5
     0.184598, 0.184585, 0.184584
 ])
 _dP_staggered_Re_parameters = np.array([_dP_staggered_Re_125, _dP_staggered_Re_15, _dP_staggered_Re_2, _dP_staggered_Re_25]).T
-dP_staggered_f = RectBivariateSpline(_dP_staggered_Res, np.array([1.25, 1.5, 2, 2.5]), _dP_staggered_Re_parameters, kx=3, ky=3, s=0.002)
 
 # Excellent plot, though it does linear extrapolation on some lines
 #import matplotlib.pyplot as plt
@@ -951,7 +1142,6 @@ _dP_staggered_correction_Re_100000 = np.array([1.45829, 1.42587, 1.40486, 1.3829
     0.939698, 0.939698, 0.939698
 ])
 _dP_staggered_correction_Re_parameters = np.array([_dP_staggered_correction_Re_100, _dP_staggered_correction_Re_1000, _dP_staggered_correction_Re_10000, _dP_staggered_correction_Re_100000]).T
-dP_staggered_correction = RectBivariateSpline(_dP_staggered_correction_parameters, np.array([1E2, 1E3, 1E4, 1E5]), _dP_staggered_correction_Re_parameters, kx=1, ky=3, s=0.002)
 
 # Maybe good plot - bad around the middle
 #dP_staggered_correction_zs = np.array([1E2, 1E3, 1E4, 1E5])
@@ -1038,7 +1228,6 @@ _dP_inline_Re_25 = np.array([0.349884, 0.344353, 0.339587, 0.334753, 0.324384, 0
     0.157321, 0.157272, 0.157272, 0.157223, 0.157223, 0.157174, 0.157173, 0.157129, 0.157125
 ])
 _dP_inline_Re_parameters = np.array([_dP_inline_Re_125, _dP_inline_Re_15, _dP_inline_Re_2, _dP_inline_Re_25]).T
-dP_inline_f = RectBivariateSpline(_dP_inline_Res, np.array([1.25, 1.5, 2, 2.5]), _dP_inline_Re_parameters, kx = 3, ky = 3, s = 0.002)
 
 
 _dP_inline_correction_parameters = np.array([0.0661637, 0.0767956, 0.0811521, 0.091014, 0.0965946, 0.102863, 0.114663, 0.117455, 0.132109, 0.135196, 0.152089,
@@ -1064,7 +1253,294 @@ _dP_inline_correction_Re_1000000 = np.array([3.14214, 2.9391, 2.8673, 2.72361, 2
                      
 _dP_inline_correction_zs = np.array([1E3, 1E4, 1E5, 1E6])
 _dP_inline_correction_Re_parameters = np.array([_dP_inline_correction_Re_1000, _dP_inline_correction_Re_10000, _dP_inline_correction_Re_100000, _dP_inline_correction_Re_1000000]).T
-dP_inline_correction = RectBivariateSpline(_dP_inline_correction_parameters, _dP_inline_correction_zs, _dP_inline_correction_Re_parameters, kx=1, ky=3, s=0.002) # s=0.002
+
+# Smoothing splines (s=0.002) of the digitized curves above, as fitted by
+# RectBivariateSpline; tests/test_conv_tube_bank.py checks they are reproduced
+dP_staggered_f_tck = implementation_optimize_tck([[10.0, 10.0, 10.0, 10.0, 11.6733, 13.1024,
+    14.0153, 14.9918, 17.1536, 18.5267, 19.8182, 20.7261, 22.243, 23.7936, 26.7057, 32.2732, 34.858,
+    37.2879, 41.0554, 44.4722, 47.8949, 51.2337, 55.3369, 65.1821, 70.4025, 76.0437, 82.1368,
+    88.7182, 95.1284, 103.386, 108.398, 129.188, 155.444, 168.914, 182.793, 197.771, 223.559,
+    278.915, 335.015, 497.559, 731.917, 1119.14, 1748.56, 2308.27, 3363.57, 4367.03, 4854.24,
+    6817.15, 9914.09, 19683.7, 39838.4, 86914.7, 177710.0, 329652.0, 453370.0, 617548.0, 1388740.0,
+    2756750.0, 2756750.0, 2756750.0, 2756750.0],
+[1.25, 1.25, 1.25, 1.25, 2.5, 2.5, 2.5, 2.5],
+[23.993727564949694, -10.244567028024317, 10.175863843810976, 1.7999490702171597,
+    23.522204247227894, -10.206973826192078, 10.10518140310304, 1.780787357025903,
+    21.056398673217306, -8.809585811775245, 9.191305635699116, 1.7221653902388994,
+    19.30502693908655, -8.454343171481037, 8.87084592501417, 1.6628307168281609, 17.765109289150598,
+    -7.7133771799002115, 8.35255872722289, 1.6185259877007414, 16.183640933328732,
+    -6.833873600289119, 7.722187414020649, 1.5690827476330849, 14.694535763926543,
+    -6.150405226666587, 7.22393729697023, 1.5213836637875222, 13.605573060235757,
+    -5.4221574812289735, 6.657567596977061, 1.4767279611552022, 13.00457363939894,
+    -5.517651045065633, 6.649512891288891, 1.4466870011383937, 11.995125279422092,
+    -4.905206010958158, 6.23685497204518, 1.4176362748134403, 11.320923863947378,
+    -4.3609663889341554, 5.823387965136728, 1.3889295522585867, 10.55081833434363,
+    -4.2246761575331195, 5.6424642699146474, 1.3494878611293746, 9.136637777542301,
+    -3.3738486997113624, 4.988770673854508, 1.2912945512808613, 8.142082809925073,
+    -3.0640564076701335, 4.673896497087432, 1.2394666235276033, 7.307435480320903,
+    -2.4507512853218927, 4.184651311906238, 1.197270318810632, 6.823162531391426,
+    -2.341520042292131, 4.031868925359543, 1.1654503211708163, 6.292609559336966,
+    -2.172105165179806, 3.851181307698692, 1.1342864317994863, 5.7736639984989955,
+    -1.8024125693369684, 3.540068552249239, 1.103663937920097, 5.456996186731616,
+    -1.6944442210715904, 3.394074222435801, 1.0771356178101834, 5.04760166750843,
+    -1.5241640716734404, 3.2252084065116606, 1.051345959799993, 4.547228150208529,
+    -1.2330993185368226, 2.940049991699233, 1.0141134328178203, 4.14534270298608,
+    -1.0164114172228296, 2.7045876551545796, 0.9793370063645501, 3.771066238885074,
+    -0.8748901176380479, 2.528229788862222, 0.9470018923394338, 3.578714777343189,
+    -0.7900362603927293, 2.4000658218893482, 0.9229840539840486, 3.2657684683098536,
+    -0.5425913450233749, 2.185378113310861, 0.8999825646391477, 3.1380949473394075,
+    -0.5491995911762386, 2.1192169444451854, 0.8771813561150372, 2.8710190479957056,
+    -0.3178235005664693, 1.9163896313226092, 0.8571821847817371, 2.7427220096515885,
+    -0.35065324494593403, 1.8829269684603023, 0.8348323725060139, 2.4836006182031682,
+    -0.13524074469089908, 1.6647896666111899, 0.8142139723548999, 2.2164004811891416,
+    -0.037190904409863806, 1.492301567301747, 0.7533707758356281, 1.9945634411125996,
+    0.11239968063579184, 1.2956302127875685, 0.7249191411158085, 1.842686059394845,
+    0.16071816499109753, 1.2153169523034464, 0.6897021922030252, 1.7377903418611442,
+    0.28929279589655305, 1.08344601062934, 0.6729372197342073, 1.6396914034896823,
+    0.1989615127535343, 1.0850029234159282, 0.6499001080984353, 1.487502515283381,
+    0.3730846731246894, 0.9013971733000221, 0.6182632804995061, 1.3522211422419148,
+    0.29114768909268346, 0.8964977394892637, 0.5767990957491218, 1.1810712591370587,
+    0.3394790407828216, 0.7652655011740844, 0.5323341532737186, 1.02811191715534,
+    0.28877248283264134, 0.7066399775545615, 0.47789313417627943, 0.8895112183187074,
+    0.3210418642443666, 0.6143186197557094, 0.4467010633652874, 0.7932715410752142,
+    0.3211662514007235, 0.5619909984438982, 0.4128889836673581, 0.7375513367809549,
+    0.31442597583489285, 0.528973351907581, 0.40946816332703617, 0.6972754846297644,
+    0.3205333114809629, 0.49185229647193535, 0.379830474083385, 0.6641316600566393,
+    0.281121553527687, 0.509197543189297, 0.37834157522498535, 0.6244559596650743,
+    0.2837572552667433, 0.4993191757674828, 0.3669254758741835, 0.6023735792473888,
+    0.27619337582069536, 0.4987865496444748, 0.36447787146862204, 0.5590674813131451,
+    0.2621282514144033, 0.4629707633705547, 0.344500324531334, 0.47826187747821025,
+    0.24854110423247427, 0.3784315811630596, 0.3033924096858183, 0.3937668979943847,
+    0.21276843181697333, 0.31548280027960035, 0.2539053524737366, 0.31876438844008,
+    0.158795177701543, 0.25642988185907434, 0.20260524488060627, 0.2666571057762706,
+    0.12559509247246703, 0.22131797267049313, 0.1679289011957269, 0.21458509405589332,
+    0.08216081030845324, 0.1746802190336271, 0.1296792214950967, 0.22658308704042596,
+    0.11933630526911945, 0.19390705971382824, 0.14155272246220635, 0.22368700281202908,
+    0.187323377693516, 0.19566933127448077, 0.1768800813854576, 0.22670189786582112,
+    0.17244551677539754, 0.19623023497041756, 0.1908917559338361, 0.22444400177103246,
+    0.18818582448900387, 0.20455765748479432, 0.17469852498703695, 0.2264047973889584,
+    0.1728059947546293, 0.2044769358453351, 0.18919915441777863, 0.2281141554162358,
+    0.17407465072202716, 0.2115805378214652, 0.1837416784138279],
+3, 3])
+
+dP_staggered_correction_tck = implementation_optimize_tck([[0.4387, 0.4387, 0.609319, 0.84214,
+    1.22243, 1.45385, 2.22751, 3.54351, 3.54351],
+[100.0, 100.0, 100.0, 100.0, 100000.0, 100000.0, 100000.0, 100000.0],
+[0.9974058596752864, 2.2479507236683025, -2.927557461079741, 1.4506256824457617, 0.9973256008060759,
+    1.2891120004637224, 2.57756043014528, 1.308194055102965, 0.99328828308559, 0.9777071534489982,
+    2.690730180307897, 1.1511575741885283, 1.0225516740093321, 0.654636148703268,
+    3.5328468308711605, 0.9841004806410495, 1.1242321684355248, -1.285317900605766,
+    18.760679189927053, 0.9465800254548173, 1.4029517756874132, -6.782908749288587,
+    62.67683464108982, 0.9308263957725467, 1.6896512655274156, -12.264942447053453,
+    107.33977758986381, 0.9417015493955058],
+1, 3])
+
+dP_inline_f_tck = implementation_optimize_tck([[28.5094, 28.5094, 28.5094, 28.5094, 32.9727,
+    35.3563, 41.2101, 52.6143, 59.107, 63.7533, 82.9896, 124.713, 157.106, 278.938, 528.457,
+    795.679, 1107.38, 1616.19, 4852.32, 6545.85, 8113.39, 14521.4, 53971.7, 98430.6, 169621.0,
+    605857.0, 1871040.0, 1871040.0, 1871040.0, 1871040.0],
+[1.25, 1.25, 1.25, 1.25, 2.5, 2.5, 2.5, 2.5],
+[5.930973938528779, -1.4817265127271453, 0.45537970186636195, 0.3498836798224479, 5.658593208961423,
+    -0.864342651441936, 0.08593026693355739, 0.34613560382323216, 5.313966014275998,
+    -0.9488816374714495, 0.19582902072826486, 0.34092060252169976, 4.7479017538057215,
+    -0.9103110524004313, 0.2580592449510698, 0.33234093710001716, 3.985380347891111,
+    -0.8082048062363013, 0.30838265437930656, 0.3209043535273658, 3.386764509595187,
+    -0.6210063941958163, 0.27739125226392713, 0.31012791737633943, 2.997259057262402,
+    -0.6436424918427293, 0.3541133458508599, 0.301791078024438, 2.5313481368123476,
+    -0.4636698687516479, 0.30801296333629424, 0.29158828319463104, 1.9067355729954962,
+    -0.4062699968822227, 0.3701523002949395, 0.2746968125881167, 1.4860009590268453,
+    -0.30472135335912676, 0.3724777524638413, 0.25864425955561277, 0.9575648609085928,
+    -0.204166339279796, 0.3941734724654094, 0.2357333057087107, 0.617062433119386,
+    -0.10880867994591494, 0.39408633772540214, 0.20892734716395606, 0.47229647331059593,
+    -0.05580970506304061, 0.38704056037031837, 0.1913524081468901, 0.3995262320386994,
+    -0.025364894783629043, 0.3882892706432594, 0.17223243383813486, 0.4645326824064042,
+    0.006781252703459961, 0.3521348515608552, 0.17536693538855636, 0.5446976745961594,
+    0.15241945766867596, 0.24698689592423084, 0.17681557375149798, 0.5104609851427283,
+    0.12624322456056636, 0.2778791531974582, 0.17784586815757317, 0.47477783729053963,
+    0.18418150133237582, 0.23902625324786367, 0.1784924161355043, 0.43317072175815224,
+    0.19660866631353266, 0.24203812520559442, 0.1781297356716778, 0.3463614484492485,
+    0.2262216378962929, 0.16574119419147584, 0.17041401680557733, 0.3137425743888637,
+    0.2228368744465938, 0.12873829665476522, 0.1588140647661027, 0.26669827511587546,
+    0.20630581043269916, 0.1587051313760535, 0.15874112237185797, 0.2469799643017819,
+    0.20748674266409423, 0.16199118528352172, 0.15808816963614555, 0.2548927358191072,
+    0.20725204412357132, 0.15888749480417735, 0.15723734153785307, 0.24980627342152784,
+    0.20193738501181946, 0.16354922984992293, 0.15735848188343948, 0.2539191494035861,
+    0.20088977366171992, 0.16307518633772777, 0.15709983931130342],
+3, 3])
+
+dP_inline_correction_tck = implementation_optimize_tck([[0.0661637, 0.0661637, 0.0767956, 0.0811521,
+    0.091014, 0.0965946, 0.102863, 0.114663, 0.132109, 0.152089, 0.19133, 0.21534, 0.244667,
+    0.324839, 0.392087, 0.446129, 2.2286, 2.3885, 2.92864, 4.54434, 5.71411, 5.71411],
+[1000.0, 1000.0, 1000.0, 1000.0, 1000000.0, 1000000.0, 1000000.0, 1000000.0],
+[7.538736359135697, -46.71817818497095, 386.72023291797194, 3.1419878453856827, 6.855846630592806,
+    -42.26016642856161, 350.8294410498906, 2.939338686456688, 6.545884260444981, -37.867305398022,
+    314.45822585098205, 2.8673172547463555, 6.102818966149279, -35.80012633098025,
+    298.08261006074326, 2.7234060508859224, 5.9160908780197, -36.3557179323105, 303.42773162886317,
+    2.6438647789995735, 5.361789414243408, -22.43660667829914, 187.2800197224985, 2.562124763947459,
+    5.053961418694562, -23.542326814891076, 199.44990807091722, 2.468279955754308,
+    4.551704016414509, -19.577070938171893, 169.62413394187573, 2.366997210096423,
+    4.1227319738252355, -17.982861253207133, 157.99263479700983, 2.2245466433762515,
+    3.527839280964076, -13.792985417472774, 123.16932841811348, 2.0206486106122608,
+    3.2281835431697203, -12.727391960575988, 116.94099447300276, 1.9240273537366896,
+    2.8935295395564835, -7.4941501865270315, 72.37874624325472, 1.815991693733779,
+    2.311816004228666, -2.858842622096957, 33.822788213957054, 1.6346370259896956,
+    1.990508468037504, -0.6109981810708844, 14.988668920614074, 1.5064649079871524,
+    1.7980203708169251, 0.5471449115006041, 5.2716586423732075, 1.4300466547812154,
+    0.55715709359329, 2.4072950718065225, -12.062316891379075, 0.7475608351101791,
+    0.5286624778048733, 2.3409953404784267, -11.621651687786857, 0.7305767980411719,
+    0.4507801377592137, 2.274357576406181, -11.439769638146574, 0.673349085634455,
+    0.31759813179345364, 2.2764392628241525, -12.4672273381274, 0.5591665952226491,
+    0.2711854654138374, 1.8646434603152886, -9.380608841585765, 0.5166150615601409],
+1, 3])
+
+
+def dP_staggered_f_interp(Re, ST_D):
+    r'''Friction factor of a staggered tube bank as a function of Reynolds
+    number and transverse pitch ratio, for :obj:`dP_Zukauskas`; a smoothing
+    spline of the graph in [1]_, as the `ev` method of :obj:`dP_staggered_f`
+    evaluates it. Accepts arrays, which are broadcast against each other.
+
+    Parameters
+    ----------
+    Re : float
+        Reynolds number, [-]
+    ST_D : float
+        Ratio of transverse pitch to tube outer diameter, [-]
+
+    Returns
+    -------
+    f : float
+        Friction factor, [-]
+
+    Examples
+    --------
+    >>> dP_staggered_f_interp(13943., 1.25)
+    0.469112769678402
+
+    References
+    ----------
+    .. [1] Zukauskas, A. Heat transfer from tubes in crossflow. In T.F. Irvine,
+       Jr. and J. P. Hartnett, editors, Advances in Heat Transfer, volume 8,
+       pages 93-160. Academic Press, Inc., New York, 1972.
+    '''
+    return _bisplev_points(Re, ST_D, dP_staggered_f_tck)
+
+
+def dP_staggered_correction_interp(ST_SL, Re):
+    r'''Correction factor for the pitch ratio of a staggered tube bank,
+    for :obj:`dP_Zukauskas`; a smoothing spline of the graph in [1]_, as the
+    `ev` method of :obj:`dP_staggered_correction` evaluates it. Accepts
+    arrays, which are broadcast against each other.
+
+    Parameters
+    ----------
+    ST_SL : float
+        Ratio of transverse pitch to longitudinal pitch, [-]
+    Re : float
+        Reynolds number, [-]
+
+    Returns
+    -------
+    x : float
+        Correction factor, [-]
+
+    References
+    ----------
+    .. [1] Zukauskas, A. Heat transfer from tubes in crossflow. In T.F. Irvine,
+       Jr. and J. P. Hartnett, editors, Advances in Heat Transfer, volume 8,
+       pages 93-160. Academic Press, Inc., New York, 1972.
+    '''
+    return _bisplev_points(ST_SL, Re, dP_staggered_correction_tck)
+
+
+def dP_inline_f_interp(Re, SL_D):
+    r'''Friction factor of an inline tube bank as a function of Reynolds
+    number and longitudinal pitch ratio, for :obj:`dP_Zukauskas`; a
+    smoothing spline of the graph in [1]_, as the `ev` method of
+    :obj:`dP_inline_f` evaluates it. Accepts arrays, which are broadcast
+    against each other.
+
+    Parameters
+    ----------
+    Re : float
+        Reynolds number, [-]
+    SL_D : float
+        Ratio of longitudinal pitch to tube outer diameter, [-]
+
+    Returns
+    -------
+    f : float
+        Friction factor, [-]
+
+    References
+    ----------
+    .. [1] Zukauskas, A. Heat transfer from tubes in crossflow. In T.F. Irvine,
+       Jr. and J. P. Hartnett, editors, Advances in Heat Transfer, volume 8,
+       pages 93-160. Academic Press, Inc., New York, 1972.
+    '''
+    return _bisplev_points(Re, SL_D, dP_inline_f_tck)
+
+
+def dP_inline_correction_interp(parameter, Re):
+    r'''Correction factor for the pitch ratio of an inline tube bank, for
+    :obj:`dP_Zukauskas`; a smoothing spline of the graph in [1]_, as the
+    `ev` method of :obj:`dP_inline_correction` evaluates it. Accepts arrays,
+    which are broadcast against each other.
+
+    Parameters
+    ----------
+    parameter : float
+        Ratio (ST/D - 1)/(SL/D - 1), [-]
+    Re : float
+        Reynolds number, [-]
+
+    Returns
+    -------
+    x : float
+        Correction factor, [-]
+
+    References
+    ----------
+    .. [1] Zukauskas, A. Heat transfer from tubes in crossflow. In T.F. Irvine,
+       Jr. and J. P. Hartnett, editors, Advances in Heat Transfer, volume 8,
+       pages 93-160. Academic Press, Inc., New York, 1972.
+    '''
+    return _bisplev_points(parameter, Re, dP_inline_correction_tck)
+
+
+# The RectBivariateSpline objects of the fits above, under the names they have
+# always had; fitting them takes several milliseconds, so they are built on
+# first access of the module attribute and cached. The functions above
+# evaluate the same splines without them.
+_dP_Zukauskas_spline_data = {
+    'dP_staggered_f': (_dP_staggered_Res, np.array([1.25, 1.5, 2, 2.5]), _dP_staggered_Re_parameters, 3, 3),
+    'dP_staggered_correction': (_dP_staggered_correction_parameters, np.array([1E2, 1E3, 1E4, 1E5]), _dP_staggered_correction_Re_parameters, 1, 3),
+    'dP_inline_f': (_dP_inline_Res, np.array([1.25, 1.5, 2, 2.5]), _dP_inline_Re_parameters, 3, 3),
+    'dP_inline_correction': (_dP_inline_correction_parameters, _dP_inline_correction_zs, _dP_inline_correction_Re_parameters, 1, 3),
+}
+_dP_Zukauskas_splines = {}
+
+def _dP_Zukauskas_spline(name):
+    try:
+        return _dP_Zukauskas_splines[name]
+    except KeyError:
+        pass
+    from scipy.interpolate import RectBivariateSpline
+    x, y, z, kx, ky = _dP_Zukauskas_spline_data[name]
+    spline = RectBivariateSpline(x, y, z, kx=kx, ky=ky, s=0.002)
+    _dP_Zukauskas_splines[name] = spline
+    return spline
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _dP_Zukauskas_spline_data:
+            return _dP_Zukauskas_spline(name)
+        raise AttributeError("module %r has no attribute %r" %(__name__, name))
+else:
+    for _name in _dP_Zukauskas_spline_data:
+        globals()[_name] = _dP_Zukauskas_spline(_name)
+
+
 # RectBivariateSpline does a terrible job
 
 #low, high = min(_dP_inline_correction_parameters), max(_dP_inline_correction_parameters)
@@ -1111,12 +1587,21 @@ def dP_Zukauskas(Re, n, ST, SL, D, rho, Vmax):
     Interpolation used with 4 graphs to obtain friction factor and a
     correction factor.
 
+    All of the inputs may also be arrays, which are broadcast against each
+    other; the splines are then evaluated at every point at once, and an
+    array is returned. Banks with equal pitches are taken as inline, and
+    all others as staggered, point by point.
+
     Examples
     --------
     >>> dP_Zukauskas(Re=13943., n=7, ST=0.0313, SL=0.0343, D=0.0164, rho=1.217, Vmax=12.6)
     235.22916169118335
     >>> dP_Zukauskas(Re=13943., n=7, ST=0.0313, SL=0.0313, D=0.0164, rho=1.217, Vmax=12.6)
     217.0750033117563
+    >>> import numpy as np
+    >>> dP_Zukauskas(Re=13943., n=7, ST=0.0313, SL=np.array([0.0343, 0.0313]),
+    ... D=0.0164, rho=1.217, Vmax=12.6)
+    array([235.22916169, 217.07500331])
 
     References
     ----------
@@ -1129,14 +1614,22 @@ def dP_Zukauskas(Re, n, ST, SL, D, rho, Vmax):
     '''
     a = ST/D
     b = SL/D
-    if a == b:
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        # Inline where the pitches are equal, staggered elsewhere
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        inline = a == b
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f = np.where(inline, dP_inline_f_interp(Re, b), dP_staggered_f_interp(Re, a))
+            x = np.where(inline, dP_inline_correction_interp((a - 1.)/(b - 1.), Re),
+                         dP_staggered_correction_interp(a/b, Re))
+    elif a == b:
         parameter = (a-1.)/(b-1.)
-        f = float(dP_inline_f(Re, b))
-        x = float(dP_inline_correction(parameter, Re))
+        f = dP_inline_f_interp(Re, b)
+        x = dP_inline_correction_interp(parameter, Re)
     else:
         parameter = a/b
-        f = float(dP_staggered_f(Re, a))
-        x = float(dP_staggered_correction(parameter, Re))
+        f = dP_staggered_f_interp(Re, a)
+        x = dP_staggered_correction_interp(parameter, Re)
 
     return n*x*f*rho/2*Vmax**2
 
@@ -1201,16 +1694,16 @@ def baffle_correction_Bell(crossflow_tube_fraction, method='spline'):
         J_c = 0.55 + 0.72Fc
     Parameters
     ----------
-    crossflow_tube_fraction : float
+    crossflow_tube_fraction : float or array
         Fraction of tubes which are between baffle tips and not
         in the window, [-]
 
     method : str, optional
         One of 'chebyshev', 'spline', or 'HEDH'
-    
+
     Returns
     -------
-    Jc : float
+    Jc : float or array
         Baffle correction factor in the Bell-Delaware method, [-]
 
     Notes
@@ -1249,7 +1742,9 @@ def baffle_correction_Bell(crossflow_tube_fraction, method='spline'):
        Applications and Rules of Thumb. 2E. Amsterdam: Academic Press, 2014.
     '''
     if method == 'spline':
-        Jc = float(Bell_baffle_configuration_obj(crossflow_tube_fraction))
+        Jc = Bell_baffle_configuration_obj(crossflow_tube_fraction)
+        if not isinstance(crossflow_tube_fraction, np.ndarray):
+            Jc = float(Jc)
     elif method == 'chebyshev':
         return horner(Bell_baffle_configuration_coeffs, 2.0*crossflow_tube_fraction - 1.0)
     elif method == 'HEDH':
@@ -1278,6 +1773,47 @@ Bell_baffle_leakage_tck = implementation_optimize_tck([[0.0, 0.0, 0.0, 0.0, 0.02
                                      0.4540959882735219, 0.35278120580740957, 0.24364672351604122, 0.1606942128340308],
                            3, 1])
 Bell_baffle_leakage_obj = lambda x, z : bisplev(x, z, Bell_baffle_leakage_tck)
+
+
+'''The spline is linear in `z` between its knots at 0, 0.25, 0.5, 0.75 and 1;
+a Chebyshev polynomial in the square root of `x`, which straightens the steep
+fall of the curves near zero, was fit to the curve at each of those knots,
+and is interpolated between them linearly as the spline is. Derived with:
+
+u_to_x = lambda u: (0.5*(u + 1.0))**2*Bell_baffle_leakage_x_max
+f = np.vectorize(lambda u, z: float(Bell_baffle_leakage_obj(u_to_x(u), z)))
+fits = [Chebyshev.interpolate(f, 14, args=(z,)) for z in [0.0, 0.25, 0.5, 0.75, 1.0]]
+[cheb2poly(fit.coef)[::-1].tolist() for fit in fits]
+
+Compared to the spline (both limited to 1) on a 3000 x 201 grid of `x` and
+`z`, the maximum relative error is 0.098%, and the average 0.0075%.
+'''
+Bell_baffle_leakage_coeffs = [
+    [-0.44427371780087316, -0.2908603933076544, 1.9979850116449596,
+     0.8269967341583044, -3.5313827140175666, -0.821552541389453,
+     3.1084730899695767, 0.35313736889077874, -1.5037577453965936,
+     -0.02124201069795118, 0.4326264476745165, -0.09959983891742358,
+     -0.09314753459730937, -0.1649405991172865, 0.8155737852289651],
+    [0.5297048549749889, -1.164609245980076, -1.0853435908005242,
+     3.7606386438564336, -0.0012103219080701333, -4.532248235865351,
+     1.4466166952968593, 2.507012951409295, -1.309216384063227,
+     -0.5554574796688516, 0.48167939796587583, -0.075044182772311,
+     -0.10417578419901768, -0.2127560360263338, 0.7684986271480089],
+    [0.5132289611870268, -1.2853390708090349, -0.9521637270231922,
+     4.129310234638426, -0.2858819343656863, -4.946687817934856,
+     1.6639276374508878, 2.7323431292859865, -1.3344960769384318,
+     -0.6245343653774116, 0.44114557880475647, -0.06972786338625231,
+     -0.09580061029344755, -0.25844304002989327, 0.7258876614652822],
+    [1.0190486684902378, -1.823766413909713, -2.4680637207800533,
+     5.886505113689205, 1.2993482079580276, -7.08893996617558,
+     1.0437507864931046, 3.9309732409450957, -1.3259583070814842,
+     -0.9171953838373199, 0.4835656064965818, -0.06270305691803896,
+     -0.10853232373419117, -0.30218152122843145, 0.6777949878420713],
+    [1.6100432323214287, -2.359790216193748, -4.129281573730259,
+     7.396458873380622, 2.946342210062668, -8.51418615668689,
+     0.2698927243130654, 4.454246015801747, -1.0602221919336392,
+     -1.0317002784312461, 0.43592323875769134, -0.03546003341234703,
+     -0.12340904864058203, -0.32799407625068966, 0.6298513900844751]]
             
     
 def baffle_leakage_Bell(Ssb, Stb, Sm, method='spline'):
@@ -1285,11 +1821,15 @@ def baffle_leakage_Bell(Ssb, Stb, Sm, method='spline'):
     leakage between each baffle.
     Cubic spline interpolation is the default method of retrieving a value
     from the graph, which was digitized with Engauge-Digitizer.
-    
-    The Heat Exchanger Design Handbook [4]_, [5]_ provides a curve 
-    fit as well. This method is not recommended, but can be used via 
+
+    Chebyshev polynomials were also fit to the spline, to a maximum error of
+    0.098%, average error 0.0075%; they are nearly twice as fast and
+    accessible via the 'chebyshev' method.
+
+    The Heat Exchanger Design Handbook [4]_, [5]_ provides a curve
+    fit as well. This method is not recommended, but can be used via
     the method "HEDH".
-        
+
     .. math::
         J_L = 0.44(1-r_s) + [1 - 0.44(1-r_s)]\exp(-2.2r_{lm})
         
@@ -1301,25 +1841,32 @@ def baffle_leakage_Bell(Ssb, Stb, Sm, method='spline'):
         
     Parameters
     ----------
-    Ssb : float
+    Ssb : float or array
         Shell to baffle leakage area, [m^2]
-    Stb : float
+    Stb : float or array
         Total baffle leakage area, [m^2]
-    Sm : float
+    Sm : float or array
         Crossflow area, [m^2]
 
     method : str, optional
-        One of 'spline', or 'HEDH'
-    
+        One of 'spline', 'chebyshev', or 'HEDH'
+
     Returns
     -------
-    Jl : float
+    Jl : float or array
         Baffle leakage factor in the Bell-Delaware method, [-]
 
     Notes
     -----
     Takes ~5 us per call, and 600 us to construct the spline.
     If the `x` parameter is larger than 0.743614, it is clipped to it.
+
+    The spline is linear in `z` = Ssb/(Ssb + Stb) between its knots at 0,
+    0.25, 0.5, 0.75 and 1; the 'chebyshev' method fits a polynomial in the
+    square root of `x` to the spline at each of them, and interpolates
+    between them linearly in the same way.
+
+    Arrays are evaluated at every point at once by all of the methods.
     
     The HEDH curve fits are rather poor and only 6x faster to evaluate. 
     The HEDH example in [6]_'s spreadsheet has an error and uses 0.044 instead
@@ -1329,6 +1876,8 @@ def baffle_leakage_Bell(Ssb, Stb, Sm, method='spline'):
     --------
     >>> baffle_leakage_Bell(1, 3, 8)
     0.5906621282470395
+    >>> baffle_leakage_Bell(1, 3, 8, 'chebyshev')
+    0.5906438981148219
     >>> baffle_leakage_Bell(1, 3, 8, 'HEDH')
     0.5530236260777133
     
@@ -1351,14 +1900,41 @@ def baffle_leakage_Bell(Ssb, Stb, Sm, method='spline'):
        5th edition. Oxford ; Waltham , MA: Butterworth-Heinemann, 2012.
     '''
     x = (Ssb + Stb)/Sm
+    z = Ssb/(Ssb + Stb)
+    if isinstance(x, np.ndarray) or isinstance(z, np.ndarray):
+        x, z = np.broadcast_arrays(np.minimum(x, Bell_baffle_leakage_x_max), z)
+        if np.any(z > 1) or np.any(z < 0):
+            raise ValueError('Ssb/(Ssb + Stb) must be between 0 and 1')
+        if method == 'HEDH':
+            return 0.44*(1.0 - z) + (1.0 - 0.44*(1.0 - z))*np.exp(-2.2*x)
+        if method == 'spline':
+            Jl = _bisplev_points(x, z, Bell_baffle_leakage_tck)
+        elif method == 'chebyshev':
+            # Interpolate the coefficients in z, then evaluate one polynomial
+            u = 2.0*np.sqrt(x/Bell_baffle_leakage_x_max) - 1.0
+            i = np.minimum((4.0*z).astype(int), 3)
+            t = (4.0*z - i)[..., None]
+            coeffs = np.array(Bell_baffle_leakage_coeffs)
+            coeffs = (1.0 - t)*coeffs[i] + t*coeffs[i + 1]
+            Jl = 0.0
+            for k in range(coeffs.shape[-1]):
+                Jl = Jl*u + coeffs[..., k]
+        return np.minimum(Jl, 1.0)
+
     if x > Bell_baffle_leakage_x_max:
         x = Bell_baffle_leakage_x_max
-    z = Ssb/(Ssb + Stb)
     if z > 1 or z < 0:
         raise ValueError('Ssb/(Ssb + Stb) must be between 0 and 1')
     if method == 'spline':
         Jl = Bell_baffle_leakage_obj(x, z)
         Jl = min(float(Jl), 1.0)
+    elif method == 'chebyshev':
+        u = 2.0*sqrt(x/Bell_baffle_leakage_x_max) - 1.0
+        i = int(4.0*z) if z < 1.0 else 3
+        t = 4.0*z - i
+        Jl = ((1.0 - t)*horner(Bell_baffle_leakage_coeffs[i], u)
+              + t*horner(Bell_baffle_leakage_coeffs[i + 1], u))
+        Jl = min(Jl, 1.0)
     elif method == 'HEDH':
         # Hemisphere uses 0.44 as coefficient, rules of thumb uses 0.044 in spreadsheet
         Jl = 0.44*(1.0 - z) + (1.0 - 0.44*(1.0 - z))*exp(-2.2*x)
@@ -1394,13 +1970,94 @@ Bell_bundle_bypass_low_spl = implementation_optimize_tck([[0.0, 0.0, 0.0, 0.0, 0
 Bell_bundle_bypass_low_obj = lambda x, y : bisplev(x, y, Bell_bundle_bypass_low_spl)
 
 
+'''A bivariate Chebyshev series of degree 4 in `x` and 10 in `z` was fit to
+each of the splines by least squares on a 100 x 100 grid of Chebyshev points
+covering `x` from 0 to 0.69532 and `z` from 0 to 0.5; it is stored as the
+power series in u = 2x/0.69532 - 1 of polynomials in v = 4z - 1, the fewest
+polynomials to evaluate. Derived with:
+
+N = 100
+nodes = np.sort(np.cos(np.pi*(np.arange(N) + 0.5)/N))
+U, V = np.meshgrid(nodes, nodes, indexing='ij')
+values = bisplev(0.5*(nodes + 1.0)*Bell_bundle_bypass_x_max, 0.25*(nodes + 1.0), tck)
+A = chebvander2d(U.ravel(), V.ravel(), [4, 10])
+coeffs = np.linalg.lstsq(A, np.ravel(values))[0].reshape(5, 11)
+coeffs = np.apply_along_axis(cheb2poly, 1, np.apply_along_axis(cheb2poly, 0, coeffs))
+coeffs[::-1, ::-1].tolist()
+
+Compared to the splines (both limited to 1) on a 1000 x 501 grid of `x` and
+`z`, the maximum relative errors are 0.084% (turbulent) and 0.122% (laminar),
+and the average errors 0.022% and 0.025%.
+'''
+Bell_bundle_bypass_high_coeffs = [
+    [0.16121122877454752, -0.0798087867704318, -0.4304824999927952,
+     0.2528184213465918, 0.35399954846879034, -0.2549543754658228,
+     -0.0520583478823462, 0.11301424543017766, -0.03595969117549386,
+     -0.032423545532526736, 0.0047475405802388515],
+    [-0.014985937814191885, 0.006378471225612969, 0.0414210594823885,
+     -0.021446432144303085, -0.037356324246747175, 0.025658509605693713,
+     0.005286951173566368, -0.00903851502111891, 0.00479465573037019,
+     0.002826536312747298, -0.003548892473803824],
+    [-0.23068519430773193, 0.12539265002507882, 0.6008971873180133,
+     -0.3838747583020843, -0.45870352253731095, 0.34376386393364966,
+     0.06967776531828024, -0.144726750592074, 0.046785615194027796,
+     0.030383632101834854, 0.0009440246548697989],
+    [0.15345041234209855, -0.10154188491531646, -0.37524412722055445,
+     0.2911664177792073, 0.2275927486921856, -0.1945414556404921,
+     -0.038547356028277496, 0.05184704586875464, -0.029634365287253165,
+     0.09302099058788854, -0.07747643914075372],
+    [0.18303034095356452, -0.1291320891474439, -0.43675970530226005,
+     0.3631281867938679, 0.23718465671139682, -0.21695323157381924,
+     -0.04252851346164513, 0.05697786980275178, -0.027869176012789522,
+     0.10105457301439916, 0.9119746893002157]]
+
+Bell_bundle_bypass_low_coeffs = [
+    [-0.05199613664183289, 0.029245213331634545, 0.13411634802072392,
+     -0.08846437145866304, -0.09919244283133732, 0.07563576543431472,
+     0.0152827789086033, -0.03468473462953045, -0.0017470921402923945,
+     0.01630068513772987, 0.005471402287932581],
+    [0.06111831619029218, -0.035978720330787084, -0.15548270220462346,
+     0.10715042973432753, 0.10974105049937333, -0.08588848799771118,
+     -0.017274331521257735, 0.01589823197277409, -0.00506785938516318,
+     0.004552651591383046, 0.0012692987531270662],
+    [-0.03408425788257219, 0.030885456029170477, 0.07210576024387017,
+     -0.08113005146079133, -0.01492716957939666, 0.027530065041591,
+     0.004977280314881538, 0.02686586601439922, 0.0065547065978088515,
+     -0.03806025415708586, -0.0007356624453757621],
+    [0.1521832203046154, -0.09964836295883861, -0.3735691149908107,
+     0.2866780358362516, 0.23022466241539602, -0.1949207067394557,
+     -0.03868298970279173, 0.058482202504250805, -0.027562107841908354,
+     0.09634883276308034, -0.08944201927921268],
+    [0.25039749337321027, -0.1702421387881139, -0.6061785935531374,
+     0.48410359399984143, 0.35193328750903025, -0.30888852962699903,
+     -0.060943864892361296, 0.058349854238555515, -0.0291125780976476,
+     0.12436604862603756, 0.9063645670500599]]
+
+
+def _bundle_bypassing_Bell_chebyshev(x, z, laminar):
+    '''Evaluates the fits of the turbulent or laminar bundle bypassing
+    splines, for floats or arrays within their domain.
+    '''
+    coeffs = Bell_bundle_bypass_low_coeffs if laminar else Bell_bundle_bypass_high_coeffs
+    u = 2.0*x/Bell_bundle_bypass_x_max - 1.0
+    v = 4.0*z - 1.0
+    Jb = 0.0
+    for row in coeffs:
+        Jb = Jb*u + horner(row, v)
+    return Jb
+
+
 def bundle_bypassing_Bell(bypass_area_fraction, seal_strips, crossflow_rows,
                           laminar=False, method='spline'):
     r'''Calculate the bundle bypassing effect `Jb` according to the 
     Bell-Delaware method for heat exchanger design.   
     Cubic spline interpolation is the default method of retrieving a value
     from the graph, which was digitized with Engauge-Digitizer.
-    
+
+    Bivariate Chebyshev polynomials were also fit to the splines, to a maximum
+    error of 0.084% (turbulent) and 0.122% (laminar), average error 0.025%;
+    they are nearly twice as fast and accessible via the 'chebyshev' method.
+
     The Heat Exchanger Design Handbook [4]_, [5]_ provides a curve 
     fit as well. This method is not recommended, but can be used via 
     the method "HEDH":
@@ -1412,23 +2069,23 @@ def bundle_bypassing_Bell(bypass_area_fraction, seal_strips, crossflow_rows,
         
     Parameters
     ----------
-    bypass_area_fraction : float
+    bypass_area_fraction : float or array
         Fraction of the crossflow area which is not blocked by a baffle or 
         anything else and available for bypassing, [-]
-    seal_strips : int
+    seal_strips : int or array
         Number of seal strips per side of a baffle added to prevent bypassing,
         [-]
-    crossflow_rows : int
+    crossflow_rows : int or array
         The number of tube rows in the crosslfow of the baffle, [-]
     laminar : bool
         Whether to use the turbulent correction values or the laminar ones;
         the Bell-Delaware method uses a Re criteria of 100 for this, [-]
     method : str, optional
-        One of 'spline', or 'HEDH'
+        One of 'spline', 'chebyshev', or 'HEDH'
 
     Returns
     -------
-    Jb : float
+    Jb : float or array
         Bundle bypassing effect correction factor in the Bell-Delaware method, 
         [-]
 
@@ -1437,13 +2094,19 @@ def bundle_bypassing_Bell(bypass_area_fraction, seal_strips, crossflow_rows,
     Takes ~5 us per call, and 1.2 ms to construct both the turbulent and
     laminar splines.
     If the `bypass_area_fraction` parameter is larger than 0.695, it is clipped
-    to it.
+    to it. The splines are flat at 1 beyond a ratio of seal strips to
+    crossflow rows of 0.5, to which the 'chebyshev' method clips that ratio.
+
+    Arrays are evaluated at every point at once by all of the methods.
 
     Examples
     --------
     >>> bundle_bypassing_Bell(0.5, 5, 25)
     0.8469611760884599
-    
+
+    >>> bundle_bypassing_Bell(0.5, 5, 25, method='chebyshev')
+    0.8470025109045178
+
     >>> bundle_bypassing_Bell(0.5, 5, 25, method='HEDH')
     0.8483210970579099
     
@@ -1460,12 +2123,31 @@ def bundle_bypassing_Bell(bypass_area_fraction, seal_strips, crossflow_rows,
     '''
     z = seal_strips/crossflow_rows
     x = bypass_area_fraction
+    if isinstance(x, np.ndarray) or isinstance(z, np.ndarray):
+        x, z = np.broadcast_arrays(x, z)
+        if method == 'HEDH':
+            c = 1.35 if laminar else 1.25
+            return np.exp(-c*x*(1.0 - (2.0*z)**(1/3.)))
+        x = np.minimum(x, Bell_bundle_bypass_x_max)
+        if method == 'spline':
+            tck = Bell_bundle_bypass_low_spl if laminar else Bell_bundle_bypass_high_spl
+            Jb = _bisplev_points(x, z, tck)
+        elif method == 'chebyshev':
+            Jb = _bundle_bypassing_Bell_chebyshev(x, np.minimum(z, 0.5), laminar)
+        return np.minimum(Jb, 1.0)
+
     if method == 'spline':
         obj = Bell_bundle_bypass_low_obj if laminar else Bell_bundle_bypass_high_obj
         if x > Bell_bundle_bypass_x_max:
             x = Bell_bundle_bypass_x_max
         Jb = obj(x, z)
         Jb = min(float(Jb), 1.0)
+    elif method == 'chebyshev':
+        if x > Bell_bundle_bypass_x_max:
+            x = Bell_bundle_bypass_x_max
+        if z > 0.5:
+            z = 0.5
+        Jb = min(_bundle_bypassing_Bell_chebyshev(x, z, laminar), 1.0)
     elif method == 'HEDH':
         c = 1.35 if laminar else 1.25
         Jb = exp(-c*x*(1.0 - (2.0*z)**(1/3.)))
@@ -1603,3 +2285,577 @@ def laminar_correction_Bell(Re, total_row_passes):
     if Jr < 0.4:
         Jr = 0.4
     return Jr
+
+
+# Ideal tube bank j and f factor coefficients of the Bell-Delaware method [1]_
+# for each tube layout angle; (a3, a4, b3, b4) and rows of (a1, a2, b1, b2)
+# for Re < 10, 10-100, 100-1E3, 1E3-1E4, and > 1E4
+Bell_ideal_bank_Re_limits = [10.0, 100.0, 1E3, 1E4]
+Bell_ideal_bank_coeffs = {
+    30: ((1.450, 0.519, 7.00, 0.500),
+         [[1.400, -0.667, 48.000, -1.000],
+          [1.360, -0.657, 45.100, -0.973],
+          [0.593, -0.477, 4.570, -0.476],
+          [0.321, -0.388, 0.486, -0.152],
+          [0.321, -0.388, 0.372, -0.123]]),
+    45: ((1.930, 0.500, 6.59, 0.520),
+         [[1.550, -0.667, 32.000, -1.000],
+          [0.498, -0.656, 26.200, -0.913],
+          [0.730, -0.500, 3.500, -0.476],
+          [0.370, -0.396, 0.333, -0.136],
+          [0.370, -0.396, 0.303, -0.126]]),
+    90: ((1.187, 0.370, 6.30, 0.378),
+         [[0.970, -0.667, 35.000, -1.000],
+          [0.900, -0.631, 32.100, -0.963],
+          [0.408, -0.460, 6.090, -0.602],
+          [0.107, -0.266, 0.0815, 0.022],
+          [0.370, -0.395, 0.391, -0.148]]),
+}
+
+# Pitch parallel and normal to the flow, and the effective pitch for the
+# crossflow area, as fractions of the tube pitch
+Bell_layout_pitches = {30: (0.866, 0.5, 1.0), 45: (0.707, 0.707, 0.707),
+                       90: (1.0, 1.0, 1.0)}
+
+
+class BellDelawareShell(object):
+    r'''Shell-side rating of a segmentally baffled shell and tube heat
+    exchanger by the Bell-Delaware method [1]_, [2]_, [3]_. All of the
+    geometric quantities of the method are calculated once, when the shell
+    is created, and are available as attributes; :obj:`rate` then evaluates
+    the heat transfer coefficient and pressure drop for arrays of flow rates
+    and fluid properties at once.
+
+    The heat transfer coefficient is that of an ideal tube bank, corrected
+    for baffle configuration, leakage, bundle bypassing, unequal baffle
+    spacing, and laminar flow:
+
+    .. math::
+        h = j_i C_p \frac{\dot m}{S_m} Pr^{-2/3}
+        \left(\frac{\mu}{\mu_w}\right)^{0.14} J_c J_l J_b J_s J_r
+
+    .. math::
+        j_i = a_1\left(\frac{1.33}{p/D_o}\right)^a Re^{a_2};\;
+        a = \frac{a_3}{1 + 0.14Re^{a_4}};\;
+        Re = \frac{D_o \dot m}{S_m \mu}
+
+    The pressure drop is the sum of those across the crossflow sections
+    between the baffle tips, through the baffle windows, and across the two
+    end sections:
+
+    .. math::
+        \Delta P = [(N_b - 1)\Delta P_{bi}R_b + N_b\Delta P_{wi}]R_l
+        + 2\Delta P_{bi}\left(1 + \frac{N_{tcw}}{N_{tcc}}\right)R_b R_s
+
+    .. math::
+        \Delta P_{bi} = 2 f_i N_{tcc}\frac{(\dot m/S_m)^2}{\rho}
+        \left(\frac{\mu_w}{\mu}\right)^{0.14}
+
+    Parameters
+    ----------
+    DShell : float
+        Shell inner diameter, [m]
+    Do : float
+        Tube outer diameter, [m]
+    pitch : float
+        Tube pitch, [m]
+    Ntubes : int
+        Total number of tubes in the bundle, [-]
+    baffle_cut : float
+        Height of the baffle cut as a fraction of the shell inner diameter,
+        [-]
+    baffle_spacing : float
+        Spacing between the central baffles, [m]
+    baffles : int
+        Number of baffles, [-]
+    angle : float, optional
+        Tube layout angle; 30, 45, or 90, [degrees]
+    DBundle : float, optional
+        Diameter of the circle enclosing the outer tubes of the bundle; the
+        shell diameter less the clearance of :obj:`ht.hx.shell_clearance`
+        by default, [m]
+    baffle_spacing_in : float, optional
+        Spacing between the inlet tubesheet and the first baffle; the
+        central spacing by default, [m]
+    baffle_spacing_out : float, optional
+        Spacing between the last baffle and the outlet tubesheet; the
+        central spacing by default, [m]
+    seal_strips : int, optional
+        Number of pairs of sealing strips, [-]
+    shell_baffle_clearance : float, optional
+        Diametral clearance between the shell and the baffles; by default
+        3.1 mm plus 0.004 times the shell diameter [2]_, [m]
+    tube_baffle_clearance : float, optional
+        Diametral clearance between the tubes and the baffle holes; by
+        default the TEMA clearance of :obj:`ht.hx.D_baffle_holes` for tubes
+        unsupported across two baffle spacings, [m]
+    method : str, optional
+        Method passed to :obj:`baffle_correction_Bell`,
+        :obj:`baffle_leakage_Bell` and :obj:`bundle_bypassing_Bell`; one of
+        'spline', 'chebyshev' or 'HEDH', [-]
+
+    Notes
+    -----
+    The geometry follows [2]_; the attributes are the crossflow area `Sm`,
+    the shell to baffle and tube to baffle leakage areas `Ssb` and `Stb`,
+    the net window flow area `Sw`, the hydraulic diameter of the window
+    `Dw`, the fractions of tubes in crossflow `Fc` and in one window `Fw`,
+    the fraction of the crossflow area open to bypassing `Fsbp`, the numbers
+    of tube rows crossed between the baffle tips `Ntcc` and effectively
+    crossed in each window `Ntcw`, and the total number of tube rows crossed
+    `Nc`. The correction factors which depend only on the geometry, `Jc` and
+    `Jl`, are calculated once as well.
+
+    Flow is taken to be laminar for Re < 100, where the bypass, unequal
+    spacing, and window pressure drop relations change.
+
+    Examples
+    --------
+    >>> shell = BellDelawareShell(DShell=0.489, Do=0.01905, pitch=0.0254,
+    ... Ntubes=224, baffle_cut=0.25, baffle_spacing=0.127, baffles=30,
+    ... seal_strips=1)
+    >>> res = shell.rate(m=5.2, rho=850., Cp=2100., k=0.13, mu=1.2E-3)
+    >>> round(res['h'], 2), round(res['dP'], 1)
+    (656.58, 6145.2)
+    >>> round(res['Jc'], 4), round(res['Jl'], 4), round(res['Jb'], 4)
+    (1.0249, 0.5806, 0.9783)
+
+    References
+    ----------
+    .. [1] Bell, Kenneth J. Delaware Method for Shell-Side Design. In Heat
+       Transfer Equipment Design, by Shah, R.  K., Eleswarapu Chinna Subbarao,
+       and R. A. Mashelkar. CRC Press, 1988.
+    .. [2] Schlünder, Ernst U, and International Center for Heat and Mass
+       Transfer. Heat Exchanger Design Handbook. Washington:
+       Hemisphere Pub. Corp., 1987.
+    .. [3] Serth, R. W., Process Heat Transfer: Principles,
+       Applications and Rules of Thumb. 2E. Amsterdam: Academic Press, 2014.
+    '''
+    def __init__(self, DShell, Do, pitch, Ntubes, baffle_cut, baffle_spacing,
+                 baffles, angle=30, DBundle=None, baffle_spacing_in=None,
+                 baffle_spacing_out=None, seal_strips=0,
+                 shell_baffle_clearance=None, tube_baffle_clearance=None,
+                 method='spline'):
+        from ht.hx import shell_clearance, D_baffle_holes
+        if angle not in Bell_ideal_bank_coeffs:
+            raise Exception('Tube layout angle must be 30, 45, or 90 degrees')
+        if DBundle is None:
+            DBundle = DShell - shell_clearance(DShell=DShell)
+        if baffle_spacing_in is None:
+            baffle_spacing_in = baffle_spacing
+        if baffle_spacing_out is None:
+            baffle_spacing_out = baffle_spacing
+        if shell_baffle_clearance is None:
+            shell_baffle_clearance = 3.1E-3 + 0.004*DShell
+        if tube_baffle_clearance is None:
+            tube_baffle_clearance = D_baffle_holes(Do, 2.0*baffle_spacing) - Do
+
+        self.DShell, self.Do, self.pitch, self.Ntubes = DShell, Do, pitch, Ntubes
+        self.baffle_cut, self.baffle_spacing, self.baffles = baffle_cut, baffle_spacing, baffles
+        self.angle, self.DBundle, self.seal_strips = angle, DBundle, seal_strips
+        self.baffle_spacing_in = baffle_spacing_in
+        self.baffle_spacing_out = baffle_spacing_out
+
+        pitch_parallel, pitch_normal, pitch_effective = Bell_layout_pitches[angle]
+        pitch_parallel *= pitch
+        Dctl = DBundle - Do
+        # Angles subtended by the baffle cut at the shell and at the circle
+        # through the centers of the outer tubes
+        theta_ds = 2.0*acos(1.0 - 2.0*baffle_cut)
+        theta_ctl = 2.0*acos(min(max(DShell*(1.0 - 2.0*baffle_cut)/Dctl, -1.0), 1.0))
+        self.Fw = Fw = (theta_ctl - sin(theta_ctl))/(2.0*pi)
+        self.Fc = 1.0 - 2.0*Fw
+        Ntw = Fw*Ntubes
+
+        self.Sm = Sm = baffle_spacing*(DShell - DBundle + Dctl/(pitch_effective*pitch)*(pitch - Do))
+        self.Fsbp = baffle_spacing*(DShell - DBundle)/Sm
+        self.Ssb = Ssb = pi*DShell*0.5*shell_baffle_clearance*(1.0 - theta_ds/(2.0*pi))
+        self.Stb = Stb = 0.25*pi*((Do + tube_baffle_clearance)**2 - Do*Do)*Ntubes*(1.0 - Fw)
+        self.Sw = Sw = DShell*DShell/8.0*(theta_ds - sin(theta_ds)) - 0.25*pi*Do*Do*Ntw
+        self.Dw = 4.0*Sw/(pi*Do*Ntw + DShell*theta_ds)
+        self.Ntcc = Ntcc = DShell*(1.0 - 2.0*baffle_cut)/pitch_parallel
+        self.Ntcw = Ntcw = 0.8/pitch_parallel*(DShell*baffle_cut - 0.5*(DShell - Dctl))
+        self.Nc = (Ntcc + Ntcw)*(baffles + 1)
+        self.rs = rs = Ssb/(Ssb + Stb)
+        self.rlm = rlm = (Ssb + Stb)/Sm
+        self.rss = rss = seal_strips/Ntcc
+
+        self.Jc = baffle_correction_Bell(self.Fc, method=method)
+        self.Jl = baffle_leakage_Bell(Ssb, Stb, Sm, method=method)
+        # Factors which differ in laminar flow, as (turbulent, laminar)
+        self._Jb = [bundle_bypassing_Bell(self.Fsbp, seal_strips, Ntcc, laminar, method=method)
+                    for laminar in (False, True)]
+        self._Js = [unequal_baffle_spacing_Bell(baffles, baffle_spacing, baffle_spacing_in,
+                                                baffle_spacing_out, laminar)
+                    for laminar in (False, True)]
+        self._Jrr = (10.0/self.Nc)**0.18
+
+        self.Rl = exp(-1.33*(1.0 + rs)*rlm**(-0.15*(1.0 + rs) + 0.8))
+        self._Rb = [exp(-C*self.Fsbp*(1.0 - (2.0*rss)**(1/3.))) if rss < 0.5 else 1.0
+                    for C in (3.7, 4.5)]
+        self._Rs = [0.5*((baffle_spacing/baffle_spacing_in)**(2.0 - n)
+                         + (baffle_spacing/baffle_spacing_out)**(2.0 - n))
+                    for n in (0.2, 1.0)]
+
+        (a3, a4, b3, b4), rows = Bell_ideal_bank_coeffs[angle]
+        self._ideal_exponents = a3, a4, b3, b4
+        self._ideal_coeffs = np.array(rows)
+
+    def ideal_bank(self, Re):
+        r'''Returns the j and f factors of an ideal tube bank with the
+        layout of this shell, for an array of Reynolds numbers.
+
+        Parameters
+        ----------
+        Re : float or array
+            Shell Reynolds number in the Bell-Delaware method, [-]
+
+        Returns
+        -------
+        j : float or array
+            Colburn j factor of the ideal tube bank, [-]
+        f : float or array
+            Friction factor of the ideal tube bank, [-]
+        '''
+        Re = np.asarray(Re, dtype=float)
+        a1, a2, b1, b2 = self._ideal_coeffs[np.searchsorted(Bell_ideal_bank_Re_limits, Re, side='right')].T
+        a3, a4, b3, b4 = self._ideal_exponents
+        ratio = 1.33*self.Do/self.pitch
+        j = a1*ratio**(a3/(1.0 + 0.14*Re**a4))*Re**a2
+        f = b1*ratio**(b3/(1.0 + 0.14*Re**b4))*Re**b2
+        return j, f
+
+    def rate(self, m, rho, Cp, k, mu, mu_w=None):
+        r'''Calculates the shell-side heat transfer coefficient and pressure
+        drop, and all of the factors they are made of. All inputs may be
+        arrays, and are broadcast against each other.
+
+        Parameters
+        ----------
+        m : float or array
+            Mass flow rate of the shell-side fluid, [kg/s]
+        rho : float or array
+            Density of the shell-side fluid, [kg/m^3]
+        Cp : float or array
+            Heat capacity of the shell-side fluid, [J/kg/K]
+        k : float or array
+            Thermal conductivity of the shell-side fluid, [W/m/K]
+        mu : float or array
+            Viscosity of the shell-side fluid, [Pa*s]
+        mu_w : float or array, optional
+            Viscosity of the shell-side fluid at the tube wall temperature;
+            if not given, no wall correction is applied, [Pa*s]
+
+        Returns
+        -------
+        results : dict
+            * h : Shell-side heat transfer coefficient, [W/m^2/K]
+            * dP : Shell-side pressure drop, excluding the nozzles, [Pa]
+            * Re : Shell Reynolds number, [-]
+            * j : Colburn j factor of the ideal tube bank, [-]
+            * f : Friction factor of the ideal tube bank, [-]
+            * h_ideal : Heat transfer coefficient of the ideal tube bank,
+              [W/m^2/K]
+            * Jc, Jl, Jb, Js, Jr : Correction factors for baffle
+              configuration, baffle leakage, bundle bypassing, unequal baffle
+              spacing, and laminar flow, [-]
+            * dP_ideal : Pressure drop across one ideal crossflow section,
+              [Pa]
+            * dP_crossflow : Pressure drop across all of the crossflow
+              sections between baffle tips, [Pa]
+            * dP_window : Pressure drop through all of the baffle windows,
+              [Pa]
+            * dP_ends : Pressure drop across both end sections, [Pa]
+            * Rl, Rb, Rs : Pressure drop correction factors for baffle
+              leakage, bundle bypassing, and unequal end baffle spacing, [-]
+
+        Notes
+        -----
+        The results are floats if all of the inputs are scalars, and arrays
+        of their broadcast shape otherwise.
+        '''
+        m, rho, Cp, k, mu = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                                   for v in (m, rho, Cp, k, mu)])
+        G = m/self.Sm
+        Re = self.Do*G/mu
+        laminar = (Re < 100.0).astype(int)
+        if mu_w is None:
+            wall = 1.0
+        else:
+            wall = (mu/mu_w)**0.14
+
+        j, f = self.ideal_bank(Re)
+        Pr = Cp*mu/k
+        h_ideal = j*Cp*G*Pr**(-2/3.)*wall
+        Jb = np.take(self._Jb, laminar)
+        Js = np.take(self._Js, laminar)
+        # laminar_correction_Bell, for every Re at once
+        Jr = np.maximum(self._Jrr + np.clip((20.0 - Re)/80.0, -1.0, 0.0)*(self._Jrr - 1.0), 0.4)
+        h = h_ideal*self.Jc*self.Jl*Jb*Js*Jr
+
+        Ntcw, baffles = self.Ntcw, self.baffles
+        Rb = np.take(self._Rb, laminar)
+        Rs = np.take(self._Rs, laminar)
+        dP_ideal = 2.0*f*self.Ntcc*G*G/(rho*wall)
+        # Window flow, with the geometric mean of the window and crossflow
+        # mass velocities
+        Gw2 = m*m/(self.Sm*self.Sw)
+        dP_wi = np.where(laminar,
+                         26.0*mu*np.sqrt(Gw2)/rho*(Ntcw/(self.pitch - self.Do)
+                                                  + self.baffle_spacing/self.Dw**2)
+                         + Gw2/rho,
+                         (2.0 + 0.6*Ntcw)*Gw2/(2.0*rho))
+        dP_crossflow = (baffles - 1)*dP_ideal*Rb*self.Rl
+        dP_window = baffles*dP_wi*self.Rl
+        dP_ends = 2.0*dP_ideal*(1.0 + Ntcw/self.Ntcc)*Rb*Rs
+
+        results = {'h': h, 'dP': dP_crossflow + dP_window + dP_ends, 'Re': Re,
+                   'j': j, 'f': f, 'h_ideal': h_ideal, 'Jc': self.Jc,
+                   'Jl': self.Jl, 'Jb': Jb, 'Js': Js, 'Jr': Jr,
+                   'dP_ideal': dP_ideal, 'dP_crossflow': dP_crossflow,
+                   'dP_window': dP_window, 'dP_ends': dP_ends, 'Rl': self.Rl,
+                   'Rb': Rb, 'Rs': Rs}
+        shape = np.broadcast(Re, wall).shape
+        if not shape:
+            return {key: float(value) for key, value in results.items()}
+        zeros = np.zeros(shape)
+        for key, value in results.items():
+            results[key] = value + zeros
+        return results
+
+
+def _tube_row_factors(averages):
+    '''Returns the correction factors of each individual row of a tube bank
+    whose running means are the bank-averaged row correction factors
+    `averages` for 1, 2, ... rows, followed by 1 for the rows beyond them.
+    '''
+    averages = np.asarray(averages, dtype=float)
+    totals = averages*np.arange(1, averages.shape[-1] + 1)
+    factors = np.diff(totals, axis=-1, prepend=0.0)
+    return np.concatenate((factors, np.ones(averages.shape[:-1] + (1,))), axis=-1)
+
+
+# Correction factors of each row, counted from the gas inlet, indexed as the
+# bank-averaged tables they are derived from
+Zukauskas_row_factors = _tube_row_factors(Zukauskas_Czs_table)
+ESDU_73031_row_factors = _tube_row_factors(ESDU_73031_F2_table)
+
+
+def _row_values(value, T):
+    '''Returns a property for every row; `value` is either a constant, a
+    table with one value per row, or a function of the row temperatures.
+    '''
+    if callable(value):
+        value = value(T)
+    return np.asarray(value, dtype=float) + np.zeros(T.shape)
+
+
+def _march_rows(a, b, T_in):
+    '''Returns the temperatures before and after each row for the linear
+    recurrence T[i+1] = a[i]*T[i] + b[i] along the last axis, by composing
+    the maps of all rows with a parallel prefix scan of log2(rows)
+    vectorized steps.
+    '''
+    a, b = a.copy(), b.copy()
+    shift = 1
+    while shift < a.shape[-1]:
+        # Apply the map of the rows `shift` before each row first
+        b[..., shift:] = a[..., shift:]*b[..., :-shift] + b[..., shift:]
+        a[..., shift:] = a[..., shift:]*a[..., :-shift]
+        shift *= 2
+    T_in = np.asarray(T_in, dtype=float)[..., None] + np.zeros(a.shape[:-1] + (1,))
+    return np.concatenate((T_in, a*T_in + b), axis=-1)
+
+
+def tube_bank_march(m, T_in, T_tubes, rows, A_row, A_min, Do, pitch_parallel,
+                    pitch_normal, rho, Cp, k, mu, R_tubes=0.0,
+                    method='Zukauskas', tol=1E-9, maxiter=100):
+    r'''Rates a gas flowing across a bank of bare tubes row by row, with the
+    heat transfer coefficient, pressure drop and properties of the gas
+    evaluated separately at every row. The properties of the gas may each be
+    a constant, a table with one value per row, or a function of the gas
+    temperature; the temperature of the tubes, and any resistance to heat
+    transfer besides that of the gas, may differ from row to row.
+
+    Each row exchanges heat with the gas as a single stream at the constant
+    temperature of its tubes:
+
+    .. math::
+        T_{i+1} = T_{t,i} + (T_i - T_{t,i})\exp\left(-\frac{U_i A_{row}}
+        {\dot m C_{p,i}}\right)
+
+    .. math::
+        \frac{1}{U_i} = \frac{1}{h_i} + R_{t,i}
+
+    The heat transfer coefficient of each row is that of an infinitely deep
+    bank at the Reynolds and Prandtl numbers of the row, times a correction
+    factor for the position of the row. Those factors are derived from the
+    bank-averaged tube row corrections `F` of the method, so that the
+    average over the first `N` rows is `F(N)`:
+
+    .. math::
+        f_i = i F(i) - (i - 1) F(i - 1)
+
+    All of the rows are solved together, and where the properties are
+    functions of temperature, they are re-evaluated at the mean gas
+    temperature of each row and the solution repeated until the temperatures
+    stop changing. Many banks are rated at once by giving arrays of any of
+    the inputs.
+
+    Parameters
+    ----------
+    m : float or array
+        Mass flow rate of the gas, [kg/s]
+    T_in : float or array
+        Temperature of the gas entering the first row, [K]
+    T_tubes : float or array
+        Temperature of the tubes; constant, or one value for each row along
+        the last axis, [K]
+    rows : int
+        Number of rows of tubes in the direction of flow, [-]
+    A_row : float or array
+        Outside area of the tubes of one row, [m^2]
+    A_min : float or array
+        Minimum flow area of the gas between the tubes of a row, [m^2]
+    Do : float or array
+        Outer diameter of the tubes, [m]
+    pitch_parallel : float or array
+        Distance between tube center along a line parallel to the flow;
+        has been called `longitudinal` pitch, `pp`, `s2`, `SL`, and `p2`, [m]
+    pitch_normal : float or array
+        Distance between tube centers in a line 90° to the line of flow;
+        has been called the `transverse` pitch, `pn`, `s1`, `ST`, and `p1`, [m]
+    rho : float, array, or callable
+        Density of the gas; a constant, one value for each row along the last
+        axis, or a function of an array of the mean gas temperatures of the
+        rows returning an array of it, [kg/m^3]
+    Cp : float, array, or callable
+        Heat capacity of the gas, specified in the same way as `rho`,
+        [J/kg/K]
+    k : float, array, or callable
+        Thermal conductivity of the gas, specified in the same way as `rho`,
+        [W/m/K]
+    mu : float, array, or callable
+        Viscosity of the gas, specified in the same way as `rho`, [Pa*s]
+    R_tubes : float or array, optional
+        Resistance to heat transfer of the tube wall, fouling and the fluid
+        inside the tubes, with respect to their outside area; constant, or
+        one value for each row along the last axis, [m^2*K/W]
+    method : str, optional
+        Correlation of the heat transfer coefficient and its row correction;
+        'Zukauskas' for :obj:`Nu_Zukauskas_Bejan` and
+        :obj:`Zukauskas_tube_row_correction`, or 'ESDU' for
+        :obj:`Nu_ESDU_73031` and :obj:`ESDU_tube_row_correction`, [-]
+    tol : float, optional
+        Largest change in any temperature between two successive solutions,
+        relative to the largest difference between the inlet gas and tube
+        temperatures, at which the solution is accepted, [-]
+    maxiter : int, optional
+        Maximum number of times the properties are re-evaluated, [-]
+
+    Returns
+    -------
+    results : dict
+        * Q : Heat transferred from the gas to the tubes, [W]
+        * T_out : Temperature of the gas leaving the last row, [K]
+        * dP : Pressure drop of the gas across the bank, [Pa]
+        * T : Temperatures of the gas before the first row and after each
+          row, along the last axis, [K]
+        * Q_rows : Heat transferred in each row, [W]
+        * dP_rows : Pressure drop across each row, [Pa]
+        * h_rows : Heat transfer coefficient of the gas at each row, [W/m^2/K]
+        * U_rows : Overall heat transfer coefficient of each row, [W/m^2/K]
+        * Re_rows : Reynolds number of the gas at each row, with respect to
+          the tube outer diameter and the velocity through `A_min`, [-]
+        * iterations : Number of times the properties were evaluated, [-]
+
+    Notes
+    -----
+    Per-bank inputs may be arrays of the shape of the banks, and per-row
+    inputs and tabulated properties arrays of that shape followed by the
+    number of rows; all of the results have the shape of the banks, and the
+    per-row results that shape followed by the number of rows (plus one for
+    `T`). With a single bank, the totals are floats.
+
+    The pressure drop of each row is that of :obj:`dP_Zukauskas` for one row
+    at the properties of the row; the properties are functions of
+    temperature only, and are not corrected for the pressure drop or for
+    the temperature of the tube wall.
+
+    The temperatures of all of the rows are found with products of the
+    linear relations between the temperatures before and after each row,
+    in log2(`rows`) vectorized steps.
+
+    Examples
+    --------
+    Cooling flue gas across 20 rows of staggered tubes carrying boiling water:
+
+    >>> res = tube_bank_march(m=5., T_in=700., T_tubes=450., rows=20, A_row=10.,
+    ... A_min=2.5, Do=0.0508, pitch_parallel=0.0889, pitch_normal=0.1016,
+    ... rho=lambda T: 101325.*0.029/(8.314*T), Cp=lambda T: 940. + 0.2*T,
+    ... k=lambda T: 0.0241*(T/273.)**0.81, mu=lambda T: 1.716E-5*(T/273.)**0.7)
+    >>> round(res['Q'], 1), round(res['T_out'], 3), round(res['dP'], 2)
+    (997175.8, 512.068, 28.01)
+    '''
+    if method == 'Zukauskas':
+        row_factors, infinite_rows = Zukauskas_row_factors, 20
+    elif method == 'ESDU':
+        row_factors, infinite_rows = ESDU_73031_row_factors, 10
+    else:
+        raise Exception("Method must be one of 'Zukauskas' or 'ESDU'")
+
+    # Per-bank inputs gain an axis for the rows
+    m, A_row, A_min, Do, pitch_parallel, pitch_normal = [
+        np.asarray(value, dtype=float)[..., None]
+        for value in (m, A_row, A_min, Do, pitch_parallel, pitch_normal)]
+    # Tabulated properties may give the shape of the banks as well
+    tables = [np.asarray(value, dtype=float) for value in (rho, Cp, k, mu)
+              if not callable(value)]
+    shape = np.broadcast(np.asarray(T_in)[..., None], m, A_row, A_min, Do,
+                         pitch_parallel, pitch_normal, T_tubes, R_tubes,
+                         *tables).shape[:-1] + (rows,)
+    T_tubes = np.asarray(T_tubes, dtype=float) + np.zeros(shape)
+    R_tubes = np.asarray(R_tubes, dtype=float) + np.zeros(shape)
+    staggered = np.abs(1 - pitch_normal/pitch_parallel) > 0.05
+    position = np.minimum(np.arange(1, rows + 1), row_factors.shape[-1]) - 1
+    constant = not (callable(rho) or callable(Cp) or callable(k) or callable(mu))
+    dT = np.max(np.abs(np.asarray(T_in, dtype=float)[..., None] - T_tubes))
+
+    # The properties are first evaluated at the inlet temperature
+    T = np.asarray(T_in, dtype=float)[..., None] + np.zeros(shape[:-1] + (rows + 1,))
+    for iterations in range(1, maxiter + 1):
+        Tm = 0.5*(T[..., 1:] + T[..., :-1])
+        Cps = _row_values(Cp, Tm)
+        ks = _row_values(k, Tm)
+        mus = _row_values(mu, Tm)
+        Re = m*Do/(A_min*mus)
+        Pr = Cps*mus/ks
+        if method == 'Zukauskas':
+            Nu = Nu_Zukauskas_Bejan(Re, Pr, infinite_rows, pitch_parallel, pitch_normal)
+            configuration = np.where(staggered, np.where(Re < 1000, 1, 2), 0)
+        else:
+            Nu = Nu_ESDU_73031(Re, Pr, infinite_rows, pitch_parallel, pitch_normal)
+            configuration = staggered.astype(int) + np.zeros(shape, dtype=int)
+        h = Nu*ks/Do*row_factors[configuration, position]
+        U = 1.0/(1.0/h + R_tubes)
+        a = np.exp(-U*A_row/(m*Cps))
+        T_new = _march_rows(a, (1.0 - a)*T_tubes, T_in)
+        change = np.max(np.abs(T_new - T))
+        T = T_new
+        if constant or change <= tol*dT:
+            break
+    else:
+        raise Exception('The temperatures of the rows did not converge in '
+                        '%d iterations' %maxiter)
+
+    rhos = _row_values(rho, Tm)
+    dP_rows = dP_Zukauskas(Re=Re, n=1, ST=pitch_normal, SL=pitch_parallel, D=Do,
+                           rho=rhos, Vmax=m/(rhos*A_min))
+    dP_rows = dP_rows + np.zeros(shape)
+    Q_rows = m*Cps*(T[..., :-1] - T[..., 1:])
+    Q, T_out, dP = np.sum(Q_rows, axis=-1), T[..., -1], np.sum(dP_rows, axis=-1)
+    if not shape[:-1]:
+        Q, T_out, dP = float(Q), float(T_out), float(dP)
+    return {'Q': Q, 'T_out': T_out, 'dP': dP, 'T': T, 'Q_rows': Q_rows,
+            'dP_rows': dP_rows, 'h_rows': h, 'U_rows': U, 'Re_rows': Re,
+            'iterations': iterations}
@@ -23,7 +23,7 @@ SOFTWARE.'''
 from __future__ import division
 from math import pi
 from fluids import Reynolds, Prandtl
-from ht.conv_internal import laminar_entry_Seider_Tate
+from ht.conv_internal import laminar_entry_Seider_Tate, _tuple_getter
 
 __all__ = ['Davis_David', 'Elamvaluthi_Srinivas', 'Groothuis_Hendal',
            'Hughmark', 'Knott', 'Kudirka_Grosh_McFadden', 'Martin_Sims',
@@ -828,26 +828,53 @@ def h_two_phase(m, x, D, Cpl, kl, rhol=None, rhog=None, mul=None,
     >>> h_two_phase(m=1, x=.9, D=.3, alpha=.9, rhol=1000, Cpl=2300, kl=.6, mu_b=1E-3, mu_w=1.2E-3, L=5, method='Aggour')
     420.9347146885667
     '''
-    def list_methods(variables):
-        methods = []
-        for method in conv_two_phase_methods_ranked:
-            args = conv_two_phase_methods[method][1]
-            if all(variables[i] is not None for i in args):
-                methods.append(method)
-        return methods
-    
+    values = (m, x, D, Cpl, kl, rhol, rhog, mul, mu_b, mu_w, mug, L, alpha)
     if available_methods:
-        return list_methods(dict(locals()))
+        return _h_two_phase_methods(values)
     if not method:
-        method = list_methods(dict(locals()))[0]
+        method = _h_two_phase_methods(values)[0]
+    return _h_two_phase_bind(method)(*values)
 
-    if method in conv_two_phase_methods:
-        f, args = conv_two_phase_methods[method]
-        
-        kwargs = {}
-        for arg in args:
-            kwargs[arg] = locals()[arg]
-        return f(**kwargs)
-    else:
+
+_h_two_phase_args = ('m', 'x', 'D', 'Cpl', 'kl', 'rhol', 'rhog', 'mul', 'mu_b', 
+                     'mu_w', 'mug', 'L', 'alpha')
+
+def _h_two_phase_methods(values):
+    methods = []
+    for method in conv_two_phase_methods_ranked:
+        args = conv_two_phase_methods[method][1]
+        if all(values[_h_two_phase_args.index(i)] is not None for i in args):
+            methods.append(method)
+    return methods
+
+
+_h_two_phase_bound = {}
+
+def _h_two_phase_bind(method):
+    '''Returns a function with the arguments of :obj:`h_two_phase` which
+    evaluates the correlation `method` directly.
+    '''
+    if method in _h_two_phase_bound:
+        return _h_two_phase_bound[method]
+    if method not in conv_two_phase_methods:
         raise Exception("Correlation name not recognized; the availble methods "
                         "are %s." %(list(conv_two_phase_methods.keys())))
+    f, args = conv_two_phase_methods[method]
+    indexes = [_h_two_phase_args.index(arg) for arg in args]
+    if f.__code__.co_varnames[:len(args)] == args:
+        get = _tuple_getter(indexes)
+        call = lambda values: f(*get(values))
+    else:
+        call = lambda values: f(**{arg: values[i] for arg, i in zip(args, indexes)})
+
+    def h(m, x, D, Cpl, kl, rhol=None, rhog=None, mul=None, mu_b=None, 
+          mu_w=None, mug=None, L=None, alpha=None):
+        return call((m, x, D, Cpl, kl, rhol, rhog, mul, mu_b, mu_w, mug, L, alpha))
+    _h_two_phase_bound[method] = h
+    return h
+
+
+def _h_two_phase_resolve(Method=None, **inputs):
+    if not Method:
+        Method = _h_two_phase_methods([inputs.get(i) for i in _h_two_phase_args])[0]
+    return _h_two_phase_bind(Method)
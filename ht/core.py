@@ -21,7 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
-from math import log
+from math import log1p
 from fluids.numerics import i1, i0, k1, k0
 
 __all__ =['LMTD', 'wall_factor', 'is_heating_property', 
@@ -80,6 +80,10 @@ def LMTD(Thi, Tho, Tci, Tco, counterflow=True):
     
     For the same problem with the co-current case, the limit evaluates to a
     temperature difference of zero.
+    
+    The logarithm is evaluated as :math:`\ln(1 + (\Delta T_2 - \Delta T_1)
+    /\Delta T_1)` with `log1p`, which is accurate when the two differences
+    are nearly equal.
 
     Examples
     --------
@@ -107,7 +111,8 @@ def LMTD(Thi, Tho, Tci, Tco, counterflow=True):
         dTF1 = Thi-Tci
         dTF2 = Tho-Tco
     try:
-        return (dTF2 - dTF1)/log(dTF2/dTF1)
+        # log1p keeps the result accurate when the differences are nearly equal
+        return (dTF2 - dTF1)/log1p((dTF2 - dTF1)/dTF1)
     except (ZeroDivisionError, ValueError):
         if counterflow:
             return dTF1
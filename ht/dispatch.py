@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+from ht import conv_internal, conv_external, conv_free_immersed, conv_two_phase
+from ht import boiling_nucleic
+
+__all__ = ['resolve']
+
+_resolvers = {
+    'Nu_conv_internal': conv_internal._Nu_conv_internal_resolve,
+    'Nu_external_cylinder': conv_external._Nu_external_cylinder_resolve,
+    'Nu_vertical_cylinder': conv_free_immersed._Nu_vertical_cylinder_resolve,
+    'Nu_horizontal_cylinder': conv_free_immersed._Nu_horizontal_cylinder_resolve,
+    'h_two_phase': conv_two_phase._h_two_phase_resolve,
+    'h_nucleic': boiling_nucleic._h_nucleic_resolve,
+}
+
+_resolved = {}
+
+
+def _input_kind(value):
+    # The correlations are chosen from the values of strings, and only from
+    # whether the other inputs are given (and for scalars, zero)
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and value == 0:
+        return 0.0
+    return 1.0
+
+
+def resolve(name, Method=None, **inputs):
+    r'''Returns a function which calculates the same result as the method
+    selecting function `name` (one of 'Nu_conv_internal', 'h_nucleic', 
+    'h_two_phase', 'Nu_external_cylinder', 'Nu_vertical_cylinder', or 
+    'Nu_horizontal_cylinder'), for inputs of the same kind as the example
+    `inputs`. 
+
+    The selecting functions decide which correlation to use each time they
+    are called; here the choice is made once, from which of the example 
+    inputs (passed as keyword arguments) are specified, and the correlation
+    is bound to a function which takes the same arguments as `name`. Only 
+    whether the example inputs are specified matters, except for strings 
+    such as `CAS` whose values are used; they may also be arrays. The bound
+    functions are cached, so calling `resolve` again with the same kinds of
+    inputs is cheap.
+    
+    Parameters
+    ----------
+    name : str
+        Name of the method selecting function to resolve, [-]
+    Method : str, optional
+        Name of the correlation to use; if not specified, the one `name`
+        would select for the example inputs is used, [-]
+
+    Returns
+    -------
+    f : callable
+        Function which takes the same arguments as `name` (except the ones
+        for selecting a method) and returns its result, [-]
+
+    Notes
+    -----
+    For `Nu_conv_internal`, the laminar, turbulent, and liquid metal 
+    correlations are all resolved and the one matching `Re` and `Pr` is
+    used on each call, as `Nu_conv_internal` does. 
+    
+    Inputs which are specified as zero are treated as not specified by
+    most of the selecting functions; they are resolved separately.
+    
+    Examples
+    --------
+    >>> Nu = resolve('Nu_conv_internal', Re=1E5, Pr=.7, eD=1E-4)
+    >>> Nu(Re=1E5, Pr=.7, eD=1E-4)
+    188.80794855893413
+    '''
+    kinds = dict((k, _input_kind(v)) for k, v in inputs.items())
+    key = (name, Method, tuple(sorted(kinds.items())))
+    if key in _resolved:
+        return _resolved[key]
+    if name not in _resolvers:
+        raise Exception('Function %s does not select a method; the functions '
+                        'which can be resolved are %s.' %(name, sorted(_resolvers.keys())))
+    # The resolvers see only the kinds of the inputs, so the result depends
+    # on nothing else in the key
+    f = _resolvers[name](Method, **kinds)
+    _resolved[key] = f
+    return f
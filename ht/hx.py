@@ -21,14 +21,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
-from math import exp, log, floor, sqrt, factorial, tanh  # tanh= 1/coth
+from math import exp, expm1, log, log1p, floor, sqrt, tanh  # tanh= 1/coth
 import math
+import threading
+import types
 from pprint import pprint
 from bisect import bisect, bisect_left, bisect_right
 from fluids.constants import inch, foot, degree_Fahrenheit, hour, Btu
 from fluids.numerics import horner, newton, ridder
-from fluids.numerics import bisect as sp_bisect
-from fluids.numerics import iv
 from fluids.piping import BWG_integers, BWG_inch, BWG_SI
 import numpy as np
 
@@ -41,7 +41,8 @@ __all__ = ['effectiveness_from_NTU', 'NTU_from_effectiveness', 'calc_Cmin',
 'temperature_effectiveness_air_cooler',
 'P_NTU_method',  'NTU_from_P_basic',
 'NTU_from_P_J', 'NTU_from_P_G', 'NTU_from_P_E', 'NTU_from_P_H',
-'NTU_from_P_plate', 'check_tubing_TEMA', 'get_tube_TEMA',
+'NTU_from_P_plate', 'plate_effectiveness_kernel', 'check_tubing_TEMA', 'get_tube_TEMA',
+'TEMATubeCatalog', 'TEMA_tube_catalog',
 'DBundle_min', 'shell_clearance', 'baffle_thickness', 'D_baffle_holes',
 'L_unsupported_max', 'Ntubes', 'size_bundle_from_tubecount',
 'Ntubes_Perrys', 'Ntubes_VDI', 'Ntubes_Phadkeb', 
@@ -54,7 +55,7 @@ __all__ = ['effectiveness_from_NTU', 'NTU_from_effectiveness', 'calc_Cmin',
 R_value = foot*foot*degree_Fahrenheit*hour/Btu
 
 
-def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
+def effectiveness_from_NTU(NTU, Cr, subtype='counterflow', derivatives=False):
     r'''Returns the effectiveness of a heat exchanger at a specified heat 
     capacity rate, number of transfer units, and configuration. The following
     configurations are supported:
@@ -109,15 +110,15 @@ def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
         \epsilon = 1 - \exp\left[\left(\frac{1}{C_r}\right)
         (NTU)^{0.22}\left\{\exp\left[C_r(NTU)^{0.78}\right]-1\right\}\right]
         
-    The exact solution for crossflow (fluids unmixed) uses SciPy's quad
-    to perform an integral (there is no analytical integral solution available).
-    :math:`I_0(v)` is the modified Bessel function of the first kind. This formula
-    was developed in [4]_.
+    The exact solution for crossflow (fluids unmixed) has no closed form; it
+    is evaluated from the following series, in which :math:`P(a, x)` is the
+    regularized lower incomplete gamma function. The formula is discussed in
+    [4]_. Terms well below :math:`C_r \cdot NTU` are one and those well above 
+    it are negligible, so only the terms near it are summed.
     
     .. math::
-        \epsilon = \frac{1}{C_r} - \frac{\exp(-C_r \cdot NTU)}{2(C_r NTU)^2}
-        \int_0^{2 NTU\sqrt{C_r}} \left(1 + NTU - \frac{v^2}{4C_r NTU}\right)
-        \exp\left(-\frac{v^2}{4C_r NTU}\right)v I_0(v) dv
+        \epsilon = \frac{1}{C_r \cdot NTU}\sum_{n=0}^\infty P(n+1, NTU)
+        P(n+1, C_r \cdot NTU)
 
     For cross-flow (single-pass) heat exchangers with Cmax mixed, Cmin unmixed:
 
@@ -147,11 +148,21 @@ def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
         'crossflow approximate', 'crossflow, mixed Cmin', 
         'crossflow, mixed Cmax', 'boiler', 'condenser', 'S&T', or 'nS&T' where 
         n is the number of shell and tube exchangers in a row.
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `effectiveness` with respect to `NTU` and `Cr`, [-]
+
 
     Returns
     -------
     effectiveness : float
         The thermal effectiveness of the heat exchanger, [-]
+    deff_dNTU : float
+        Partial derivative of `effectiveness` with respect to `NTU`, returned
+        only if `derivatives` is True, [-]
+    deff_dCr : float
+        Partial derivative of `effectiveness` with respect to `Cr`, returned
+        only if `derivatives` is True, [-]
 
     Notes
     -----
@@ -205,7 +216,7 @@ def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
     Crossflow, somewhat higher effectiveness:
         
     >>> effectiveness_from_NTU(NTU=5, Cr=0.7, subtype='crossflow')
-    0.8444821799748551
+    0.8444821799748553
 
     Counterflow, better than either crossflow or parallel flow:
 
@@ -275,14 +286,13 @@ def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
        and Mass Transfer 36, no. 2 (February 1, 2009): 121-24. 
        doi:10.1016/j.icheatmasstransfer.2008.10.012.
     '''
+    if derivatives:
+        return _P1_derivatives(lambda Cr, NTU: effectiveness_from_NTU(NTU, Cr, subtype), Cr, NTU)
     if Cr > 1:
         raise Exception('Heat capacity rate must be less than 1 by definition.')
         
     if subtype == 'counterflow':
-        if Cr < 1:
-            return (1. - exp(-NTU*(1. - Cr)))/(1. - Cr*exp(-NTU*(1. - Cr)))
-        elif Cr == 1:
-            return NTU/(1. + NTU)
+        return Pc(NTU, Cr)
     elif subtype == 'parallel':
             return (1. - exp(-NTU*(1. + Cr)))/(1. + Cr)
     elif 'S&T' in subtype:
@@ -298,11 +308,7 @@ def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
             effectiveness = (term - 1.)/(term - Cr)
         return effectiveness
     elif subtype == 'crossflow':
-        def to_int(v, NTU, Cr):
-            return (1. + NTU - v*v/(4.*Cr*NTU))*exp(-v*v/(4.*Cr*NTU))*v*float(iv(0, v))
-        from scipy.integrate import quad
-        int_term = quad(to_int, 0, 2.*NTU*Cr**0.5, args=(NTU, Cr))[0]
-        return 1./Cr - exp(-Cr*NTU)/(2.*(Cr*NTU)**2)*int_term
+        return _crossflow_unmixed(NTU, Cr)
     elif subtype == 'crossflow approximate':
         return 1. - exp(1./Cr*NTU**0.22*(exp(-Cr*NTU**0.78) - 1.))
     elif subtype == 'crossflow, mixed Cmin':
@@ -373,10 +379,10 @@ def NTU_from_effectiveness(effectiveness, Cr, subtype='counterflow'):
     there is no analytical solution. However, the function is monotonically
     increasing, and a closed-form solver is implemented as 'crossflow approximate',
     guaranteed to solve for :math:`10^{-7} < NTU < 10^5`. The exact solution
-    for 'crossflow' uses the approximate solution's initial guess as a starting
-    point for Newton's method. Some issues are noted at effectivenesses higher
-    than 0.9 and very high NTUs, because the numerical integral term approaches
-    1 too quickly.
+    for 'crossflow' is solved with Newton's method and the analytical 
+    derivative of its series, starting from the NTU of a counterflow exchanger;
+    as this is always lower than the solution and the effectiveness is concave,
+    the solver does not overshoot.
 
     For cross-flow (single-pass) heat exchangers with Cmax mixed, Cmin unmixed:
 
@@ -434,7 +440,7 @@ def NTU_from_effectiveness(effectiveness, Cr, subtype='counterflow'):
     Crossflow, somewhat higher effectiveness:
         
     >>> NTU_from_effectiveness(effectiveness=0.8444821799748551, Cr=0.7, subtype='crossflow')
-    5.000000000000859
+    5.000000000000006
 
     Counterflow, better than either crossflow or parallel flow:
 
@@ -524,12 +530,17 @@ possible for this configuration; the maximum effectiveness possible is %s.' % (m
         NTU = -(1. + Cr*Cr)**-0.5*log((E - 1.)/(E + 1.))
         return shells*NTU
     elif subtype == 'crossflow':
-        # Can't use a bisect solver here because at high NTU there's a derivative of 0
-        # due to the integral term not changing when it's very near one
-        guess = NTU_from_effectiveness(effectiveness, Cr, 'crossflow approximate')
+        # Newton's method with the derivative of the series solution; a
+        # bracketing solver struggles with the flat curve at high NTU.
+        # Counterflow needs the least NTU of any arrangement, and as the
+        # effectiveness is concave in NTU Newton's method converges to the
+        # root from below without overshooting it.
+        guess = NTU_from_effectiveness(effectiveness, Cr, 'counterflow')
         def to_solve(NTU, Cr, effectiveness):
-            return effectiveness_from_NTU(NTU, Cr, subtype='crossflow') - effectiveness
-        return newton(to_solve, guess, args=(Cr, effectiveness))
+            return _crossflow_unmixed(NTU, Cr) - effectiveness
+        def to_solve_der(NTU, Cr, effectiveness):
+            return _crossflow_unmixed(NTU, Cr, derivative=True)[1]
+        return newton(to_solve, guess, fprime=to_solve_der, args=(Cr, effectiveness))
     elif subtype == 'crossflow approximate':
         # This will fail if NTU is more than 10,000 or less than 1E-7, but
         # this is extremely unlikely to occur in normal usage.
@@ -856,9 +867,12 @@ def Pc(x, y):
 
     Notes
     -----
-    Used with the P-NTU plate method for heat exchanger design. At y =-1,
-    this function has a ZeroDivisionError but can be evaluated at the limit
-    to be :math:`z = \frac{x}{1+x}`.
+    Used with the P-NTU plate method for heat exchanger design. At y = 1,
+    the expression above is 0/0 but has the limit 
+    :math:`z = \frac{x}{1+x}`. It is evaluated as
+    :math:`x/(x + \zeta/(\exp(\zeta) - 1))` with :math:`\zeta = x(1 - y)`,
+    which is continuous through y = 1, does not lose precision near it, and
+    cannot overflow for y > 1.
 
     Examples
     --------
@@ -872,11 +886,110 @@ def Pc(x, y):
     .. [2] Rohsenow, Warren and James Hartnett and Young Cho. Handbook of Heat
        Transfer, 3E. New York: McGraw-Hill, 1998.
     '''
-    try:
-        term = exp(-x*(1. - y))
-        return (1. - term)/(1. - y*term)
-    except ZeroDivisionError:
-        return x/(1. + x)
+    return x/(x + _z_over_expm1(x*(1. - y)))
+
+
+def _z_over_expm1(z):
+    '''Returns z/(exp(z) - 1), which is 1 at z = 0 and cannot overflow.
+    '''
+    if z > 700.:
+        return z*exp(-z)
+    elif z == 0.0:
+        return 1.0
+    return z/expm1(z)
+
+
+def _z_over_expm1_derivative(z, g):
+    '''Returns the derivative of :obj:`_z_over_expm1` at `z`, given its 
+    value `g` there. A series is used near z = 0 where the closed form 
+    cancels.
+    '''
+    if abs(z) < 1E-3:
+        return -0.5 + z/6. - z*z*z/180.
+    elif z < -700.:
+        return g/z
+    return g*(1./z + 1./expm1(-z))
+
+
+def _Poisson_tails(z, n_min, n_max=None):
+    r'''Returns the Poisson terms :math:`t_n = e^{-z}z^n/n!` and the
+    regularized lower incomplete gamma functions
+    :math:`P(n+1, z) = \sum_{m > n} t_m` for n from `n_min` to `n_max`, or
+    until the terms become negligible if `n_max` is not given. The upper
+    tail is summed directly so small values of P keep their precision.
+    Terms more than nine standard deviations below the mean are taken as
+    zero (and P as one).
+    '''
+    start = max(n_min, int(z - 9.*sqrt(z)))
+    if n_max is not None and start > n_max:
+        count = n_max - n_min + 1
+        return [0.0]*count, [1.0]*count
+    term = exp(-z + start*log(z) - math.lgamma(start + 1.))
+    terms = [term]
+    m = start
+    term_max = term
+    while True:
+        m += 1
+        term *= z/m
+        if term > term_max:
+            term_max = term
+        elif (n_max is None or m > n_max) and term < 1E-17*term_max:
+            break
+        terms.append(term)
+    tails = [0.0]*len(terms)
+    tail = term
+    for i in range(len(terms)-1, -1, -1):
+        tails[i] = tail
+        tail += terms[i]
+    offset = start - n_min
+    if n_max is not None:
+        terms, tails = terms[:n_max - start + 1], tails[:n_max - start + 1]
+    return [0.0]*offset + terms, [1.0]*offset + tails
+
+
+def _crossflow_unmixed(NTU1, R1, derivative=False):
+    r'''Exact thermal effectiveness of a single pass crossflow exchanger with
+    both fluids unmixed, from the series solution discussed in [1]_:
+
+    .. math::
+        P_1 = \frac{1}{R_1 NTU_1}\sum_{n=0}^\infty P(n+1, NTU_1)
+        P(n+1, R_1 NTU_1)
+
+    where P is the regularized lower incomplete gamma function. If
+    `derivative` is True, the derivative of `P1` with respect to `NTU1` is
+    returned as well. The series is symmetric in its two arguments; only
+    the terms near the smaller one need to be summed, as both functions are
+    one below it.
+
+    References
+    ----------
+    .. [1] Triboix, Alain. "Exact and Approximate Formulas for Cross Flow 
+       Heat Exchangers with Unmixed Fluids." International Communications in
+       Heat and Mass Transfer 36, no. 2 (February 1, 2009): 121-24. 
+    '''
+    x, y = NTU1, R1*NTU1
+    if x == 0.0 or y == 0.0:
+        # Limit of one stream having an infinite heat capacity rate
+        P1 = -expm1(-x)
+        return (P1, exp(-x)) if derivative else P1
+    # The derivatives of x and y with respect to NTU1 are 1 and R1
+    if y < x:
+        small, big, d_small, d_big = y, x, R1, 1.
+    else:
+        small, big, d_small, d_big = x, y, 1., R1
+    n_min = max(0, int(small - 9.*sqrt(small)))
+    t_small, P_small = _Poisson_tails(small, n_min)
+    n_max = n_min + len(P_small) - 1
+    t_big, P_big = _Poisson_tails(big, n_min, n_max)
+    S = float(n_min)
+    dS = 0.0
+    for i in range(len(P_small)):
+        S += P_small[i]*P_big[i]
+        dS += d_small*t_small[i]*P_big[i] + d_big*P_small[i]*t_big[i]
+    P1 = S/y
+    if not derivative:
+        return P1
+    return P1, (dS - S/x)/y
 
 
 def effectiveness_NTU_method(mh, mc, Cph, Cpc, subtype='counterflow', Thi=None, 
@@ -1049,7 +1162,54 @@ def effectiveness_NTU_method(mh, mc, Cph, Cpc, subtype='counterflow', Thi=None,
             'Tci': Tci, 'Tco': Tco} 
         
 
-def temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce=True):
+_air_cooler_log_binomials = {}
+
+
+def _air_cooler_coefficients(N):
+    '''Returns the logarithms of the binomial coefficients C(N, k) for k
+    from 0 to `N`, cached for each `N`.
+    '''
+    try:
+        return _air_cooler_log_binomials[N]
+    except KeyError:
+        log_binomials = [math.lgamma(N + 1.) - math.lgamma(k + 1.) - math.lgamma(N - k + 1.)
+                         for k in range(N + 1)]
+        _air_cooler_log_binomials[N] = log_binomials
+        return log_binomials
+
+
+def _air_cooler_rows(R1, NTU1, N):
+    r'''Temperature effectiveness of an air cooler with `N` rows and one
+    pass. With :math:`K = 1 - \exp(-NTU_1/N)` and :math:`x = NKR_1`, the 
+    double sum of :obj:`temperature_effectiveness_air_cooler` rearranges to
+    
+    .. math::
+        P_1 = \frac{1}{x}\sum_{j=0}^{N-1} P(j+1, x)\;
+        \text{Pr}[B(N, K) > j]
+
+    where P is the regularized lower incomplete gamma function (the
+    probability of more than j Poisson events of mean x) and B(N, K) is a
+    binomial random variable. Every term is positive and bounded, and both
+    factors are accumulated from their tails, so this takes O(N) operations.
+    '''
+    a = NTU1/N
+    K = -expm1(-a)
+    x = N*K*R1
+    if x == 0.0:
+        # Limit of the air having an infinite heat capacity rate
+        return -expm1(-NTU1)
+    log_binomials = _air_cooler_coefficients(N)
+    log_K = log(K)
+    P = _Poisson_tails(x, 0, N - 1)[1]
+    tail = 0.0
+    tot = 0.0
+    for j in range(N - 1, -1, -1):
+        tail += exp(log_binomials[j + 1] + (j + 1)*log_K - (N - j - 1)*a)
+        tot += P[j]*tail
+    return tot/x
+
+
+def temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce=True, derivatives=False):
     r'''Returns temperature effectiveness `P1` of an air cooler with 
     a specified heat capacity ratio, number of transfer units `NTU1`,
     number of rows `rows`, and number of passes `passes`. The supported cases
@@ -1137,32 +1297,32 @@ def temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce=True):
         If True, the number of passes or rows, if otherwise unsupported, will
         be replaced with a similar number to allow the calculation to proceed,
         [-]
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
         
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 (process fluid side) [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
-    For the 1-pass case, the exact formula used can take a while to compute for
-    large numbers of tube rows; 100 us for 20 rows, 1 ms for 50 rows.
-    Floating point rounding behavior can also be an issue for large numbers of
-    tube passes, leading to thermal effectivenesses larger than one being
-    returned:
-        
-    >>> temperature_effectiveness_air_cooler(1e-10, 100, rows=150, passes=1.0)
-    1.000026728092962
-    
-    Furthermore, as a factorial of the number of tube counts is used, there
-    comes a point where standard floats are not able to hold the intermediate
-    calculations values and an error will occur:
+    For the 1-pass case, the double sum is not evaluated as written; it is
+    rearranged into a single sum of products of Poisson and binomial
+    probabilities, which takes time proportional to the number of rows and
+    does not lose precision or overflow for large numbers of rows.
         
-    >>> temperature_effectiveness_air_cooler(.5, 1.1, rows=200, passes=1.0)
-    Traceback (most recent call last):
-    ...
-    OverflowError: long int too large to convert to float
+    >>> temperature_effectiveness_air_cooler(.5, 1.1, rows=200, passes=1)
+    0.5744610145657314
     
 
     Examples
@@ -1183,37 +1343,10 @@ def temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce=True):
        design." Council for Scientific and Industrial Research, Special Report
        Chem. 223, Pretoria, South Africa (1972).
     '''
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce), R1, NTU1)
     if passes == 1:
-        N = rows
-        K = 1. - exp(-NTU1/N)
-        NKR1 = N*K*R1
-        NTU1_N = NTU1/N
-        top = N*exp(N*K*R1)
-        # Precalculate integer factorials up to N
-        factorials = [factorial(i) for i in range(N)]
-        K_powers = [K**j for j in range(0, N+1)]
-        NKR1_powers = [NKR1**k for k in range(0, N+1)]
-        exp_terms = [exp(i*NTU1_N) for i in range(-N+1, 1)]
-        NKR1_powers_over_factorials = [NKR1_powers[k]/factorials[k] 
-                                       for k in range(N)]
-        
-        # Precompute even more...
-        NKR1_pows_div_factorials = [0]
-        for k in NKR1_powers_over_factorials:
-            NKR1_pows_div_factorials.append(NKR1_pows_div_factorials[-1]+k)
-        NKR1_pows_div_factorials.pop(0)
-        
-        final_speed = [i*j for i, j in zip(K_powers, NKR1_pows_div_factorials)]
-        
-        tot = 0.
-        for i in range(1, N):
-            for j in range(0, i+1):
-                # can't optimize the factorial
-                prod = factorials[i]/(factorials[i-j]*factorials[j])
-                tot1 = prod*exp_terms[j-i-1]
-                tot += tot1*final_speed[j]
-    
-        return 1./R1*(1. - 1./(top/(1.+tot)))
+        return _air_cooler_rows(R1, NTU1, rows)
     elif rows == passes == 2:
         K = 1. - exp(-0.5*NTU1)
         xi = 0.5*K + (1. - 0.5*K)*exp(2.*K*R1)
@@ -1265,7 +1398,7 @@ def temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce=True):
             raise Exception('Number of passes and rows not supported.')
 
 
-def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
+def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow', derivatives=False):
     r'''Returns temperature effectiveness `P1` of a heat exchanger with 
     a specified heat capacity ratio, number of transfer units `NTU1`,
     and of type `subtype`. This function performs the calculations for the
@@ -1291,19 +1424,20 @@ def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
 
     For cross-flow (single-pass) heat exchangers with both fluids unmixed
     (this configuration is symmetric), there are two solutions available;
-    a frequently cited approximation and an exact solution which uses
-    a numerical integration developed in [4]_. The approximate solution is:
+    a frequently cited approximation and an exact series solution discussed
+    in [4]_. The approximate solution is:
 
     .. math::
         P_1 \approx 1 - \exp\left[\frac{NTU_1^{0.22}}{R_1}
         (\exp(-R_1 NTU_1^{0.78})-1)\right]
 
-    The exact solution for crossflow (single pass, fluids unmixed) is:
+    The exact solution for crossflow (single pass, fluids unmixed) is the 
+    following series, where :math:`P(a, x)` is the regularized lower 
+    incomplete gamma function:
         
     .. math::
-        \epsilon = \frac{1}{R_1} - \frac{\exp(-R_1 \cdot NTU_1)}{2(R_1 NTU_1)^2}
-        \int_0^{2 NTU_1\sqrt{R_1}} \left(1 + NTU_1 - \frac{v^2}{4R_1 NTU_1}
-        \right)\exp\left(-\frac{v^2}{4R_1 NTU_1}\right)v I_0(v) dv
+        P_1 = \frac{1}{R_1 NTU_1}\sum_{n=0}^\infty P(n+1, NTU_1)
+        P(n+1, R_1 NTU_1)
 
     For cross-flow (single-pass) heat exchangers with fluid 1 mixed, fluid 2
     unmixed:
@@ -1347,18 +1481,29 @@ def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
         The type of heat exchanger; one of 'counterflow', 'parallel', 
         'crossflow', 'crossflow approximate', 'crossflow, mixed 1', 
         'crossflow, mixed 2', 'crossflow, mixed 1&2'.
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
         
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
-    The crossflow case is an approximation only. There is an actual
-    solution involving an infinite sum. This was implemented, but found to 
-    differ substantially so the approximation is used instead.
+    The exact crossflow series converges quickly; only the terms near the 
+    smaller of `NTU1` and `R1*NTU1` need to be summed, as the others are one 
+    or negligible. This is several times faster than numerically integrating
+    the equivalent integral of [4]_, and remains accurate at high `NTU1`.
 
     Examples
     --------
@@ -1378,9 +1523,11 @@ def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
        and Mass Transfer 36, no. 2 (February 1, 2009): 121-24. 
        doi:10.1016/j.icheatmasstransfer.2008.10.012.
     '''
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_basic(R1, NTU1, subtype), R1, NTU1)
     if subtype == 'counterflow':
         # Same as TEMA 1 pass
-        P1 = (1.0 - exp(-NTU1*(1 - R1)))/(1.0 - R1*exp(-NTU1*(1-R1)))
+        P1 = Pc(NTU1, R1)
     elif subtype == 'parallel':
         P1 = (1.0 - exp(-NTU1*(1 + R1)))/(1.0 + R1)
     elif subtype == 'crossflow approximate':
@@ -1389,14 +1536,7 @@ def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
         # but is found not to be within the 1% claimed of this equation
         P1 = 1.0 - exp(NTU1**0.22/R1*(exp(-R1*NTU1**0.78) - 1.))
     elif subtype == 'crossflow':
-        # TODO attempt chebyshev approximation of P1 as a function of R1, NTU1 (for stability)
-        R1_NTU1_4_inv = 1.0/(4.*R1*NTU1)
-        def to_int(v):
-            v2 = v*v
-            return (1. + NTU1 - v2*R1_NTU1_4_inv)*exp(-v2*R1_NTU1_4_inv)*v*float(iv(0, v))
-        from scipy.integrate import quad
-        int_term = quad(to_int, 0.0, 2.*NTU1*R1**0.5)[0]# args=(NTU1, R1)
-        P1 = 1./R1 - exp(-R1*NTU1)/(2.*(R1*NTU1)**2)*int_term
+        P1 = _crossflow_unmixed(NTU1, R1)
     elif subtype == 'crossflow, mixed 1':
         # Not symmetric
         K = 1 - exp(-R1*NTU1)
@@ -1414,7 +1554,7 @@ def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
     return P1
 
 
-def temperature_effectiveness_TEMA_J(R1, NTU1, Ntp):
+def temperature_effectiveness_TEMA_J(R1, NTU1, Ntp, derivatives=False):
     r'''Returns temperature effectiveness `P1` of a TEMA J type heat exchanger  
     with a specified heat capacity ratio, number of transfer units `NTU1`,
     and of number of tube passes `Ntp`. The supported cases are as follows:
@@ -1486,12 +1626,22 @@ def temperature_effectiveness_TEMA_J(R1, NTU1, Ntp):
         = 2) [-]
     Ntp : int
         Number of tube passes, 1, 2, or 4, [-]
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
         
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
@@ -1514,34 +1664,44 @@ def temperature_effectiveness_TEMA_J(R1, NTU1, Ntp):
     .. [3] Rohsenow, Warren and James Hartnett and Young Cho. Handbook of Heat
        Transfer, 3E. New York: McGraw-Hill, 1998.
     '''
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_TEMA_J(R1, NTU1, Ntp), R1, NTU1)
+    # All terms are written with exp(-NTU1) instead of A = exp(NTU1), so
+    # nothing can overflow at high NTU1
     if Ntp == 1:
-        A = exp(NTU1)
-        B = exp(-NTU1*R1/2.)
         if R1 != 2:
-            P1 = 1./R1*(1. - (2. - R1)*(2.*A + R1*B)/(2. + R1)/(2.*A - R1/B))
+            # (2A + R1*B)/(2A - R1/B), divided through by 2A, or multiplied
+            # through by B when R1 > 2
+            B_A = exp(-NTU1*(1. + R1/2.))
+            if R1 < 2:
+                ratio = (2. + R1*B_A)/(2. - R1*exp(-NTU1*(1. - R1/2.)))
+            else:
+                AB = exp(NTU1*(1. - R1/2.))
+                ratio = (2.*AB + R1*B_A*AB)/(2.*AB - R1)
+            P1 = 1./R1*(1. - (2. - R1)*ratio/(2. + R1))
         else:
-            P1 = 0.5*(1. - (1. + A**-2)/2./(1. + NTU1))
+            P1 = 0.5*(1. - (1. + exp(-2.*NTU1))/2./(1. + NTU1))
     elif Ntp == 2:
         lambda1 = (1. + R1*R1/4.)**0.5
-        A = exp(NTU1)
-        D = 1. + lambda1*A**((lambda1 - 1.)/2.)/(A**lambda1 - 1.)
-        C = A**((1+lambda1)/2.)/(lambda1 - 1. + (1. + lambda1)*A**lambda1)
-        B = (A**lambda1 + 1.)/(A**lambda1 - 1.)
+        A_lambda = exp(-lambda1*NTU1) # A**-lambda1
+        D = 1. - lambda1*exp(-NTU1*(lambda1 + 1.)/2.)/expm1(-lambda1*NTU1)
+        C = exp(-NTU1*(lambda1 - 1.)/2.)/((lambda1 - 1.)*A_lambda + 1. + lambda1)
+        B = -(1. + A_lambda)/expm1(-lambda1*NTU1)
         P1 = 1./(1. + R1/2. + lambda1*B - 2.*lambda1*C*D)
     elif Ntp == 4:
         lambda1 = (1. + R1**2/16.)**0.5
-        E = exp(R1*NTU1/2.)
-        A = exp(NTU1)
-        D = 1. + lambda1*A**((lambda1-1)/2.)/(A**lambda1-1.)
-        C = A**((1+lambda1)/2.)/(lambda1 - 1. + (1. + lambda1)*A**lambda1)
-        B = (A**lambda1 + 1.)/(A**lambda1-1)
-        P1 = 1./(1. + R1/4.*(1. + 3.*E)/(1. + E) + lambda1*B - 2.*lambda1*C*D)
+        E = exp(-R1*NTU1/2.) # 1/E in the original expression
+        A_lambda = exp(-lambda1*NTU1) # A**-lambda1
+        D = 1. - lambda1*exp(-NTU1*(lambda1 + 1.)/2.)/expm1(-lambda1*NTU1)
+        C = exp(-NTU1*(lambda1 - 1.)/2.)/((lambda1 - 1.)*A_lambda + 1. + lambda1)
+        B = -(1. + A_lambda)/expm1(-lambda1*NTU1)
+        P1 = 1./(1. + R1/4.*(E + 3.)/(E + 1.) + lambda1*B - 2.*lambda1*C*D)
     else:
         raise Exception('Supported numbers of tube passes are 1, 2, and 4.')
     return P1
 
 
-def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True):
+def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True, derivatives=False):
     r'''Returns temperature effectiveness `P1` of a TEMA H type heat exchanger  
     with a specified heat capacity ratio, number of transfer units `NTU1`,
     and of number of tube passes `Ntp`. For the two tube pass case, there are
@@ -1642,12 +1802,22 @@ def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True):
         Whether or not the arrangement is configured to give more of a
         countercurrent and efficient (True) case or an inefficient parallel
         case, [-]
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
         
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
@@ -1670,25 +1840,31 @@ def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True):
     .. [3] Rohsenow, Warren and James Hartnett and Young Cho. Handbook of Heat
        Transfer, 3E. New York: McGraw-Hill, 1998.
     '''
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal), R1, NTU1)
     if Ntp == 1:
         A = 1./(1 + R1/2.)*(1. - exp(-NTU1*(1. + R1/2.)/2.))
-        D = exp(-NTU1*(1. - R1/2.)/2.)
-        if R1 != 2:
-            B = (1. - D)/(1. - R1*D/2.)
-        else:
-            B = NTU1/(2. + NTU1)
+        B = Pc(NTU1/2., R1/2.)
         E = (A + B - A*B*R1/2.)/2.
         P1 = E*(1. + (1. - B*R1/2.)*(1. - A*R1/2. + A*B*R1)) - A*B*(1. - B*R1/2.)
     elif Ntp == 2 and optimal:
         alpha = NTU1*(4. + R1)/8.
         beta = NTU1*(4. - R1)/8.
         D = (1. - exp(-alpha))/(4./R1 + 1)
-        if R1 != 4:
-            E = (1. - exp(-beta))/(4./R1 - 1.)
-            H = (1. - exp(-2.*beta))/(4./R1 - 1.)
-        else:
+        if R1 == 4:
             E = NTU1/2.
             H = NTU1
+        elif R1 > 4:
+            # E and H grow with exp(-beta); they are scaled by s = exp(beta)
+            s = exp(beta)
+            Es = (s - 1.)/(4./R1 - 1.) # E*s
+            Hs = (s*s - 1.)/(4./R1 - 1.) # H*s**2
+            Gs = (1-D)**2*(D**2*s*s + Es**2) + D**2*(s + Es)**2 # G*s**2
+            Bs = (s*s + Hs)*(s + Es)**2 # B*s**4
+            return 1./R1*(1. - (1. - D)**4*s**4/(Bs - 4.*Gs*s*s/R1))
+        else:
+            E = (1. - exp(-beta))/(4./R1 - 1.)
+            H = (1. - exp(-2.*beta))/(4./R1 - 1.)
         G = (1-D)**2*(D**2 + E**2) + D**2*(1+E)**2
         B = (1. + H)*(1. + E)**2
         P1 = 1./R1*(1. - (1. - D)**4/(B - 4.*G/R1))
@@ -1704,12 +1880,19 @@ def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True):
         H = (exp(-2.*beta) - 1.)/(4.*R1 + 1.)
         E = (exp(-beta) - 1.)/(4.*R1 + 1.)
         B = (1. + H)*(1. + E)**2
-        if R1 != 0.25:
-            D = (1. - exp(-alpha))/(1. - 4.*R1)
+        if R1 == 0.25:
+            D = -NTU1/8.
             G = (1. - D)**2*(D**2 + E**2) + D**2*(1. + E)**2
             P1 = (1. - (B + 4.*G*R1)/(1. - D)**4)
+        elif R1 < 0.25:
+            # D grows with exp(-alpha); 1/(1 - D) and D/(1 - D) are formed
+            # directly so it is never evaluated
+            d = exp(alpha)
+            u = d*(1. - 4.*R1)/(1. - 4.*R1*d) # 1/(1 - D)
+            v = (d - 1.)/(1. - 4.*R1*d) # D/(1 - D)
+            P1 = 1. - B*u**4 - 4.*R1*(v*v + E*E*u*u + v*v*u*u*(1. + E)**2)
         else:
-            D = -NTU1/8.
+            D = (1. - exp(-alpha))/(1. - 4.*R1)
             G = (1. - D)**2*(D**2 + E**2) + D**2*(1. + E)**2
             P1 = (1. - (B + 4.*G*R1)/(1. - D)**4)
         P1 = P1/R1_orig # switch 3, confirmed
@@ -1718,7 +1901,7 @@ def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True):
     return P1
 
 
-def temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal=True):
+def temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal=True, derivatives=False):
     r'''Returns temperature effectiveness `P1` of a TEMA G type heat exchanger  
     with a specified heat capacity ratio, number of transfer units `NTU1`,
     and of number of tube passes `Ntp`. For the two tube pass case, there are
@@ -1800,12 +1983,22 @@ def temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal=True):
         Whether or not the arrangement is configured to give more of a
         countercurrent and efficient (True) case or an inefficient parallel
         case (only applies for two passes), [-]
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
 
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
@@ -1828,46 +2021,58 @@ def temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal=True):
     .. [3] Rohsenow, Warren and James Hartnett and Young Cho. Handbook of Heat
        Transfer, 3E. New York: McGraw-Hill, 1998.
     '''
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal), R1, NTU1)
     if Ntp == 1:
-        D = exp(-NTU1*(1. - R1)/2.)
-        if R1 != 1:
-            B = (1. - D)/(1. - R1*D)
-        else:
-            B = NTU1/(2. + NTU1)
+        B = Pc(NTU1/2., R1)
         A = 1./(1. + R1)*(1. - exp(-NTU1*(1. + R1)/2.))
         P1 = A + B - A*B*(1. + R1) + R1*A*B**2
     elif Ntp == 2 and optimal:
-        if R1 != 2:
+        if R1 == 2:
+            alpha = exp(-NTU1)
+            P1 = (1. + 2.*NTU1 - alpha**2)/(4. + 4.*NTU1 - (1. - alpha)**2)
+        elif R1 < 2:
             beta = exp(-NTU1*(2. - R1)/2.)
             alpha = exp(-NTU1*(2. + R1)/4.)
             B = (4. - beta*(2. + R1))/(2. - R1)
             A = -2.*R1*(1-alpha)**2/(2. + R1)
             P1 = (B - alpha**2)/(A + 2. + R1*B)
         else:
-            alpha = exp(-NTU1)
-            P1 = (1. + 2.*NTU1 - alpha**2)/(4. + 4.*NTU1 - (1. - alpha)**2)
+            # Divided through by beta, which would overflow
+            beta_inv = exp(-NTU1*(R1 - 2.)/2.)
+            alpha = exp(-NTU1*(2. + R1)/4.)
+            B = (4.*beta_inv - (2. + R1))/(2. - R1) # B/beta
+            A = -2.*R1*(1-alpha)**2/(2. + R1)
+            P1 = (B - alpha**2*beta_inv)/((A + 2.)*beta_inv + R1*B)
     elif Ntp == 2 and not optimal:
         R1_orig = R1
         #NTU2 = NTU1*R1_orig but we want to treat it as NTU1 in this case
         NTU1 = NTU1*R1_orig # switch 1
         # R2 = 1/R1 but we want to treat it as R1 in this case
         R1 = 1./R1_orig # switch 2
-        if R1 != 0.5:
+        if R1 == 0.5:
+            beta = exp(-2.*R1*NTU1)
+            P1 = (1. + 2.*R1*NTU1 - beta)/R1/(4. + 4.*R1*NTU1 + R1**2*NTU1**2)
+        elif R1 > 0.5:
             beta = exp(-NTU1*(2.*R1 + 1.)/2.)
             alpha = exp(-NTU1*(2.*R1 - 1.)/4.)
             B = (4.*R1 - beta*(2.*R1 - 1.))/(2.*R1 + 1.)
             A = (1. - alpha)**2/(R1 - 0.5)
             P1 = (B - alpha**2)/(R1*(A - alpha**2/R1 + 2.))
         else:
-            beta = exp(-2.*R1*NTU1)
-            P1 = (1. + 2.*R1*NTU1 - beta)/R1/(4. + 4.*R1*NTU1 + R1**2*NTU1**2)
+            # Multiplied through by 1/alpha**2, as alpha would overflow
+            beta = exp(-NTU1*(2.*R1 + 1.)/2.)
+            alpha_inv = exp(NTU1*(2.*R1 - 1.)/4.)
+            B = (4.*R1 - beta*(2.*R1 - 1.))/(2.*R1 + 1.)
+            P1 = ((B*alpha_inv**2 - 1.)
+                  /(R1*((alpha_inv - 1.)**2/(R1 - 0.5) + 2.*alpha_inv**2) - 1.))
         P1 = P1/R1_orig # switch 3, confirmed
     else:
         raise Exception('Supported numbers of tube passes are 1 and 2.')
     return P1
 
 
-def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True):
+def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True, derivatives=False):
     r'''Returns temperature effectiveness `P1` of a TEMA E type heat exchanger  
     with a specified heat capacity ratio, number of transfer units `NTU1`,
     number of tube passes `Ntp`, and whether or not it is arranged in a more 
@@ -2008,12 +2213,22 @@ def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True):
         Whether or not the arrangement is configured to give more of a
         countercurrent and efficient (True) case or an inefficient parallel
         case, [-]
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
 
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
@@ -2027,7 +2242,7 @@ def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True):
     Examples
     --------
     >>> temperature_effectiveness_TEMA_E(R1=1/3., NTU1=1., Ntp=1)
-    0.5870500654031314
+    0.5870500654031315
 
     References
     ----------
@@ -2038,27 +2253,28 @@ def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True):
     .. [3] Rohsenow, Warren and James Hartnett and Young Cho. Handbook of Heat
        Transfer, 3E. New York: McGraw-Hill, 1998.
     '''
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_TEMA_E(R1, NTU1, Ntp, optimal), R1, NTU1)
     if Ntp == 1:
         # Just the basic counterflow case
-        if R1 != 1:
-            P1 = (1-exp(-NTU1*(1-R1))) / (1 - R1*exp(-NTU1*(1-R1)))
-        else:
-            P1 = NTU1/(1. + NTU1)
+        P1 = Pc(NTU1, R1)
     elif Ntp == 2 and optimal:
-        if R1 != 1:
-            E = (1. + R1**2)**0.5
-            P1 = 2./(1 + R1 + E/tanh(E*NTU1/2.))
-        else:
-            P1 = 1/(1 + 1/tanh(NTU1*2**-0.5)*2**-0.5)
+        E = (1. + R1**2)**0.5
+        P1 = 2./(1 + R1 + E/tanh(E*NTU1/2.))
     elif Ntp == 2 and not optimal:
         # Shah, reverse flow but with divider; without divider would be parallel.
         # Same as J-1, but E = A and B = B.
-        A = exp(NTU1)
-        B = exp(-NTU1*R1/2.)
+        # Written without A = exp(NTU1) as in temperature_effectiveness_TEMA_J
         if R1 != 2:
-            P1 = 1/R1*(1 - (2-R1)*(2*A + R1*B)/(2+R1)/(2*A - R1/B))
+            B_A = exp(-NTU1*(1. + R1/2.))
+            if R1 < 2:
+                ratio = (2. + R1*B_A)/(2. - R1*exp(-NTU1*(1. - R1/2.)))
+            else:
+                AB = exp(NTU1*(1. - R1/2.))
+                ratio = (2.*AB + R1*B_A*AB)/(2.*AB - R1)
+            P1 = 1./R1*(1. - (2. - R1)*ratio/(2. + R1))
         else:
-            P1 = 0.5*(1 - (1 + A**-2)/2./(1+NTU1))
+            P1 = 0.5*(1 - (1 + exp(-2.*NTU1))/2./(1+NTU1))
     elif Ntp == 3 and optimal:
         # This gives slightly different results than in Thulukkanam!
         lambda3 = R1 # in Rosehnhow, this is minus. makes a small diff though
@@ -2124,8 +2340,114 @@ def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True):
     return P1
 
 
+# Temperature effectiveness of each plate exchanger pass arrangement as a
+# function of (R1, NTU1) only; see `temperature_effectiveness_plate` for the
+# formulas. Each is selected once with `plate_effectiveness_kernel` and
+# may be called repeatedly; they are module level functions so the inverse
+# solvers can evaluate them with mpmath and tabulate them by name.
+
+def _plate_1_1_counterflow(R1, NTU1):
+    # Also the 2 pass/2 pass case with every pass in counterflow
+    return Pc(NTU1, R1)
+
+
+def _plate_1_1_parallel(R1, NTU1):
+    # Also the 2 pass/2 pass case with every pass in parallel flow
+    return Pp(NTU1, R1)
+
+
+def _plate_1_2(R1, NTU1):
+    # There are four configurations but all have the same formula
+    # They do behave different depending on the number of available plates
+    # but this model assues infinity
+    # There are four more arrangements that are equivalent as well
+    A = Pp(NTU1, 0.5*R1)
+    B = Pc(NTU1, 0.5*R1)
+    return 0.5*(A + B - 0.5*A*B*R1)
+
+
+def _plate_1_3_counterflow(R1, NTU1):
+    # There are six configurations, two formulas
+    # Each behaves differently though as a function of number of plates
+    A = Pp(NTU1, R1/3.)
+    B = Pc(NTU1, R1/3.)
+    return 1/3.*(A + B*(1. - R1*A/3.)*(2. - R1*B/3.))
+
+
+def _plate_1_3_parallel(R1, NTU1):
+    A = Pp(NTU1, R1/3.)
+    B = Pc(NTU1, R1/3.)
+    return 1/3.*(B + A*(1. - R1*B/3.)*(2. - R1*A/3.))
+
+
+def _plate_1_4(R1, NTU1):
+    # four configurations
+    # Again a function of number of plates, but because expressions assume
+    # infinity it gets ignored and they're the same
+    A = Pp(NTU1, 0.25*R1)
+    B = Pc(NTU1, 0.25*R1)
+    t1 = (1. - 0.25*A*R1)
+    t2 = (1. - 0.25*B*R1)
+    t3 = t1*t2 # minor optimization
+    return (1. - t3*t3)/R1
+
+
+def _plate_2_2_counterflow_parallel(R1, NTU1):
+    # Overall counterflow, individual passes in parallel flow
+    A = Pp(0.5*NTU1, R1)
+    return (2.*A - A*A*(1. + R1))/(1. - R1*A*A)
+
+
+def _plate_2_2_parallel_counterflow(R1, NTU1):
+    # Overall parallel flow, individual passes in counterflow
+    B = Pc(0.5*NTU1, R1)
+    return B*(2. - B*(1. + R1))
+
+
+def _plate_2_3_counterflow(R1, NTU1):
+    # One place says there are four configurations; no other discussion is
+    # presented
+    H = Pp(0.5*NTU1, 2./3.*R1)
+    G = Pc(0.5*NTU1, 2./3.*R1)
+    E = 1./(2./3.*R1*G)
+    F = 1./(2./3.*R1*H)
+    E2 = E*E
+    F2 = F*F
+    A = (2.*R1*E*F2 - 2.*E*F + F - F2)/(2.*R1*E2*F2 - E2 - F2 - 2.*E*F + E + F)
+    C = (1. - A)/E
+    D = R1*E*E*C - R1*E + R1 - 0.5*C
+    B = A*(E - 1.)/F
+    return (A + 0.5*B + 0.5*C + D)/R1
+
+
+def _plate_2_3_parallel(R1, NTU1):
+    D = 2*R1/3.
+    A = Pp(NTU1/2, D)
+    B = Pc(NTU1/2, D)
+    AB = A*B
+    return (A + B - (2/9. + D/3.)*(A*A + B*B)
+            -(5./9. + 4./3.*D)*AB
+            + D*(1. + D)*AB*(A + B)/3.
+            - D*D*AB*AB/9.)
+
+
+def _plate_2_4_counterflow(R1, NTU1):
+    # Both cases are correct for passes_counterflow=True or False
+    A = Pp(0.5*NTU1, 0.5*R1)
+    B = Pc(0.5*NTU1, 0.5*R1)
+    D = 0.5*(A + B - 0.5*A*B*R1)
+    return (2.*D - (1. + R1)*D*D)/(1. - D*D*R1)
+
+
+def _plate_2_4_parallel(R1, NTU1):
+    A = Pp(0.5*NTU1, 0.5*R1)
+    B = Pc(0.5*NTU1, 0.5*R1)
+    D = 0.5*(A + B - 0.5*A*B*R1)
+    return 2.*D - ((1. + R1)*D*D)
+
+
 def temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=True, 
-                                    passes_counterflow=True, reverse=False):
+                                    passes_counterflow=True, reverse=False, derivatives=False):
     r'''Returns the temperature effectiveness `P1` of side 1 of a plate heat 
     exchanger with a specified side 1 heat capacity ratio `R1`, side 1 number
     of transfer units `NTU1`, number of passes on sides 1 and 2 (respectively
@@ -2350,12 +2672,22 @@ def temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=True,
     reverse : bool
         Used **internally only** to allow cases like the 1-4 formula to work  
         for the 4-1 flow case, without having to duplicate the code [-]
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives
+        of `P1` with respect to `NTU1` and `R1`, [-]
+
 
     Returns
     -------
     P1 : float
         Thermal effectiveness of the heat exchanger in the P-NTU method,
         calculated with respect to stream 1 [-]
+    dP1_dNTU1 : float
+        Partial derivative of `P1` with respect to `NTU1`, returned only
+        if `derivatives` is True, [-]
+    dP1_dR1 : float
+        Partial derivative of `P1` with respect to `R1`, returned only
+        if `derivatives` is True, [-]
 
     Notes
     -----
@@ -2371,6 +2703,9 @@ def temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=True,
     
     If a number of passes which is not supported is provided, an exception is
     raised.
+    
+    To evaluate one arrangement many times, the formula for it can be
+    selected once with :obj:`plate_effectiveness_kernel`.
 
     Examples
     --------
@@ -2400,102 +2735,19 @@ def temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=True,
        Arrangements." Journal of Heat Transfer 111, no. 2 (May 1, 1989): 
        300-313. doi:10.1115/1.3250678.   
     '''
-    if Np1 == 1 and Np2 == 1 and counterflow:
-        return Pc(NTU1, R1)
-    elif Np1 == 1 and Np2 == 1 and not counterflow:
-        return Pp(NTU1, R1)
-    elif Np1 == 1 and Np2 == 2:
-        # There are four configurations but all have the same formula
-        # They do behave different depending on the number of available plates
-        # but this model assues infinity
-        # There are four more arrangements that are equivalent as well
-        A = Pp(NTU1, 0.5*R1)
-        B = Pc(NTU1, 0.5*R1)
-        return 0.5*(A + B - 0.5*A*B*R1)
-    elif Np1 == 1 and Np2 == 3 and counterflow:
-        # There are six configurations, two formulas
-        # Each behaves differently though as a function of number of plates
-        A = Pp(NTU1, R1/3.)
-        B = Pc(NTU1, R1/3.)
-        return 1/3.*(A + B*(1. - R1*A/3.)*(2. - R1*B/3.))
-    elif Np1 == 1 and Np2 == 3 and not counterflow:
-        A = Pp(NTU1, R1/3.)
-        B = Pc(NTU1, R1/3.)
-        return 1/3.*(B + A*(1. - R1*B/3.)*(2. - R1*A/3.))
-    elif Np1 == 1 and Np2 == 4:
-        # four configurations
-        # Again a function of number of plates, but because expressions assume
-        # infinity it gets ignored and they're the same
-        A = Pp(NTU1, 0.25*R1)
-        B = Pc(NTU1, 0.25*R1)
-        t1 = (1. - 0.25*A*R1)
-        t2 = (1. - 0.25*B*R1)
-        t3 = t1*t2 # minor optimization
-        return (1. - t3*t3)/R1
-    elif Np1 == 2 and Np2 == 2:
-        if counterflow and passes_counterflow:
-            return Pc(NTU1, R1)
-        elif counterflow and not passes_counterflow:
-            A = Pp(0.5*NTU1, R1)
-            return (2.*A - A*A*(1. + R1))/(1. - R1*A*A)
-        elif not counterflow and passes_counterflow:
-            B = Pc(0.5*NTU1, R1)
-            return B*(2. - B*(1. + R1))
-        elif not counterflow and not passes_counterflow:
-            return temperature_effectiveness_plate(R1, NTU1, Np1=1, Np2=1, 
-                                                   counterflow=False)
-    elif Np1 == 2 and Np2 == 3:
-        # One place says there are four configurations; no other discussion is
-        # presented
-        if counterflow:
-            H = Pp(0.5*NTU1, 2./3.*R1)
-            G = Pc(0.5*NTU1, 2./3.*R1)
-            E = 1./(2./3.*R1*G)
-            F = 1./(2./3.*R1*H)
-            E2 = E*E
-            F2 = F*F
-            A = (2.*R1*E*F2 - 2.*E*F + F - F2)/(2.*R1*E2*F2 - E2 - F2 - 2.*E*F + E + F)
-            C = (1. - A)/E
-            D = R1*E*E*C - R1*E + R1 - 0.5*C
-            B = A*(E - 1.)/F
-            return (A + 0.5*B + 0.5*C + D)/R1
-        elif not counterflow:
-            D = 2*R1/3.
-            A = Pp(NTU1/2, D)
-            B = Pc(NTU1/2, D)
-            return (A + B - (2/9. + D/3.)*(A*A + B*B)
-                    -(5./9. + 4./3.*D)*A*B
-                    + D*(1. + D)*A*B*(A + B)/3.
-                    - D*D*A*A*B*B/9.)
-    elif Np1 == 2 and Np2 == 4:
-        # Both cases are correct for passes_counterflow=True or False
-        if counterflow:
-            A = Pp(0.5*NTU1, 0.5*R1)
-            B = Pc(0.5*NTU1, 0.5*R1)
-            D = 0.5*(A + B - 0.5*A*B*R1)
-            return (2.*D - (1. + R1)*D*D)/(1. - D*D*R1)
-        elif not counterflow:
-            A = Pp(0.5*NTU1, 0.5*R1)
-            B = Pc(0.5*NTU1, 0.5*R1)
-            D = 0.5*(A + B - 0.5*A*B*R1)
-            return 2.*D - ((1. + R1)*D*D)
-    if not reverse:
-        # only the asymmetric cases will be able to solve by flipping things
-        # Note that asymmetric performs differently depending on the arguments
-        # The user still needs to input R1, NTU1 for side 1
-        # so if they want to do a 3-1 instead of a 1-3 as is implemented here
-        # They give R1 and NTU1 for "3 pass" side instead of the "1 pass" side 
-        # and will get back P1 for the "3 pass" side.
-        R2 = 1./R1
-        NTU2 = NTU1*R1
-        P2 = temperature_effectiveness_plate(R1=R2, NTU1=NTU2, Np1=Np2, Np2=Np1,
-                                             counterflow=counterflow, 
-                                             passes_counterflow=passes_counterflow, 
-                                             reverse=True)
-        P1 = P2*R2
-        return P1
-    
-    raise Exception('Supported number of passes does not have a formula available')
+    if derivatives:
+        return _P1_derivatives(lambda R1, NTU1: temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow, passes_counterflow, reverse), R1, NTU1)
+    kernels = _plate_arrangements if reverse else _plate_kernels
+    try:
+        kernel = kernels[(Np1, Np2, counterflow, passes_counterflow)]
+    except KeyError:
+        kernel = kernels.get((Np1, Np2, bool(counterflow), bool(passes_counterflow)))
+        if kernel is None:
+            raise Exception('Supported number of passes does not have a formula available')
+    if reverse:
+        kernel = kernel[0]
+    return kernel(R1, NTU1)
+
 
     
 NTU_from_plate_2_3_parallel = {
@@ -3089,33 +3341,462 @@ NTU_from_P_basic_crossflow_mixed_12 = {
 
 
 
-def _NTU_from_P_objective(NTU1, R1, P1, function, **kwargs):
-    '''Private function to hold the common objective function used by 
-    all backwards solvers for the P-NTU method.
-    These methods are really hard on on floating points (overflows and divide
-    by zeroes due to numbers really close to 1), so if the function fails,
-    mpmath is imported and tried.
+def _plate_reversed(kernel):
+    '''Wraps the kernel of a plate exchanger arrangement so it applies to the
+    arrangement with sides 1 and 2 switched; the user still gives `R1` and
+    `NTU1` for side 1 and gets back `P1` for side 1.
+    '''
+    def reversed_kernel(R1, NTU1):
+        R2 = 1./R1
+        return kernel(R2, NTU1*R1)*R2
+    reversed_kernel.__name__ = kernel.__name__ + '_reversed'
+    return reversed_kernel
+
+
+# (Np1, Np2, counterflow, passes_counterflow, kernel, NTU_max); None for
+# either flow direction means the formula applies to both. NTU_max bounds the
+# solver in `NTU_from_P_plate`; it is either a number, a table for
+# `_NTU_max_for_P_solver`, or None where the inverse has a closed form.
+_plate_arrangement_list = [
+    (1, 1, True, None, _plate_1_1_counterflow, None),
+    (1, 1, False, None, _plate_1_1_parallel, None),
+    (1, 2, None, None, _plate_1_2, 100.),
+    (1, 3, True, None, _plate_1_3_counterflow, 100.),
+    (1, 3, False, None, _plate_1_3_parallel, 100.),
+    (1, 4, None, None, _plate_1_4, 100.),
+    (2, 2, True, True, _plate_1_1_counterflow, None),
+    (2, 2, True, False, _plate_2_2_counterflow_parallel, 100.),
+    (2, 2, False, True, _plate_2_2_parallel_counterflow, NTU_from_plate_2_2_parallel_counterflow),
+    (2, 2, False, False, _plate_1_1_parallel, None),
+    (2, 3, True, None, _plate_2_3_counterflow, 100.),
+    (2, 3, False, None, _plate_2_3_parallel, NTU_from_plate_2_3_parallel),
+    (2, 4, True, None, _plate_2_4_counterflow, 100.),
+    (2, 4, False, None, _plate_2_4_parallel, NTU_from_plate_2_4_parallel),
+]
+
+_plate_arrangements = {(Np1, Np2, c, pc): (kernel, NTU_max)
+                       for Np1, Np2, counterflow, passes_counterflow, kernel, NTU_max in _plate_arrangement_list
+                       for c in ((True, False) if counterflow is None else (counterflow,))
+                       for pc in ((True, False) if passes_counterflow is None else (passes_counterflow,))}
+
+
+
+def _plate_kernel_table(arrangements):
+    '''Returns the kernels of `arrangements` keyed by arrangement, along
+    with the reversed kernels for the arrangements only available with the 
+    sides switched.
+    '''
+    kernels = {key: v[0] for key, v in arrangements.items()}
+    kernels.update({(Np2, Np1, c, pc): _plate_reversed(v[0])
+                    for (Np1, Np2, c, pc), v in arrangements.items()
+                    if (Np2, Np1, c, pc) not in arrangements})
+    return kernels
+
+
+_plate_kernels = _plate_kernel_table(_plate_arrangements)
+
+
+def plate_effectiveness_kernel(Np1, Np2, counterflow=True,
+                               passes_counterflow=True):
+    r'''Returns a function of (`R1`, `NTU1`) only which calculates the
+    temperature effectiveness `P1` of side 1 of a plate heat exchanger with 
+    the specified arrangement of passes, as in 
+    :obj:`temperature_effectiveness_plate`.
+    
+    The arrangement is only looked up once, so this is convenient when the
+    same arrangement is evaluated many times; the returned function contains
+    only the formula of that arrangement. 
+    :obj:`ht.vectorized.plate_effectiveness_kernel` returns the same
+    formulas evaluated over numpy arrays.
+
+    Parameters
+    ----------
+    Np1 : int
+        Number of passes on side 1 [-]
+    Np2 : int
+        Number of passes on side 2 [-]
+    counterflow : bool
+        Whether or not the overall flow through the heat exchanger is in
+        counterflow or parallel flow, [-]
+    passes_counterflow : bool
+        In addition to the overall flow direction, in some cases individual 
+        passes may be in counter or parallel flow; this controls that [-]
+
+    Returns
+    -------
+    kernel : callable
+        Function of (`R1`, `NTU1`) returning `P1`, [-]
+
+    Notes
+    -----
+    If a number of passes which is not supported is provided, an exception is
+    raised.
+
+    Examples
+    --------
+    >>> P1 = plate_effectiveness_kernel(Np1=3, Np2=1)
+    >>> P1(R1=1/3., NTU1=1.)
+    0.5743514352720835
     '''
     try:
-        P1_calc = function(R1, NTU1, **kwargs)
-    except :
+        return _plate_kernels[(Np1, Np2, bool(counterflow), bool(passes_counterflow))]
+    except KeyError:
+        raise Exception('Supported number of passes does not have a formula available')
+
+
+_mpmath_functions = {}
+
+
+def _mpmath_function(function):
+    '''Returns a copy of `function` which evaluates its exponentials with
+    mpmath, so intermediary results cannot overflow. Every function of this
+    module is copied into a separate namespace the first time this is
+    needed, so nested calls use mpmath as well; the module's own functions
+    are never modified and may still be used concurrently.
+    '''
+    if not _mpmath_functions:
         try:
             import mpmath
         except ImportError:  # pragma: no cover
             raise Exception('For some reverse P-NTU numerical solutions, the \
 intermediary results are ill-conditioned and do not fit in a float; mpmath must \
 be installed for this calculation to proceed.')
-        globals()['exp'] = mpmath.exp
-        P1_calc = float(function(R1, NTU1, **kwargs))
-        globals()['exp'] = math.exp
+        namespace = dict(globals())
+        namespace.update({'exp': mpmath.exp, 'expm1': mpmath.expm1})
+        functions = {}
+        for name, obj in globals().items():
+            if isinstance(obj, types.FunctionType) and obj.__module__ == __name__:
+                functions[name] = types.FunctionType(obj.__code__, namespace, 
+                                                     name, obj.__defaults__,
+                                                     obj.__closure__)
+        namespace.update(functions)
+        _mpmath_functions.update(functions)
+    return _mpmath_functions[function.__name__]
+
+
+class _DualSingularity(Exception):
+    '''Raised when a :obj:`_Dual` is compared for equality with a number it 
+    equals or nearly equals, as the formulas only do so to select a limiting
+    expression which does not carry the derivatives of the general one. Near
+    that number the general expression cancels, and its derivatives lose
+    far more precision than its value does.
+    '''
+
+# Relative distance from the value selecting a limiting expression, times
+# NTU1 where that exceeds 1, within which the derivatives of the general
+# expression are not used; they lose precision with the square, or for some
+# formulas the fourth power, of it. The distance for the current calculation
+# is kept per thread.
+_dual_singularity_tol = 1E-2
+_dual_singularity = threading.local()
+
+
+class _Dual(object):
+    '''Forward mode automatic differentiation number, holding a `value` 
+    and its partial derivatives `dx` and `dy` with respect to two seeded 
+    inputs. The closed-form P-NTU expressions of this module are evaluated 
+    with these by :obj:`_dual_function` to obtain their analytic 
+    derivatives.
+
+    Comparisons are made with the value only; there is deliberately no
+    `__float__`, so a function which has not been made aware of dual numbers
+    raises instead of silently dropping the derivatives.
+    '''
+    __slots__ = ('value', 'dx', 'dy')
+
+    def __init__(self, value, dx, dy):
+        self.value = value
+        self.dx = dx
+        self.dy = dy
+
+    def __repr__(self):
+        return '_Dual(%r, %r, %r)' %(self.value, self.dx, self.dy)
+
+    def __add__(self, other):
+        if isinstance(other, _Dual):
+            return _Dual(self.value + other.value, self.dx + other.dx, 
+                         self.dy + other.dy)
+        return _Dual(self.value + other, self.dx, self.dy)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, _Dual):
+            return _Dual(self.value - other.value, self.dx - other.dx, 
+                         self.dy - other.dy)
+        return _Dual(self.value - other, self.dx, self.dy)
+
+    def __rsub__(self, other):
+        return _Dual(other - self.value, -self.dx, -self.dy)
+
+    def __mul__(self, other):
+        if isinstance(other, _Dual):
+            a, b = self.value, other.value
+            return _Dual(a*b, b*self.dx + a*other.dx, b*self.dy + a*other.dy)
+        return _Dual(self.value*other, self.dx*other, self.dy*other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, _Dual):
+            b = other.value
+            value = self.value/b
+            return _Dual(value, (self.dx - value*other.dx)/b, 
+                         (self.dy - value*other.dy)/b)
+        return _Dual(self.value/other, self.dx/other, self.dy/other)
+
+    def __rtruediv__(self, other):
+        value = other/self.value
+        slope = -value/self.value
+        return _Dual(value, slope*self.dx, slope*self.dy)
+
+    __div__, __rdiv__ = __truediv__, __rtruediv__
+
+    def __pow__(self, other):
+        if isinstance(other, _Dual):
+            return _dual_math['exp'](other*_dual_math['log'](self))
+        value = self.value**other
+        slope = other*self.value**(other - 1.0)
+        return _Dual(value, slope*self.dx, slope*self.dy)
+
+    def __rpow__(self, other):
+        value = other**self.value
+        slope = value*log(other)
+        return _Dual(value, slope*self.dx, slope*self.dy)
+
+    def __neg__(self):
+        return _Dual(-self.value, -self.dx, -self.dy)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0.0 else -self
+
+    def __int__(self):
+        # Integers are only taken of values to size series, and are 
+        # piecewise constant
+        return int(self.value)
+
+    def __eq__(self, other):
+        other = other.value if isinstance(other, _Dual) else other
+        if abs(self.value - other) <= getattr(_dual_singularity, 'tol', 0.0)*abs(other):
+            raise _DualSingularity()
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, _Dual) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, _Dual) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, _Dual) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, _Dual) else other)
+
+
+def _dual_primitive(function, derivative):
+    '''Returns a version of the scalar function `function` which also 
+    accepts a :obj:`_Dual`, with `derivative(x, value)` its derivative at `x`.
+    '''
+    def dual_function(x):
+        if isinstance(x, _Dual):
+            value = function(x.value)
+            slope = derivative(x.value, value)
+            return _Dual(value, slope*x.dx, slope*x.dy)
+        return function(x)
+    dual_function.__name__ = function.__name__
+    return dual_function
+
+
+_dual_math = {'exp': _dual_primitive(exp, lambda x, value: value),
+              'expm1': _dual_primitive(expm1, lambda x, value: exp(x)),
+              'log': _dual_primitive(log, lambda x, value: 1.0/x),
+              'log1p': _dual_primitive(log1p, lambda x, value: 1.0/(1.0 + x)),
+              'sqrt': _dual_primitive(sqrt, lambda x, value: 0.5/value),
+              'tanh': _dual_primitive(tanh, lambda x, value: 1.0 - value*value),
+              '_z_over_expm1': _dual_primitive(_z_over_expm1, _z_over_expm1_derivative)}
+
+_dual_namespace = {}
+
+
+def _dual_function(function):
+    '''Returns a copy of `function` which evaluates with :obj:`_Dual` 
+    arguments. As for :obj:`_mpmath_function`, every function of this module
+    is copied into a separate namespace the first time this is needed,
+    using the dual-aware versions of the math functions and plate kernels.
+    '''
+    if not _dual_namespace:
+        namespace = dict(globals())
+        for name, obj in globals().items():
+            if isinstance(obj, types.FunctionType) and obj.__module__ == __name__:
+                namespace[name] = types.FunctionType(obj.__code__, namespace, 
+                                                     name, obj.__defaults__,
+                                                     obj.__closure__)
+        namespace.update(_dual_math)
+        arrangements = {key: (namespace[kernel.__name__], NTU_max) 
+                        for key, (kernel, NTU_max) in _plate_arrangements.items()}
+        namespace['_plate_arrangements'] = arrangements
+        namespace['_plate_kernels'] = namespace['_plate_kernel_table'](arrangements)
+        _dual_namespace.update(namespace)
+    return types.FunctionType(function.__code__, _dual_namespace, 
+                              function.__name__, function.__defaults__,
+                              function.__closure__)
+
+
+def _P1_derivatives(function, R1, NTU1):
+    '''Returns `function(R1, NTU1)` and its analytic partial derivatives with
+    respect to `NTU1` and `R1`. Where `R1` is at or near the value selecting
+    the limiting expression of a formula, the derivatives are continuous
+    there and are extrapolated from those of the general expression either
+    side of it.
+    '''
+    dual = _dual_function(function)
+    # The general expressions cancel in NTU1 times the distance from the
+    # limiting value, so the region avoided narrows as NTU1 grows
+    tol = _dual_singularity_tol/max(1.0, abs(NTU1))
+    tol_outer = getattr(_dual_singularity, 'tol', 0.0)
+    _dual_singularity.tol = tol
+    try:
+        P1 = dual(_Dual(R1, 0.0, 1.0), _Dual(NTU1, 1.0, 0.0))
+    except _DualSingularity:
+        def mean(step):
+            low = dual(_Dual(R1*(1.0 - step), 0.0, 1.0), _Dual(NTU1, 1.0, 0.0))
+            high = dual(_Dual(R1*(1.0 + step), 0.0, 1.0), _Dual(NTU1, 1.0, 0.0))
+            return 0.5*(low.dx + high.dx), 0.5*(low.dy + high.dy)
+        # The means have errors in even powers of step, which are eliminated
+        # by Richardson extrapolation; the steps keep every point at least
+        # 1.5 times the tolerance from the limiting value, so the
+        # cancellation of the general formula there stays small
+        step = 2.5*tol
+        D1, D2, D3, D4 = mean(step), mean(2.0*step), mean(3.0*step), mean(4.0*step)
+        dNTU1, dR1 = [(1008.0*a - 504.0*b + 144.0*c - 18.0*d)/630.0
+                      for a, b, c, d in zip(D1, D2, D3, D4)]
+        return function(R1, NTU1), dNTU1, dR1
+    finally:
+        _dual_singularity.tol = tol_outer
+    if not isinstance(P1, _Dual):
+        # Limits independent of both inputs
+        return P1, 0.0, 0.0
+    return P1.value, P1.dx, P1.dy
+
+
+def _NTU_from_P_objective(NTU1, R1, P1, function, **kwargs):
+    '''Private function to hold the common objective function used by 
+    all backwards solvers for the P-NTU method.
+    These methods are really hard on on floating points (overflows and divide
+    by zeroes due to numbers really close to 1), so if the function fails,
+    it is evaluated again with mpmath.
+    '''
+    try:
+        P1_calc = function(R1, NTU1, **kwargs)
+    except (ArithmeticError, ValueError):
+        P1_calc = float(_mpmath_function(function)(R1, NTU1, **kwargs))
     return P1_calc - P1
 
 
-def _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, **kwargs):
+# Interpolation tables of P1 against NTU1 for the iterative NTU_from_P
+# functions; built the first time each configuration is solved with `tol`
+_NTU_from_P_tables = {}
+_NTU_from_P_table_lnR1s = [0.1*log(10.)*i for i in range(-30, 31)]
+_NTU_from_P_table_lnNTU1s = [log(1E-4) + 0.125*log(10.)*i for i in range(49)]
+
+
+def _NTU_from_P_table(function, kwargs):
+    '''Returns the interpolation table for `function` with the configuration
+    `kwargs`, building it if it does not exist yet. For each tabulated value
+    of ln(R1), P1 is evaluated over the ln(NTU1) grid up to the point it
+    stops increasing, so that each row can be interpolated inversely.
+    '''
+    key = (function.__name__, tuple(sorted(kwargs.items())))
+    try:
+        return _NTU_from_P_tables[key]
+    except KeyError:
+        pass
+    rows = []
+    for lnR1 in _NTU_from_P_table_lnR1s:
+        R1 = exp(lnR1)
+        row = []
+        for lnNTU1 in _NTU_from_P_table_lnNTU1s:
+            try:
+                P1 = function(R1, exp(lnNTU1), **kwargs)
+            except (ArithmeticError, ValueError):
+                break
+            if not (P1 == P1 and (not row or P1 > row[-1])):
+                break
+            row.append(P1)
+        rows.append(row)
+    _NTU_from_P_tables[key] = rows
+    return rows
+
+
+def _NTU_from_P_interpolated(P1, R1, NTU_min, NTU_max, function, tol, kwargs):
+    '''Solves for NTU1 starting from an estimate from the interpolation
+    table of `function`, refined with secant steps in ln(NTU1) until P1 is
+    matched to within `tol`. Returns None if the point is outside the table
+    or the refinement does not converge, in which case the full solver
+    should be used.
+    '''
+    lnR1s = _NTU_from_P_table_lnR1s
+    if not R1 > 0.0:
+        return None
+    lnR1 = log(R1)
+    if lnR1 < lnR1s[0] or lnR1 > lnR1s[-1]:
+        return None
+    rows = _NTU_from_P_table(function, kwargs)
+    i = min(bisect_right(lnR1s, lnR1), len(lnR1s) - 1)
+    lnNTU1s = []
+    for row in (rows[i-1], rows[i]):
+        if len(row) < 2:
+            return None
+        # P1 may be past the end of one of the rows near the maximum P1;
+        # the estimate is then clamped to the end of that row
+        j = min(max(bisect_right(row, P1), 1), len(row) - 1)
+        frac = min(max((P1 - row[j-1])/(row[j] - row[j-1]), 0.0), 1.0)
+        lnNTU1s.append(_NTU_from_P_table_lnNTU1s[j-1] + frac*(
+                _NTU_from_P_table_lnNTU1s[j] - _NTU_from_P_table_lnNTU1s[j-1]))
+    frac = (lnR1 - lnR1s[i-1])/(lnR1s[i] - lnR1s[i-1])
+    x0 = lnNTU1s[0] + frac*(lnNTU1s[1] - lnNTU1s[0])
+
+    x_min, x_max = log(NTU_min), log(NTU_max)
+    if not x_min <= x0 <= x_max:
+        return None
+    f0 = _NTU_from_P_objective(exp(x0), R1, P1, function, **kwargs)
+    x1 = x0
+    if abs(f0) > tol:
+        x1 = x0 + 1E-6
+        for _ in range(8):
+            if not x_min <= x1 <= x_max:
+                return None
+            f1 = _NTU_from_P_objective(exp(x1), R1, P1, function, **kwargs)
+            if abs(f1) <= tol:
+                break
+            if f1 == f0:
+                return None
+            x0, x1, f0 = x1, x1 - f1*(x1 - x0)/(f1 - f0), f1
+        else:
+            return None
+    return exp(x1)
+
+
+def _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, tol=None, **kwargs):
     '''Private function to solve the P-NTU method backwards, given the
     function to use, the upper and lower NTU bounds for consideration,
-    and the desired P1 and R1 values.
+    and the desired P1 and R1 values. If `tol` is given, the interpolation
+    table of the function is tried first.
     '''
+    if tol is not None:
+        NTU1 = _NTU_from_P_interpolated(P1, R1, NTU_min, NTU_max, function,
+                                        tol, kwargs)
+        if NTU1 is not None:
+            return NTU1
     P1_max = _NTU_from_P_objective(NTU_max, R1, 0, function, **kwargs)
     P1_min = _NTU_from_P_objective(NTU_min, R1, 0, function, **kwargs)
     if P1 > P1_max:
@@ -3212,10 +3893,11 @@ def NTU_from_P_basic(P1, R1, subtype='crossflow'):
     For the 'crossflow approximate' solution the function is monotonic, and a
     bounded solver is used within the range of NTU1 from 1E-11 to 1E5. 
     
-    For the full correct 'crossflow' solution, the initial guess for newton's
-    method is obtained by the 'crossflow approximate' solution; the function
-    may not converge because of inaccuracy performing the numerical integral 
-    involved.
+    For the full correct 'crossflow' solution, Newton's method is used with
+    the analytical derivative of the series solution, starting from the
+    'counterflow' solution (which is always lower). If it does not converge,
+    as can happen at very high NTU1 where P1 hardly changes, a bounded solver
+    is used on a bracket doubled from that solution up to NTU1 = 1E5.
 
     For the 'crossflow, mixed 1&2' solution, a bounded solver is first use, but
     the upper bound on P1 and the upper NTU1 limit is calculated from a pade
@@ -3242,15 +3924,39 @@ def NTU_from_P_basic(P1, R1, subtype='crossflow'):
         # These are tricky but also easy because P1 can always be 1
         NTU_max = 1E5
     elif subtype == 'crossflow':
-        guess = NTU_from_P_basic(P1, R1, subtype='crossflow approximate')
-        to_solve = lambda NTU1 : _NTU_from_P_objective(NTU1, R1, P1, function, subtype='crossflow')
-        return newton(to_solve, guess)
+        # Counterflow needs the least NTU1 of any arrangement; see
+        # NTU_from_effectiveness. Its limit is used for balanced streams, and
+        # the guess is kept within the bounds of the bracketed solver
+        NTU_max = 1E5
+        try:
+            if R1 == 1.0:
+                guess = P1/(1. - P1)
+            else:
+                guess = NTU_from_P_basic(P1, R1, subtype='counterflow')
+        except (ArithmeticError, ValueError):
+            guess = NTU_max
+        guess = min(max(guess, NTU_min), NTU_max)
+        to_solve = lambda NTU1 : _crossflow_unmixed(NTU1, R1) - P1
+        to_solve_der = lambda NTU1 : _crossflow_unmixed(NTU1, R1, derivative=True)[1]
+        try:
+            return newton(to_solve, guess, fprime=to_solve_der)
+        except Exception:
+            pass
+        # Where P1 hardly changes with NTU1, Newton's method can stall on
+        # rounding noise; a bracket is grown upwards from the guess instead,
+        # as the series is not accurate enough to be bounded at NTU_max
+        low, high = NTU_min, guess
+        while to_solve(high) < 0.0:
+            if high >= NTU_max:
+                raise ValueError('No solution possible gives such a high P1; maximum P1=%f at NTU1=%f' %(P1 + to_solve(high), high))
+            low, high = high, min(2.0*high, NTU_max)
+        return ridder(to_solve, low, high)
     else:
         raise Exception('Subtype not recognized.')
     return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, subtype=subtype)
 
 
-def NTU_from_P_G(P1, R1, Ntp, optimal=True):
+def NTU_from_P_G(P1, R1, Ntp, optimal=True, tol=None):
     r'''Returns the number of transfer units of a TEMA G type heat exchanger
     with a specified (for side 1) thermal effectiveness `P1`, heat capacity 
     ratio `R1`, the number of tube passes `Ntp`, and for the two-pass case
@@ -3278,6 +3984,11 @@ def NTU_from_P_G(P1, R1, Ntp, optimal=True):
         Whether or not the arrangement is configured to give more of a
         countercurrent and efficient (True) case or an inefficient parallel
         case (only applies for two passes), [-]
+    tol : float, optional
+        If specified, NTU1 is estimated from an interpolation table (built
+        the first time each configuration is solved this way) and refined
+        with secant steps until `P1` is matched to within `tol`; points
+        outside the table fall back to the full solver, [-]
 
     Returns
     -------
@@ -3310,7 +4021,7 @@ def NTU_from_P_G(P1, R1, Ntp, optimal=True):
     Examples
     --------
     >>> NTU_from_P_G(P1=.573, R1=1/3., Ntp=1)
-    0.9999513707769526
+    0.9999513707769523
     '''
     NTU_min = 1E-11
     function = temperature_effectiveness_TEMA_G
@@ -3323,10 +4034,10 @@ def NTU_from_P_G(P1, R1, Ntp, optimal=True):
         NTU_max = _NTU_max_for_P_solver(NTU_from_G_2_unoptimal, R1)
     else:
         raise Exception('Supported numbers of tube passes are 1 or 2.')
-    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, Ntp=Ntp, optimal=optimal)
+    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, tol=tol, Ntp=Ntp, optimal=optimal)
 
 
-def NTU_from_P_J(P1, R1, Ntp):
+def NTU_from_P_J(P1, R1, Ntp, tol=None):
     r'''Returns the number of transfer units of a TEMA J type heat exchanger
     with a specified (for side 1) thermal effectiveness `P1`, heat capacity 
     ratio `R1`, and the number of tube passes `Ntp`. The supported cases are 
@@ -3346,7 +4057,12 @@ def NTU_from_P_J(P1, R1, Ntp):
         calculated with respect to stream 1 (shell side = 1, tube side = 2) [-]
     Ntp : int
         Number of tube passes, 1, 2, or 4, [-]
-        
+    tol : float, optional
+        If specified, NTU1 is estimated from an interpolation table (built
+        the first time each configuration is solved this way) and refined
+        with secant steps until `P1` is matched to within `tol`; points
+        outside the table fall back to the full solver, [-]
+
     Returns
     -------
     NTU1 : float
@@ -3398,10 +4114,10 @@ def NTU_from_P_J(P1, R1, Ntp):
         NTU_max = _NTU_max_for_P_solver(NTU_from_P_J_4, R1)
     else:
         raise Exception('Supported numbers of tube passes are 1, 2, and 4.')
-    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, Ntp=Ntp)
+    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, tol=tol, Ntp=Ntp)
 
 
-def NTU_from_P_E(P1, R1, Ntp, optimal=True):
+def NTU_from_P_E(P1, R1, Ntp, optimal=True, tol=None):
     r'''Returns the number of transfer units of a TEMA E type heat exchanger
     with a specified (for side 1) thermal effectiveness `P1`, heat capacity 
     ratio `R1`, the number of tube passes `Ntp`, and for the two-pass case
@@ -3449,6 +4165,11 @@ def NTU_from_P_E(P1, R1, Ntp, optimal=True):
         Whether or not the arrangement is configured to give more of a
         countercurrent and efficient (True) case or an inefficient parallel
         case, [-]
+    tol : float, optional
+        If specified, NTU1 is estimated from an interpolation table (built
+        the first time each configuration is solved this way) and refined
+        with secant steps until `P1` is matched to within `tol`; points
+        outside the table fall back to the full solver, [-]
 
     Returns
     -------
@@ -3509,10 +4230,10 @@ def NTU_from_P_E(P1, R1, Ntp, optimal=True):
         NTU_max = 1E3
     else:
         raise Exception('For TEMA E shells with an odd number of tube passes more than 3, no solution is implemented.')
-    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, Ntp=Ntp, optimal=optimal)
+    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, tol=tol, Ntp=Ntp, optimal=optimal)
 
 
-def NTU_from_P_H(P1, R1, Ntp, optimal=True):
+def NTU_from_P_H(P1, R1, Ntp, optimal=True, tol=None):
     r'''Returns the number of transfer units of a TEMA H type heat exchanger
     with a specified (for side 1) thermal effectiveness `P1`, heat capacity 
     ratio `R1`, the number of tube passes `Ntp`, and for the two-pass case
@@ -3539,7 +4260,12 @@ def NTU_from_P_H(P1, R1, Ntp, optimal=True):
         Whether or not the arrangement is configured to give more of a
         countercurrent and efficient (True) case or an inefficient parallel
         case, [-]
-        
+    tol : float, optional
+        If specified, NTU1 is estimated from an interpolation table (built
+        the first time each configuration is solved this way) and refined
+        with secant steps until `P1` is matched to within `tol`; points
+        outside the table fall back to the full solver, [-]
+
     Returns
     -------
     NTU1 : float
@@ -3564,7 +4290,7 @@ def NTU_from_P_H(P1, R1, Ntp, optimal=True):
     Examples
     --------
     >>> NTU_from_P_H(P1=0.573, R1=1/3., Ntp=1)
-    0.9997628696881165
+    0.9997628696881166
     '''
     NTU_min = 1E-11
     function = temperature_effectiveness_TEMA_H
@@ -3576,11 +4302,11 @@ def NTU_from_P_H(P1, R1, Ntp, optimal=True):
         NTU_max = _NTU_max_for_P_solver(NTU_from_H_2_unoptimal, R1)
     else:
         raise Exception('Supported numbers of tube passes are 1 and 2.')
-    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, Ntp=Ntp, optimal=optimal)
+    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, tol=tol, Ntp=Ntp, optimal=optimal)
 
 
 def NTU_from_P_plate(P1, R1, Np1, Np2, counterflow=True, 
-                     passes_counterflow=True, reverse=False):
+                     passes_counterflow=True, reverse=False, tol=None):
     r'''Returns the number of transfer units of a plate heat exchanger
     with a specified side 1 heat capacity ratio `R1`, side 1 number
     of transfer units `NTU1`, number of passes on sides 1 and 2 (respectively
@@ -3644,6 +4370,11 @@ def NTU_from_P_plate(P1, R1, Np1, Np2, counterflow=True,
     reverse : bool
         Used **internally only** to allow cases like the 1-4 formula to work  
         for the 4-1 flow case, without having to duplicate the code [-]
+    tol : float, optional
+        If specified, NTU1 is estimated from an interpolation table (built
+        the first time each configuration is solved this way) and refined
+        with secant steps until `P1` is matched to within `tol`; points
+        outside the table fall back to the full solver, [-]
 
     Returns
     -------
@@ -3671,66 +4402,39 @@ def NTU_from_P_plate(P1, R1, Np1, Np2, counterflow=True,
     0.9998336056060733
     '''
     NTU_min = 1E-11
-    function = temperature_effectiveness_plate
-    if Np1 == 1 and Np2 == 1 and counterflow:
-        try:
-            return -log((P1*R1 - 1.)/(P1 - 1.))/(R1 - 1.)
-        except ValueError:
-            raise ValueError('The maximum P1 obtainable at the specified R1 is %f at the limit of NTU1=inf.' %(1./R1))
-        
-    elif Np1 == 1 and Np2 == 1 and not counterflow:
-        try:
-            return log(-1./(P1*(R1 + 1.) - 1.))/(R1 + 1.)
-        except ValueError:
-            raise ValueError('The maximum P1 obtainable at the specified R1 is %f at the limit of NTU1=inf.' %Pp(1E10, R1))
-    elif Np1 == 1 and Np2 == 2:
-        NTU_max = 100.
-    elif Np1 == 1 and Np2 == 3 and counterflow:
-        NTU_max = 100.
-    elif Np1 == 1 and Np2 == 3 and not counterflow:
-        NTU_max = 100.
-    elif Np1 == 1 and Np2 == 4:
-        NTU_max = 100.
-    elif Np1 == 2 and Np2 == 2:
-        if counterflow and passes_counterflow:
-            return NTU_from_P_plate(P1, R1, Np1=1, Np2=1, counterflow=True, 
-                                    passes_counterflow=True)
-        elif counterflow and not passes_counterflow:
-            NTU_max = 100
-        elif not counterflow and passes_counterflow:
-            NTU_max = _NTU_max_for_P_solver(NTU_from_plate_2_2_parallel_counterflow, R1)
-        elif not counterflow and not passes_counterflow:
-            return NTU_from_P_plate(P1, R1, Np1=1, Np2=1, counterflow=False, 
-                                    passes_counterflow=False)
-    elif Np1 == 2 and Np2 == 3:
-        if counterflow:
-            NTU_max = 100
-        elif not counterflow:
-            NTU_max = _NTU_max_for_P_solver(NTU_from_plate_2_3_parallel, R1)
-    elif Np1 == 2 and Np2 == 4:
-        if counterflow:
-            NTU_max = 100
-        elif not counterflow:
-            NTU_max = _NTU_max_for_P_solver(NTU_from_plate_2_4_parallel, R1)
-    elif not reverse:
+    key = (Np1, Np2, bool(counterflow), bool(passes_counterflow))
+    if key not in _plate_arrangements:
+        if reverse:
+            raise Exception('Supported number of passes does not have a formula available')
         # Proved to work by example
         P2 = P1*R1
         R2 = 1./R1
         NTU2 = NTU_from_P_plate(R1=R2, P1=P2, Np1=Np2, Np2=Np1,
                                 counterflow=counterflow, 
                                 passes_counterflow=passes_counterflow, 
-                                reverse=True)
+                                reverse=True, tol=None if tol is None else tol*R1)
         NTU1 = NTU2/R1
         return NTU1
-    else:
-        raise Exception('Supported number of passes does not have a formula available')
-    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, Np1=Np1, 
-                              Np2=Np2, counterflow=counterflow, 
-                              passes_counterflow=passes_counterflow)
+
+    function, NTU_max = _plate_arrangements[key]
+    if function is _plate_1_1_counterflow:
+        try:
+            return -log((P1*R1 - 1.)/(P1 - 1.))/(R1 - 1.)
+        except ValueError:
+            raise ValueError('The maximum P1 obtainable at the specified R1 is %f at the limit of NTU1=inf.' %(1./R1))
+    elif function is _plate_1_1_parallel:
+        try:
+            return log(-1./(P1*(R1 + 1.) - 1.))/(R1 + 1.)
+        except ValueError:
+            raise ValueError('The maximum P1 obtainable at the specified R1 is %f at the limit of NTU1=inf.' %Pp(1E10, R1))
+    if isinstance(NTU_max, dict):
+        NTU_max = _NTU_max_for_P_solver(NTU_max, R1)
+    return _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, tol=tol)
 
 
 def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None, 
-                 T2i=None, T2o=None, subtype='crossflow', Ntp=1, optimal=True):
+                 T2i=None, T2o=None, subtype='crossflow', Ntp=1, optimal=True,
+                 derivatives=False):
     r'''Wrapper for the various P-NTU method function calls,
     which can solve a heat exchanger. The heat capacities and mass flows
     of each stream and the type of the heat exchanger are always required.
@@ -3778,6 +4482,10 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
         For real heat exchangers (types 'E', 'G', 'H', and 'J'), there is often
         a more countercurrent (optimal) way to arrange the tube passes and a
         more parallel (optimal=False) way to arrange them. This controls that.
+    derivatives : bool, optional
+        Whether or not to also return the analytic partial derivatives of 
+        the solution with respect to `UA`, `m1` and `m2`; only supported when
+        `UA` is specified, [-]
 
     Returns
     -------
@@ -3796,6 +4504,15 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
         * C2 : The heat capacity rate of fluid 2, [W/K]
         * NTU1 : Thermal Number of Transfer Units with respect to stream 1 [-]
         * NTU2 : Thermal Number of Transfer Units with respect to stream 2 [-]
+        * dP1_dNTU1, dP1_dR1 : Partial derivatives of `P1` with respect to
+          `NTU1` and `R1`; only if `derivatives` is True, [-]
+        * dQ_dUA, dQ_dm1, dQ_dm2 : Partial derivatives of `Q` with respect
+          to `UA`, `m1` and `m2`; only if `derivatives` is True, [K, J/kg, 
+          J/kg]
+        * dT1i_dUA, dT1i_dm1, ... dT2o_dm2 : Partial derivatives of each 
+          temperature with respect to `UA`, `m1` and `m2`, zero for the 
+          specified temperatures; only if `derivatives` is True, [K^2/W, 
+          K*s/kg, K*s/kg]
     
     Notes
     -----
@@ -3908,6 +4625,16 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
         T_{2,o} = \frac{1}{P_{1}} \left(P_{1} R_{1} \left(T_{1,i} 
         - T_{1,o}\right) + P_{1} T_{1,i} - T_{1,i} + T_{1,o}\right)
         
+    The expression for `P1` is differentiated by forward mode automatic 
+    differentiation, exact to rounding error except close to a value of 
+    `R1` at which the formula switches to a limiting expression, where the
+    derivatives are extrapolated from either side instead, and the chain
+    rule is applied through the equations above with
+    :math:`\partial NTU_1/\partial m_1 = -NTU_1/m_1` and 
+    :math:`\partial R_1/\partial m_1 = R_1/m_1`. They are useful for 
+    sensitivity studies and for gradient based optimization or fitting of
+    `UA`, without the step size and double cost of finite differences.
+        
     See also
     --------
     temperature_effectiveness_basic
@@ -3988,6 +4715,14 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
      'T2o': 26.7,
      'UA': 300}
 
+    The sensitivities of the first exchanger's duty and tube side outlet
+    temperature to its UA and tube side flow:
+
+    >>> res = P_NTU_method(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900, subtype='E', 
+    ... Ntp=4, T2i=15, T1i=130, UA=3041.75, derivatives=True)
+    >>> res['dQ_dUA'], res['dT2o_dm2']
+    (31.222506204971744, -28.37592658424136)
+
     References
     ----------
     .. [1] Shah, Ramesh K., and Dusan P. Sekulic. Fundamentals of Heat 
@@ -3997,6 +4732,8 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
     .. [3] Rohsenow, Warren and James Hartnett and Young Cho. Handbook of Heat
        Transfer, 3E. New York: McGraw-Hill, 1998.
     '''
+    if derivatives and UA is None:
+        raise Exception('Derivatives are only available when UA is specified')
     # Shellside: 1
     # Tubeside: 2
     C1 = m1*Cp1
@@ -4009,15 +4746,15 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
         NTU2 = UA/C2
         
         if subtype in ['counterflow', 'parallel', 'crossflow', 'crossflow, mixed 1', 'crossflow, mixed 2', 'crossflow, mixed 1&2']:
-            P1 = temperature_effectiveness_basic(R1, NTU1, subtype=subtype)
+            P1 = temperature_effectiveness_basic(R1, NTU1, subtype=subtype, derivatives=derivatives)
         elif subtype == 'E':
-            P1 = temperature_effectiveness_TEMA_E(R1=R1, NTU1=NTU1, Ntp=Ntp, optimal=optimal)
+            P1 = temperature_effectiveness_TEMA_E(R1=R1, NTU1=NTU1, Ntp=Ntp, optimal=optimal, derivatives=derivatives)
         elif subtype == 'G':
-            P1 = temperature_effectiveness_TEMA_G(R1=R1, NTU1=NTU1, Ntp=Ntp, optimal=optimal)
+            P1 = temperature_effectiveness_TEMA_G(R1=R1, NTU1=NTU1, Ntp=Ntp, optimal=optimal, derivatives=derivatives)
         elif subtype == 'H':
-            P1 = temperature_effectiveness_TEMA_H(R1=R1, NTU1=NTU1, Ntp=Ntp, optimal=optimal)
+            P1 = temperature_effectiveness_TEMA_H(R1=R1, NTU1=NTU1, Ntp=Ntp, optimal=optimal, derivatives=derivatives)
         elif subtype == 'J':
-            P1 = temperature_effectiveness_TEMA_J(R1=R1, NTU1=NTU1, Ntp=Ntp)
+            P1 = temperature_effectiveness_TEMA_J(R1=R1, NTU1=NTU1, Ntp=Ntp, derivatives=derivatives)
         elif '/' in subtype:
             passes_counterflow = True
             Np1, end = subtype.split('/')
@@ -4025,11 +4762,19 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
                 passes_counterflow = True if end[-1] == 'c' else False
                 end = end[0:-1]
             Np1, Np2 = int(Np1), int(end)
-            P1 = temperature_effectiveness_plate(R1=R1, NTU1=NTU1, Np1=Np1, Np2=Np2, counterflow=optimal, passes_counterflow=passes_counterflow)
+            P1 = temperature_effectiveness_plate(R1=R1, NTU1=NTU1, Np1=Np1, Np2=Np2, counterflow=optimal, passes_counterflow=passes_counterflow, derivatives=derivatives)
         else:
             raise Exception("Supported types are 'E', 'G', 'H', 'J', 'counterflow',\
     'parallel', 'crossflow', 'crossflow, mixed 1', 'crossflow, mixed 2', \
     'crossflow, mixed 1&2', or 'Np1/Np2' for plate exchangers")
+        if derivatives:
+            # The rest of the solution is evaluated with its derivatives with
+            # respect to P1 and R1 carried along; those of P1 and R1 with 
+            # respect to UA, m1 and m2 are applied after
+            P1, dP1_dNTU1, dP1_dR1 = P1
+            dP1s = (dP1_dNTU1/C1, (dP1_dR1*R1 - dP1_dNTU1*NTU1)/m1, -dP1_dR1*R1/m2)
+            dR1s = (0.0, R1/m1, -R1/m2)
+            P1, R1 = _Dual(P1, 1.0, 0.0), _Dual(R1, 0.0, 1.0)
         
         possible_inputs = [(T1i, T2i), (T1o, T2o), (T1i, T2o), (T1o, T2i), (T1i, T1o), (T2i, T2o)]
         if not any([i for i in possible_inputs if None not in i]):
@@ -4118,6 +4863,21 @@ def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
 #    effectiveness = max(C1, C2)/min(C1, C2)
     results = {'Q': Q, 'T1i': T1i, 'T1o': T1o, 'T2i': T2i, 'T2o': T2o, 
           'C1': C1, 'C2': C2, 'R1': R1, 'R2': R2, 'P1': P1, 'P2': P2, 'NTU1': NTU1, 'NTU2': NTU2, 'UA': UA}
+    if derivatives:
+        for key in ('Q', 'T1i', 'T1o', 'T2i', 'T2o'):
+            value = results[key]
+            if isinstance(value, _Dual):
+                results[key] = value.value
+                slopes = [value.dx*dP1 + value.dy*dR1 for dP1, dR1 in zip(dP1s, dR1s)]
+            else:
+                slopes = (0.0, 0.0, 0.0)
+            results['d%s_dUA' %key], results['d%s_dm1' %key], results['d%s_dm2' %key] = slopes
+        for key in ('R1', 'P1', 'P2'):
+            results[key] = results[key].value
+        # Q is also proportional to C1
+        results['dQ_dm1'] += results['Q']/m1
+        results['dP1_dNTU1'] = dP1_dNTU1
+        results['dP1_dR1'] = dP1_dR1
     return results
 
 
@@ -4174,6 +4934,11 @@ def F_LMTD_Fakheri(Thi, Tho, Tci, Tco, shells=1):
     This expression is symmetric - the same result is calculated if the cold
     side values are swapped with the hot side values. It also does not 
     depend on the units of the temperature given.
+    
+    It is evaluated in terms of :math:`\ln W` and :math:`1 - W`, both divided
+    by :math:`R - 1`, which remains accurate as R approaches 1. See
+    :obj:`ht.vectorized.LMTD_and_F_LMTD_Fakheri` to calculate this and the
+    log-mean temperature difference for many exchangers at once.
 
     Examples
     --------
@@ -4195,9 +4960,14 @@ def F_LMTD_Fakheri(Thi, Tho, Tci, Tco, shells=1):
         W2 = (shells - shells*P)/(shells - shells*P + P)
         return (2**0.5*(1. - W2)/W2)/log(((W2/(1. - W2) + 2**-0.5)/(W2/(1. - W2) - 2**-0.5)))
     else:
-        W = ((1. - P*R)/(1. - P))**(1./shells)
-        S = (R*R + 1.)**0.5/(R - 1.)
-        return S*log(W)/log((1. + W - S + S*W)/(1. + W + S - S*W))
+        # S*ln(W) and S*(1 - W) are evaluated with ln(W) from log1p, so the
+        # error in R - 1 cancels as R approaches 1
+        lnW = log1p(P*(1. - R)/(1. - P))/shells
+        root = (R*R + 1.)**0.5
+        S_lnW = root*lnW/(R - 1.)
+        S_1_W = -root*expm1(lnW)/(R - 1.)
+        W = exp(lnW)
+        return S_lnW/log((1. + W - S_1_W)/(1. + W + S_1_W))
 
 ### Tubes
 
@@ -4222,6 +4992,166 @@ TEMA_tubing = {0.25: (22, 24), 0.375: (18, 20, 22), 0.5: (18, 20),
 #    Di = Do-2*t
 #    print t*1000, Di*1000
 #
+class TEMATubeCatalog(object):
+    r'''Array-backed catalog of the TEMA tube sizes listed in
+    :obj:`TEMA_tubing`, for fast lookups of single tubes and batches of
+    tubes. Each tube is a row of nominal size `NPS` [inch], gauge `BWG`,
+    outer diameter `Do` [m], inner diameter `Di` [m], and wall thickness
+    `t` [m]; these are available as the arrays of the same names, sorted by
+    `NPS` and then by increasing wall thickness.
+
+    Exact (NPS, BWG) lookups use a hash index. Lookups by outer diameter or
+    wall thickness use sorted arrays and match to the nearest listed tube;
+    outer diameters must match within a relative tolerance of `rtol_Do`, and
+    thicknesses within `atol_t`. The scalar methods return tuples of
+    (NPS, BWG, Do, Di, t) and raise an exception if no tube matches; the
+    `_many` methods accept arrays, and return structured arrays with those
+    fields.
+
+    Parameters
+    ----------
+    tubing : dict, optional
+        Nominal sizes and the gauges listed for each, as in
+        :obj:`TEMA_tubing`, [-]
+
+    Examples
+    --------
+    >>> TEMA_tube_catalog.lookup(0.75, 16)
+    (0.75, 16, 0.019049999999999997, 0.015747999999999998, 0.001651)
+    >>> TEMA_tube_catalog.thinnest_many([0.75, 1.], 0.0015)['BWG']
+    array([16, 16])
+    '''
+    dtype = np.dtype([('NPS', float), ('BWG', int), ('Do', float),
+                      ('Di', float), ('t', float)])
+    rtol_Do = 1E-6
+    atol_t = 1E-7
+
+    def __init__(self, tubing=TEMA_tubing):
+        rows = []
+        for NPS, BWGs in tubing.items():
+            Do = 0.0254*NPS
+            for BWG in BWGs:
+                t = BWG_SI[BWG_integers.index(BWG)]
+                rows.append((float(NPS), int(BWG), Do, Do-2*t, t))
+        rows.sort(key=lambda row: (row[0], row[4]))
+        self._rows = rows
+        self._index = {(row[0], row[1]): i for i, row in enumerate(rows)}
+        self._sizes = sorted(set(row[0] for row in rows))
+        # First row and thicknesses of each nominal size
+        self._thicknesses = {}
+        for i, row in enumerate(rows):
+            if row[0] not in self._thicknesses:
+                self._thicknesses[row[0]] = (i, [])
+            self._thicknesses[row[0]][1].append(row[4])
+
+        self.table = np.array(rows, dtype=self.dtype)
+        self.NPS = self.table['NPS']
+        self.BWG = self.table['BWG']
+        self.Do = self.table['Do']
+        self.Di = self.table['Di']
+        self.t = self.table['t']
+        self.sizes = np.array(self._sizes)
+        # Keys sorted by size and then thickness, which is below 1 cm
+        self._groups = np.searchsorted(self.sizes, self.NPS)
+        self._t_keys = self._groups + self.t/0.01
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def lookup(self, NPS, BWG):
+        r'''Returns the tube of nominal size `NPS` and gauge `BWG`.'''
+        try:
+            return self._rows[self._index[(NPS, BWG)]]
+        except (KeyError, TypeError):
+            raise Exception('NPS and BWG Specified are not listed in TEMA')
+
+    def size_for_Do(self, Do):
+        r'''Returns the nominal size whose outer diameter is `Do`.'''
+        NPS = Do/0.0254
+        i = bisect_left(self._sizes, NPS)
+        for size in self._sizes[max(i-1, 0):i+1]:
+            if abs(size - NPS) <= self.rtol_Do*size:
+                return size
+        raise Exception('Outer diameter specified is not listed in TEMA')
+
+    def thinnest(self, NPS, tmin):
+        r'''Returns the tube of nominal size `NPS` with the thinnest wall
+        which is at least `tmin` thick.
+        '''
+        if NPS not in self._thicknesses:
+            raise Exception('NPS Specified is not listed in TEMA')
+        start, ts = self._thicknesses[NPS]
+        i = bisect_left(ts, tmin)
+        if i == len(ts):
+            raise Exception('Specified minimum thickness is larger than available in TEMA')
+        return self._rows[start + i]
+
+    def with_thickness(self, NPS, t):
+        r'''Returns the tube of nominal size `NPS` with a wall `t` thick.'''
+        if NPS not in self._thicknesses:
+            raise Exception('NPS Specified is not listed in TEMA')
+        start, ts = self._thicknesses[NPS]
+        i = bisect_left(ts, t)
+        for j in (i-1, i):
+            if 0 <= j < len(ts) and abs(ts[j] - t) <= self.atol_t:
+                return self._rows[start + j]
+        raise Exception('NPS and wall thickness specified are not listed in TEMA')
+
+    def _groups_of(self, NPS):
+        NPS = np.asarray(NPS, dtype=float)
+        g = np.clip(np.searchsorted(self.sizes, NPS), 0, len(self.sizes) - 1)
+        return g, self.sizes[g] == NPS
+
+    def lookup_many(self, NPS, BWG):
+        r'''Array version of :obj:`lookup`.'''
+        g, valid = self._groups_of(NPS)
+        BWG = np.asarray(BWG)
+        # Gauges decrease as thickness increases within each size
+        keys = self._groups*1000 - self.BWG
+        i = np.minimum(np.searchsorted(keys, g*1000 - BWG), len(self) - 1)
+        if not np.all(valid & (keys[i] == g*1000 - BWG)):
+            raise Exception('NPS and BWG Specified are not listed in TEMA')
+        return self.table[i]
+
+    def sizes_for_Do(self, Do):
+        r'''Array version of :obj:`size_for_Do`; outer diameters which are
+        not listed give NaN.
+        '''
+        NPS = np.asarray(Do, dtype=float)/0.0254
+        i = np.clip(np.searchsorted(self.sizes, NPS), 1, len(self.sizes) - 1)
+        lower, upper = self.sizes[i-1], self.sizes[i]
+        nearest = np.where(np.abs(NPS - lower) <= np.abs(upper - NPS), lower, upper)
+        return np.where(np.abs(nearest - NPS) <= self.rtol_Do*nearest, nearest, np.nan)
+
+    def thinnest_many(self, NPS, tmin):
+        r'''Array version of :obj:`thinnest`.'''
+        g, valid = self._groups_of(NPS)
+        tmin = np.asarray(tmin, dtype=float)
+        i = np.minimum(np.searchsorted(self._t_keys, g + tmin/0.01), len(self) - 1)
+        # The key may round the thickness slightly
+        i = np.minimum(np.where(self.t[i] < tmin, i + 1, i), len(self) - 1)
+        if not np.all(valid & (self._groups[i] == g) & (self.t[i] >= tmin)):
+            raise Exception('Specified minimum thickness is larger than available in TEMA')
+        return self.table[i]
+
+    def with_thickness_many(self, NPS, t):
+        r'''Array version of :obj:`with_thickness`.'''
+        g, valid = self._groups_of(NPS)
+        t = np.asarray(t, dtype=float)
+        key, keys = g + t/0.01, self._t_keys
+        i = np.clip(np.searchsorted(keys, key), 1, len(self) - 1)
+        i = np.where(np.abs(keys[i-1] - key) <= np.abs(keys[i] - key), i - 1, i)
+        if not np.all(valid & (self._groups[i] == g) & (np.abs(self.t[i] - t) <= self.atol_t)):
+            raise Exception('NPS and wall thickness specified are not listed in TEMA')
+        return self.table[i]
+
+
+TEMA_tube_catalog = TEMATubeCatalog()
+
+
 def check_tubing_TEMA(NPS=None, BWG=None):
     '''
     >>> check_tubing_TEMA(2, 22)
@@ -4237,63 +5167,32 @@ def check_tubing_TEMA(NPS=None, BWG=None):
 
 def get_tube_TEMA(NPS=None, BWG=None, Do=None, Di=None, tmin=None):
     # Tube defined by a thickness and an outer diameter only, no pipe.
-    # If Di or Do are specified, they must be exactly correct.
+    # Outer diameters and thicknesses are matched to the nearest listed tube.
+    catalog = TEMA_tube_catalog
     if NPS and BWG:
         # Fully defined, guaranteed
-        if not check_tubing_TEMA(NPS, BWG):
-            raise Exception('NPS and BWG Specified are not listed in TEMA')
-        Do = 0.0254*NPS
-        t = BWG_SI[BWG_integers.index(BWG)]
-        Di = Do-2*t
+        return catalog.lookup(NPS, BWG)
     elif Do and BWG:
-        NPS = Do/.0254
-        if not check_tubing_TEMA(NPS, BWG):
-            raise Exception('NPS and BWG Specified are not listed in TEMA')
-        t = BWG_SI[BWG_integers.index(BWG)]
-        Di = Do-2*t
+        return catalog.lookup(catalog.size_for_Do(Do), BWG)
     elif BWG and Di:
         t = BWG_SI[BWG_integers.index(BWG)] # Will fail if BWG not int
-        Do = t*2 + Di
-        NPS = Do/.0254
-        if not check_tubing_TEMA(NPS, BWG):
-            raise Exception('NPS and BWG Specified are not listed in TEMA')
+        return catalog.lookup(catalog.size_for_Do(Di + 2*t), BWG)
     elif NPS and Di:
-        Do = 0.0254*NPS
-        t = (Do - Di)/2
-        BWG = [BWG_integers[BWG_SI.index(t)]]
-        if not check_tubing_TEMA(NPS, BWG):
-            raise Exception('NPS and BWG Specified are not listed in TEMA')
+        return catalog.with_thickness(NPS, (0.0254*NPS - Di)/2)
     elif Di and Do:
-        NPS = Do/.0254
-        t = (Do - Di)/2
-        BWG = [BWG_integers[BWG_SI.index(t)]]
-        if not check_tubing_TEMA(NPS, BWG):
-            raise Exception('NPS and BWG Specified are not listed in TEMA')
+        return catalog.with_thickness(catalog.size_for_Do(Do), (Do - Di)/2)
     # Begin Fuzzy matching
     elif NPS and tmin:
-        Do = 0.0254*NPS
-        ts = [BWG_SI[BWG_integers.index(BWG)] for BWG in TEMA_tubing[NPS]]
-        ts.reverse() # Small to large
-        if tmin > ts[-1]:
-            raise Exception('Specified minimum thickness is larger than available in TEMA')
-        for t in ts: # Runs if at least 1 of the thicknesses are the right size.
-            if tmin <= t:
-                break
-        BWG = [BWG_integers[BWG_SI.index(t)]]
-        Di = Do-2*t
+        return catalog.thinnest(NPS, tmin)
     elif Do and tmin:
-        NPS = Do/.0254
-        NPS, BWG, Do, Di, t = get_tube_TEMA(NPS=NPS, tmin=tmin)
+        return catalog.thinnest(catalog.size_for_Do(Do), tmin)
     elif Di and tmin:
         raise Exception('Not funny defined input for TEMA Schedule; multiple solutions')
     elif NPS:
-        BWG = TEMA_tubing[NPS][0] # Pick the first listed size
-        Do = 0.0254*NPS
-        t = BWG_SI[BWG_integers.index(BWG)]
-        Di = Do-2*t
-    else:
-        raise Exception('Insufficient information provided')
-    return NPS, BWG, Do, Di, t
+        if NPS not in TEMA_tubing:
+            raise Exception('NPS Specified is not listed in TEMA')
+        return catalog.lookup(NPS, TEMA_tubing[NPS][0]) # Pick the first listed size
+    raise Exception('Insufficient information provided')
 
 TEMA_Ls_imperial = [96., 120., 144., 192., 240.] # inches
 TEMA_Ls = [2.438, 3.048, 3.658, 4.877, 6.096]
@@ -6052,13 +6951,177 @@ def Ntubes_Phadkeb(DBundle, Do, pitch, Ntp, angle=30):
     return ans
 
 
+def _Ntubes_Phadkeb_array(DBundle, Do, pitch, Ntp, angle=30):
+    '''Array version of :obj:`Ntubes_Phadkeb`, exposed as
+    :obj:`ht.vectorized.Ntubes_Phadkeb`; also used to build the index of
+    :obj:`DBundle_for_Ntubes_Phadkeb`.
+    '''
+    DBundle, Do, pitch = [np.asarray(v, dtype=float) for v in (DBundle, Do, pitch)]
+    if Ntp not in (1, 2, 4, 6, 8):
+        raise Exception('Only 1, 2, 4, 6, or 8 tube passes are supported')
+    if angle == 30 or angle == 60:
+        Ns_table, C1_table = triangular_Ns, triangular_C1s
+    elif angle == 45 or angle == 90:
+        Ns_table, C1_table = square_Ns, square_C1s
+    else:
+        raise Exception('Supported tube layout angles are 30, 45, 60 and 90 degrees')
+    e = 0.265 if Ntp == 6 else (0.404 if Ntp == 8 else 0.)
+
+    r = 0.5*(DBundle - Do)/pitch
+    s = r*r
+    Ns, Nr = np.floor(s), np.floor(r)
+    # If Ns is between two numbers, take the smaller one
+    C1 = C1_table[np.searchsorted(Ns_table, Ns, side='right') - 1]
+    Cx = 2*Nr + 1.
+    with np.errstate(invalid='ignore'):
+        if angle == 30 or angle == 60:
+            Nw = np.floor(2*r/3**0.5)
+            Cy = np.where(Nw % 2 == 0, 3*Nw, 3*Nw + 1)
+            if Ntp == 2:
+                N = C1 - Cx if angle == 30 else C1 - Cy - 1
+            C4 = C1 - Cx - Cy
+            if Ntp == 6 or Ntp == 8:
+                if angle == 30:
+                    Nv = np.floor(2*e*r/3**0.5 + 0.5)
+                    u = 3**0.5*Nv/2.
+                    z = (s - u*u)**0.5
+                    Nz = np.floor(np.where(Nv % 2 == 0, z, z - 0.5))
+                    N = C1 - Cy - 4*Nz - 1 if Ntp == 6 else C4 - 4*Nz
+                else:
+                    Nv = np.floor(2.*e*r)
+                    u1 = 0.5*Nv
+                    w1 = 2*(s - u1*u1)**0.5/2**0.5
+                    u2 = 0.5*(Nv + 1)
+                    w2 = 2.*(s - u2*u2)**0.5/3**0.5
+                    even = Nv % 2 == 0
+                    Nz1 = np.floor(np.where(even, 0.5*w1, 0.5*(w1 + 1)))
+                    Nz2 = np.floor(np.where(even, 0.5*(w2 + 1), 0.5*w2))
+                    N = C1 - Cx - 4.*(Nz1 + Nz2) if Ntp == 6 else C4 - 4.*(Nz1 + Nz2)
+        else:
+            if angle == 45:
+                # Rotated square
+                Cx = 2.*np.floor(r/2**0.5) + 1
+            Cy = Cx - 1.
+            if Ntp == 2:
+                N = C1 - Cx
+            C4 = C1 - Cx - Cy
+            if Ntp == 6 or Ntp == 8:
+                if angle == 90:
+                    Nv = np.floor(e*r + 0.5)
+                    Nz = np.floor((s - Nv*Nv)**0.5)
+                    N = C1 - Cy - 4*Nz - 1 if Ntp == 6 else C4 - 4*Nz
+                else:
+                    Nv = np.floor(2**0.5*e*r)
+                    u1 = Nv/2**0.5
+                    w1 = 2**0.5*(s - u1*u1)**0.5
+                    u2 = (Nv + 1)/2**0.5
+                    w2 = 2**0.5*(s - u2*u2)**0.5
+                    # if Nv is odd, 21a and 22a. If even, 21b and 22b
+                    even = Nv % 2 == 0
+                    Nz1 = np.floor(np.where(even, 0.5*w1, 0.5*(w1 + 1)))
+                    Nz2 = np.floor(np.where(even, 0.5*(w2 + 1), 0.5*w2))
+                    N = C1 - Cx - 4*(Nz1 + Nz2) if Ntp == 6 else C4 - 4*(Nz1 + Nz2)
+    if Ntp == 1:
+        N = C1
+    elif Ntp == 4:
+        N = C4
+    # In some cases, a negative number (or NaN, where the scalar function
+    # fails) would be returned by these formulas
+    N = np.where((DBundle <= Do*Ntp) | ~(N > 0), 0, N)
+    return N.astype(int)
+
+
+_Phadkeb_indexes = {}
+
+
+def _Phadkeb_index(Ntp, angle):
+    '''Returns the index used by :obj:`DBundle_for_Ntubes_Phadkeb` for one
+    number of tube passes and tube layout angle. The tube count of
+    :obj:`Ntubes_Phadkeb` depends on the bundle diameter only through
+    :math:`r = (D_{bundle} - D_o)/(2 p)`, and changes only where :math:`r^2`
+    is a multiple of 1/4 or where one of the pass partition terms, linear in
+    r, crosses an integer; so the count is evaluated once between each pair
+    of these values.
+
+    Returned are the r at which each of these plateaus starts, the count on
+    it, the running maximum of the counts, and the plateaus sorted by count
+    then r, as `count*len(r) + plateau`. The count is not always increasing
+    with diameter for multiple pass triangular layouts, so the running
+    maximum is kept separately. Bundles no larger than `Ntp` tube diameters
+    have no tubes; as that depends on the ratio of pitch to tube diameter,
+    it is applied when the index is used. The index is built the first time
+    it is needed and cached.
+    '''
+    key = (Ntp, angle)
+    if key in _Phadkeb_indexes:
+        return _Phadkeb_indexes[key]
+    Ns_max = (triangular_Ns if angle == 30 or angle == 60 else square_Ns)[-1]
+    r_max = (Ns_max + 1.)**0.5
+    r = [np.sqrt(np.arange(4*Ns_max + 5)/4.)]
+    if Ntp == 6 or Ntp == 8:
+        e = 0.265 if Ntp == 6 else 0.404
+        k = np.arange(2.*r_max + 2.)
+        r += [(k - 0.5)*3**0.5/(2*e), k/(2*e), (k - 0.5)/e, k/(2**0.5*e)]
+    r = np.unique(np.concatenate(r))
+    r = r[r < r_max]
+    r_mid = np.append(0.5*(r[1:] + r[:-1]), 0.5*(r[-1] + r_max))
+    # With Do = 0, DBundle = 2*pitch*r and the small bundle check is off
+    counts = _Ntubes_Phadkeb_array(2.*r_mid, 0.0, 1.0, Ntp, angle).astype(np.int64)
+    keys = np.sort(counts*len(r) + np.arange(len(r)))
+    index = (r, counts, np.maximum.accumulate(counts), keys)
+    _Phadkeb_indexes[key] = index
+    return index
+
+
+def _DBundle_for_Ntubes_Phadkeb_array(Ntubes, Do, pitch, Ntp, angle=30):
+    '''Array version of :obj:`DBundle_for_Ntubes_Phadkeb`, for many tube
+    counts with one tube diameter and pitch; exposed as
+    :obj:`ht.vectorized.DBundle_for_Ntubes_Phadkeb`. Counts larger than
+    the tables of :obj:`Ntubes_Phadkeb` give NaN.
+    '''
+    Ntubes = np.asarray(Ntubes)
+    r, counts, counts_max, keys = _Phadkeb_index(Ntp, angle)
+    n = len(r)
+    # Below r_cut there are no tubes; the plateau it falls in starts there
+    r_cut = 0.5*(Ntp - 1.)*Do/pitch
+    first = max(np.searchsorted(r, r_cut, side='right') - 1, 0)
+    N = np.maximum(Ntubes, 0).astype(np.int64)
+    beyond = N > counts_max[-1]
+    N = np.where(beyond, 0, N)
+
+    # The first plateau from the cut on with exactly N tubes, if any
+    i = np.minimum(np.searchsorted(keys, N*n + first, side='left'), n - 1)
+    exact = (keys[i]//n == N) & (keys[i] % n >= first)
+    # Otherwise the first one from the cut on with at least N tubes
+    j = np.searchsorted(counts_max, N, side='left')
+    before = ~exact & (j < first)
+    if before.any():
+        # Small counts may be reached first below the cut
+        counts_max_cut = np.maximum.accumulate(counts[first:])
+        j = np.where(before, first + np.searchsorted(counts_max_cut, N, side='left'), j)
+    plateau = np.where(exact, keys[i] % n, j)
+    zero = N == 0
+    r_N = np.where(zero, 0.0, np.maximum(r[plateau], r_cut))
+    target = np.where(zero, 0, counts[plateau])
+    DBundle = Do + 2.*pitch*r_N
+    # The start of a range of diameters may round to just below it
+    for _ in range(16):
+        low = _Ntubes_Phadkeb_array(DBundle, Do, pitch, Ntp, angle) != target
+        if not low.any():
+            break
+        DBundle = np.where(low, np.nextafter(DBundle, np.inf), DBundle)
+    return np.where(beyond, np.nan, DBundle)
+
+
 def DBundle_for_Ntubes_Phadkeb(Ntubes, Do, pitch, Ntp, angle=30):
     r'''Determine the bundle diameter required to fit a specified number of
     tubes in a heat exchanger. Uses the highly accurate method of [1]_,
     which takes into account pitch, number of tube passes, angle, 
     and tube diameter. The method is analytically correct when used in the
     other direction (calculating number of tubes from bundle diameter); in
-    reverse, it is solved by bisection.
+    reverse, the smallest bundle diameter with the specified number of tubes
+    is looked up in an index of every tube count :obj:`Ntubes_Phadkeb` can
+    give.
 
     Parameters
     ----------
@@ -6082,29 +7145,86 @@ def DBundle_for_Ntubes_Phadkeb(Ntubes, Do, pitch, Ntp, angle=30):
     -----
     This function will fail when there are more than 100,000 tubes. There are 
     a range of correct diameters for which there can be the given number of 
-    tubes; a number within that range is returned as found by bisection.
+    tubes; the smallest is returned. If no diameter gives exactly that number
+    of tubes, the smallest diameter which fits more is returned.
+    
+    The index is built the first time a combination of `Ntp` and `angle` is
+    used, and is cached; later calls, with any `pitch` and `Do`, are
+    lookups. See :obj:`ht.vectorized.DBundle_for_Ntubes_Phadkeb` to size
+    many bundles at once.
 
     Examples
     --------
     >>> DBundle_for_Ntubes_Phadkeb(Ntubes=782, Do=.028, pitch=.036, Ntp=2, angle=45.)
-    1.1879392959379533
+    1.1822478070154607
 
     References
     ----------
     .. [1] Phadke, P. S., Determining tube counts for shell and tube
        exchangers, Chem. Eng., September, 91, 65-68 (1984).
     '''
+    DBundle = float(_DBundle_for_Ntubes_Phadkeb_array(Ntubes, Do, pitch, Ntp, angle))
+    if DBundle != DBundle:
+        raise Exception('More tubes than the tube counts of Ntubes_Phadkeb are tabulated for')
+    return DBundle
+
+
+def _Ntubes_Perrys_polynomial(DBundle, Do, Ntp, angle=30):
+    # Tube count of Ntubes_Perrys before truncation; accepts arrays
     if angle == 30 or angle == 60:
-        Ns = triangular_Ns[-1]
+        C = 0.75*DBundle/Do - 36.
+        if Ntp == 1:
+            Nt = 1298. + 74.86*C + 1.283*C**2 - .0078*C**3 - .0006*C**4
+        elif Ntp == 2:
+            Nt = 1266. + 73.58*C + 1.234*C**2 - .0071*C**3 - .0005*C**4
+        elif Ntp == 4:
+            Nt = 1196. + 70.79*C + 1.180*C**2 - .0059*C**3 - .0004*C**4
+        elif Ntp == 6:
+            Nt = 1166. + 70.72*C + 1.269*C**2 - .0074*C**3 - .0006*C**4
+        else:
+            raise Exception('N passes not 1, 2, 4 or 6')
     elif angle == 45 or angle == 90:
-        Ns = square_Ns[-1]
-    s = Ns + 1
-    r = s**0.5
-    DBundle_max = (Do + 2.*pitch*r)*(1. - 1E-8) # Cannot be exact or floor(s) will give an int too high
-    def to_solve(DBundle):
-        ans = Ntubes_Phadkeb(DBundle=DBundle, Do=Do, pitch=pitch, Ntp=Ntp, angle=angle) - Ntubes
-        return ans
-    return sp_bisect(to_solve, 0, DBundle_max)
+        C = DBundle/Do - 36.
+        if Ntp == 1:
+            Nt = 593.6 + 33.52*C + .3782*C**2 - .0012*C**3 + .0001*C**4
+        elif Ntp == 2:
+            Nt = 578.8 + 33.36*C + .3847*C**2 - .0013*C**3 + .0001*C**4
+        elif Ntp == 4:
+            Nt = 562.0 + 33.04*C + .3661*C**2 - .0016*C**3 + .0002*C**4
+        elif Ntp == 6:
+            Nt = 550.4 + 32.49*C + .3873*C**2 - .0013*C**3 + .0001*C**4
+        else:
+            raise Exception('N passes not 1, 2, 4 or 6')
+    return Nt
+
+
+_Perrys_indexes = {}
+
+def _Perrys_index(Ntp, angle):
+    # Running maximum of the Perry's polynomial on a grid of D/Do from 5 to
+    # 1000, the range the equation is solved over
+    key = (Ntp, angle)
+    if key not in _Perrys_indexes:
+        x = np.linspace(5., 1000., 199001)
+        _Perrys_indexes[key] = (x, np.maximum.accumulate(
+                _Ntubes_Perrys_polynomial(x, 1., Ntp, angle)))
+    return _Perrys_indexes[key]
+
+
+def _DBundle_for_Ntubes_Perrys_array(N, Do, Ntp, angle=30):
+    # Smallest bundle diameter for which Ntubes_Perrys gives N tubes or more;
+    # NaN where that is outside 5 to 1000 tube diameters
+    N = np.asarray(N)
+    x, q_max = _Perrys_index(Ntp, angle)
+    i = np.searchsorted(q_max, N, side='left')
+    outside = (i == 0) | (i == len(x))
+    i = np.where(outside, 1, i)
+    lo, hi = x[i-1], x[i]
+    for _ in range(52):
+        mid = 0.5*(lo + hi)
+        above = _Ntubes_Perrys_polynomial(mid, 1., Ntp, angle) >= N
+        lo, hi = np.where(above, lo, mid), np.where(above, mid, hi)
+    return np.where(outside, np.nan, hi*Do)
 
 
 def Ntubes_Perrys(DBundle, Do, Ntp, angle=30):
@@ -6146,31 +7266,7 @@ def Ntubes_Perrys(DBundle, Do, Ntp, angle=30):
     .. [1] Green, Don, and Robert Perry. Perry's Chemical Engineers' Handbook,
        Eighth Edition. New York: McGraw-Hill Education, 2007.
     '''
-    if angle == 30 or angle == 60:
-        C = 0.75*DBundle/Do - 36.
-        if Ntp == 1:
-            Nt = 1298. + 74.86*C + 1.283*C**2 - .0078*C**3 - .0006*C**4
-        elif Ntp == 2:
-            Nt = 1266. + 73.58*C + 1.234*C**2 - .0071*C**3 - .0005*C**4
-        elif Ntp == 4:
-            Nt = 1196. + 70.79*C + 1.180*C**2 - .0059*C**3 - .0004*C**4
-        elif Ntp == 6:
-            Nt = 1166. + 70.72*C + 1.269*C**2 - .0074*C**3 - .0006*C**4
-        else:
-            raise Exception('N passes not 1, 2, 4 or 6')
-    elif angle == 45 or angle == 90:
-        C = DBundle/Do - 36.
-        if Ntp == 1:
-            Nt = 593.6 + 33.52*C + .3782*C**2 - .0012*C**3 + .0001*C**4
-        elif Ntp == 2:
-            Nt = 578.8 + 33.36*C + .3847*C**2 - .0013*C**3 + .0001*C**4
-        elif Ntp == 4:
-            Nt = 562.0 + 33.04*C + .3661*C**2 - .0016*C**3 + .0002*C**4
-        elif Ntp == 6:
-            Nt = 550.4 + 32.49*C + .3873*C**2 - .0013*C**3 + .0001*C**4
-        else:
-            raise Exception('N passes not 1, 2, 4 or 6')
-    return int(Nt)
+    return int(_Ntubes_Perrys_polynomial(DBundle, Do, Ntp, angle))
 
 
 def Ntubes_VDI(DBundle=None, Ntp=None, Do=None, pitch=None, angle=30.):
@@ -6545,12 +7641,17 @@ def size_bundle_from_tubecount(N, Do, pitch, Ntp=1, angle=30, Method=None,
     
     Notes
     -----
-    The 'Perry' method is solved with a numerical solver and is very unreliable.
+    The 'Perry' method returns the smallest diameter, between 5 and 1000 tube
+    diameters, at which its equation gives the specified number of tubes;
+    the equation is not monotonic, and should be used with care.
+    
+    All methods accept arrays of `N` through
+    :obj:`ht.vectorized.size_bundle_from_tubecount`.
     
     Examples
     --------
     >>> size_bundle_from_tubecount(N=1285, Do=0.025, pitch=0.03125)
-    1.1985676402390355
+    1.1959371246996997
     '''
     def list_methods():
         methods = ['Phadkeb']
@@ -6574,8 +7675,10 @@ def size_bundle_from_tubecount(N, Do, pitch, Ntp=1, angle=30, Method=None,
     elif Method == 'HEDH':
         return DBundle_for_Ntubes_HEDH(N=N, Do=Do, pitch=pitch, angle=angle)
     elif Method == 'Perry':
-        to_solve = lambda D : Ntubes_Perrys(DBundle=D, Do=Do, Ntp=Ntp, angle=angle) - N
-        return ridder(to_solve, Do*5, 1000*Do)
+        DBundle = float(_DBundle_for_Ntubes_Perrys_array(N, Do, Ntp, angle))
+        if DBundle != DBundle:
+            raise Exception('Tube count outside the range of the Perry method')
+        return DBundle
     else:
         raise Exception('Method not recognized; allowable methods are '
                         '"Phadkeb", "HEDH", "VDI", and "Perry"')
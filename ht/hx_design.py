@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+from __future__ import division
+from math import pi
+import numpy as np
+from ht.hx import (TEMA_tube_catalog, TEMA_tubing, TEMA_Ls, HEDH_shells,
+                   HEDH_pitches, shell_clearance, L_unsupported_max,
+                   NTU_from_P_basic, _Ntubes_Phadkeb_array)
+
+__all__ = ['shell_and_tube_designs', 'design_dtype']
+
+# Fields of each design: tube size [inch], gauge, tube diameters [m], pitch [m],
+# layout angle [degrees], tube passes, shell and bundle diameters [m], tube
+# count, tube length [m], baffle spacing [m], number of baffles, outer tube
+# area [m^2], U [W/m^2/K], UA [W/K], P1, duty [W], and duty margin
+design_dtype = np.dtype([('NPS', float), ('BWG', int), ('Do', float),
+                         ('Di', float), ('pitch', float), ('angle', float),
+                         ('Ntp', int), ('DShell', float), ('DBundle', float),
+                         ('Ntubes', int), ('L', float),
+                         ('baffle_spacing', float), ('N_baffles', int),
+                         ('A', float), ('U', float), ('UA', float),
+                         ('P1', float), ('Q', float), ('margin', float)])
+
+
+def _Pareto_front(A, margin):
+    '''Returns the indexes of the designs not dominated by any other, with a
+    smaller or equal area and a larger or equal duty margin, in order of
+    increasing area. Of designs with identical area and margin, only the
+    first is kept.
+    '''
+    # Stable sort by area, and then by decreasing margin
+    order = np.lexsort((-margin, A))
+    margin = margin[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = margin[1:] > np.maximum.accumulate(margin)[:-1]
+    return order[keep]
+
+
+def _tube_designs(task):
+    '''Enumerates, prunes, and rates every design with one tube size; run in
+    a worker process when more than one process is used.
+    '''
+    from ht.vectorized import temperature_effectiveness_TEMA_E
+    (NPS, BWG, Do, Di, t), pitch_ratios, s = task
+    DShells, DBundles, Ls = s['DShells'], s['DBundles'], s['Ls']
+    span_max = L_unsupported_max(Do, s['material'])
+    L_D = Ls[None, :]/DShells[:, None]
+    L_D_ok = (L_D >= s['L_D_ratios'][0]) & (L_D <= s['L_D_ratios'][1])
+
+    blocks = []
+    for pitch_ratio in pitch_ratios:
+        pitch = pitch_ratio*Do
+        for angle in s['angles']:
+            for Ntp in s['Ntps']:
+                # Cheap geometric bounds before anything is rated: at least
+                # one tube per pass, shell proportions, and the smallest
+                # area which could meet the duty in counterflow
+                Ntubes = _Ntubes_Phadkeb_array(DBundles, Do, pitch, Ntp, angle)
+                shell, length = np.nonzero((Ntubes >= Ntp)[:, None] & L_D_ok)
+                A = Ntubes[shell]*(pi*Do)*Ls[length]
+                ok = A >= s['A_min']
+                shell, length, A = shell[ok], length[ok], A[ok]
+                for baffle_ratio in s['baffle_spacing_ratios']:
+                    B = baffle_ratio*DShells[shell]
+                    # Tubes in the baffle windows are supported by every
+                    # other baffle only
+                    ok = (B >= 0.0508) & (2.*B <= span_max) & (B < Ls[length])
+                    if not ok.any():
+                        continue
+                    block = np.zeros(int(ok.sum()), dtype=design_dtype)
+                    block['NPS'], block['BWG'], block['Do'], block['Di'] = NPS, BWG, Do, Di
+                    block['pitch'], block['angle'], block['Ntp'] = pitch, angle, Ntp
+                    block['DShell'] = DShells[shell[ok]]
+                    block['DBundle'] = DBundles[shell[ok]]
+                    block['Ntubes'] = Ntubes[shell[ok]]
+                    block['L'] = Ls[length[ok]]
+                    block['baffle_spacing'] = B[ok]
+                    block['N_baffles'] = np.maximum(np.floor(block['L']/B[ok]) - 1, 0)
+                    block['A'] = A[ok]
+                    blocks.append(block)
+    if not blocks:
+        return np.zeros(0, dtype=design_dtype)
+    designs = np.concatenate(blocks)
+
+    U = s['U']
+    designs['U'] = U(designs) if callable(U) else U
+    designs['UA'] = designs['U']*designs['A']
+    NTU1 = designs['UA']/s['C1']
+    for Ntp in np.unique(designs['Ntp']):
+        group = designs['Ntp'] == Ntp
+        designs['P1'][group] = temperature_effectiveness_TEMA_E(
+                s['R1'], NTU1[group], int(Ntp), s['optimal'])
+    designs['Q'] = designs['P1']*s['C1']*s['dT']
+    designs['margin'] = designs['Q']/s['Q'] - 1.
+
+    ok = designs['margin'] >= s['margin_min']
+    if s['margin_max'] is not None:
+        ok &= designs['margin'] <= s['margin_max']
+    designs = designs[ok]
+    if s['Pareto'] and len(designs):
+        designs = designs[_Pareto_front(designs['A'], designs['margin'])]
+    return designs
+
+
+def shell_and_tube_designs(m1, m2, Cp1, Cp2, T1i, T2i, Q, U, NPSs=None,
+                           tmin=None, pitch_ratios=None, angles=(30, 90),
+                           DShells=None, Ls=None, Ntps=(1, 2, 4, 6, 8),
+                           baffle_spacing_ratios=(0.4,),
+                           L_D_ratios=(3., 15.), margin_min=0.,
+                           margin_max=None, optimal=True, material='CS',
+                           Pareto=True, processes=1):
+    r'''Enumerates the TEMA E shell-and-tube heat exchanger designs which
+    meet a specified duty, and returns those on the Pareto front of
+    smallest heat transfer area and largest duty margin. Fluid 1 is on the
+    shell side, and fluid 2 in the tubes.
+
+    Every combination of tube size, tube pitch, layout angle, shell
+    diameter, tube length, number of tube passes, and baffle spacing is
+    considered. Combinations are discarded before they are rated if:
+
+        * There is not at least one tube per pass (:obj:`ht.hx.Ntubes_Phadkeb`)
+        * The ratio of tube length to shell diameter is outside `L_D_ratios`
+        * The baffle spacing is less than 2 inches, not less than the tube length,
+          or half the maximum unsupported tube span
+          (:obj:`ht.hx.L_unsupported_max`) is exceeded
+        * The area is smaller than that which would meet the duty with
+          `margin_min` in an ideal counterflow exchanger; only when `U` is a
+          constant
+
+    The survivors are rated with the P-NTU method
+    (:obj:`ht.hx.temperature_effectiveness_TEMA_E`), all of those with the
+    same tube size and number of passes at once. The work for each tube
+    size can be spread over a pool of processes.
+
+    Parameters
+    ----------
+    m1 : float
+        Mass flow rate of fluid 1, in the shell, [kg/s]
+    m2 : float
+        Mass flow rate of fluid 2, in the tubes, [kg/s]
+    Cp1 : float
+        Averaged heat capacity of fluid 1, [J/kg/K]
+    Cp2 : float
+        Averaged heat capacity of fluid 2, [J/kg/K]
+    T1i : float
+        Inlet temperature of fluid 1, [K]
+    T2i : float
+        Inlet temperature of fluid 2, [K]
+    Q : float
+        Duty which must be met, [W]
+    U : float or callable
+        Overall heat transfer coefficient based on the outer tube area, or
+        a function of an array of designs (with the fields of
+        :obj:`design_dtype`; the rating fields are zero) returning an array
+        of it, [W/m^2/K]
+    NPSs : list[float], optional
+        Nominal tube sizes to consider; all sizes in
+        :obj:`ht.hx.TEMA_tubing` by default, [inch]
+    tmin : float, optional
+        Minimum tube wall thickness; if specified only the thinnest gauge
+        of each size meeting it is considered, otherwise all gauges are, [m]
+    pitch_ratios : list[float], optional
+        Ratios of tube pitch to outer diameter to consider; the
+        recommendations in `HEDH_pitches` for each size by default, [-]
+    angles : list[float], optional
+        Tube layout angles to consider; 30, 45, 60 or 90, [degrees]
+    DShells : list[float], optional
+        Shell inner diameters to consider; `HEDH_shells` by default, [m]
+    Ls : list[float], optional
+        Tube lengths to consider; `TEMA_Ls` by default, [m]
+    Ntps : list[int], optional
+        Numbers of tube passes to consider; 1, 2, 4, 6 or 8, [-]
+    baffle_spacing_ratios : list[float], optional
+        Ratios of baffle spacing to shell inner diameter to consider, [-]
+    L_D_ratios : tuple(float, 2), optional
+        Smallest and largest ratios of tube length to shell inner diameter
+        to consider, [-]
+    margin_min : float, optional
+        Smallest ratio of duty to the specified duty, less 1, to accept;
+        negative to accept designs which do not quite meet the duty, [-]
+    margin_max : float, optional
+        Largest ratio of duty to the specified duty, less 1, to accept, [-]
+    optimal : bool, optional
+        Whether or not the tube passes are arranged in the more efficient
+        way, as in :obj:`ht.hx.temperature_effectiveness_TEMA_E`, [-]
+    material : str, optional
+        Tube material for :obj:`ht.hx.L_unsupported_max`, [-]
+    Pareto : bool, optional
+        If False, every accepted design is returned, not only those on the
+        Pareto front, [-]
+    processes : int, optional
+        Number of processes to rate designs in; 1 rates them in this process,
+        and None uses one per CPU. `U` must be picklable if this is not 1, [-]
+
+    Returns
+    -------
+    designs : ndarray
+        Structured array of the accepted designs with the fields of
+        :obj:`design_dtype`, sorted by increasing area; `margin` is the
+        ratio of duty to the specified duty, less 1, [-]
+
+    Notes
+    -----
+    The shell diameters are those of the shells, and the bundle diameters
+    are found from them with :obj:`ht.hx.shell_clearance`. The tube count
+    is exact, from :obj:`ht.hx.Ntubes_Phadkeb`; no tubes are removed for
+    impingement plates or tie rods.
+
+    If the duty cannot be met even by an infinitely large counterflow
+    exchanger, no designs are returned.
+
+    Designs with identical areas and duty margins, such as those which
+    differ only in baffle spacing when `U` is a constant, are only returned
+    once on the Pareto front; the first one considered is kept.
+
+    Examples
+    --------
+    >>> designs = shell_and_tube_designs(m1=5.2, m2=1.45, Cp1=1860.,
+    ... Cp2=1900., T1i=130., T2i=15., Q=2E5, U=300., NPSs=[0.75], tmin=1E-3,
+    ... Ntps=[2])
+    >>> len(designs)
+    410
+    >>> best = designs[0]
+    >>> float(best['A']), float(best['margin'])
+    (11.088993943348482, 0.004769579841912064)
+    >>> float(best['DShell']), int(best['Ntubes']), float(best['L'])
+    (0.3048, 76, 2.438)
+    '''
+    C1, C2 = m1*Cp1, m2*Cp2
+    R1 = C1/C2
+    dT = abs(T1i - T2i)
+    P1_min = Q*(1. + margin_min)/(C1*dT)
+    if P1_min >= min(1., 1./R1):
+        return np.zeros(0, dtype=design_dtype)
+    if callable(U) or P1_min <= 0.:
+        A_min = 0.
+    else:
+        if R1 == 1.:
+            # Limit of the counterflow solution for balanced streams
+            NTU1_min = P1_min/(1. - P1_min)
+        else:
+            NTU1_min = NTU_from_P_basic(P1_min, R1, subtype='counterflow')
+        A_min = NTU1_min*C1/U
+
+    if NPSs is None:
+        NPSs = sorted(TEMA_tubing)
+    if DShells is None:
+        DShells = HEDH_shells
+    if Ls is None:
+        Ls = TEMA_Ls
+    DShells = np.array(DShells, dtype=float)
+    settings = {'C1': C1, 'R1': R1, 'dT': dT, 'Q': Q, 'U': U, 'A_min': A_min,
+                'DShells': DShells, 'Ls': np.array(Ls, dtype=float),
+                'DBundles': DShells - np.array([shell_clearance(DShell=DShell)
+                                                for DShell in DShells]),
+                'angles': angles, 'Ntps': Ntps,
+                'baffle_spacing_ratios': baffle_spacing_ratios,
+                'L_D_ratios': L_D_ratios, 'margin_min': margin_min,
+                'margin_max': margin_max, 'optimal': optimal,
+                'material': material, 'Pareto': Pareto}
+
+    tasks = []
+    for NPS in NPSs:
+        if NPS not in TEMA_tubing:
+            raise Exception('NPS Specified is not listed in TEMA')
+        if tmin is None:
+            tubes = [TEMA_tube_catalog.lookup(NPS, BWG) for BWG in TEMA_tubing[NPS]]
+        else:
+            try:
+                tubes = [TEMA_tube_catalog.thinnest(NPS, tmin)]
+            except Exception:
+                continue
+        ratios = pitch_ratios if pitch_ratios is not None else HEDH_pitches.get(NPS, (1.25,))
+        tasks.extend((tube, ratios, settings) for tube in tubes)
+
+    if processes == 1:
+        results = [_tube_designs(task) for task in tasks]
+    else:
+        from multiprocessing import Pool
+        pool = Pool(processes)
+        try:
+            results = pool.map(_tube_designs, tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+    designs = np.concatenate([np.zeros(0, dtype=design_dtype)] + results)
+    if Pareto:
+        return designs[_Pareto_front(designs['A'], designs['margin'])]
+    return designs[np.argsort(designs['A'], kind='mergesort')]
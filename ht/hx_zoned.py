@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+from __future__ import division
+import numpy as np
+
+__all__ = ['P_NTU_zoned']
+
+
+def _zone_values(value, zones, *T):
+    '''Returns a property for every zone; `value` is either a constant, a
+    table with one value per zone, or a function of the zone temperatures.
+    '''
+    if callable(value):
+        value = value(*T)
+    value = np.asarray(value, dtype=float)
+    if value.ndim and value.shape != (zones,):
+        raise Exception('Tabulated properties must have one value per zone')
+    return value + np.zeros(zones)
+
+
+def _cumulative_products(M):
+    '''Returns the products M[k] @ ... @ M[0] of a stack of 2x2 matrices for
+    every k, with a parallel prefix scan of log2(len(M)) vectorized steps.
+    '''
+    M = M.copy()
+    shift = 1
+    while shift < len(M):
+        M[shift:] = np.matmul(M[shift:], M[:-shift])
+        shift *= 2
+    return M
+
+
+def _zone_temperatures(P1, R1, NTU1, T1i, T2i, counterflow):
+    '''Returns the temperatures of both fluids at the boundaries of the
+    zones, in the direction of flow of fluid 1, given the temperature
+    effectiveness and ratio of heat capacity rates of every zone.
+    '''
+    if counterflow and np.sum(NTU1*(R1 - 1.)) > 0.:
+        # The temperature difference grows in the direction of fluid 1;
+        # march in that of fluid 2 instead, so errors in the temperature of
+        # fluid 2 at the far end are not amplified along the exchanger
+        T2, T1 = _zone_temperatures((P1*R1)[::-1], (1./R1)[::-1],
+                                    (NTU1*R1)[::-1], T2i, T1i, True)
+        return T1[::-1], T2[::-1]
+
+    P2 = P1*R1
+    M = np.empty((len(P1), 2, 2))
+    if counterflow:
+        # Zone k has the inlets T1[k] and T2[k+1]; its two balances are
+        # rearranged for T1[k+1] and T2[k+1]
+        M[:, 1, 0] = -P2/(1. - P2)
+        M[:, 1, 1] = 1./(1. - P2)
+        M[:, 0, 0] = 1. - P1 + P1*M[:, 1, 0]
+        M[:, 0, 1] = P1*M[:, 1, 1]
+    else:
+        M[:, 0, 0] = 1. - P1
+        M[:, 0, 1] = P1
+        M[:, 1, 0] = P2
+        M[:, 1, 1] = 1. - P2
+    products = _cumulative_products(M)
+
+    if counterflow:
+        # Fluid 2 leaves where fluid 1 enters, at the temperature which
+        # brings it to T2i at the other end
+        T20 = (T2i - products[-1, 1, 0]*T1i)/products[-1, 1, 1]
+    else:
+        T20 = T2i
+    T1 = np.concatenate(([T1i], products[:, 0, 0]*T1i + products[:, 0, 1]*T20))
+    T2 = np.concatenate(([T20], products[:, 1, 0]*T1i + products[:, 1, 1]*T20))
+    if counterflow:
+        T2[-1] = T2i
+    return T1, T2
+
+
+def P_NTU_zoned(m1, m2, Cp1, Cp2, T1i, T2i, UA=None, U=None, A=None,
+                zones=20, subtype='counterflow', tol=1E-9, maxiter=100):
+    r'''Rates a counterflow or parallel flow heat exchanger whose properties
+    vary along its length, by dividing it into `zones` zones of equal area
+    and applying the P-NTU relation of the flow arrangement to each of them.
+    The heat capacities of either fluid and the overall heat transfer
+    coefficient may each be a constant, a table with one value per zone, or
+    a function of the temperatures in the zones.
+
+    In each zone, the temperature effectiveness is that of
+    :obj:`ht.hx.temperature_effectiveness_basic` with the heat capacity
+    rates and UA of the zone:
+
+    .. math::
+        T_{1,k+1} = T_{1,k} - P_{1,k}(T_{1,k} - T_{2,in,k})
+
+    .. math::
+        T_{2,out,k} = T_{2,in,k} + P_{1,k}R_{1,k}(T_{1,k} - T_{2,in,k})
+
+    All of these linear relations are solved together for the temperatures
+    at the boundaries of the zones, for the whole exchanger at once; where
+    the properties are functions of temperature, they are re-evaluated at
+    the mean temperature of each zone and the solution repeated until the
+    temperatures stop changing.
+
+    Parameters
+    ----------
+    m1 : float
+        Mass flow rate of fluid 1, [kg/s]
+    m2 : float
+        Mass flow rate of fluid 2, [kg/s]
+    Cp1 : float, array, or callable
+        Heat capacity of fluid 1; a constant, one value for each zone in the
+        direction of flow of fluid 1, or a function of an array of the mean
+        temperatures of fluid 1 in the zones returning an array of it,
+        [J/kg/K]
+    Cp2 : float, array, or callable
+        Heat capacity of fluid 2, specified in the same way as `Cp1` but
+        with the temperatures of fluid 2, [J/kg/K]
+    T1i : float
+        Inlet temperature of fluid 1, [K]
+    T2i : float
+        Inlet temperature of fluid 2, [K]
+    UA : float, optional
+        Combined area-heat transfer coefficient term of the whole exchanger,
+        shared equally among the zones, [W/K]
+    U : float, array, or callable, optional
+        Overall heat transfer coefficient; a constant, one value for each
+        zone, or a function of arrays of the mean temperatures of fluid 1
+        and fluid 2 in the zones returning an array of it; used with `A`
+        instead of `UA`, [W/m^2/K]
+    A : float, optional
+        Heat transfer area of the whole exchanger, [m^2]
+    zones : int, optional
+        Number of zones of equal area the exchanger is divided into, [-]
+    subtype : str, optional
+        The flow arrangement, 'counterflow' or 'parallel', [-]
+    tol : float, optional
+        Largest change in any temperature between two successive solutions,
+        relative to the difference of the inlet temperatures, at which the
+        solution is accepted, [-]
+    maxiter : int, optional
+        Maximum number of times the properties are re-evaluated, [-]
+
+    Returns
+    -------
+    results : dict
+        * Q : Heat exchanged in the heat exchanger, [W]
+        * T1i : Inlet temperature of fluid 1, [K]
+        * T1o : Outlet temperature of fluid 1, [K]
+        * T2i : Inlet temperature of fluid 2, [K]
+        * T2o : Outlet temperature of fluid 2, [K]
+        * P1 : Temperature effectiveness of the whole exchanger with
+          respect to fluid 1, [-]
+        * P2 : Temperature effectiveness of the whole exchanger with
+          respect to fluid 2, [-]
+        * UA : Combined area-heat transfer coefficient term of the whole
+          exchanger, [W/K]
+        * T1 : Temperatures of fluid 1 at the `zones` + 1 boundaries of
+          the zones, in the direction of flow of fluid 1, [K]
+        * T2 : Temperatures of fluid 2 at the same boundaries, [K]
+        * Q_zones : Heat exchanged in each zone, [W]
+        * C1_zones : Heat capacity rate of fluid 1 in each zone, [W/K]
+        * C2_zones : Heat capacity rate of fluid 2 in each zone, [W/K]
+        * UA_zones : Area-heat transfer coefficient term of each zone, [W/K]
+        * P1_zones : Temperature effectiveness of each zone with respect to
+          fluid 1, [-]
+        * iterations : Number of times the properties were evaluated, [-]
+
+    Notes
+    -----
+    With constant properties the result is that of
+    :obj:`ht.hx.P_NTU_method` for any number of zones, and no iteration is
+    performed. Otherwise the error of approximating the properties of each
+    zone by those at its mean temperatures falls with the square of the
+    number of zones.
+
+    A fluid condensing or boiling at constant temperature can be represented
+    by a very large heat capacity in the zones where it changes phase;
+    the heat capacity of a zone is that of the fluid at the mean
+    temperature of the zone, so a table of values is preferred to a
+    function with a discontinuity there.
+
+    The temperatures are marched across the exchanger with the products of
+    the 2x2 matrices relating the temperatures at the two ends of each zone,
+    which are all found in log2(`zones`) vectorized steps. In counterflow,
+    they are marched in the direction of flow of whichever fluid the
+    temperature difference falls along.
+
+    Examples
+    --------
+    Cooling oil whose heat capacity rises with temperature against water:
+
+    >>> res = P_NTU_zoned(m1=5.2, m2=1.45, Cp1=lambda T: 1500. + 3.*T,
+    ... Cp2=4180., T1i=130., T2i=15., UA=3041.75)
+    >>> round(res['Q'], 1), round(res['T1o'], 4), round(res['T2o'], 4)
+    (247964.0, 104.2431, 55.9114)
+    '''
+    if subtype not in ('counterflow', 'parallel'):
+        raise Exception("Zones may only be arranged in 'counterflow' or "
+                        "'parallel'")
+    if UA is None and (U is None or A is None):
+        raise Exception('Either UA or both U and A are required')
+    from ht.vectorized import temperature_effectiveness_basic
+    counterflow = subtype == 'counterflow'
+    constant = not (callable(Cp1) or callable(Cp2) or (UA is None and callable(U)))
+    dT = abs(T1i - T2i)
+
+    # The properties are first evaluated at the inlet temperatures
+    T1 = np.full(zones + 1, float(T1i))
+    T2 = np.full(zones + 1, float(T2i))
+    for iterations in range(1, maxiter + 1):
+        T1m, T2m = 0.5*(T1[1:] + T1[:-1]), 0.5*(T2[1:] + T2[:-1])
+        C1 = m1*_zone_values(Cp1, zones, T1m)
+        C2 = m2*_zone_values(Cp2, zones, T2m)
+        if UA is not None:
+            UAs = np.full(zones, UA/zones)
+        else:
+            UAs = _zone_values(U, zones, T1m, T2m)*(A/zones)
+        R1 = C1/C2
+        NTU1 = UAs/C1
+        P1 = temperature_effectiveness_basic(R1, NTU1, subtype=subtype)
+        T1_new, T2_new = _zone_temperatures(P1, R1, NTU1, T1i, T2i, counterflow)
+        change = max(np.max(np.abs(T1_new - T1)), np.max(np.abs(T2_new - T2)))
+        T1, T2 = T1_new, T2_new
+        if constant or change <= tol*dT:
+            break
+    else:
+        raise Exception('The temperatures of the zones did not converge in '
+                        '%d iterations' %maxiter)
+
+    Q_zones = C1*(T1[:-1] - T1[1:])
+    Q = float(np.sum(Q_zones))
+    T1o = float(T1[-1])
+    T2o = float(T2[0] if counterflow else T2[-1])
+    return {'Q': Q, 'T1i': T1i, 'T1o': T1o, 'T2i': T2i, 'T2o': T2o,
+            'P1': (T1i - T1o)/(T1i - T2i), 'P2': (T2o - T2i)/(T1i - T2i),
+            'UA': float(np.sum(UAs)), 'T1': T1, 'T2': T2, 'Q_zones': Q_zones,
+            'C1_zones': C1, 'C2_zones': C2, 'UA_zones': UAs,
+            'P1_zones': P1, 'iterations': iterations}
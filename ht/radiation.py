@@ -25,9 +25,12 @@ from math import exp, e
 import os
 from io import open
 from fluids.constants import sigma, h, c, k, pi
+from fluids.numerics import horner
 
-__all__ = ['blackbody_spectral_radiance', 'q_rad', 'grey_transmittance',
-           'solar_spectrum']
+__all__ = ['blackbody_spectral_radiance', 'blackbody_fraction', 'q_rad',
+           'grey_transmittance', 'solar_spectrum',
+           'blackbody_weighted_property', 'spectrum_weighted_property',
+           'solar_absorbed_flux']
 
 folder = os.path.join(os.path.dirname(__file__), 'data')
 
@@ -84,6 +87,162 @@ def blackbody_spectral_radiance(T, wavelength):
         return 0.0
 
 
+# Second radiation constant, [m*K]
+C2 = h*c/k
+# Coefficients in zeta^2 of the expansion of the fraction of emission above a
+# wavelength for small zeta = C2/(wavelength*T); the n-th is
+# B_2n/((2n + 3)(2n)!) with B_2n the Bernoulli numbers. Used for zeta < 2.
+_blackbody_fraction_coeffs = [
+    6.87258318890207e-26, -2.888231428076628e-24, 1.2188644964239542e-22,
+    -5.1683202540046385e-21, 2.203601131344092e-19, -9.455950863295921e-18,
+    4.088600979179926e-16, -1.784042261222412e-14, 7.872080312167458e-13,
+    -3.522793425791662e-11, 1.6059043836821615e-09, -7.515632515632516e-08,
+    3.6743092298647855e-06, -0.0001984126984126984, 0.016666666666666666]
+_blackbody_fraction_factor = 15.0/pi**4
+
+
+def _blackbody_fractions(zeta):
+    # Fractions of blackbody emission below and above a wavelength, each
+    # evaluated so that it is accurate when small.
+    if zeta >= 2.0:
+        if zeta > 800.0:
+            return 0.0, 1.0
+        below = 0.0
+        for n in range(1, int(40.0/zeta) + 2):
+            below += exp(-n*zeta)/n*(zeta*zeta*zeta + 3.0*zeta*zeta/n
+                                     + 6.0*zeta/(n*n) + 6.0/(n*n*n))
+        below *= _blackbody_fraction_factor
+        return below, 1.0 - below
+    zeta2 = zeta*zeta
+    above = _blackbody_fraction_factor*zeta*zeta2*(1.0/3.0 - 0.125*zeta
+            + zeta2*horner(_blackbody_fraction_coeffs, zeta2))
+    return 1.0 - above, above
+
+
+def _blackbody_fractions_array(zeta):
+    # Array version of `_blackbody_fractions`
+    import numpy as np
+    below, above = np.zeros(zeta.shape), np.zeros(zeta.shape)
+    large = zeta >= 2.0
+    z = np.minimum(zeta[large], 800.0)
+    s = np.exp(-z)*(z*z*z + 3.0*z*z + 6.0*z + 6.0)
+    # Sum only the terms which are significant for each zeta
+    active = np.flatnonzero(z < 40.0)
+    for n in range(2, 22):
+        za = z[active]
+        w = n*za
+        s[active] += np.exp(-w)*(((w + 3.0)*w + 6.0)*w + 6.0)*(1.0/(n*n*n*n))
+        active = active[za < 40.0/n]
+        if not active.size:
+            break
+    below[large] = s*_blackbody_fraction_factor
+    above[large] = 1.0 - below[large]
+    
+    small = ~large
+    z = zeta[small]
+    z2 = z*z
+    poly = np.zeros(z.shape)
+    for coeff in _blackbody_fraction_coeffs:
+        poly = poly*z2 + coeff
+    s = _blackbody_fraction_factor*z*z2*(1.0/3.0 - 0.125*z + z2*poly)
+    above[small] = s
+    below[small] = 1.0 - s
+    return below, above
+
+
+def _blackbody_fraction_array(T, wavelength_min=0.0, wavelength_max=None):
+    # Array version of `blackbody_fraction`, broadcasting its arguments
+    import numpy as np
+    T = np.asarray(T, dtype=float)
+    wavelength_min = np.asarray(wavelength_min, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zeta_low = np.where((T > 0.0) & (wavelength_min > 0.0),
+                            C2/(wavelength_min*T), np.inf)
+        if wavelength_max is None:
+            zeta_high = np.zeros(np.shape(zeta_low))
+            empty = False
+        else:
+            wavelength_max = np.asarray(wavelength_max, dtype=float)
+            zeta_high = np.where(T > 0.0, C2/(wavelength_max*T), np.inf)
+            empty = wavelength_max <= wavelength_min
+    zeta_low, zeta_high = np.broadcast_arrays(zeta_low, zeta_high)
+    below_low, above_low = _blackbody_fractions_array(zeta_low)
+    below_high, above_high = _blackbody_fractions_array(zeta_high)
+    fraction = np.where(below_high <= 0.5, below_high - below_low,
+                        above_low - above_high)
+    return np.where(empty, 0.0, fraction)
+
+
+def blackbody_fraction(T, wavelength_min=0.0, wavelength_max=None):
+    r'''Returns the fraction of the total emissive power of a blackbody at
+    temperature `T` which is emitted between two wavelengths.
+
+    .. math::
+        F_{\lambda_1 - \lambda_2} = \frac{1}{\sigma T^4}
+        \int_{\lambda_1}^{\lambda_2} \pi I_{\lambda,blackbody,e}(\lambda,T)
+        d\lambda
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature of the surface, [K]
+    wavelength_min : float or array-like, optional
+        Shortest wavelength of the band, [m]
+    wavelength_max : float or array-like, optional
+        Longest wavelength of the band; infinite if not specified, [m]
+
+    Returns
+    -------
+    fraction : float or ndarray
+        Fraction of blackbody emission within the band; an array of the
+        broadcast shape of the inputs if any of them is an array, [-]
+
+    Notes
+    -----
+    The fraction emitted below a wavelength depends only on
+    :math:`\zeta = hc_o/(\lambda k T)`. It is evaluated with the exponential
+    series of [1]_ for :math:`\zeta \ge 2`, and otherwise from the
+    complementary fraction, with the expansion of
+    :math:`\int_0^\zeta x^3/(e^x-1) dx` in terms of the Bernoulli numbers.
+    Both are accurate to about machine precision, and no quadrature is
+    needed. Arrays of temperatures and band limits are evaluated together,
+    with both series summed for all of the points at once.
+
+    Examples
+    --------
+    Fraction of the emission of the sun in the visible spectrum:
+
+    >>> blackbody_fraction(5778., 380E-9, 750E-9)
+    0.4380559161133125
+
+    >>> blackbody_fraction([1000., 5778.], 380E-9, 750E-9)
+    array([5.94858334e-06, 4.38055916e-01])
+
+    References
+    ----------
+    .. [1] Modest, Michael F. Radiative Heat Transfer, Third Edition. 3rd
+       edition. New York: Academic Press, 2013.
+    '''
+    for value in (T, wavelength_min, wavelength_max):
+        if isinstance(value, (list, tuple)) or getattr(value, 'ndim', 0):
+            return _blackbody_fraction_array(T, wavelength_min, wavelength_max)
+    if wavelength_max is not None and wavelength_max <= wavelength_min:
+        return 0.0
+    if wavelength_min <= 0.0 or T <= 0.0:
+        low = (0.0, 1.0)
+    else:
+        low = _blackbody_fractions(C2/(wavelength_min*T))
+    if wavelength_max is None:
+        high = (1.0, 0.0)
+    elif T <= 0.0:
+        high = (0.0, 1.0)
+    else:
+        high = _blackbody_fractions(C2/(wavelength_max*T))
+    if high[0] <= 0.5:
+        return high[0] - low[0]
+    return low[1] - high[1]
+
+
 def q_rad(emissivity, T, T2=0):
     r'''Returns the radiant heat flux of a surface, optionally including
     assuming radiant heat transfer back to the surface.
@@ -181,6 +340,70 @@ def grey_transmittance(extinction_coefficient, molar_density, length, base=e):
     return base**(-transmittance)
 
 
+_solar_spectrum_files = {'SOLAR-ISS': 'solar_iss_2018_spectrum.dat'}
+_solar_spectrum_cache = {}
+
+
+def _parse_solar_spectrum(model):
+    import numpy as np
+    pth = os.path.join(folder, _solar_spectrum_files[model])
+    data = np.loadtxt(pth)
+    wavelengths, SSI, uncertainties = data[:, 0], data[:, 1], data[:, 2]
+    
+    wavelengths = wavelengths*1E-9
+    SSI = SSI*1E9
+    
+    # Convert -1 uncertainties to nans
+    uncertainties[uncertainties == -1] = np.nan
+    
+    uncertainties = uncertainties*1E9
+    return np.array([wavelengths, SSI, uncertainties])
+
+
+def _user_cache_folder():
+    '''Returns the folder binary copies of the data files are kept in, which
+    is in the user's cache rather than the installed package so that
+    read-only installs work.
+    '''
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ht')
+
+
+def _load_solar_spectrum(model):
+    # Prefer the binary copy of the parsed data in the user's cache unless the
+    # text file is newer; create it if possible, but without a writable cache
+    # only the speedup is lost.
+    import numpy as np
+    pth = os.path.join(folder, _solar_spectrum_files[model])
+    cache_folder = _user_cache_folder()
+    npy_pth = os.path.join(cache_folder, os.path.splitext(_solar_spectrum_files[model])[0] + '.npy')
+    try:
+        if os.path.getmtime(npy_pth) >= os.path.getmtime(pth):
+            return np.asarray(np.load(npy_pth, mmap_mode='r'))
+    except (IOError, OSError, ValueError):
+        pass
+    data = _parse_solar_spectrum(model)
+    tmp_pth = '%s.%d.tmp' %(npy_pth, os.getpid())
+    try:
+        if not os.path.isdir(cache_folder):
+            os.makedirs(cache_folder)
+        with open(tmp_pth, 'wb') as f:
+            np.save(f, data)
+        if os.path.exists(npy_pth):
+            os.remove(npy_pth)
+        os.rename(tmp_pth, npy_pth)
+    except (IOError, OSError):
+        try:
+            os.remove(tmp_pth)
+        except (IOError, OSError):
+            pass
+    data.flags.writeable = False
+    return data
+
+
 def solar_spectrum(model='SOLAR-ISS'):
     r'''Returns the solar spectrum of the sun according to the specified model.
     Only the 'SOLAR-ISS' model is supported.
@@ -215,8 +438,12 @@ def solar_spectrum(model='SOLAR-ISS'):
     
     [2]_ contains another dataset.
     
-    99.9% of the time this function takes is to read in the solar data from
-    disk. This could be reduced by using pandas.
+    The data is parsed once per process and cached; the arrays returned are
+    read-only views of the cache, so copy them before modifying them. The
+    parsed data is also written to an `ht` folder in the user's cache
+    directory (`XDG_CACHE_HOME`, `~/.cache`, or `LOCALAPPDATA` on Windows) as
+    a `.npy` file, which is memory-mapped instead of parsing the text file in
+    later processes.
     
     Examples
     --------
@@ -248,18 +475,197 @@ def solar_spectrum(model='SOLAR-ISS'):
        Research Letters 36, no. 1 (January 1, 2009).
        https://doi.org/10.1029/2008GL036373.
     '''
-    if model == 'SOLAR-ISS':
-        import numpy as np
-        pth = os.path.join(folder, 'solar_iss_2018_spectrum.dat')
-        data = np.loadtxt(pth)
-        wavelengths, SSI, uncertainties = data[:, 0], data[:, 1], data[:, 2]
-        
-        wavelengths = wavelengths*1E-9
-        SSI = SSI*1E9
-        
-        # Convert -1 uncertainties to nans
-        uncertainties[uncertainties == -1] = np.nan
-        
-        uncertainties = uncertainties*1E9
-    return wavelengths, SSI, uncertainties
+    if model not in _solar_spectrum_files:
+        raise Exception('Model not recognized')
+    try:
+        data = _solar_spectrum_cache[model]
+    except KeyError:
+        data = _solar_spectrum_cache[model] = tuple(_load_solar_spectrum(model))
+    return data
+
+
+
+def _band_edges(wavelengths):
+    # Each value applies from halfway to the previous wavelength to halfway to
+    # the next; the first and last extend to zero and infinite wavelength.
+    import numpy as np
+    wavelengths = np.asarray(wavelengths, dtype=float)
+    mid = 0.5*(wavelengths[1:] + wavelengths[:-1])
+    return np.concatenate(([0.0], mid, [np.inf]))
+
+
+def _cumulative_spectrum(wavelengths, spectrum):
+    # Trapezoidal integral of the spectrum from its first wavelength
+    import numpy as np
+    wavelengths = np.asarray(wavelengths, dtype=float)
+    spectrum = np.asarray(spectrum, dtype=float)
+    cumulative = np.zeros(wavelengths.shape)
+    np.cumsum(0.5*(spectrum[1:] + spectrum[:-1])*np.diff(wavelengths),
+              out=cumulative[1:])
+    return wavelengths, cumulative
+
 
+def _band_integrals(edges, wavelengths, cumulative):
+    import numpy as np
+    return np.diff(np.interp(edges, wavelengths, cumulative))
+
+
+_solar_cumulative_cache = {}
+
+
+def blackbody_weighted_property(T, wavelengths, values):
+    r'''Returns the average of a spectral property of a surface, weighted by the
+    emission of a blackbody at temperature `T`. With spectral emissivities,
+    this is the total hemispherical emissivity of the surface at `T`; with
+    spectral absorptivities, its total absorptivity for radiation from a
+    blackbody source at `T`.
+
+    .. math::
+        \epsilon(T) = \sum_i \epsilon_{\lambda,i} F_{\lambda_{i-1/2}
+        - \lambda_{i+1/2}}(T)
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature of the blackbody, [K]
+    wavelengths : array-like
+        Increasing wavelengths at which the property is specified, [m]
+    values : array-like
+        Spectral property at each wavelength, along the last axis, [-]
+
+    Returns
+    -------
+    value : float or ndarray
+        Blackbody-weighted average of the property; `T` and `values` without
+        their last axis are broadcast against each other, [-]
+
+    Notes
+    -----
+    The property is taken as constant from halfway to the previous
+    wavelength to halfway to the next one, and the first and last values
+    extend to zero and infinite wavelength. The fraction of blackbody emission
+    in each of these bands is calculated in closed form as in
+    :obj:`blackbody_fraction`, so thousands of temperatures and surfaces
+    can be evaluated at once.
+
+    Examples
+    --------
+    A selective surface with a high absorptivity below 2 um and a low
+    emissivity above it:
+
+    >>> blackbody_weighted_property([400., 5778.], [1E-6, 3E-6], [0.95, 0.1])
+    array([0.10001397, 0.89869921])
+
+    References
+    ----------
+    .. [1] Bergman, Theodore L., Adrienne S. Lavine, Frank P. Incropera, and
+       David P. DeWitt. Introduction to Heat Transfer. 6E. Hoboken, NJ:
+       Wiley, 2011.
+    '''
+    import numpy as np
+    T = np.asarray(T, dtype=float)
+    edges = _band_edges(wavelengths)
+    with np.errstate(divide='ignore'):
+        zeta = C2/(edges*T[..., None])
+    below, above = _blackbody_fractions_array(zeta)
+    below_high = below[..., 1:]
+    fractions = np.where(below_high <= 0.5, below_high - below[..., :-1],
+                         above[..., :-1] - above[..., 1:])
+    return (np.asarray(values, dtype=float)*fractions).sum(axis=-1)
+
+
+def spectrum_weighted_property(wavelengths, values, spectrum_wavelengths,
+                               spectrum):
+    r'''Returns the average of a spectral property of a surface, weighted by a
+    spectrum of incident radiation; for example the absorptivity of a surface
+    for the light of a lamp, or for sunlight through a window.
+
+    .. math::
+        \alpha = \frac{\int \alpha_\lambda G_\lambda d\lambda}
+        {\int G_\lambda d\lambda}
+
+    Parameters
+    ----------
+    wavelengths : array-like
+        Increasing wavelengths at which the property is specified, [m]
+    values : array-like
+        Spectral property at each wavelength, along the last axis, [-]
+    spectrum_wavelengths : array-like
+        Increasing wavelengths at which the spectrum is specified, [m]
+    spectrum : array-like
+        Spectral irradiance (or any quantity proportional to it) at each
+        of `spectrum_wavelengths`, [W/(m^2*m)]
+
+    Returns
+    -------
+    value : float or ndarray
+        Spectrum-weighted average of the property, for each set of `values`,
+        [-]
+
+    Notes
+    -----
+    The property is taken as constant over bands as in
+    :obj:`blackbody_weighted_property`. The spectrum is integrated with the
+    trapezoidal rule, and the power of the spectrum in each band is found
+    from its cumulative integral, so the cost of many sets of `values` is a
+    single matrix product.
+
+    Examples
+    --------
+    >>> wavelengths, SSI, _ = solar_spectrum()
+    >>> spectrum_weighted_property([1E-6, 3E-6], [0.95, 0.1], wavelengths, SSI)
+    0.9147021422770992
+    '''
+    import numpy as np
+    spectrum_wavelengths, cumulative = _cumulative_spectrum(spectrum_wavelengths, spectrum)
+    bands = _band_integrals(_band_edges(wavelengths), spectrum_wavelengths, cumulative)
+    return np.dot(np.asarray(values, dtype=float), bands)/cumulative[-1]
+
+
+def solar_absorbed_flux(wavelengths, absorptivities, model='SOLAR-ISS'):
+    r'''Returns the solar heat flux absorbed by a surface outside the earth's
+    atmosphere, facing the sun at one astronomical unit, given its spectral
+    absorptivity. The spectrum is from :obj:`solar_spectrum`.
+
+    .. math::
+        q = \int \alpha_\lambda G_{\lambda,sun} d\lambda
+
+    Parameters
+    ----------
+    wavelengths : array-like
+        Increasing wavelengths at which the absorptivity is specified, [m]
+    absorptivities : array-like
+        Spectral absorptivity at each wavelength, along the last axis, [-]
+    model : str, optional
+        The solar spectrum model to use; see :obj:`solar_spectrum`, [-]
+
+    Returns
+    -------
+    q : float or ndarray
+        Absorbed heat flux, for each set of `absorptivities`, [W/m^2]
+
+    Notes
+    -----
+    The cumulative integral of the solar spectrum is calculated once and
+    cached; afterwards each call only bins it into the bands of the
+    absorptivity, as in :obj:`spectrum_weighted_property`. Divide by
+    the solar constant (the result for an absorptivity of one) to obtain the
+    solar absorptivity.
+
+    Examples
+    --------
+    >>> solar_absorbed_flux([1E-6, 3E-6], [0.95, 0.1])
+    1230.0941651349162
+    >>> solar_absorbed_flux([1E-6], [1.0])
+    1344.8029782379938
+    '''
+    import numpy as np
+    try:
+        spectrum_wavelengths, cumulative = _solar_cumulative_cache[model]
+    except KeyError:
+        wavelengths_solar, SSI, _ = solar_spectrum(model)
+        spectrum_wavelengths, cumulative = _cumulative_spectrum(wavelengths_solar, SSI)
+        cumulative.flags.writeable = False
+        _solar_cumulative_cache[model] = (spectrum_wavelengths, cumulative)
+    bands = _band_integrals(_band_edges(wavelengths), spectrum_wavelengths, cumulative)
+    return np.dot(np.asarray(absorptivities, dtype=float), bands)
@@ -48,8 +48,13 @@ __funcs = {}
 
 
 for name in dir(ht):
+    if name.startswith('_'):
+        continue
     obj = getattr(ht, name)
-    if isinstance(obj, types.FunctionType) and obj not in [ht.get_tube_TEMA, ht.check_tubing_TEMA]:
+    if isinstance(obj, types.FunctionType) and obj not in [ht.get_tube_TEMA, ht.check_tubing_TEMA, ht.resolve,
+                                                      ht.plate_effectiveness_kernel,
+                                                      ht.shell_and_tube_designs, ht.P_NTU_zoned,
+                                                      ht.tube_bank_march]:
         obj = wraps_numpydoc(u)(obj)
     elif isinstance(obj, str):
         continue
@@ -23,13 +23,16 @@ SOFTWARE.'''
 from __future__ import division
 import types
 import numpy as np
+from scipy.special import gammainc, gammaln
 import ht
+from ht import hx, conv_internal, conv_external, conv_free_immersed, conv_supercritical
+from ht import radiation
 
 
 '''Basic module which wraps all ht functions with numpy's vectorize.
-All other object - dicts, classes, etc - are not wrapped. Supports star 
+All other object - dicts, classes, etc - are not wrapped. Supports star
 imports; so the same objects exported when importing from the main library
-will be imported from here. 
+will be imported from here.
 
 >>> from ht.vectorized import *
 
@@ -39,9 +42,55 @@ Inputs do not need to be numpy arrays; they can be any iterable:
 >>> ht.vectorized.LMTD([100, 101], 60., 30., 40.2)
 array([ 43.20040929,  43.60182765])
 
+`np.vectorize` is only a loop in Python, so the closed-form correlations of
+:obj:`ht.conv_internal`, :obj:`ht.conv_external`,
+:obj:`ht.conv_free_immersed` and :obj:`ht.conv_supercritical`, as well as
+:obj:`ht.core.LMTD`, :obj:`ht.hx.effectiveness_from_NTU` (including
+the series solution for unmixed crossflow) and
+:obj:`ht.radiation.blackbody_fraction`, are replaced here by native
+numpy kernels. These broadcast their arguments against each other and give the
+same results as the scalar functions to within floating point precision.
+Arguments which select an option (`heating`, `buoyancy`, `subtype`, etc.)
+must be scalars for these kernels. Functions which select a correlation
+(`Nu_conv_internal`, `Nu_external_cylinder`, ...) still use `np.vectorize`,
+as the chosen correlation may differ for every point.
+
+The temperature effectiveness of TEMA E, G, H and J shells also has native
+kernels, for one number of tube passes `Ntp` (and `optimal`) per call; the
+special cases of the scalar functions at particular values of `R1` are
+selected point by point. So does every arrangement of passes of
+:obj:`ht.hx.temperature_effectiveness_plate`; the kernel for one arrangement
+can be selected once with :obj:`plate_effectiveness_kernel` and reused.
+:obj:`ht.hx.temperature_effectiveness_air_cooler` has a native kernel for
+one number of rows and passes per call.
+
+:obj:`Ntubes_Phadkeb` counts the tubes of many bundle diameters in one call,
+for one number of tube passes and layout angle; :obj:`DBundle_for_Ntubes_Phadkeb`
+and :obj:`size_bundle_from_tubecount` size many bundles in one call from a
+cached index of tube counts.
+
+:obj:`P_NTU_method` and the `NTU_from_P` functions are also provided for
+rating or sizing many exchangers of one type at once; the temperature
+effectiveness is solved for NTU at every point simultaneously, and points
+with no solution are returned as NaN. :obj:`LMTD_and_F_LMTD_Fakheri` returns
+the log-mean temperature difference and its shell-and-tube correction factor
+together, and remains accurate as the temperature changes of the two fluids
+become equal.
+
+The spectral functions of :obj:`ht.radiation`
+(:obj:`ht.radiation.blackbody_weighted_property`,
+:obj:`ht.radiation.spectrum_weighted_property` and
+:obj:`ht.radiation.solar_absorbed_flux`) already take arrays, and are
+exported here unchanged, as are :obj:`ht.hx_design.shell_and_tube_designs`,
+which rates its designs in batches, :obj:`ht.hx_zoned.P_NTU_zoned`,
+which solves all of its zones at once,
+:obj:`ht.conv_tube_bank.BellDelawareShell`, which rates arrays of operating
+points, and :obj:`ht.conv_tube_bank.tube_bank_march`, which rates arrays of
+tube banks row by row.
+
 Note that because this needs to import ht itself, ht.vectorized
 needs to be imported separately; the following will cause an error:
-    
+
 >>> import ht
 >>> ht.vectorized # Won't work, has not been imported yet
 
@@ -55,10 +104,21 @@ __all__ = []
 
 
 __funcs = {}
+_unwrapped = (ht.resolve, ht.solar_spectrum, ht.blackbody_weighted_property,
+              ht.spectrum_weighted_property, ht.solar_absorbed_flux,
+              ht.shell_and_tube_designs, ht.P_NTU_zoned, ht.tube_bank_march,
+              ht.dP_staggered_f_interp, ht.dP_staggered_correction_interp,
+              ht.dP_inline_f_interp, ht.dP_inline_correction_interp)
 
 for name in dir(ht):
+    if name.startswith('_'):
+        continue
     obj = getattr(ht, name)
-    if isinstance(obj, types.FunctionType):
+    # `resolve` returns functions rather than values, and the spectral
+    # functions of `ht.radiation`, the design enumerator, the zoned
+    # exchanger model and the dP_Zukauskas spline evaluators already operate
+    # on arrays
+    if isinstance(obj, types.FunctionType) and obj not in _unwrapped:
         obj = np.vectorize(obj)
     elif isinstance(obj, str):
         continue
@@ -68,5 +128,1367 @@ for name in dir(ht):
 globals().update(__funcs)
 
 
+### Native numpy kernels
+
+_numpy_math = {'exp': np.exp, 'log': np.log, 'log10': np.log10,
+               'tanh': np.tanh, 'sqrt': np.sqrt}
+
+
+def _asarray(value):
+    '''Converts list or tuple inputs to float arrays; all other inputs,
+    including None, scalars and existing arrays, are returned unchanged.
+    '''
+    if isinstance(value, (list, tuple)):
+        return np.array(value, dtype=float)
+    return value
+
+
+def _as_float_arrays(*values):
+    return [None if v is None else np.asarray(v, dtype=float) for v in values]
+
+
+def _numpy_kernel(f):
+    '''Creates a copy of the closed-form scalar function `f` whose calls to
+    the `math` module are resolved to the numpy ufuncs of the same name,
+    so the same expressions are evaluated over whole arrays at once.
+    Only functions without branches on the value of their array arguments
+    may be converted this way.
+    '''
+    namespace = dict(f.__globals__)
+    namespace.update(_numpy_math)
+    kernel = types.FunctionType(f.__code__, namespace, f.__name__,
+                                f.__defaults__, f.__closure__)
+    def wrapper(*args, **kwargs):
+        args = [_asarray(arg) for arg in args]
+        for k, v in kwargs.items():
+            kwargs[k] = _asarray(v)
+        return kernel(*args, **kwargs)
+    wrapper.__name__ = f.__name__
+    wrapper.__doc__ = f.__doc__
+    return wrapper
+
+
+def _given(*values):
+    '''Returns a mask of where all of `values` are nonzero, as the scalar
+    functions use ``if a and b:`` to check for optional arguments; or None
+    if any of the values were not provided at all.
+    '''
+    if any(v is None for v in values):
+        return None
+    mask = True
+    for v in values:
+        mask = mask & (v != 0.0)
+    return mask
+
+
+def _correction(num, den, power, *given):
+    '''Returns the optional property-ratio correction (num/den)**power,
+    applied only where the scalar function would have applied it.
+    '''
+    mask = _given(*(given or (num, den)))
+    if mask is None:
+        return 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(mask, (num/den)**power, 1.0)
+
+
+_closed_form_functions = [
+    conv_internal.laminar_entry_thermal_Hausen,
+    conv_internal.laminar_entry_Baehr_Stephan,
+    conv_internal.turbulent_Dittus_Boelter,
+    conv_internal.turbulent_entry_Hausen,
+    conv_internal.turbulent_Colburn,
+    conv_internal.turbulent_Drexel_McAdams,
+    conv_internal.turbulent_von_Karman,
+    conv_internal.turbulent_Prandtl,
+    conv_internal.turbulent_Friend_Metzner,
+    conv_internal.turbulent_Petukhov_Kirillov_Popov,
+    conv_internal.turbulent_Webb,
+    conv_internal.turbulent_Sandall,
+    conv_internal.turbulent_Gnielinski,
+    conv_internal.turbulent_Gnielinski_smooth_1,
+    conv_internal.turbulent_Gnielinski_smooth_2,
+    conv_internal.turbulent_Churchill_Zajic,
+    conv_internal.turbulent_ESDU,
+    conv_internal.turbulent_Martinelli,
+    conv_internal.turbulent_Nunner,
+    conv_internal.turbulent_Dipprey_Sabersky,
+    conv_internal.turbulent_Gowen_Smith,
+    conv_internal.turbulent_Kawase_Ulbrecht,
+    conv_internal.turbulent_Kawase_De,
+    conv_internal.turbulent_Bhatti_Shah,
+    conv_internal.Morimoto_Hotta,
+    conv_internal.helical_turbulent_Nu_Xin_Ebadian,
+    conv_internal.Nu_laminar_rectangular_Shan_London,
+
+    conv_external.Nu_cylinder_Churchill_Bernstein,
+    conv_external.Nu_cylinder_Sanitjai_Goldstein,
+    conv_external.Nu_cylinder_Fand,
+    conv_external.Nu_cylinder_McAdams,
+    conv_external.Nu_horizontal_plate_laminar_Churchill_Ozoe,
+    conv_external.Nu_horizontal_plate_turbulent_Schlichting,
+    conv_external.Nu_horizontal_plate_turbulent_Kreith,
+
+    conv_free_immersed.Nu_vertical_plate_Churchill,
+    conv_free_immersed.Nu_horizontal_plate_Rohsenow,
+    conv_free_immersed.Nu_sphere_Churchill,
+    conv_free_immersed.Nu_vertical_cylinder_Hanesian_Kalish_Morgan,
+    conv_free_immersed.Nu_vertical_cylinder_Popiel_Churchill,
+    conv_free_immersed.Nu_horizontal_cylinder_Churchill_Chu,
+    conv_free_immersed.Nu_horizontal_cylinder_Kuehn_Goldstein,
+    conv_free_immersed.Nu_coil_Xin_Ebadian,
+
+    conv_supercritical.Nu_McAdams,
+    conv_supercritical.Nu_Bringer_Smith,
+    conv_supercritical.Nu_Gorban,
+]
+
+for f in _closed_form_functions:
+    globals()[f.__name__] = _numpy_kernel(f)
+
+
+def _log1p_ratio(x):
+    '''log1p(x)/x, from its series where x is small, including 0.'''
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.log1p(x)/x
+    return np.where(np.abs(x) < 1E-4, 1. - x*(0.5 - x*(1/3. - 0.25*x)), ratio)
+
+
+def _expm1_ratio(x):
+    '''expm1(x)/x, from its series where x is small, including 0.'''
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.expm1(x)/x
+    return np.where(np.abs(x) < 1E-4, 1. + x*(0.5 + x*(1/6. + x/24.)), ratio)
+
+
+def _LMTD(dTF1, dTF2, counterflow=True):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = (dTF2 - dTF1)/dTF1
+        # (dTF2 - dTF1)/log1p(x), which stays accurate as x approaches 0
+        ans = dTF1/_log1p_ratio(x)
+    # Wherever the scalar function would raise and return the limit
+    singular = (dTF1 == 0.0) | (x <= -1.0) | (x == 0.0)
+    limit = dTF1 if counterflow else 0.0
+    return np.where(singular, limit, ans)
+
+
+def LMTD(Thi, Tho, Tci, Tco, counterflow=True):
+    Thi, Tho, Tci, Tco = _as_float_arrays(Thi, Tho, Tci, Tco)
+    if counterflow:
+        return _LMTD(Thi-Tco, Tho-Tci, True)
+    return _LMTD(Thi-Tci, Tho-Tco, False)
+
+
+def _F_LMTD_Fakheri(dTh, dTc, dTmax, shells):
+    # Temperature changes of the hot and cold fluids, and the difference of
+    # the inlets
+    with np.errstate(divide='ignore', invalid='ignore'):
+        R = dTh/dTc
+        P = dTc/dTmax
+        u = P*(1. - R)/(1. - P)
+        log1p_ratio = _log1p_ratio(u)
+        lnW = u*log1p_ratio/shells
+        # S*ln(W) and S*(1 - W), divided through by R - 1 analytically; at
+        # R = 1 this is the limiting form of the scalar function
+        root = np.sqrt(R*R + 1.)
+        S_lnW = -root*P/(1. - P)/shells*log1p_ratio
+        S_1_W = -S_lnW*_expm1_ratio(lnW)
+        W = np.exp(lnW)
+        return S_lnW/np.log((1. + W - S_1_W)/(1. + W + S_1_W))
+
+
+def F_LMTD_Fakheri(Thi, Tho, Tci, Tco, shells=1):
+    Thi, Tho, Tci, Tco = _as_float_arrays(Thi, Tho, Tci, Tco)
+    return _F_LMTD_Fakheri(Thi - Tho, Tco - Tci, Thi - Tci, shells)
+
+
+def LMTD_and_F_LMTD_Fakheri(Thi, Tho, Tci, Tco, shells=1):
+    r'''Returns both the counterflow log-mean temperature difference
+    (:obj:`ht.core.LMTD`) and its correction factor for a shell-and-tube heat
+    exchanger (:obj:`ht.hx.F_LMTD_Fakheri`), for many sets of terminal
+    temperatures at once. The temperatures are broadcast against each other;
+    `shells` may be a scalar or an array.
+
+    Both are evaluated in terms of `log1p` and `expm1`, with their series
+    selected point by point near the singular case of equal temperature
+    changes of the two fluids, so there is no loss of accuracy as it is
+    approached. Points at which the correction factor is undefined give NaN.
+
+    Examples
+    --------
+    >>> dTlm, Ft = LMTD_and_F_LMTD_Fakheri(Thi=130, Tho=110, Tci=15, Tco=[85, 35])
+    >>> dTlm
+    array([66.91519847, 95.        ])
+    >>> Ft
+    array([0.94383588, 0.99256894])
+    '''
+    Thi, Tho, Tci, Tco = _as_float_arrays(Thi, Tho, Tci, Tco)
+    dTh, dTc = Thi - Tho, Tco - Tci
+    return (_LMTD(Thi - Tco, Tho - Tci),
+            _F_LMTD_Fakheri(dTh, dTc, Thi - Tci, shells))
+
+__all__.append('LMTD_and_F_LMTD_Fakheri')
+
+
+def _crossflow_unmixed(NTU1, R1, derivative=False):
+    '''Array version of :obj:`ht.hx._crossflow_unmixed`. The series is
+    summed for all points at once, starting at each point's own first
+    significant term and dropping points as their terms become negligible.
+    '''
+    NTU1, R1 = np.broadcast_arrays(*_as_float_arrays(NTU1, R1))
+    shape = NTU1.shape
+    NTU1, R1 = NTU1.ravel(), R1.ravel()
+    x, y = NTU1, R1*NTU1
+    small, big = np.minimum(x, y), np.maximum(x, y)
+    d_small, d_big = np.where(y < x, R1, 1.), np.where(y < x, 1., R1)
+    limit = (small == 0.0)
+    small, big = np.where(limit, 1., small), np.where(limit, 1., big)
+
+    n_min = np.floor(np.maximum(0., small - 9.*np.sqrt(small)))
+    S, dS = n_min.copy(), np.zeros(small.shape)
+    active = np.arange(small.size)
+    j = 0
+    while active.size:
+        n = n_min[active] + j
+        z_s, z_b = small[active], big[active]
+        P_s, P_b = gammainc(n + 1., z_s), gammainc(n + 1., z_b)
+        term = P_s*P_b
+        S[active] += term
+        if derivative:
+            t_s = np.exp(-z_s + n*np.log(z_s) - gammaln(n + 1.))
+            t_b = np.exp(-z_b + n*np.log(z_b) - gammaln(n + 1.))
+            dS[active] += d_small[active]*t_s*P_b + d_big[active]*P_s*t_b
+        keep = (n <= z_s) | (term >= 1E-17*S[active])
+        active = active[keep]
+        j += 1
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        P1 = np.where(limit, -np.expm1(-x), S/y).reshape(shape)
+        if not derivative:
+            return P1
+        dP1 = np.where(limit, np.exp(-x), (dS - S/x)/y).reshape(shape)
+    return P1, dP1
+
+
+def effectiveness_from_NTU(NTU, Cr, subtype='counterflow'):
+    NTU, Cr = _as_float_arrays(NTU, Cr)
+    if np.any(Cr > 1):
+        raise Exception('Heat capacity rate must be less than 1 by definition.')
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if subtype == 'counterflow':
+            return _Pc(NTU, Cr)
+        elif subtype == 'parallel':
+            return (1. - np.exp(-NTU*(1. + Cr)))/(1. + Cr)
+        elif 'S&T' in subtype:
+            str_shells = subtype.split('S&T')[0]
+            shells = int(str_shells) if str_shells else 1
+            NTU = NTU/shells
+
+            top = 1. + np.exp(-NTU*(1. + Cr**2)**.5)
+            bottom = 1. - np.exp(-NTU*(1. + Cr**2)**.5)
+            effectiveness = 2./(1. + Cr + (1. + Cr**2)**.5*top/bottom)
+            if shells > 1:
+                term = ((1. - effectiveness*Cr)/(1. - effectiveness))**shells
+                effectiveness = (term - 1.)/(term - Cr)
+            return effectiveness
+        elif subtype == 'crossflow':
+            return _crossflow_unmixed(NTU, Cr)
+        elif subtype == 'crossflow approximate':
+            return 1. - np.exp(1./Cr*NTU**0.22*(np.exp(-Cr*NTU**0.78) - 1.))
+        elif subtype == 'crossflow, mixed Cmin':
+            return 1. - np.exp(-Cr**-1*(1. - np.exp(-Cr*NTU)))
+        elif subtype ==  'crossflow, mixed Cmax':
+            return (1./Cr)*(1. - np.exp(-Cr*(1. - np.exp(-NTU))))
+        elif subtype in ['boiler', 'condenser']:
+            return 1. - np.exp(-NTU) + 0.*Cr
+    raise Exception('Input heat exchanger type not recognized')
+
+
+def temperature_effectiveness_basic(R1, NTU1, subtype='crossflow'):
+    R1, NTU1 = _as_float_arrays(R1, NTU1)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if subtype == 'counterflow':
+            return _Pc(NTU1, R1)
+        elif subtype == 'parallel':
+            return (1. - np.exp(-NTU1*(1. + R1)))/(1. + R1)
+        elif subtype == 'crossflow approximate':
+            return 1. - np.exp(NTU1**0.22/R1*(np.exp(-R1*NTU1**0.78) - 1.))
+        elif subtype == 'crossflow':
+            return _crossflow_unmixed(NTU1, R1)
+        elif subtype == 'crossflow, mixed 1':
+            K = 1. - np.exp(-R1*NTU1)
+            return 1. - np.exp(-K/R1)
+        elif subtype == 'crossflow, mixed 2':
+            K = 1. - np.exp(-NTU1)
+            return (1. - np.exp(-K*R1))/R1
+        elif subtype == 'crossflow, mixed 1&2':
+            K1 = 1. - np.exp(-NTU1)
+            K2 = 1. - np.exp(-R1*NTU1)
+            return (1./K1 + R1/K2 - 1./NTU1)**-1
+    raise Exception('Subtype not recognized.')
+
+
+
+def _Pc(x, y):
+    # x/(x + z/expm1(z)) with z = x(1 - y), as in ht.hx.Pc
+    with np.errstate(over='ignore'):
+        return x/(x + 1./_expm1_ratio(x*(1. - y)))
+
+
+def _Pp(x, y):
+    return np.where(y == -1., x, (1. - np.exp(-x*(1. + y)))/(1. + y))
+
+
+# Namespace in which functions of ht.hx are evaluated over arrays; the
+# array versions of its helpers are added to it as they are defined
+_hx_namespace = dict(vars(hx))
+_hx_namespace.update(_numpy_math)
+_hx_namespace.update({'Pc': _Pc, 'Pp': _Pp})
+
+
+def _plate_kernel(f, reverse=False):
+    '''Array version of a kernel of :obj:`ht.hx.plate_effectiveness_kernel`;
+    the same formula is evaluated with the array versions of `Pc` and `Pp`.
+    If `reverse`, it applies to the arrangement with sides 1 and 2
+    switched.
+    '''
+    kernel = types.FunctionType(f.__code__, _hx_namespace, f.__name__)
+    def plate_kernel(R1, NTU1):
+        R1, NTU1 = _as_float_arrays(R1, NTU1)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if reverse:
+                R2 = 1./R1
+                return kernel(R2, NTU1*R1)*R2
+            return kernel(R1, NTU1)
+    plate_kernel.__name__ = f.__name__
+    return plate_kernel
+
+
+_plate_kernels = {}
+for key, (f, _) in hx._plate_arrangements.items():
+    Np1, Np2, counterflow, passes_counterflow = key
+    _plate_kernels[key] = _plate_kernel(f)
+    if (Np2, Np1, counterflow, passes_counterflow) not in hx._plate_arrangements:
+        _plate_kernels[(Np2, Np1, counterflow, passes_counterflow)] = _plate_kernel(f, reverse=True)
+
+
+def plate_effectiveness_kernel(Np1, Np2, counterflow=True, passes_counterflow=True):
+    try:
+        return _plate_kernels[(Np1, Np2, bool(counterflow), bool(passes_counterflow))]
+    except KeyError:
+        raise Exception('Supported number of passes does not have a formula available')
+
+
+def temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=True,
+                                    passes_counterflow=True, reverse=False):
+    key = (Np1, Np2, bool(counterflow), bool(passes_counterflow))
+    if reverse and key not in hx._plate_arrangements:
+        raise Exception('Supported number of passes does not have a formula available')
+    return plate_effectiveness_kernel(Np1, Np2, counterflow, passes_counterflow)(R1, NTU1)
+
+
+def _air_cooler_rows(R1, NTU1, N):
+    '''Array version of :obj:`ht.hx._air_cooler_rows`; the Poisson
+    probabilities are evaluated with `gammainc`.
+    '''
+    a = NTU1/N
+    K = -np.expm1(-a)
+    x = N*K*R1
+    log_binomials = hx._air_cooler_coefficients(N)
+    log_K = np.log(K)
+    tail = 0.0
+    tot = 0.0
+    for j in range(N - 1, -1, -1):
+        tail = tail + np.exp(log_binomials[j + 1] + (j + 1)*log_K - (N - j - 1)*a)
+        tot = tot + gammainc(j + 1., x)*tail
+    return np.where(x == 0.0, -np.expm1(-NTU1), tot/x)
+
+
+_hx_namespace['_air_cooler_rows'] = _air_cooler_rows
+_air_cooler_kernel = types.FunctionType(hx.temperature_effectiveness_air_cooler.__code__,
+                                        _hx_namespace, 'temperature_effectiveness_air_cooler',
+                                        hx.temperature_effectiveness_air_cooler.__defaults__)
+_hx_namespace['temperature_effectiveness_air_cooler'] = _air_cooler_kernel
+
+
+def temperature_effectiveness_air_cooler(R1, NTU1, rows, passes, coerce=True):
+    R1, NTU1 = _as_float_arrays(R1, NTU1)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        return _air_cooler_kernel(R1, NTU1, rows, passes, coerce)
+
+
+def _TEMA_J_1(R1, NTU1):
+    # Also the two pass, unoptimal TEMA E shell
+    B_A = np.exp(-NTU1*(1. + R1/2.))
+    AB = np.exp(NTU1*(1. - R1/2.))
+    ratio = np.where(R1 < 2, (2. + R1*B_A)/(2. - R1*np.exp(-NTU1*(1. - R1/2.))),
+                     (2.*AB + R1*B_A*AB)/(2.*AB - R1))
+    P1 = 1./R1*(1. - (2. - R1)*ratio/(2. + R1))
+    return np.where(R1 == 2, 0.5*(1. - (1. + np.exp(-2.*NTU1))/2./(1. + NTU1)), P1)
+
+
+def _TEMA_J_2_4(R1, NTU1, Ntp):
+    lambda1 = (1. + R1*R1/(Ntp*Ntp))**0.5
+    A_lambda = np.exp(-lambda1*NTU1)
+    D = 1. - lambda1*np.exp(-NTU1*(lambda1 + 1.)/2.)/np.expm1(-lambda1*NTU1)
+    C = np.exp(-NTU1*(lambda1 - 1.)/2.)/((lambda1 - 1.)*A_lambda + 1. + lambda1)
+    B = -(1. + A_lambda)/np.expm1(-lambda1*NTU1)
+    if Ntp == 2:
+        return 1./(1. + R1/2. + lambda1*B - 2.*lambda1*C*D)
+    E = np.exp(-R1*NTU1/2.)
+    return 1./(1. + R1/4.*(E + 3.)/(E + 1.) + lambda1*B - 2.*lambda1*C*D)
+
+
+def temperature_effectiveness_TEMA_J(R1, NTU1, Ntp):
+    R1, NTU1 = _as_float_arrays(R1, NTU1)
+    if Ntp not in (1, 2, 4):
+        raise Exception('Supported numbers of tube passes are 1, 2, and 4.')
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if Ntp == 1:
+            return _TEMA_J_1(R1, NTU1)
+        return _TEMA_J_2_4(R1, NTU1, Ntp)
+
+
+def temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal=True):
+    R1, NTU1 = _as_float_arrays(R1, NTU1)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if Ntp == 1:
+            A = 1./(1 + R1/2.)*(1. - np.exp(-NTU1*(1. + R1/2.)/2.))
+            B = np.where(R1 != 2, _Pc(NTU1/2., R1/2.), NTU1/(2. + NTU1))
+            E = (A + B - A*B*R1/2.)/2.
+            return E*(1. + (1. - B*R1/2.)*(1. - A*R1/2. + A*B*R1)) - A*B*(1. - B*R1/2.)
+        elif Ntp == 2 and optimal:
+            alpha = NTU1*(4. + R1)/8.
+            beta = NTU1*(4. - R1)/8.
+            D = (1. - np.exp(-alpha))/(4./R1 + 1)
+            # R1 > 4, scaled by s = exp(beta) as in the scalar function
+            s = np.exp(beta)
+            Es = (s - 1.)/(4./R1 - 1.)
+            Hs = (s*s - 1.)/(4./R1 - 1.)
+            Gs = (1-D)**2*(D**2*s*s + Es**2) + D**2*(s + Es)**2
+            Bs = (s*s + Hs)*(s + Es)**2
+            P_high = 1./R1*(1. - (1. - D)**4*s**4/(Bs - 4.*Gs*s*s/R1))
+            
+            E = np.where(R1 != 4, (1. - np.exp(-beta))/(4./R1 - 1.), NTU1/2.)
+            H = np.where(R1 != 4, (1. - np.exp(-2.*beta))/(4./R1 - 1.), NTU1)
+            G = (1-D)**2*(D**2 + E**2) + D**2*(1+E)**2
+            B = (1. + H)*(1. + E)**2
+            P_low = 1./R1*(1. - (1. - D)**4/(B - 4.*G/R1))
+            return np.where(R1 > 4, P_high, P_low)
+        elif Ntp == 2 and not optimal:
+            R1_orig = R1
+            NTU1 = NTU1*R1_orig # switch 1
+            R1 = 1./R1_orig # switch 2
+            
+            beta = NTU1*(4.*R1 + 1)/8.
+            alpha = NTU1/8.*(4.*R1 - 1.)
+            H = (np.exp(-2.*beta) - 1.)/(4.*R1 + 1.)
+            E = (np.exp(-beta) - 1.)/(4.*R1 + 1.)
+            B = (1. + H)*(1. + E)**2
+            # R1 < 0.25, without forming D as in the scalar function
+            d = np.exp(alpha)
+            u = d*(1. - 4.*R1)/(1. - 4.*R1*d)
+            v = (d - 1.)/(1. - 4.*R1*d)
+            P_low = 1. - B*u**4 - 4.*R1*(v*v + E*E*u*u + v*v*u*u*(1. + E)**2)
+            
+            D = np.where(R1 != 0.25, (1. - np.exp(-alpha))/(1. - 4.*R1), -NTU1/8.)
+            G = (1. - D)**2*(D**2 + E**2) + D**2*(1. + E)**2
+            P_high = (1. - (B + 4.*G*R1)/(1. - D)**4)
+            return np.where(R1 < 0.25, P_low, P_high)/R1_orig # switch 3
+    raise Exception('Supported numbers of tube passes are 1 and 2.')
+
+
+def temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal=True):
+    R1, NTU1 = _as_float_arrays(R1, NTU1)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if Ntp == 1:
+            B = np.where(R1 != 1, _Pc(NTU1/2., R1), NTU1/(2. + NTU1))
+            A = 1./(1. + R1)*(1. - np.exp(-NTU1*(1. + R1)/2.))
+            return A + B - A*B*(1. + R1) + R1*A*B**2
+        elif Ntp == 2 and optimal:
+            alpha = np.exp(-NTU1*(2. + R1)/4.)
+            A = -2.*R1*(1-alpha)**2/(2. + R1)
+            beta = np.exp(-NTU1*(2. - R1)/2.)
+            B = (4. - beta*(2. + R1))/(2. - R1)
+            P_low = (B - alpha**2)/(A + 2. + R1*B)
+            # R1 > 2, divided through by beta
+            beta_inv = np.exp(-NTU1*(R1 - 2.)/2.)
+            B = (4.*beta_inv - (2. + R1))/(2. - R1)
+            P_high = (B - alpha**2*beta_inv)/((A + 2.)*beta_inv + R1*B)
+            
+            alpha = np.exp(-NTU1)
+            P_2 = (1. + 2.*NTU1 - alpha**2)/(4. + 4.*NTU1 - (1. - alpha)**2)
+            return np.where(R1 < 2, P_low, np.where(R1 > 2, P_high, P_2))
+        elif Ntp == 2 and not optimal:
+            R1_orig = R1
+            NTU1 = NTU1*R1_orig # switch 1
+            R1 = 1./R1_orig # switch 2
+            beta = np.exp(-NTU1*(2.*R1 + 1.)/2.)
+            B = (4.*R1 - beta*(2.*R1 - 1.))/(2.*R1 + 1.)
+            alpha = np.exp(-NTU1*(2.*R1 - 1.)/4.)
+            A = (1. - alpha)**2/(R1 - 0.5)
+            P_high = (B - alpha**2)/(R1*(A - alpha**2/R1 + 2.))
+            # R1 < 0.5, multiplied through by 1/alpha**2
+            alpha_inv = np.exp(NTU1*(2.*R1 - 1.)/4.)
+            P_low = ((B*alpha_inv**2 - 1.)
+                     /(R1*((alpha_inv - 1.)**2/(R1 - 0.5) + 2.*alpha_inv**2) - 1.))
+            
+            beta = np.exp(-2.*R1*NTU1)
+            P_half = (1. + 2.*R1*NTU1 - beta)/R1/(4. + 4.*R1*NTU1 + R1**2*NTU1**2)
+            P1 = np.where(R1 > 0.5, P_high, np.where(R1 < 0.5, P_low, P_half))
+            return P1/R1_orig # switch 3
+    raise Exception('Supported numbers of tube passes are 1 and 2.')
+
+
+def temperature_effectiveness_TEMA_E(R1, NTU1, Ntp=1, optimal=True):
+    R1, NTU1 = _as_float_arrays(R1, NTU1)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if Ntp == 1:
+            return _Pc(NTU1, R1)
+        elif Ntp == 2 and optimal:
+            E = (1. + R1**2)**0.5
+            return np.where(R1 != 1, 2./(1 + R1 + E/np.tanh(E*NTU1/2.)),
+                            1/(1 + 1/np.tanh(NTU1*2**-0.5)*2**-0.5))
+        elif Ntp == 2 and not optimal:
+            return _TEMA_J_1(R1, NTU1)
+        elif Ntp == 3 and optimal:
+            lambda3 = R1
+            lambda2 = -1.5 - (2.25 + R1*(R1-1))**0.5
+            lambda1 = -1.5 + (2.25 + R1*(R1-1))**0.5
+            delta = lambda1 - lambda2
+            X1 = np.exp(lambda1*NTU1/3.)/2/delta
+            X2 = np.exp(lambda2*NTU1/3.)/2/delta
+            X3 = np.exp(lambda3*NTU1/3.)/2/delta
+            C = X2*(3*R1 + lambda1) - X1*(3*R1 + lambda2) + X3*delta
+            B = X1*(R1 - lambda2) - X2*(R1 - lambda1) + X3*delta
+            A = np.where(R1 != 1,
+                         X1*(R1 + lambda1)*(R1 - lambda2)/2/lambda1 - X3*delta
+                         - X2*(R1 + lambda2)*(R1 - lambda1)/2/lambda2 + 1./(1-R1),
+                         -np.exp(-NTU1)/18 - np.exp(NTU1/3.)/2 + (NTU1 + 5)/9.)
+            return 1./R1*(1. - C/(A*C + B*B))
+        elif Ntp == 3 and not optimal:
+            R1_orig = R1
+            NTU1 = NTU1*R1_orig # switch 1
+            R1 = 1./R1_orig # switch 2
+            delta = (9*R1**2 + 4*(1 - R1))**0.5/R1
+            l1 = (-3 + delta)/2.
+            l2 = (-3 - delta)/2.
+            chi1 = np.exp(l1*R1*NTU1/3.)/2/delta
+            chi2 = np.exp(l2*R1*NTU1/3.)/2/delta
+            E = 0.5*np.exp(NTU1/3.)
+            C = -chi1*(3 + R1*l2)/R1 + chi2*(3 + R1*l1)/R1 + E
+            B = chi1*(1 - R1*l2)/R1 - chi2*(1 - R1*l1)/R1 + E
+            A = (chi1*(1 + R1*l1)*(1 - R1*l2)/(2*R1**2*l1) - E
+                 - chi2*(1 + R1*l2)*(1 - R1*l1)/(2*R1**2*l2) + R1*(R1 -1))
+            return (1 - C/(A*C + B**2))/R1_orig # switch 3
+        elif Ntp == 4 or Ntp %2 == 0:
+            R1_orig = R1
+            NTU1 = NTU1*R1_orig # switch 1
+            R1 = 1./R1_orig # switch 2
+            N1 = Ntp/2.
+            C = 1/N1*(1 + N1**2*R1**2)**0.5/np.tanh(NTU1/(2*N1)*(1 + N1**2*R1**2)**0.5)
+            B = -1/N1/np.tanh(NTU1/(2*N1))
+            A = 1 + R1 + 1/np.tanh(NTU1/2.)
+            return 2/(A + B + C)/R1_orig # switch 3
+    raise Exception('For TEMA E shells with an odd number of tube passes more than 3, no solution is implemented.')
+
+
+def _NTU_max_for_P_solver(data, R1):
+    '''Array version of :obj:`ht.hx._NTU_max_for_P_solver`; each value of
+    `R1` is evaluated with the first Pade approximation whose offset
+    exceeds it, or the last one.
+    '''
+    offsets = data['offset']
+    R1 = np.asarray(R1, dtype=float)
+    segments = np.minimum(np.searchsorted(offsets, R1, side='right'),
+                          len(offsets) - 1)
+    NTU_max = np.empty(R1.shape)
+    for i in np.unique(segments):
+        mask = segments == i
+        x = R1[mask] - offsets[i]
+        NTU_max[mask] = np.polyval(data['p'][i], x)/np.polyval(data['q'][i], x)
+    return NTU_max
+
+
+def _P_function(name, **kwargs):
+    '''Returns the temperature effectiveness function `name` as a function
+    of (R1, NTU1) only, for use by :obj:`_NTU_from_P_solver`. If it is
+    still wrapped with `np.vectorize`, points which cannot be evaluated in
+    floating point give NaN instead of raising an exception.
+    '''
+    f = globals()[name]
+    if isinstance(f, np.vectorize):
+        scalar = getattr(hx, name)
+        def point(R1, NTU1):
+            try:
+                return scalar(float(R1), float(NTU1), **kwargs)
+            except (ArithmeticError, ValueError):
+                return np.nan
+        return np.vectorize(point, otypes=[float])
+    return lambda R1, NTU1: f(R1, NTU1, **kwargs)
+
+
+def _NTU_from_P_solver(P1, R1, NTU_min, NTU_max, function, scalar,
+                       xtol=2E-12, rtol=1E-14, maxiter=100):
+    '''Solves `function`(R1, NTU1) = P1 for NTU1 at every point at once with
+    Ridder's method, bracketed by [`NTU_min`, `NTU_max`]. Points whose P1
+    cannot be reached within the bracket are returned as NaN. Points where
+    `function` cannot be evaluated in floating point are solved
+    individually with the scalar solver `scalar`(P1, R1), which handles
+    the ill-conditioned cases.
+    '''
+    P1, R1, NTU_max = np.broadcast_arrays(*_as_float_arrays(P1, R1, NTU_max))
+    shape = P1.shape
+    P1, R1, NTU_max = P1.ravel(), R1.ravel(), NTU_max.ravel()
+    NTU1 = np.full(P1.shape, np.nan)
+
+    a, b = np.full(P1.shape, float(NTU_min)), NTU_max.copy()
+    with np.errstate(all='ignore'):
+        fa = function(R1, a) - P1
+        fb = function(R1, b) - P1
+    failed = ~(np.isfinite(fa) & np.isfinite(fb))
+    NTU1[~failed & (fa == 0.0)] = NTU_min
+    NTU1[~failed & (fb == 0.0)] = b[~failed & (fb == 0.0)]
+    active = np.nonzero(~failed & (fa < 0.0) & (fb > 0.0))[0]
+    a, b, fa, fb = a[active], b[active], fa[active], fb[active]
+
+    for _ in range(maxiter):
+        if not active.size:
+            break
+        R1_active, P1_active = R1[active], P1[active]
+        with np.errstate(all='ignore'):
+            xm = 0.5*(a + b)
+            fm = function(R1_active, xm) - P1_active
+            s = np.sqrt(fm*fm - fa*fb)
+            x = np.where(fm == 0.0, xm, xm + (xm - a)*np.sign(fa - fb)*fm/s)
+            fx = function(R1_active, x) - P1_active
+        bad = ~(np.isfinite(fm) & np.isfinite(fx))
+        failed[active[bad]] = True
+
+        # Keep the root bracketed, as in the scalar solver
+        flip = np.sign(fm) != np.sign(fx)
+        upper = ~flip & (np.sign(fa) != np.sign(fx))
+        lower = ~flip & ~upper
+        a, fa = np.where(flip, xm, np.where(lower, x, a)), np.where(flip, fm, np.where(lower, fx, fa))
+        b, fb = np.where(flip | upper, x, b), np.where(flip | upper, fx, fb)
+
+        NTU1[active] = x
+        done = bad | (fx == 0.0) | (np.abs(b - a) <= xtol + rtol*np.abs(x))
+        keep = ~done
+        active, a, b, fa, fb = active[keep], a[keep], b[keep], fa[keep], fb[keep]
+
+    for i in np.nonzero(failed)[0]:
+        try:
+            NTU1[i] = scalar(float(P1[i]), float(R1[i]))
+        except Exception:
+            NTU1[i] = np.nan
+    return NTU1.reshape(shape)
+
+
+def _NTU_from_P_crossflow(P1, R1, rtol=1E-13, maxiter=100):
+    '''Solves the exact unmixed crossflow series for NTU1 with Newton's
+    method at every point at once, as in :obj:`ht.hx.NTU_from_P_basic`.
+    Starting from the counterflow solution, the iterations increase
+    monotonically to the root, so iterating stops at the first step which
+    is not positive. Points with no solution are NaN.
+    '''
+    P1, R1 = np.broadcast_arrays(*_as_float_arrays(P1, R1))
+    shape = P1.shape
+    P1, R1 = P1.ravel(), R1.ravel()
+    NTU1 = NTU_from_P_basic(P1, R1, 'counterflow')
+    active = np.nonzero(np.isfinite(NTU1) & (NTU1 > 0.0))[0]
+    for _ in range(maxiter):
+        if not active.size:
+            break
+        f, df = _crossflow_unmixed(NTU1[active], R1[active], derivative=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = (P1[active] - f)/df
+        # Steps only shrink towards the root; a step that does not is noise
+        step = np.where(step > 0.0, step, 0.0)
+        NTU1[active] += step
+        keep = step > rtol*NTU1[active]
+        active = active[keep]
+    return NTU1.reshape(shape)
+
+
+def NTU_from_P_basic(P1, R1, subtype='crossflow'):
+    P1, R1 = _as_float_arrays(P1, R1)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if subtype == 'counterflow':
+            return np.where(R1 == 1, P1/(1. - P1),
+                            -np.log((P1*R1 - 1.)/(P1 - 1.))/(R1 - 1.))
+        elif subtype == 'parallel':
+            return np.log(-1./(P1*(R1 + 1.) - 1.))/(R1 + 1.)
+        elif subtype == 'crossflow, mixed 1':
+            return -np.log(R1*np.log(-(P1 - 1.)*np.exp(1./R1)))/R1
+        elif subtype == 'crossflow, mixed 2':
+            return -np.log(np.log(-(P1*R1 - 1.)*np.exp(R1))/R1)
+    if subtype == 'crossflow, mixed 1&2':
+        NTU_max = _NTU_max_for_P_solver(hx.NTU_from_P_basic_crossflow_mixed_12, R1)
+    elif subtype == 'crossflow approximate':
+        NTU_max = 1E5
+    elif subtype == 'crossflow':
+        return _NTU_from_P_crossflow(P1, R1)
+    else:
+        raise Exception('Subtype not recognized.')
+    function = _P_function('temperature_effectiveness_basic', subtype=subtype)
+    scalar = lambda P1, R1: hx.NTU_from_P_basic(P1, R1, subtype)
+    return _NTU_from_P_solver(P1, R1, 1E-11, NTU_max, function, scalar)
+
+
+def NTU_from_P_G(P1, R1, Ntp, optimal=True):
+    P1, R1 = _as_float_arrays(P1, R1)
+    if Ntp == 1 or (Ntp == 2 and optimal):
+        NTU_max = 1E4
+    elif Ntp == 2 and not optimal:
+        NTU_max = _NTU_max_for_P_solver(hx.NTU_from_G_2_unoptimal, R1)
+    else:
+        raise Exception('Supported numbers of tube passes are 1 or 2.')
+    function = _P_function('temperature_effectiveness_TEMA_G', Ntp=Ntp, optimal=optimal)
+    scalar = lambda P1, R1: hx.NTU_from_P_G(P1, R1, Ntp, optimal)
+    return _NTU_from_P_solver(P1, R1, 1E-11, NTU_max, function, scalar)
+
+
+def NTU_from_P_J(P1, R1, Ntp):
+    P1, R1 = _as_float_arrays(P1, R1)
+    if Ntp == 1:
+        NTU_max = 1E3
+    elif Ntp == 2:
+        NTU_max = _NTU_max_for_P_solver(hx.NTU_from_P_J_2, R1)
+    elif Ntp == 4:
+        NTU_max = _NTU_max_for_P_solver(hx.NTU_from_P_J_4, R1)
+    else:
+        raise Exception('Supported numbers of tube passes are 1, 2, and 4.')
+    function = _P_function('temperature_effectiveness_TEMA_J', Ntp=Ntp)
+    scalar = lambda P1, R1: hx.NTU_from_P_J(P1, R1, Ntp)
+    return _NTU_from_P_solver(P1, R1, 1E-11, NTU_max, function, scalar)
+
+
+def NTU_from_P_E(P1, R1, Ntp, optimal=True):
+    P1, R1 = _as_float_arrays(P1, R1)
+    if Ntp == 1:
+        return NTU_from_P_basic(P1, R1, subtype='counterflow')
+    elif Ntp == 2 and optimal:
+        x1 = R1*R1 + 1.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 2.*np.log(((P1*R1 - P1*x1**0.5 + P1 - 2.)
+                              /(P1*R1 + P1*x1**0.5 + P1 - 2.))**0.5)*x1**-.5
+    elif Ntp == 2 and not optimal:
+        NTU_max = 1E2
+    elif Ntp == 3:
+        NTU_max = 10
+    elif Ntp == 4 or Ntp %2 == 0:
+        NTU_max = 1E3
+    else:
+        raise Exception('For TEMA E shells with an odd number of tube passes more than 3, no solution is implemented.')
+    function = _P_function('temperature_effectiveness_TEMA_E', Ntp=Ntp, optimal=optimal)
+    scalar = lambda P1, R1: hx.NTU_from_P_E(P1, R1, Ntp, optimal)
+    return _NTU_from_P_solver(P1, R1, 1E-11, NTU_max, function, scalar)
+
+
+def NTU_from_P_H(P1, R1, Ntp, optimal=True):
+    P1, R1 = _as_float_arrays(P1, R1)
+    if Ntp == 1 or (Ntp == 2 and optimal):
+        NTU_max = 100
+    elif Ntp == 2 and not optimal:
+        NTU_max = _NTU_max_for_P_solver(hx.NTU_from_H_2_unoptimal, R1)
+    else:
+        raise Exception('Supported numbers of tube passes are 1 and 2.')
+    function = _P_function('temperature_effectiveness_TEMA_H', Ntp=Ntp, optimal=optimal)
+    scalar = lambda P1, R1: hx.NTU_from_P_H(P1, R1, Ntp, optimal)
+    return _NTU_from_P_solver(P1, R1, 1E-11, NTU_max, function, scalar)
+
+
+def NTU_from_P_plate(P1, R1, Np1, Np2, counterflow=True,
+                     passes_counterflow=True, reverse=False):
+    P1, R1 = _as_float_arrays(P1, R1)
+    key = (Np1, Np2, bool(counterflow), bool(passes_counterflow))
+    if key not in hx._plate_arrangements:
+        if reverse:
+            raise Exception('Supported number of passes does not have a formula available')
+        NTU2 = NTU_from_P_plate(P1*R1, 1./R1, Np1=Np2, Np2=Np1,
+                                counterflow=counterflow,
+                                passes_counterflow=passes_counterflow,
+                                reverse=True)
+        return NTU2/R1
+    kernel, NTU_max = hx._plate_arrangements[key]
+    if kernel is hx._plate_1_1_counterflow:
+        return NTU_from_P_basic(P1, R1, subtype='counterflow')
+    elif kernel is hx._plate_1_1_parallel:
+        return NTU_from_P_basic(P1, R1, subtype='parallel')
+    if isinstance(NTU_max, dict):
+        NTU_max = _NTU_max_for_P_solver(NTU_max, R1)
+    function = _plate_kernels[key]
+    scalar = lambda P1, R1: hx.NTU_from_P_plate(P1, R1, Np1, Np2,
+        counterflow=counterflow, passes_counterflow=passes_counterflow)
+    return _NTU_from_P_solver(P1, R1, 1E-11, NTU_max, function, scalar)
+
+
+_basic_subtypes = ['counterflow', 'parallel', 'crossflow', 'crossflow, mixed 1',
+                   'crossflow, mixed 2', 'crossflow, mixed 1&2']
+
+
+def _plate_passes(subtype):
+    passes_counterflow = True
+    Np1, end = subtype.split('/')
+    if end[-1] in ['c','p']:
+        passes_counterflow = True if end[-1] == 'c' else False
+        end = end[0:-1]
+    return int(Np1), int(end), passes_counterflow
+
+
+def _P_NTU_unsupported():
+    return Exception("Supported types are 'E', 'G', 'H', 'J', 'counterflow',\
+    'parallel', 'crossflow', 'crossflow, mixed 1', 'crossflow, mixed 2', \
+    'crossflow, mixed 1&2', or 'Np1/Np2' for plate exchangers")
+
+
+def P_NTU_method(m1, m2, Cp1, Cp2, UA=None, T1i=None, T1o=None,
+                 T2i=None, T2o=None, subtype='crossflow', Ntp=1, optimal=True):
+    r'''Array version of :obj:`ht.hx.P_NTU_method`, for rating or sizing
+    many exchangers of the same type at once. All numerical inputs are
+    broadcast against each other; `subtype`, `Ntp` and `optimal` must be
+    scalars. The same set of temperatures must be specified for every point.
+
+    The result is a dict with the same keys as the scalar function, each
+    holding an array of the broadcast shape.
+
+    When UA is known, the temperature effectiveness of every point is
+    evaluated at once. When UA is solved for, all points are solved together
+    by a vectorized, bracketed version of the scalar solver. Rather than
+    raising an exception, points for which no solution exists are returned
+    as NaN.
+
+    Examples
+    --------
+    >>> ans = P_NTU_method(m1=[5.2, 6.], m2=1.45, Cp1=1860., Cp2=1900,
+    ... subtype='E', Ntp=4, T2i=15, T1i=130, UA=3041.75)
+    >>> ans['T1o']
+    array([110.09566643, 112.52850751])
+    '''
+    m1, m2, Cp1, Cp2, UA, T1i, T1o, T2i, T2o = _as_float_arrays(
+            m1, m2, Cp1, Cp2, UA, T1i, T1o, T2i, T2o)
+    # Shellside: 1
+    # Tubeside: 2
+    C1 = m1*Cp1
+    C2 = m2*Cp2
+    R1 = C1/C2
+    R2 = C2/C1
+
+    if UA is not None:
+        NTU1 = UA/C1
+        NTU2 = UA/C2
+
+        if subtype in _basic_subtypes:
+            P1 = temperature_effectiveness_basic(R1, NTU1, subtype=subtype)
+        elif subtype == 'E':
+            P1 = temperature_effectiveness_TEMA_E(R1, NTU1, Ntp, optimal)
+        elif subtype == 'G':
+            P1 = temperature_effectiveness_TEMA_G(R1, NTU1, Ntp, optimal)
+        elif subtype == 'H':
+            P1 = temperature_effectiveness_TEMA_H(R1, NTU1, Ntp, optimal)
+        elif subtype == 'J':
+            P1 = temperature_effectiveness_TEMA_J(R1, NTU1, Ntp)
+        elif '/' in subtype:
+            Np1, Np2, passes_counterflow = _plate_passes(subtype)
+            P1 = temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=optimal,
+                                                 passes_counterflow=passes_counterflow)
+        else:
+            raise _P_NTU_unsupported()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if T1i is not None and T2i is not None:
+                T2o = P1*R1*T1i - P1*R1*T2i + T2i
+                T1o = -P1*T1i + P1*T2i + T1i
+            elif T1o is not None and T2o is not None:
+                T2i = (P1*R1*T1o + P1*T2o - T2o)/(P1*R1 + P1 - 1.)
+                T1i = (P1*R1*T1o + P1*T2o - T1o)/(P1*R1 + P1 - 1.)
+            elif T1o is not None and T2i is not None:
+                T2o = (R1*(P1*T2i - T1o) - (P1 - 1.)*(R1*T1o - T2i))/(P1 - 1.)
+                T1i = (P1*T2i - T1o)/(P1 - 1.)
+            elif T1i is not None and T2o is not None:
+                T1o = (P1*R1*T1i + P1*T1i - P1*T2o - T1i)/(P1*R1 - 1.)
+                T2i = (P1*R1*T1i - T2o)/(P1*R1 - 1.)
+            elif T2i is not None and T2o is not None:
+                T1o = (P1*R1*T2i + (P1 - 1.)*(T2i - T2o))/(P1*R1)
+                T1i = (P1*R1*T2i - T2i + T2o)/(P1*R1)
+            elif T1i is not None and T1o is not None:
+                T2o = (P1*R1*(T1i - T1o) + P1*T1i - T1i + T1o)/P1
+                T2i = (P1*T1i - T1i + T1o)/P1
+            else:
+                raise Exception('One set of (T1i, T2i), (T1o, T2o), (T1i, T2o), (T1o, T2i), (T1i, T1o), or (T2i, T2o) is required along with UA.')
+    else:
+        # Case where we're solving for UA
+        # Three temperatures are required
+        if T1i is not None and T1o is not None:
+            Q = m1*Cp1*(T1i-T1o)
+            if T2i is not None and T2o is None:
+                T2o = T2i + Q/(m2*Cp2)
+            elif T2o is not None and T2i is None:
+                T2i = T2o - Q/(m2*Cp2)
+            elif T2o is not None and T2i is not None:
+                Q2 = m2*Cp2*(T2o-T2i)
+                if np.any(np.abs((Q-Q2)/Q) > 0.01):
+                    raise Exception('The specified heat capacities, mass flows,'
+                                    ' and temperatures are inconsistent')
+            else:
+                raise Exception('At least one temperature is required to be '
+                                'specified on side 2.')
+        elif T2i is not None and T2o is not None:
+            Q = m2*Cp2*(T2o-T2i)
+            if T1i is not None and T1o is None:
+                T1o = T1i - Q/(m1*Cp1)
+            elif T1o is not None and T1i is None:
+                T1i = T1o + Q/(m1*Cp1)
+            else:
+                raise Exception('At least one temperature is required to be '
+                                'specified on side 2.')
+        else:
+            raise Exception('Three temperatures are required to be specified '
+                            'when solving for UA')
+
+        P1 = Q/(C1*np.abs(T2i-T1i))
+        if subtype in _basic_subtypes:
+            NTU1 = NTU_from_P_basic(P1, R1, subtype=subtype)
+        elif subtype == 'E':
+            NTU1 = NTU_from_P_E(P1, R1, Ntp, optimal)
+        elif subtype == 'G':
+            NTU1 = NTU_from_P_G(P1, R1, Ntp, optimal)
+        elif subtype == 'H':
+            NTU1 = NTU_from_P_H(P1, R1, Ntp, optimal)
+        elif subtype == 'J':
+            NTU1 = NTU_from_P_J(P1, R1, Ntp)
+        elif '/' in subtype:
+            Np1, Np2, passes_counterflow = _plate_passes(subtype)
+            NTU1 = NTU_from_P_plate(P1, R1, Np1, Np2, counterflow=optimal,
+                                    passes_counterflow=passes_counterflow)
+        else:
+            raise _P_NTU_unsupported()
+        UA = NTU1*C1
+        NTU2 = UA/C2
+
+    Q = np.abs(T1i-T2i)*P1*C1
+    P2 = P1*R1
+    results = {'Q': Q, 'T1i': T1i, 'T1o': T1o, 'T2i': T2i, 'T2o': T2o,
+               'C1': C1, 'C2': C2, 'R1': R1, 'R2': R2, 'P1': P1, 'P2': P2,
+               'NTU1': NTU1, 'NTU2': NTU2, 'UA': UA}
+    zeros = np.zeros(np.broadcast(*results.values()).shape)
+    for k, v in results.items():
+        results[k] = v + zeros
+    return results
+
+
+def Ntubes_Phadkeb(DBundle, Do, pitch, Ntp, angle=30):
+    r'''Array version of :obj:`ht.hx.Ntubes_Phadkeb`, for the tube counts of
+    many bundle diameters at once; `DBundle`, `Do` and `pitch` are broadcast
+    against each other, while `Ntp` and `angle` must be scalars. The single
+    pass tube counts are found with one `np.searchsorted` into the tables of
+    :obj:`ht.hx.Ntubes_Phadkeb`, and the tubes removed for the pass
+    partitions are calculated for every diameter at once. An integer array
+    is returned.
+
+    >>> import ht.vectorized
+    >>> ht.vectorized.Ntubes_Phadkeb([1.007, 1.008], Do=.028, pitch=.036, Ntp=2, angle=45.)
+    array([558, 574])
+    '''
+    return hx._Ntubes_Phadkeb_array(DBundle, Do, pitch, Ntp, angle)
+
+
+def DBundle_for_Ntubes_Phadkeb(Ntubes, Do, pitch, Ntp, angle=30):
+    r'''Array version of :obj:`ht.hx.DBundle_for_Ntubes_Phadkeb`, for the
+    smallest bundle diameters holding many tube counts at once; `Do`,
+    `pitch`, `Ntp` and `angle` must be scalars. All tube counts are looked
+    up at once in the cached index of the scalar function. Tube counts
+    beyond the tables of :obj:`ht.hx.Ntubes_Phadkeb` give NaN.
+
+    >>> import ht.vectorized
+    >>> ht.vectorized.DBundle_for_Ntubes_Phadkeb([558, 782], Do=.028, pitch=.036, Ntp=2, angle=45.)
+    array([0.99666093, 1.18224781])
+    '''
+    return hx._DBundle_for_Ntubes_Phadkeb_array(Ntubes, Do, pitch, Ntp, angle)
+
+
+_size_bundle_from_tubecount = size_bundle_from_tubecount
+
+def size_bundle_from_tubecount(N, Do, pitch, Ntp=1, angle=30, Method=None,
+                               AvailableMethods=False):
+    r'''Array version of :obj:`ht.hx.size_bundle_from_tubecount`, for many
+    tube counts `N` at once; `Do`, `pitch`, `Ntp` and `angle` must be
+    scalars. The 'Phadkeb' and 'Perry' methods are evaluated for every tube
+    count at once, and give NaN rather than raising an exception for tube
+    counts outside their range; the other methods are evaluated point by
+    point.
+    '''
+    if AvailableMethods:
+        return hx.size_bundle_from_tubecount(N, Do, pitch, Ntp, angle,
+                                             AvailableMethods=True)
+    if not Method or Method == 'Phadkeb':
+        return hx._DBundle_for_Ntubes_Phadkeb_array(N, Do, pitch, Ntp, angle)
+    elif Method == 'Perry':
+        return hx._DBundle_for_Ntubes_Perrys_array(N, Do, Ntp, angle)
+    return _size_bundle_from_tubecount(N, Do, pitch, Ntp, angle, Method)
+
+
+### conv_internal
+
+def laminar_entry_Seider_Tate(Re, Pr, L, Di, mu=None, mu_w=None):
+    Re, Pr, L, Di, mu, mu_w = _as_float_arrays(Re, Pr, L, Di, mu, mu_w)
+    Nu = 1.86*(Di/L*Re*Pr)**(1/3.0)
+    return Nu*_correction(mu, mu_w, 0.14)
+
+
+def turbulent_Sieder_Tate(Re, Pr, mu=None, mu_w=None):
+    Re, Pr, mu, mu_w = _as_float_arrays(Re, Pr, mu, mu_w)
+    Nu = 0.027*Re**0.8*Pr**(1/3.)
+    return Nu*_correction(mu, mu_w, 0.14)
+
+
+def helical_turbulent_Nu_Mori_Nakayama(Re, Pr, Di, Dc):
+    Re, Pr, Di, Dc = _as_float_arrays(Re, Pr, Di, Dc)
+    D_ratio = Di/Dc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        low_Pr = (Pr/(26.2*(Pr**(2/3.) - 0.074))*Re**0.8*D_ratio**0.1
+                  *(1. + 0.098*(Re*D_ratio*D_ratio)**-0.2))
+        high_Pr = (Pr**0.4/41.*Re**(5/6.)*(Di/Dc)**(1/12.)
+                   *(1. + 0.061/(Re*(Di/Dc)**2.5)**(1/6.)))
+    return np.where(Pr < 1, low_Pr, high_Pr)
+
+
+def helical_turbulent_Nu_Schmidt(Re, Pr, Di, Dc):
+    Re, Pr, Di, Dc = _as_float_arrays(Re, Pr, Di, Dc)
+    D_ratio = Di/Dc
+    term = Re**(0.8 - 0.22*D_ratio**0.1)*Pr**(1/3.)
+    low_Re = 0.023*(1. + 14.8*(1. + D_ratio)*D_ratio**(1/3.))*term
+    high_Re = 0.023*(1. + 3.6*(1. - D_ratio)*D_ratio**0.8)*Re**0.8*Pr**(1/3.)
+    return np.where(Re <= 2.2E4, low_Re, high_Re)
+
+
+### conv_external
+
+def Nu_cylinder_Zukauskas(Re, Pr, Prw=None):
+    Re, Pr, Prw = _as_float_arrays(Re, Pr, Prw)
+    regimes = [Re <= 40, Re < 1E3, Re < 2E5]
+    c = np.select(regimes, [0.75, 0.51, 0.26], 0.076)
+    m = np.select(regimes, [0.4, 0.5, 0.6], 0.7)
+    n = np.where(Pr <= 10.0, 0.37, 0.36)
+    Nu = c*Re**m*Pr**n
+    return Nu*_correction(Pr, Prw, 0.25, Prw)
+
+
+def Nu_cylinder_Whitaker(Re, Pr, mu=None, muw=None):
+    Re, Pr, mu, muw = _as_float_arrays(Re, Pr, mu, muw)
+    Nu = (0.4*Re**0.5 + 0.06*Re**(2/3.))*Pr**0.3
+    return Nu*_correction(mu, muw, 0.25)
+
+
+def Nu_cylinder_Perkins_Leppert_1962(Re, Pr, mu=None, muw=None):
+    Re, Pr, mu, muw = _as_float_arrays(Re, Pr, mu, muw)
+    Nu = (0.30*Re**0.5 + 0.10*Re**0.67)*Pr**0.4
+    return Nu*_correction(mu, muw, 0.25)
+
+
+def Nu_cylinder_Perkins_Leppert_1964(Re, Pr, mu=None, muw=None):
+    Re, Pr, mu, muw = _as_float_arrays(Re, Pr, mu, muw)
+    Nu = (0.31*Re**0.5 + 0.11*Re**0.67)*Pr**0.4
+    return Nu*_correction(mu, muw, 0.25)
+
+
+def Nu_horizontal_plate_laminar_Baehr(Re, Pr):
+    Re, Pr = _as_float_arrays(Re, Pr)
+    return np.select([Pr < 0.005, Pr < 0.05, Pr < 10.0],
+                     [1.128*(Re*Pr)**0.5, (Re*Pr)**0.5, 0.664*Re**0.5*Pr**(1/3.)],
+                     0.678*Re**0.5*Pr**(1/3.))
+
+
+### conv_free_immersed
+
+def _turbulent(turbulent, Ra, Ra_transition):
+    '''Mask of the points using the turbulent branch of a free convection
+    correlation; `turbulent` forces the branch when it is not None.
+    '''
+    if turbulent is None:
+        return Ra > Ra_transition
+    return bool(turbulent)
+
+
+def Nu_horizontal_plate_McAdams(Pr, Gr, buoyancy=True):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    if buoyancy:
+        return np.where(Ra <= 1E7, .54*Ra**0.25, 0.15*Ra**(1.0/3.0))
+    return np.where(Ra <= 1E10, .27*Ra**0.25, .15*Ra**(1.0/3.0))
+
+
+def Nu_horizontal_plate_VDI(Pr, Gr, buoyancy=True):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    if buoyancy:
+        f2 = (1.0 + (0.322/Pr)**(0.55))**(20.0/11.0)
+        return np.where(Ra*f2 < 7e4, 0.766*(Ra*f2)**0.2, 0.15*(Ra*f2)**(1.0/3.0))
+    f1 = (1.0 + (0.492/Pr)**(9.0/16.0))**(-16.0/9.0)
+    return 0.6*(Ra*f1)**0.2
+
+
+def Nu_vertical_cylinder_Griffiths_Davis_Morgan(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 1E9), 0.0782*Ra**0.357,
+                    0.67*Ra**0.25)
+
+
+def Nu_vertical_cylinder_Jakob_Linke_Morgan(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 1E8), 0.129*Ra**(1/3.),
+                    0.555*Ra**0.25)
+
+
+def Nu_vertical_cylinder_Carne_Morgan(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 2E8), 0.152*Ra**0.38,
+                    1.07*Ra**0.28)
+
+
+def Nu_vertical_cylinder_Eigenson_Morgan(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    transitional = (1E9 < Ra) & (Ra < 1.69E10) & (turbulent is not False)
+    return np.select([_turbulent(turbulent, Ra, 1.69E10), transitional],
+                     [0.148*Ra**(1/3.) - 127.6, 51.5 + 0.0000726*Ra**0.63],
+                     0.48*Ra**0.25)
+
+
+def Nu_vertical_cylinder_Touloukian_Morgan(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 4E10),
+                    0.0674*(Gr*Pr**1.29)**(1/3.), 0.726*Ra**0.25)
+
+
+def Nu_vertical_cylinder_McAdams_Weiss_Saunders(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 1E9), 0.13*Ra**(1/3.),
+                    0.59*Ra**0.25)
+
+
+def Nu_vertical_cylinder_Kreith_Eckert(Pr, Gr, turbulent=None):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 1E9), 0.021*Ra**0.4,
+                    0.555*Ra**0.25)
+
+
+def Nu_vertical_cylinder_Al_Arabi_Khamis(Pr, Gr, L, D, turbulent=None):
+    Pr, Gr, L, D = _as_float_arrays(Pr, Gr, L, D)
+    Gr_D = Gr/L**3*D**3
+    Ra = Pr*Gr
+    return np.where(_turbulent(turbulent, Ra, 2.6E9),
+                    0.47*Ra**(1/3.)*Gr_D**(-1/12.),
+                    2.9*Ra**0.25*Gr_D**(-1/12.))
+
+
+def Nu_horizontal_cylinder_Morgan(Pr, Gr):
+    Pr, Gr = _as_float_arrays(Pr, Gr)
+    Ra = Pr*Gr
+    regimes = [Ra < 1E-2, Ra < 1E2, Ra < 1E4, Ra < 1E7]
+    C = np.select(regimes, [0.675, 1.02, 0.850, 0.480], 0.125)
+    n = np.select(regimes, [0.058, 0.148, 0.188, 0.250], 0.333)
+    return C*Ra**n
+
+
+### conv_supercritical
+
+def Nu_Shitsman(Re, Pr_b, Pr_w):
+    Re, Pr_b, Pr_w = _as_float_arrays(Re, Pr_b, Pr_w)
+    return 0.023*Re**0.8*np.minimum(Pr_b, Pr_w)**0.8
+
+
+def Nu_Griem(Re, Pr, H=None):
+    Re, Pr, H = _as_float_arrays(Re, Pr, H)
+    w = 1.0
+    if H is not None:
+        w = np.select([H == 0.0, H < 1.54E6, H > 1.74E6], [1.0, 0.82, 1.0],
+                      0.82 + 9E-7*(H - 1.54E6))
+    return 0.0169*Re**0.8356*Pr**0.432*w
+
+
+def Nu_Jackson(Re, Pr, rho_w=None, rho_b=None, Cp_avg=None, Cp_b=None, T_b=None,
+               T_w=None, T_pc=None):
+    (Re, Pr, rho_w, rho_b, Cp_avg, Cp_b, T_b, T_w,
+     T_pc) = _as_float_arrays(Re, Pr, rho_w, rho_b, Cp_avg, Cp_b, T_b, T_w, T_pc)
+    n = 0.4
+    given = _given(T_b, T_w, T_pc)
+    if given is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = np.select([~given,
+                           ((T_b < T_w) & (T_w < T_pc)) | ((1.2*T_pc < T_b) & (T_b < T_w)),
+                           (T_b < T_pc) & (T_pc < T_w)],
+                          [0.4, 0.4, 0.4 + 0.2*(T_w/T_pc - 1)],
+                          0.4 + 0.2*(T_w/T_pc - 1)*(1 - 5*(T_b/T_pc - 1)))
+    Nu = 0.0183*Re**0.82*Pr**0.5
+    Nu = Nu*_correction(rho_w, rho_b, 0.3)
+    return Nu*_correction(Cp_avg, Cp_b, n)
+
+
+def Nu_Gupta(Re, Pr, rho_w=None, rho_b=None, mu_w=None, mu_b=None):
+    Re, Pr, rho_w, rho_b, mu_w, mu_b = _as_float_arrays(Re, Pr, rho_w, rho_b, mu_w, mu_b)
+    Nu = 0.004*Re**0.923*Pr**0.773
+    Nu = Nu*_correction(rho_w, rho_b, 0.186)
+    return Nu*_correction(mu_w, mu_b, 0.366)
+
+
+def Nu_Swenson(Re, Pr, rho_w=None, rho_b=None):
+    Re, Pr, rho_w, rho_b = _as_float_arrays(Re, Pr, rho_w, rho_b)
+    Nu = 0.00459*Re**0.923*Pr**0.613
+    return Nu*_correction(rho_w, rho_b, 0.231)
+
+
+def Nu_Xu(Re, Pr, rho_w=None, rho_b=None, mu_w=None, mu_b=None):
+    Re, Pr, rho_w, rho_b, mu_w, mu_b = _as_float_arrays(Re, Pr, rho_w, rho_b, mu_w, mu_b)
+    Nu = 0.02269*Re**0.8079*Pr**0.9213
+    Nu = Nu*_correction(rho_w, rho_b, 0.6638)
+    return Nu*_correction(mu_w, mu_b, 0.8687)
+
+
+def Nu_Mokry(Re, Pr, rho_w=None, rho_b=None):
+    Re, Pr, rho_w, rho_b = _as_float_arrays(Re, Pr, rho_w, rho_b)
+    Nu = 0.0061*Re**0.904*Pr**0.684
+    return Nu*_correction(rho_w, rho_b, 0.564)
+
+
+def Nu_Ornatsky(Re, Pr_b, Pr_w, rho_w=None, rho_b=None):
+    Re, Pr_b, Pr_w, rho_w, rho_b = _as_float_arrays(Re, Pr_b, Pr_w, rho_w, rho_b)
+    Nu = 0.023*Re**0.8*np.minimum(Pr_b, Pr_w)**0.8
+    return Nu*_correction(rho_w, rho_b, 0.3)
+
+
+def Nu_Zhu(Re, Pr, rho_w=None, rho_b=None, k_w=None, k_b=None):
+    Re, Pr, rho_w, rho_b, k_w, k_b = _as_float_arrays(Re, Pr, rho_w, rho_b, k_w, k_b)
+    Nu = 0.0068*Re**0.9*Pr**0.63
+    Nu = Nu*_correction(rho_w, rho_b, 0.17)
+    return Nu*_correction(k_w, k_b, 0.29)
+
+
+def Nu_Bishop(Re, Pr, rho_w=None, rho_b=None, D=None, x=None):
+    Re, Pr, rho_w, rho_b, D, x = _as_float_arrays(Re, Pr, rho_w, rho_b, D, x)
+    Nu = 0.0069*Re**0.9*Pr**0.66
+    Nu = Nu*_correction(rho_w, rho_b, 0.43)
+    given = _given(D, x)
+    if given is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Nu = Nu*np.where(given, 1 + 2.4*D/x, 1.0)
+    return Nu
+
+
+def Nu_Yamagata(Re, Pr, Pr_pc=None, Cp_avg=None, Cp_b=None, T_b=None,
+               T_w=None, T_pc=None):
+    (Re, Pr, Pr_pc, Cp_avg, Cp_b, T_b, T_w,
+     T_pc) = _as_float_arrays(Re, Pr, Pr_pc, Cp_avg, Cp_b, T_b, T_w, T_pc)
+    F = 1.0
+    given = _given(T_b, T_w, T_pc, Pr_pc, Cp_avg, Cp_b)
+    if given is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            E = (T_pc - T_b)/(T_w - T_b)
+            n2 = 1.44*(1 + 1/Pr_pc) - 0.53
+            n1 = -0.77*(1 + 1/Pr_pc) + 1.49
+            F = np.select([given & (E < 0), given & (0 < E) & (E < 1)],
+                          [(Cp_avg/Cp_b)**n2, 0.67*Pr_pc**-0.05*(Cp_avg/Cp_b)**n1],
+                          1.0)
+    return 0.0138*Re**0.85*Pr**0.8*F
+
+
+def Nu_Kitoh(Re, Pr, H=None, G=None, q=None):
+    Re, Pr, H, G, q = _as_float_arrays(Re, Pr, H, G, q)
+    m = 0.69
+    given = _given(H, G, q)
+    if given is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            qht = 200.*G**1.2
+            fc = np.select([H < 1.5E6, H <= 3.3E6],
+                           [2.9E-8 + 0.11/qht, -8.7E-8 - 0.65/qht],
+                           -9.7E-7 + 1.3/qht)
+            m = np.where(given, 0.69 - 81000./qht + fc*q, 0.69)
+    return 0.015*Re**0.85*Pr**m
+
+
+def Nu_Krasnoshchekov_Protopopov(Re, Pr, Cp_avg=None, Cp_b=None, k_w=None,
+                                 k_b=None, mu_w=None, mu_b=None):
+    (Re, Pr, Cp_avg, Cp_b, k_w, k_b, mu_w,
+     mu_b) = _as_float_arrays(Re, Pr, Cp_avg, Cp_b, k_w, k_b, mu_w, mu_b)
+    fd = (1.82*np.log10(Re) - 1.64)**-2
+    Nu = (fd/8.)*Re*Pr/(1.07 + 12.7*(fd/8.)**0.5*(Pr**(2/3.)-1))
+    Nu = Nu*_correction(mu_w, mu_b, 0.11)
+    Nu = Nu*_correction(k_w, k_b, -0.33)
+    return Nu*_correction(Cp_avg, Cp_b, 0.35)
+
+
+def Nu_Petukhov(Re, Pr, rho_w=None, rho_b=None, mu_w=None, mu_b=None):
+    Re, Pr, rho_w, rho_b, mu_w, mu_b = _as_float_arrays(Re, Pr, rho_w, rho_b, mu_w, mu_b)
+    fd = (1.82*np.log10(Re) - 1.64)**-2
+    fd = fd*_correction(rho_w, rho_b, 0.4)
+    fd = fd*_correction(mu_w, mu_b, 0.2)
+    return (fd/8.)*Re*Pr/(1 + 900./Re + 12.7*(fd/8.)**0.5*(Pr**(2/3.)-1))
+
+
+def Nu_Krasnoshchekov(Re, Pr, rho_w=None, rho_b=None, Cp_avg=None, Cp_b=None,
+                      T_b=None, T_w=None, T_pc=None):
+    (Re, Pr, rho_w, rho_b, Cp_avg, Cp_b, T_b, T_w,
+     T_pc) = _as_float_arrays(Re, Pr, rho_w, rho_b, Cp_avg, Cp_b, T_b, T_w, T_pc)
+    n = 0.4
+    given = _given(T_b, T_w, T_pc)
+    if given is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n1 = 0.22 + 0.18*T_w/T_pc
+            n = np.select([~given,
+                           ((T_b < T_w) & (T_w < T_pc)) | ((1.2*T_pc < T_b) & (T_b < T_w)),
+                           (1 < T_w/T_pc) & (T_w/T_pc < 2.5)],
+                          [0.4, 0.4, n1], n1 + (5*n1 - 2)*(1 - T_b/T_pc))
+    fd = (1.82*np.log10(Re) - 1.64)**-2
+    Nu = (fd/8.)*Re*Pr/(1.07 + 12.7*(fd/8.)**0.5*(Pr**(2/3.)-1))
+    Nu = Nu*_correction(rho_w, rho_b, 0.3)
+    return Nu*_correction(Cp_avg, Cp_b, n)
+
+
+
+def blackbody_fraction(T, wavelength_min=0.0, wavelength_max=None):
+    return radiation._blackbody_fraction_array(T, wavelength_min, wavelength_max)
+
+
+_array_kernels = ['LMTD', 'F_LMTD_Fakheri', 'effectiveness_from_NTU',
+                  'temperature_effectiveness_basic', 'NTU_from_P_basic',
+                  'temperature_effectiveness_TEMA_J',
+                  'temperature_effectiveness_TEMA_H',
+                  'temperature_effectiveness_TEMA_G',
+                  'temperature_effectiveness_TEMA_E',
+                  'temperature_effectiveness_plate', 'plate_effectiveness_kernel',
+                  'temperature_effectiveness_air_cooler',
+                  'NTU_from_P_G', 'NTU_from_P_J', 'NTU_from_P_E',
+                  'NTU_from_P_H', 'NTU_from_P_plate',
+                  'laminar_entry_Seider_Tate', 'turbulent_Sieder_Tate',
+                  'helical_turbulent_Nu_Mori_Nakayama',
+                  'helical_turbulent_Nu_Schmidt',
+                  'Nu_cylinder_Zukauskas', 'Nu_cylinder_Whitaker',
+                  'Nu_cylinder_Perkins_Leppert_1962',
+                  'Nu_cylinder_Perkins_Leppert_1964',
+                  'Nu_horizontal_plate_laminar_Baehr',
+                  'Nu_horizontal_plate_McAdams', 'Nu_horizontal_plate_VDI',
+                  'Nu_vertical_cylinder_Griffiths_Davis_Morgan',
+                  'Nu_vertical_cylinder_Jakob_Linke_Morgan',
+                  'Nu_vertical_cylinder_Carne_Morgan',
+                  'Nu_vertical_cylinder_Eigenson_Morgan',
+                  'Nu_vertical_cylinder_Touloukian_Morgan',
+                  'Nu_vertical_cylinder_McAdams_Weiss_Saunders',
+                  'Nu_vertical_cylinder_Kreith_Eckert',
+                  'Nu_vertical_cylinder_Al_Arabi_Khamis',
+                  'Nu_horizontal_cylinder_Morgan',
+                  'Nu_Shitsman', 'Nu_Griem', 'Nu_Jackson', 'Nu_Gupta',
+                  'Nu_Swenson', 'Nu_Xu', 'Nu_Mokry', 'Nu_Ornatsky', 'Nu_Zhu',
+                  'Nu_Bishop', 'Nu_Yamagata', 'Nu_Kitoh',
+                  'Nu_Krasnoshchekov_Protopopov', 'Nu_Petukhov',
+                  'Nu_Krasnoshchekov', 'blackbody_fraction']
 
-        
+for name in _array_kernels:
+    globals()[name].__doc__ = ('Array version of :obj:`ht.%s`; see its '
+                               'documentation.' %(name))
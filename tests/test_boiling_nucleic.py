@@ -227,6 +227,10 @@ def test_h_nucleic():
     h = h_nucleic(rhol=957.854, rhog=0.595593, mul=2.79E-4, kl=0.680, Cpl=4217, Hvap=2.257E6, sigma=0.0589, Te=4.9, Method='Rohsenow', Csf=0.011, n=1.26)
     assert_allclose(h, 3723.655267067467)
 
+    # Every method is bound from the table of correlations
+    from ht.boiling_nucleic import _h_nucleic_correlations
+    assert sorted(_h_nucleic_correlations) == sorted(h_nucleic_methods)
+
 
     # methods
     methods = h_nucleic(P=101325., Pc=22048321.0, MW=18.02, dPsat=3906*4.3, Tsat=437.5, CAS='7732-18-5', rhol=957.854, rhog=0.595593, mul=2.79E-4, kl=0.680, Cpl=4217, Hvap=2.257E6, sigma=0.0589, Te=4.9, AvailableMethods=True)
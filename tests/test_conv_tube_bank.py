@@ -23,6 +23,7 @@ SOFTWARE.'''
 from __future__ import division
 from ht import *
 import numpy as np
+import pytest
 
 from numpy.testing import assert_allclose
 from scipy.interpolate import interp1d, bisplrep, splrep, splev, UnivariateSpline, RectBivariateSpline
@@ -52,10 +53,10 @@ def test_Nu_Grimison_tube_bank():
     assert_allclose(Nu, 79.92721078571385)
     
     Nu = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=7,  pitch_normal=.05, pitch_parallel=.05, Do=.025)
-    assert_allclose(Nu, 77.49726188689894)
+    assert_allclose(Nu, 75.91568511369691)
     
     Nu = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=7,  pitch_normal=.07, pitch_parallel=.05, Do=.025)
-    assert_allclose(Nu, 78.32866656999958)
+    assert_allclose(Nu, 77.52939446214243)
     
     # Test the negative input
     args = dict(Re=10263.37, Pr=.708, tube_rows=-1, pitch_normal=.07, pitch_parallel=.05, Do=.025)
@@ -69,6 +70,46 @@ def test_Nu_Grimison_tube_bank():
     Nu_bulk_expect = [[83.05244932418451, 152.02626127499462, 92.67853984384722, 80.45909971688272, 80.45909971688272, 80.45909971688272, 80.45909971688272], [81.37409021240403, 75.87989409125535, 88.19403137832364, 90.10492890754932, 90.10492890754932, 90.10492890754932, 90.10492890754932], [80.154658166616, 79.27931854213506, 79.07883866010096, 88.31182349500988, 88.31182349500988, 88.31182349500988, 88.31182349500988], [73.98350370839236, 76.51020564051443, 78.3597838488104, 79.12612063682283, 86.25920529135, 86.25920529135, 86.25920529135], [73.98350370839236, 76.51020564051443, 78.3597838488104, 86.25920529135, 79.12612063682283, 86.25920529135, 86.25920529135], [73.98350370839236, 76.51020564051443, 78.3597838488104, 86.25920529135, 86.25920529135, 79.12612063682283, 86.25920529135], [73.98350370839236, 76.51020564051443, 78.3597838488104, 86.25920529135, 86.25920529135, 86.25920529135, 79.12612063682283]]
     assert_allclose(Nu_bulk, Nu_bulk_expect)
 
+    # Row corrections from the first row; 9 rows is the last corrected
+    Nu = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=1,  pitch_normal=.05, pitch_parallel=.05, Do=.025)
+    assert_allclose(Nu, 0.64*79.07883866010096)
+    Nu = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=1,  pitch_normal=.07, pitch_parallel=.05, Do=.025)
+    assert_allclose(Nu, 0.68*79.92721078571385)
+    Nu = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=9,  pitch_normal=.05, pitch_parallel=.05, Do=.025)
+    assert_allclose(Nu, 0.99*79.07883866010096)
+    Nu = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=10,  pitch_normal=.05, pitch_parallel=.05, Do=.025)
+    assert_allclose(Nu, 79.07883866010096)
+
+
+def test_Nu_Grimison_tube_bank_array():
+    pitches = [.025, .04, .05, .075, .1, .15, .2]
+    pitch_normal, pitch_parallel = np.meshgrid(pitches, pitches, indexing='ij')
+    Nus = Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=11, Do=.025,
+                                pitch_normal=pitch_normal, pitch_parallel=pitch_parallel)
+    assert Nus.shape == (7, 7)
+    assert_allclose(Nus, [[Nu_Grimison_tube_bank(Re=10263.37, Pr=.708, tube_rows=11, Do=.025,
+                                                 pitch_normal=j, pitch_parallel=i)
+                           for i in pitches] for j in pitches], rtol=1e-13)
+
+    # Every combination of Re, Pr, row count and geometry, with repeated
+    # geometries
+    Res = np.array([[300.], [5000.], [1E5]])
+    rows = np.array([-1, 1, 4, 8, 9, 10, 30])
+    pitch_normal = np.array([.05, .07, .05, .07, .1, .05, .05])
+    Nus = Nu_Grimison_tube_bank(Re=Res, Pr=np.array([.7, 3., 7., 1., .7, .9, 5.]), tube_rows=rows,
+                                pitch_normal=pitch_normal, pitch_parallel=.05, Do=.025)
+    assert Nus.shape == (3, 7)
+    for i, Re in enumerate(Res[:, 0]):
+        for j, (Pr, n, pn) in enumerate(zip([.7, 3., 7., 1., .7, .9, 5.], rows, pitch_normal)):
+            Nu = Nu_Grimison_tube_bank(Re=Re, Pr=Pr, tube_rows=n, pitch_normal=pn,
+                                       pitch_parallel=.05, Do=.025)
+            assert_allclose(Nus[i, j], Nu, rtol=1e-13)
+
+    # Only the Reynolds number varying
+    Nus = Nu_Grimison_tube_bank(Re=Res[:, 0], Pr=.708, tube_rows=7,  pitch_normal=.07, pitch_parallel=.05, Do=.025)
+    assert_allclose(Nus[1], Nu_Grimison_tube_bank(Re=5000., Pr=.708, tube_rows=7,  pitch_normal=.07, pitch_parallel=.05, Do=.025), rtol=1e-13)
+
+
 def test_Gimison_coeffs_regeneration():
     from ht.conv_tube_bank import (Grimson_SL_staggered, Grimson_ST_staggered, 
                                    Grimson_m_staggered, Grimson_C1_staggered,
@@ -90,6 +131,14 @@ def test_ESDU_tube_row_correction():
     # Test all of the inputs work
     all_values = [ESDU_tube_row_correction(i, staggered=j) for i in range(12) for j in (True, False)]
 
+    rows = np.arange(0, 14)
+    for staggered in (True, False):
+        F2s = ESDU_tube_row_correction(rows, staggered=staggered)
+        assert_allclose(F2s, [ESDU_tube_row_correction(int(i), staggered=staggered) for i in rows], rtol=1e-15)
+    F2s = ESDU_tube_row_correction(np.array([2, 4, 12]), staggered=np.array([True, False, True]))
+    assert_allclose(F2s, [ESDU_tube_row_correction(2, staggered=True),
+                          ESDU_tube_row_correction(4, staggered=False), 1.0], rtol=1e-15)
+
 def test_ESDU_tube_row_correction_refit():
     # Re-fit the data
     from ht.conv_tube_bank import ESDU_73031_F2_inline, ESDU_73031_F2_staggered
@@ -200,6 +249,15 @@ def test_Zukauskas_tube_row_correction():
     F = Zukauskas_tube_row_correction(6, staggered=False)
     assert_allclose(F, 0.9465)
 
+    rows = np.arange(-1, 25)
+    for staggered in [True, False]:
+        for Re in [500., 5000.]:
+            Fs = Zukauskas_tube_row_correction(rows, staggered=staggered, Re=Re)
+            assert_allclose(Fs, [Zukauskas_tube_row_correction(n, staggered, Re) for n in rows])
+    Fs = Zukauskas_tube_row_correction(4, staggered=np.array([True, True, False]),
+                                       Re=np.array([500., 5000., 500.]))
+    assert_allclose(Fs, [0.9402, 0.8942, 0.9054])
+
 def test_Zukauskas_tube_row_correction_refit():
     from scipy.interpolate import UnivariateSpline
     from ht.conv_tube_bank import Zukauskas_Czs_low_Re_staggered, Zukauskas_Czs_high_Re_staggered, Zukauskas_Czs_inline 
@@ -239,6 +297,28 @@ def test_Nu_Zukauskas_Bejan():
     Nus_expect = [5.263427360525052, 75.85353712516013, 793.1545862201796, 27967.361063088636]
     assert_allclose(Nus, Nus_expect)
 
+    # Inline banks between Re of 100 and 1000 have an Re exponent of 0.5
+    Nu = Nu_Zukauskas_Bejan(Re=300., Pr=7., tube_rows=30, pitch_parallel=.05, pitch_normal=.05)
+    assert_allclose(Nu, 0.52*300.**0.5*7.**0.36)
+
+
+def test_Nu_Zukauskas_Bejan_array():
+    # Every range of Re, including their limits, for both configurations
+    Res = np.array([[10.], [100.], [300.], [500.], [700.], [1000.], [1E4], [2E5], [1E7]])
+    rows = np.array([1, 5, 10, 19, 20, 30])
+    pitch_normal = np.array([.05, .09, .05, .09, .06, .05])
+    Nus = Nu_Zukauskas_Bejan(Re=Res, Pr=7., tube_rows=rows, pitch_parallel=.05,
+                             pitch_normal=pitch_normal, Pr_wall=9.)
+    assert Nus.shape == (9, 6)
+    for i, Re in enumerate(Res[:, 0]):
+        for j, (n, pn) in enumerate(zip(rows, pitch_normal)):
+            Nu = Nu_Zukauskas_Bejan(Re=Re, Pr=7., tube_rows=n, pitch_parallel=.05,
+                                    pitch_normal=pn, Pr_wall=9.)
+            assert_allclose(Nus[i, j], Nu, rtol=1e-13)
+
+    Nus = Nu_Zukauskas_Bejan(Re=np.array([10, 2000, 1E5, 1E7]), Pr=7., tube_rows=30, pitch_parallel=.05, pitch_normal=.09)
+    assert_allclose(Nus, [5.263427360525052, 75.85353712516013, 793.1545862201796, 27967.361063088636])
+
 def test_Nu_ESDU_73031():
     Nu = Nu_ESDU_73031(Re=1.32E4, Pr=0.71, tube_rows=8, pitch_parallel=.09, pitch_normal=.05)
     assert_allclose(98.2563319140594, Nu)
@@ -256,6 +336,19 @@ def test_Nu_ESDU_73031():
     Nus_expect = [5.179925804379317, 307.9970377601136, 1481.8545490578865, 4.0177935875859365, 282.40096167747, 1367.860174719831]
     assert_allclose(Nus, Nus_expect)
 
+    # Arrays of every input match the scalar calculation
+    Res = np.array([100., 299., 300., 301., 1E4, 2E5, 2.1E5, 1E6])
+    rows = np.array([1, 3, 5, 8, 10, 12, 2, 20])
+    pitch_parallels = np.array([.09, .05, .09, .05, .09, .05, .09, .05])
+    angles = np.array([90., 80., 70., 60., 50., 40., 30., 90.])
+    Nus = Nu_ESDU_73031(Re=Res, Pr=0.71, tube_rows=rows, pitch_parallel=pitch_parallels,
+                        pitch_normal=.05, Pr_wall=0.75, angle=angles)
+    for i in range(len(Res)):
+        Nu = Nu_ESDU_73031(Re=Res[i], Pr=0.71, tube_rows=int(rows[i]),
+                           pitch_parallel=pitch_parallels[i], pitch_normal=.05,
+                           Pr_wall=0.75, angle=angles[i])
+        assert_allclose(Nus[i], Nu, rtol=1e-13)
+
 
 def test_Nu_HEDH_tube_bank():
     Nu = Nu_HEDH_tube_bank(Re=1E4, Pr=7., tube_rows=10, pitch_normal=.05, pitch_parallel=.05, Do=.03)
@@ -323,6 +416,60 @@ def test_dP_Zukauskas():
     dP2 = dP_Zukauskas(Re=13943., n=7, ST=0.0313, SL=0.0313, D=0.0164, rho=1.217, Vmax=12.6)
     assert_allclose([dP1, dP2], [235.22916169118335, 217.0750033117563])
 
+    # Arrays of Re and pitches, inline and staggered together
+    Res = np.logspace(1, 6.5, 30)
+    SLs = np.array([0.0313, 0.0343, 0.05])
+    dPs = dP_Zukauskas(Re=Res[:, None], n=7, ST=0.0313, SL=SLs, D=0.0164, rho=1.217, Vmax=12.6)
+    assert dPs.shape == (30, 3)
+    for i, Re in enumerate(Res):
+        for j, SL in enumerate(SLs):
+            dP = dP_Zukauskas(Re=Re, n=7, ST=0.0313, SL=SL, D=0.0164, rho=1.217, Vmax=12.6)
+            assert type(dP) is float
+            assert_allclose(dPs[i, j], dP, rtol=1E-13)
+
+
+def test_dP_Zukauskas_tcks():
+    from ht.conv_tube_bank import (dP_staggered_f_tck, dP_staggered_correction_tck,
+                                   dP_inline_f_tck, dP_inline_correction_tck,
+                                   _dP_staggered_Res, _dP_staggered_Re_parameters,
+                                   _dP_staggered_correction_parameters,
+                                   _dP_staggered_correction_Re_parameters,
+                                   _dP_inline_Res, _dP_inline_Re_parameters,
+                                   _dP_inline_correction_parameters, _dP_inline_correction_zs,
+                                   _dP_inline_correction_Re_parameters)
+    fits = [(dP_staggered_f_tck, _dP_staggered_Res, [1.25, 1.5, 2, 2.5], _dP_staggered_Re_parameters, 3),
+            (dP_staggered_correction_tck, _dP_staggered_correction_parameters, [1E2, 1E3, 1E4, 1E5],
+             _dP_staggered_correction_Re_parameters, 1),
+            (dP_inline_f_tck, _dP_inline_Res, [1.25, 1.5, 2, 2.5], _dP_inline_Re_parameters, 3),
+            (dP_inline_correction_tck, _dP_inline_correction_parameters, _dP_inline_correction_zs,
+             _dP_inline_correction_Re_parameters, 1)]
+    for tck, x, y, z, kx in fits:
+        spline = RectBivariateSpline(x, np.array(y), z, kx=kx, ky=3, s=0.002)
+        [assert_allclose(i, j, rtol=1E-13) for i, j in zip(spline.tck, tck[:3])]
+
+        # Evaluated point by point, including beyond the data where the
+        # spline is held at its end values
+        xs = np.exp(np.linspace(np.log(min(x)) - 0.5, np.log(max(x)) + 0.5, 50))
+        ys = np.linspace(min(y) - 0.2, max(y)*1.2, 50)
+        from ht.conv_tube_bank import _bisplev_points
+        assert_allclose(_bisplev_points(xs, ys, tck), spline.ev(xs, ys), rtol=1E-12)
+        assert_allclose(_bisplev_points(xs[7], ys[3], tck), spline.ev(xs[7], ys[3]), rtol=1E-13)
+
+    # The spline objects remain available under their old names, and the
+    # evaluators of the same curves agree with them
+    import ht.conv_tube_bank
+    for name, (tck, x, y, z, kx) in zip(['dP_staggered_f', 'dP_staggered_correction',
+                                         'dP_inline_f', 'dP_inline_correction'], fits):
+        spline = getattr(ht.conv_tube_bank, name)
+        assert isinstance(spline, RectBivariateSpline)
+        assert spline is getattr(ht.conv_tube_bank, name)
+        [assert_allclose(i, j, rtol=1E-13) for i, j in zip(spline.tck, tck[:3])]
+        xs = np.exp(np.linspace(np.log(min(x)), np.log(max(x)), 20))
+        ys = np.linspace(min(y), max(y), 20)
+        interp = getattr(ht.conv_tube_bank, name + '_interp')
+        assert_allclose(interp(xs, ys), spline.ev(xs, ys), rtol=1E-12)
+        assert_allclose(interp(xs[3], ys[5]), spline(xs[3], ys[5])[0, 0], rtol=1E-13)
+
 Bell_baffle_configuration_Fcs = np.array([0, 0.0138889, 0.0277778, 0.0416667, 0.0538194, 0.0659722, 0.100694, 0.114583,
     0.126736, 0.140625, 0.152778, 0.166667, 0.178819, 0.192708, 0.215278, 0.227431, 0.241319, 0.255208,
     0.267361, 0.28125, 0.295139, 0.340278, 0.354167, 0.366319, 0.380208, 0.394097, 0.402778, 0.416667, 0.430556,
@@ -350,6 +497,11 @@ def test_baffle_correction_Bell():
     
     Jc = baffle_correction_Bell(0.1, 'chebyshev')   
     assert_allclose(Jc, 0.61868011359447)
+
+    Fcs = np.array([0.1, 0.5, 0.82])
+    for method in ['spline', 'chebyshev', 'HEDH']:
+        assert_allclose(baffle_correction_Bell(Fcs, method),
+                        [baffle_correction_Bell(Fc, method) for Fc in Fcs], rtol=1e-13)
      
     Jc = baffle_correction_Bell(0.82, 'HEDH')
     assert_allclose(Jc, 1.1404)
@@ -477,6 +629,38 @@ def test_baffle_leakage_Bell_refit():
     [assert_allclose(i, j) for (i, j) in zip(Bell_baffle_leakage_tck, new_tck)]
 
 
+def test_baffle_leakage_Bell_chebyshev():
+    from ht.conv_tube_bank import Bell_baffle_leakage_x_max
+    Jl = baffle_leakage_Bell(1, 3, 8, method='chebyshev')
+    assert_allclose(Jl, 0.5906438981148219)
+
+    # Silent clipping
+    Jl = baffle_leakage_Bell(1, .0001, .00001, method='chebyshev')
+    assert_allclose(Jl, 0.16072739052053492, rtol=1e-3)
+
+    # Documented maximum error against the spline
+    x = np.linspace(0, Bell_baffle_leakage_x_max, 300)
+    z = np.linspace(0, 1, 41)
+    X, Z = np.meshgrid(x, z)
+    Ssb, Stb, Sm = Z, 1.0 - Z, 1.0/np.where(X == 0.0, 1e-10, X)
+    Jl_spline = baffle_leakage_Bell(Ssb, Stb, Sm)
+    Jl_cheb = baffle_leakage_Bell(Ssb, Stb, Sm, method='chebyshev')
+    assert_allclose(Jl_cheb, Jl_spline, rtol=1e-3)
+
+
+def test_baffle_leakage_Bell_array():
+    Ssb = np.array([1., 1., 0.5, 2.])
+    Stb = np.array([1., 3., 2.5, 0.])
+    Sm = np.array([4., 8., 3., 1.])
+    for method in ['spline', 'chebyshev', 'HEDH']:
+        Jls = baffle_leakage_Bell(Ssb, Stb, Sm, method=method)
+        assert_allclose(Jls, [baffle_leakage_Bell(*args, method=method)
+                              for args in zip(Ssb, Stb, Sm)], rtol=1e-13)
+
+    with pytest.raises(ValueError):
+        baffle_leakage_Bell(np.array([1., -1.]), 3., 8.)
+
+
 #import matplotlib.pyplot as plt
 #for ys in Bell_baffle_leakage_zs.T:
 #    plt.plot(Bell_baffle_leakage_x, ys)
@@ -678,6 +862,36 @@ def test_bundle_bypassing_Bell():
     [assert_allclose(i, j) for i, j in zip(Bell_bundle_bypass_low_spl, low_spl)]
 
 
+def test_bundle_bypassing_Bell_chebyshev():
+    from ht.conv_tube_bank import Bell_bundle_bypass_x_max
+    Jb = bundle_bypassing_Bell(0.5, 5, 25, method='chebyshev')
+    assert_allclose(Jb, 0.8470025109045178)
+    Jb = bundle_bypassing_Bell(0.5, 5, 25, laminar=True, method='chebyshev')
+    assert_allclose(Jb, 0.8329779254237614)
+
+    # Past the end of the splines
+    assert bundle_bypassing_Bell(0.5, 20, 25, method='chebyshev') == 1.0
+
+    # Documented maximum errors against the splines
+    x = np.linspace(0, Bell_bundle_bypass_x_max, 200)
+    z = np.linspace(0, 0.5, 101)
+    X, Z = np.meshgrid(x, z)
+    for laminar, rtol in zip([False, True], [8.5e-4, 1.23e-3]):
+        Jb_spline = bundle_bypassing_Bell(X, Z, 1.0, laminar)
+        Jb_cheb = bundle_bypassing_Bell(X, Z, 1.0, laminar, method='chebyshev')
+        assert_allclose(Jb_cheb, Jb_spline, rtol=rtol)
+
+
+def test_bundle_bypassing_Bell_array():
+    fractions = np.array([0.1, 0.5, 0.9])
+    seal_strips = np.array([0, 2, 20])
+    for laminar in [False, True]:
+        for method in ['spline', 'chebyshev', 'HEDH']:
+            Jbs = bundle_bypassing_Bell(fractions, seal_strips, 25, laminar, method=method)
+            assert_allclose(Jbs, [bundle_bypassing_Bell(x, n, 25, laminar, method=method)
+                                  for x, n in zip(fractions, seal_strips)], rtol=1e-13)
+
+
 def test_unequal_baffle_spacing_Bell():
     Js = unequal_baffle_spacing_Bell(16, .1, .15, 0.15)
     assert_allclose(Js, 0.9640087802805195)
@@ -686,4 +900,159 @@ def test_laminar_correction_Bell():
     Jr = laminar_correction_Bell(30, 80)
     assert_allclose(Jr, 0.7267995454361379)
     
-    assert_allclose(0.4, laminar_correction_Bell(30, 80000))
\ No newline at end of file
+    assert_allclose(0.4, laminar_correction_Bell(30, 80000))
+
+def test_BellDelawareShell():
+    shell = BellDelawareShell(DShell=0.489, Do=0.01905, pitch=0.0254, Ntubes=224,
+                              baffle_cut=0.25, baffle_spacing=0.127, baffles=30,
+                              seal_strips=1)
+    assert_allclose([shell.Sm, shell.Ssb, shell.Stb, shell.Sw, shell.Fc, shell.Ntcc, shell.Ntcw],
+                    [0.015378112499999999, 0.0025890744704176486, 0.004481271994446923,
+                     0.025128848115455765, 0.6370193473547232, 11.11545525631467,
+                     4.012474768598498], rtol=1E-12)
+    assert shell.Jc == baffle_correction_Bell(shell.Fc)
+    assert shell.Jl == baffle_leakage_Bell(shell.Ssb, shell.Stb, shell.Sm)
+
+    res = shell.rate(m=5.2, rho=850., Cp=2100., k=0.13, mu=1.2E-3)
+    assert_allclose([res['h'], res['dP'], res['Re']],
+                    [656.5842379453402, 6145.163444521528, 5368.018994528751], rtol=1E-12)
+    # Ideal tube bank, 30 degrees, 1E3 < Re < 1E4
+    a = 1.45/(1. + 0.14*res['Re']**0.519)
+    assert_allclose(res['j'], 0.321*(1.33*0.01905/0.0254)**a*res['Re']**-0.388, rtol=1E-13)
+    assert_allclose(res['dP'], res['dP_crossflow'] + res['dP_window'] + res['dP_ends'], rtol=1E-13)
+    assert_allclose(res['h'], res['h_ideal']*res['Jc']*res['Jl']*res['Jb']*res['Js']*res['Jr'], rtol=1E-13)
+
+    # Arrays give the same answers as each point alone, in laminar and
+    # turbulent flow
+    shell = BellDelawareShell(DShell=0.489, Do=0.01905, pitch=0.0254, Ntubes=200,
+                              baffle_cut=0.3, baffle_spacing=0.15, baffles=12,
+                              baffle_spacing_in=0.3, baffle_spacing_out=0.25,
+                              angle=90, seal_strips=2, method='HEDH')
+    ms = np.array([0.002, 0.02, 0.1, 0.5, 3., 40.])
+    res = shell.rate(m=ms, rho=900., Cp=2000., k=0.12, mu=5E-3, mu_w=[[8E-3], [4E-3]])
+    assert res['h'].shape == (2, 6)
+    for i, mu_w in enumerate([8E-3, 4E-3]):
+        for j, m in enumerate(ms):
+            point = shell.rate(m=m, rho=900., Cp=2000., k=0.12, mu=5E-3, mu_w=mu_w)
+            assert type(point['h']) is float
+            for key in point:
+                assert_allclose(res[key][i, j], point[key], rtol=1E-13)
+            laminar = point['Re'] < 100.
+            assert point['Jb'] == bundle_bypassing_Bell(shell.Fsbp, 2, shell.Ntcc, laminar, method='HEDH')
+            assert point['Js'] == unequal_baffle_spacing_Bell(12, 0.15, 0.3, 0.25, laminar)
+            assert_allclose(point['Jr'], laminar_correction_Bell(point['Re'], shell.Nc), rtol=1E-13)
+    assert np.all(np.diff(res['h'], axis=1) > 0.) and np.all(np.diff(res['dP'], axis=1) > 0.)
+
+    # The Chebyshev fits of the correction factors are close to the splines
+    kwargs = dict(DShell=0.489, Do=0.01905, pitch=0.0254, Ntubes=224,
+                  baffle_cut=0.25, baffle_spacing=0.127, baffles=30, seal_strips=1)
+    spline, cheb = BellDelawareShell(**kwargs), BellDelawareShell(method='chebyshev', **kwargs)
+    for key in ['Jc', 'Jl', 'Rl']:
+        assert_allclose(getattr(cheb, key), getattr(spline, key), rtol=2e-3)
+    res_spline = spline.rate(m=5.2, rho=850., Cp=2100., k=0.13, mu=1.2E-3)
+    res_cheb = cheb.rate(m=5.2, rho=850., Cp=2100., k=0.13, mu=1.2E-3)
+    assert_allclose(res_cheb['h'], res_spline['h'], rtol=3e-3)
+    assert_allclose(res_cheb['dP'], res_spline['dP'], rtol=3e-3)
+
+    with pytest.raises(Exception):
+        BellDelawareShell(DShell=0.489, Do=0.01905, pitch=0.0254, Ntubes=224,
+                          baffle_cut=0.25, baffle_spacing=0.127, baffles=30, angle=60)
+
+
+def test_tube_bank_march():
+    kwargs = dict(T_in=700., T_tubes=450., A_row=10., A_min=2.5, Do=0.0508,
+                  rho=0.6, Cp=1080., k=0.05, mu=3.2E-5)
+    Pr = 1080.*3.2E-5/0.05
+
+    # With constant properties, the mean of the per-row coefficients is that
+    # of the bank-averaged correlations, and no iteration is performed
+    for rows in (1, 5, 9, 12, 25):
+        for pitch_parallel in (0.0889, 0.1016):
+            for m in (5., 0.3):
+                for method, Nu_bank in (('Zukauskas', Nu_Zukauskas_Bejan), ('ESDU', Nu_ESDU_73031)):
+                    res = tube_bank_march(m=m, rows=rows, pitch_parallel=pitch_parallel,
+                                          pitch_normal=0.1016, method=method, **kwargs)
+                    assert res['iterations'] == 1
+                    Nu = Nu_bank(res['Re_rows'][0], Pr, rows, pitch_parallel, 0.1016)
+                    assert_allclose(np.mean(res['h_rows'])*0.0508/0.05, Nu, rtol=1e-13)
+
+    # The temperatures agree with marching the rows one at a time
+    R_tubes = np.linspace(0., 1E-3, 15)
+    res = tube_bank_march(m=5., rows=15, pitch_parallel=0.0889, pitch_normal=0.1016,
+                          R_tubes=R_tubes, **kwargs)
+    T = [700.]
+    for U in res['U_rows']:
+        T.append(450. + (T[-1] - 450.)*np.exp(-U*10./(5.*1080.)))
+    assert_allclose(res['T'], T, rtol=1e-13)
+    assert_allclose(res['U_rows'], 1./(1./res['h_rows'] + R_tubes), rtol=1e-13)
+    assert_allclose(res['Q'], 5.*1080.*(700. - res['T_out']), rtol=1e-13)
+    assert_allclose(res['dP_rows'], [dP_Zukauskas(Re=res['Re_rows'][0], n=1, ST=0.1016,
+                                                  SL=0.0889, D=0.0508, rho=0.6,
+                                                  Vmax=5./(0.6*2.5))]*15, rtol=1e-13)
+    assert type(res['Q']) is float and type(res['dP']) is float
+
+    # Rating many banks at once is the same as rating them one at a time
+    ms = np.array([3., 5., 8.])
+    pitch_parallels = np.array([0.0889, 0.1016, 0.0889])
+    res = tube_bank_march(m=ms, rows=15, pitch_parallel=pitch_parallels,
+                          pitch_normal=0.1016, R_tubes=R_tubes, **kwargs)
+    assert res['T'].shape == (3, 16) and res['Q'].shape == (3,)
+    for i in range(3):
+        bank = tube_bank_march(m=ms[i], rows=15, pitch_parallel=pitch_parallels[i],
+                               pitch_normal=0.1016, R_tubes=R_tubes, **kwargs)
+        for key in ('Q', 'T_out', 'dP', 'T', 'h_rows', 'dP_rows'):
+            assert_allclose(res[key][i], bank[key], rtol=1e-13)
+
+    # Including the inlet temperatures, also with as many banks as rows
+    for T_ins in (np.array([600., 800.]), np.linspace(600., 800., 15)):
+        res = tube_bank_march(m=5., rows=15, pitch_parallel=0.0889, pitch_normal=0.1016,
+                              R_tubes=R_tubes, **dict(kwargs, T_in=T_ins))
+        assert res['T'].shape == (len(T_ins), 16)
+        for i in range(len(T_ins)):
+            bank = tube_bank_march(m=5., rows=15, pitch_parallel=0.0889, pitch_normal=0.1016,
+                                   R_tubes=R_tubes, **dict(kwargs, T_in=T_ins[i]))
+            for key in ('Q', 'T_out', 'dP', 'T', 'h_rows', 'dP_rows'):
+                assert_allclose(res[key][i], bank[key], rtol=1e-13)
+    res = tube_bank_march(m=ms[:2], rows=15, pitch_parallel=0.0889, pitch_normal=0.1016,
+                          **dict(kwargs, T_in=np.array([600., 800.])))
+    assert_allclose(res['Q'], [tube_bank_march(m=ms[i], rows=15, pitch_parallel=0.0889,
+                                               pitch_normal=0.1016, **dict(kwargs, T_in=T))['Q']
+                               for i, T in enumerate([600., 800.])], rtol=1e-13)
+
+
+def test_tube_bank_march_properties():
+    props = dict(rho=lambda T: 101325.*0.029/(8.314*T), Cp=lambda T: 940. + 0.2*T,
+                 k=lambda T: 0.0241*(T/273.)**0.81, mu=lambda T: 1.716E-5*(T/273.)**0.7)
+    kwargs = dict(m=5., T_in=700., T_tubes=450., rows=20, A_row=10., A_min=2.5,
+                  Do=0.0508, pitch_parallel=0.0889, pitch_normal=0.1016)
+    res = tube_bank_march(**dict(kwargs, **props))
+    assert res['iterations'] > 1
+    assert_allclose([res['Q'], res['T_out'], res['dP']], [997175.7638412195, 512.0675813268067, 28.00558408373162], rtol=1e-9)
+
+    # The properties of the converged rows, given as tables, reproduce it
+    Tm = 0.5*(res['T'][1:] + res['T'][:-1])
+    tables = dict((key, f(Tm)) for key, f in props.items())
+    table = tube_bank_march(tol=1e-12, **dict(kwargs, **tables))
+    assert table['iterations'] == 1
+    assert_allclose(table['T'], res['T'], rtol=1e-8)
+    assert_allclose(table['dP_rows'], res['dP_rows'], rtol=1e-8)
+
+    # A table of properties for several banks gives the shape of the banks
+    Cps = np.array([tables['Cp'], 1.1*tables['Cp']])
+    banks = tube_bank_march(**dict(kwargs, **dict(tables, Cp=Cps)))
+    assert banks['Q'].shape == (2,) and banks['T'].shape == (2, 21)
+    for i in range(2):
+        bank = tube_bank_march(**dict(kwargs, **dict(tables, Cp=Cps[i])))
+        for key in ('Q', 'T_out', 'dP', 'T', 'h_rows', 'dP_rows'):
+            assert_allclose(banks[key][i], bank[key], rtol=1e-13)
+
+    # Heating the gas instead; the energy balance holds with variable Cp
+    heat = tube_bank_march(**dict(kwargs, T_in=300., T_tubes=np.linspace(500., 450., 20), **props))
+    Cps = props['Cp'](0.5*(heat['T'][1:] + heat['T'][:-1]))
+    assert heat['Q'] < 0.
+    assert_allclose(heat['Q_rows'], 5.*Cps*(heat['T'][:-1] - heat['T'][1:]), rtol=1e-9)
+
+    with pytest.raises(Exception):
+        tube_bank_march(maxiter=2, **dict(kwargs, **props))
+    with pytest.raises(Exception):
+        tube_bank_march(method='Grimison', **dict(kwargs, **props))
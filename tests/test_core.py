@@ -37,6 +37,10 @@ def test_core():
     
     assert LMTD(100., 60., 20., 60) == 40
     assert LMTD(100., 60., 20., 60, counterflow=False) == 0
+
+    # Nearly equal differences; references from mpmath
+    assert_allclose(LMTD(130., 110., 15., 35. + 1E-9), 94.9999999995, rtol=1e-14)
+    assert_allclose(LMTD(130., 110., 15., 35. - 1E-12), 95.0000000000005, rtol=1e-14)
     '''Test code for limits
     from sympy import *
     Thi, Tho, Tci, Tco = symbols('Thi, Tho, Tci, Tco')
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, 2017, 2018, 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+from ht import *
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+
+def test_resolve_Nu_conv_internal():
+    # Every method, with and without the roughness or entry inputs
+    for kwargs in [dict(Re=1E5, Pr=.7), dict(Re=1E5, Pr=.7, eD=1E-4),
+                   dict(Re=1E5, Pr=.7, fd=0.02), dict(Re=1E5, Pr=.7, Di=.1, x=2.),
+                   dict(Re=1E3, Pr=.7, Di=.1, x=.01), dict(Re=1E5, Pr=.01)]:
+        Nu = resolve('Nu_conv_internal', **kwargs)
+        assert_allclose(Nu(**kwargs), Nu_conv_internal(**kwargs))
+        for Method in Nu_conv_internal(AvailableMethods=True, **kwargs):
+            Nu = resolve('Nu_conv_internal', Method=Method, **kwargs)
+            assert_allclose(Nu(**kwargs), Nu_conv_internal(Method=Method, **kwargs))
+
+    # The flow regime is still checked on each call
+    Nu = resolve('Nu_conv_internal', Re=1E5, Pr=.7, Di=.1, x=2.)
+    for Re, Pr in [(1E2, .7), (1E5, .7), (1E5, .01)]:
+        assert_allclose(Nu(Re, Pr, Di=.1, x=2.), Nu_conv_internal(Re, Pr, Di=.1, x=2.))
+
+    # Cached by which inputs are present
+    assert resolve('Nu_conv_internal', Re=1E4, Pr=7.) is resolve('Nu_conv_internal', Re=1E5, Pr=.7)
+    assert resolve('Nu_conv_internal', Re=1E4, Pr=7.) is not resolve('Nu_conv_internal', Re=1E5, Pr=.7, eD=None)
+
+    # Arrays are resolved by which inputs are present too
+    assert (resolve('Nu_conv_internal', Re=np.array([1E4, 1E5]), Pr=7., eD=np.array([1E-4, 0.]))
+            is resolve('Nu_conv_internal', Re=1E4, Pr=7., eD=1E-4))
+    assert (resolve('Nu_conv_internal', Re=1E4, Pr=np.array([7., .7]), Di=np.array([.1, .2]), x=2.)
+            is resolve('Nu_conv_internal', Re=1E4, Pr=7., Di=.1, x=2.))
+
+    # Correlations of no or a single input argument
+    Nu = resolve('Nu_conv_internal', Method='Laminar - constant T', Re=1E2, Pr=.7)
+    assert_allclose(Nu(1E2, .7), Nu_conv_internal(1E2, .7, Method='Laminar - constant T'))
+
+    # No friction factor is needed for a smooth correlation
+    assert_allclose(Nu_conv_internal(Re=1E5, Pr=.7, eD=None, Method='Dittus-Boelter'), 
+                    turbulent_Dittus_Boelter(Re=1E5, Pr=.7))
+    with pytest.raises(Exception):
+        resolve('Nu_conv_internal', Method='BADMETHOD', Re=1E5, Pr=.7)
+
+
+def test_resolve_others():
+    kwargs = dict(Re=1E4, Pr=.7, Prw=.8, mu=1E-3, muw=1.2E-3)
+    for Method in [None] + Nu_external_cylinder(AvailableMethods=True, **kwargs):
+        f = resolve('Nu_external_cylinder', Method=Method, **kwargs)
+        assert_allclose(f(**kwargs), Nu_external_cylinder(Method=Method, **kwargs))
+
+    for kwargs in [dict(Pr=.7, Gr=1E8), dict(Pr=.7, Gr=1E8, L=1.5, D=.1)]:
+        for Method in [None] + Nu_vertical_cylinder(AvailableMethods=True, **kwargs):
+            f = resolve('Nu_vertical_cylinder', Method=Method, **kwargs)
+            assert_allclose(f(**kwargs), Nu_vertical_cylinder(Method=Method, **kwargs))
+
+    for Method in [None] + Nu_horizontal_cylinder(.7, 1E8, AvailableMethods=True):
+        f = resolve('Nu_horizontal_cylinder', Method=Method, Pr=.7, Gr=1E8)
+        assert_allclose(f(.7, 1E8), Nu_horizontal_cylinder(.7, 1E8, Method=Method))
+
+    kwargs = dict(m=1, x=.9, D=.3, alpha=.9, rhol=1000, rhog=2.5, Cpl=2300, kl=.6, 
+                  mu_b=1E-3, mu_w=1.2E-3, mul=1E-3, mug=1E-5, L=5)
+    for method in [None] + h_two_phase(available_methods=True, **kwargs):
+        f = resolve('h_two_phase', Method=method, **kwargs)
+        assert_allclose(f(**kwargs), h_two_phase(method=method, **kwargs))
+
+    kwargs = dict(rhol=957.854, rhog=0.595593, mul=2.79E-4, kl=0.680, Cpl=4217, 
+                  Hvap=2.257E6, sigma=0.0589, Te=4.9, Tsat=373.15, P=101325., 
+                  Pc=22048320., MW=18.02, dPsat=5E3)
+    for CAS in [None, '7732-18-5', '7727-37-9']:
+        for Method in [None] + h_nucleic(AvailableMethods=True, CAS=CAS, **kwargs):
+            f = resolve('h_nucleic', Method=Method, CAS=CAS, **kwargs)
+            assert_allclose(f(CAS=CAS, **kwargs), h_nucleic(Method=Method, CAS=CAS, **kwargs))
+    # The selection depends on the value of CAS
+    assert (resolve('h_nucleic', CAS='7732-18-5', **kwargs) 
+            is not resolve('h_nucleic', CAS='0-00-0', **kwargs))
+    with pytest.raises(Exception):
+        resolve('h_nucleic', Te=4.9)
+
+    with pytest.raises(Exception):
+        resolve('turbulent_Dittus_Boelter', Re=1E5, Pr=.7)
+
+
+def test_resolve_arrays():
+    kwargs = dict(m=1, x=.9, D=.3, alpha=.9, rhol=1000, rhog=2.5, Cpl=2300, kl=.6, 
+                  mu_b=1E-3, mu_w=1.2E-3, mul=1E-3, mug=1E-5, L=5)
+    f = resolve('h_two_phase', **dict(kwargs, m=np.array([1., 2.]), x=np.array([.5, .9])))
+    assert f is resolve('h_two_phase', **kwargs)
+
+    kwargs = dict(rhol=957.854, rhog=0.595593, mul=2.79E-4, kl=0.680, Cpl=4217, 
+                  Hvap=2.257E6, sigma=0.0589, Te=4.9, Tsat=373.15, P=101325., 
+                  Pc=22048320., MW=18.02, dPsat=5E3)
+    f = resolve('h_nucleic', CAS='7732-18-5', **dict(kwargs, Te=np.array([3., 4.9, 8.])))
+    assert f is resolve('h_nucleic', CAS='7732-18-5', **kwargs)
+    assert_allclose([f(CAS='7732-18-5', **dict(kwargs, Te=Te)) for Te in [3., 4.9, 8.]],
+                    [h_nucleic(CAS='7732-18-5', **dict(kwargs, Te=Te)) for Te in [3., 4.9, 8.]])
+
+    f = resolve('Nu_vertical_cylinder', Pr=.7, Gr=np.array([1E6, 1E8]), L=np.array([1., 1.5]), D=.1)
+    assert f is resolve('Nu_vertical_cylinder', Pr=.7, Gr=1E8, L=1.5, D=.1)
+
+
+def test_tuple_getter():
+    from ht.conv_internal import _tuple_getter
+    values = ('a', 'b', 'c')
+    assert _tuple_getter([])(values) == ()
+    assert _tuple_getter([1])(values) == ('b',)
+    assert _tuple_getter([2, 0])(values) == ('c', 'a')
+    # A single array value is not unpacked
+    arr = np.array([1., 2.])
+    got = _tuple_getter([0])((arr, None))
+    assert len(got) == 1 and got[0] is arr
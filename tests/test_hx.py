@@ -114,6 +114,31 @@ def test_Ntubes_Phadkeb_fuzz():
                     DBundle2 = DBundle_for_Ntubes_Phadkeb(Ntubes=N, Do=D_main, pitch=pitch, Ntp=Ntp, angle=angle)
                     N2 = Ntubes_Phadkeb(DBundle=DBundle2, Do=D_main, pitch=pitch, Ntp=Ntp, angle=angle)
                     assert N2 == N
+                    # The smallest such diameter is returned
+                    assert DBundle2 <= DBundle
+                    N3 = Ntubes_Phadkeb(DBundle=DBundle2*(1-1e-12), Do=D_main, pitch=pitch, Ntp=Ntp, angle=angle)
+                    assert N3 != N
+
+    # Tube counts which no diameter gives exactly; 30 degrees and 4 passes
+    # drops from 8 tubes to 4, and never has 5 to 7
+    D = DBundle_for_Ntubes_Phadkeb(Ntubes=6, Do=.01, pitch=.0125, Ntp=4, angle=30)
+    assert Ntubes_Phadkeb(DBundle=D, Do=.01, pitch=.0125, Ntp=4, angle=30) >= 6
+    assert Ntubes_Phadkeb(DBundle=D*(1-1e-12), Do=.01, pitch=.0125, Ntp=4, angle=30) < 6
+
+    with pytest.raises(Exception):
+        DBundle_for_Ntubes_Phadkeb(Ntubes=10**7, Do=.01, pitch=.0125, Ntp=4, angle=30)
+
+    # Sweeping the pitch reuses one index, with the small bundle limit of
+    # each pitch applied on lookup
+    import ht.hx
+    for pitch_ratio in np.linspace(1.2, 1.6, 9):
+        for N in (1, 2, 3, 10, 37, 500):
+            D = DBundle_for_Ntubes_Phadkeb(Ntubes=N, Do=.01, pitch=.01*pitch_ratio, Ntp=8, angle=30)
+            assert D > .08
+            assert Ntubes_Phadkeb(DBundle=D, Do=.01, pitch=.01*pitch_ratio, Ntp=8, angle=30) >= N
+            assert Ntubes_Phadkeb(DBundle=D*(1-1e-12), Do=.01, pitch=.01*pitch_ratio, Ntp=8, angle=30) < N
+    assert (8, 30) in ht.hx._Phadkeb_indexes
+    assert all(len(key) == 2 for key in ht.hx._Phadkeb_indexes)
 
 
 @pytest.mark.slow
@@ -255,14 +280,22 @@ def test_Ntubes():
         Ntubes(DBundle=1.2, Do=0.025, pitch=.025*1.25, Method='failure')
 
     D = size_bundle_from_tubecount(N=1285, Do=0.025, pitch=0.03125)
-    assert_allclose(D, 1.1985676402390355)
+    assert_allclose(D, 1.1959371246996997)
+    # Smallest diameter holding the tubes
+    assert Ntubes(DBundle=D, Do=0.025, pitch=0.03125) == 1285
+    assert Ntubes(DBundle=D*(1-1e-12), Do=0.025, pitch=0.03125) < 1285
     D = size_bundle_from_tubecount(N=1285, Do=0.025, pitch=0.03125, Method='HEDH')
     assert_allclose(D, 1.205810838411941)
     D = size_bundle_from_tubecount(N=1285, Do=0.025, pitch=0.03125, Method='VDI')
     assert_allclose(D, 1.1749025890472795)
     
     D = size_bundle_from_tubecount(N=13252, Do=.028, Ntp=2, angle=45, pitch=.028*1.25, Method='Perry')
-    assert_allclose(D, 3.598336054740235)
+    assert_allclose(D, 3.598271362089798)
+    assert Ntubes_Perrys(DBundle=D, Do=.028, Ntp=2, angle=45) == 13252
+    assert Ntubes_Perrys(DBundle=D*(1-1e-12), Do=.028, Ntp=2, angle=45) == 13251
+
+    with pytest.raises(Exception):
+        size_bundle_from_tubecount(N=10**6, Do=.028, Ntp=2, angle=30, pitch=.028*1.25, Method='Perry')
     
     with pytest.raises(Exception):
         size_bundle_from_tubecount(N=1285, Do=0.025, pitch=0.03125, Method='BADMETHOD')
@@ -405,7 +438,36 @@ def test_effectiveness_NTU():
         assert_allclose(eff, eff_calc, rtol=1E-6) # brenth differs in old Python versions, rtol is needed 
     
     
-    
+def test_crossflow_unmixed_series():
+    from ht.hx import _crossflow_unmixed
+    # Values from mpmath with 40 digits, summing the series with nsum
+    eff = effectiveness_from_NTU(NTU=3, Cr=1E-6, subtype='crossflow')
+    assert_allclose(eff, 0.9502127075902163808, rtol=1E-14)
+    eff = effectiveness_from_NTU(NTU=0.01, Cr=0.3, subtype='crossflow')
+    assert_allclose(eff, 0.009935330268799191814, rtol=1E-14)
+    eff = effectiveness_from_NTU(NTU=1E-5, Cr=0.9, subtype='crossflow')
+    assert_allclose(eff, 9.999905000751662489e-06, rtol=1E-14)
+    assert_allclose(effectiveness_from_NTU(NTU=2, Cr=0, subtype='crossflow'), 1 - exp(-2))
+
+    # Symmetric; R1 > 1 is fine
+    P1 = temperature_effectiveness_basic(R1=2., NTU1=3., subtype='crossflow')
+    P2 = temperature_effectiveness_basic(R1=.5, NTU1=6., subtype='crossflow')
+    assert_allclose(2*P1, P2, rtol=1E-14)
+
+    for NTU1, R1 in [(0.1, 0.3), (2., 1.), (30., 0.6), (5., 3.)]:
+        P1, dP1 = _crossflow_unmixed(NTU1, R1, derivative=True)
+        h = NTU1*1E-6
+        dP1_num = (_crossflow_unmixed(NTU1 + h, R1) - _crossflow_unmixed(NTU1 - h, R1))/(2*h)
+        assert_allclose(dP1, dP1_num, rtol=1E-7)
+
+    # High effectivenesses and NTUs, where numerical integration had trouble
+    for eff, Cr in [(0.95, 1.), (0.99, 1.), (0.99, 0.9), (0.999, 0.9), (0.999, 0.3)]:
+        N = NTU_from_effectiveness(eff, Cr=Cr, subtype='crossflow')
+        assert_allclose(effectiveness_from_NTU(N, Cr=Cr, subtype='crossflow'), eff, rtol=1E-12)
+    NTU1 = NTU_from_P_basic(0.2, R1=4.5, subtype='crossflow')
+    assert_allclose(temperature_effectiveness_basic(4.5, NTU1, subtype='crossflow'), 0.2, rtol=1E-12)
+
+
 def test_effectiveness_NTU_method():
     ans_known = {'Q': 192850.0, 'Thi': 130, 'Cmax': 9672.0, 'Tho': 110.06100082712986, 'Cmin': 2755.0, 'NTU': 1.1040839095588, 'Tco': 85, 'Tci': 15, 'Cr': 0.2848428453267163, 'effectiveness': 0.6086956521739131, 'UA': 3041.751170834494}
     ans = effectiveness_NTU_method(mh=5.2, mc=1.45, Cph=1860., Cpc=1900, subtype='crossflow, mixed Cmax', Tci=15, Tco=85, Tho=110.06100082712986)
@@ -470,6 +532,12 @@ def test_F_LMTD_Fakheri():
     # R = 1 check
     F_calc = F_LMTD_Fakheri(Tci=15, Tco=35, Thi=130, Tho=110, shells=1)
     assert_allclose(F_calc, 0.9925689447100824)
+
+    # R very near 1; references from mpmath
+    F_calc = F_LMTD_Fakheri(Tci=15, Tco=35+1E-9, Thi=130, Tho=110, shells=2)
+    assert_allclose(F_calc, 0.99815054167956, rtol=1e-13)
+    F_calc = F_LMTD_Fakheri(Tci=15, Tco=35-1E-12, Thi=130, Tho=110, shells=2)
+    assert_allclose(F_calc, 0.9981505416796722, rtol=1e-13)
     
     for i in range(1, 10):
         ans = effectiveness_NTU_method(mh=5.2, mc=1.45, Cph=1860., Cpc=1900, subtype=str(i)+'S&T', Tci=15, Tco=85, Thi=130)
@@ -727,6 +795,15 @@ def test_temperature_effectiveness_air_cooler():
     P1s_calc = [calc_N_1_orig(R1=R1, NTU1=NTU1, N=N) for N in  range(1, 26)]
     assert_allclose(expected_P1s, P1s_calc)
     
+    # Many rows, where the original form overflows; checked against the
+    # original form evaluated with mpmath at 60 digits
+    P1 = temperature_effectiveness_air_cooler(.5, 1.1, rows=200, passes=1)
+    assert_allclose(P1, 0.5744610145657628, rtol=1e-12)
+    P1 = temperature_effectiveness_air_cooler(0.01, 0.01, rows=60, passes=1)
+    assert_allclose(P1, 0.009949671242331844, rtol=1e-12)
+    # Limit of an infinite air heat capacity rate
+    assert_allclose(temperature_effectiveness_air_cooler(0., 2., rows=5, passes=1), 1. - exp(-2.))
+    
     
     # N rows / N passes (N from 2 to 5) cases
     R1, NTU1 = 1.1, .5
@@ -914,6 +991,103 @@ def test_P_NTU_method_backwards():
         
 
 
+def test_temperature_effectiveness_derivatives():
+    def central(function, R1, NTU1, kwargs):
+        h = 1E-6
+        dNTU1 = (function(R1, NTU1*(1+h), **kwargs) - function(R1, NTU1*(1-h), **kwargs))/(2*h*NTU1)
+        dR1 = (function(R1*(1+h), NTU1, **kwargs) - function(R1*(1-h), NTU1, **kwargs))/(2*h*R1)
+        return dNTU1, dR1
+
+    cases = [(temperature_effectiveness_basic, {'subtype': subtype}) for subtype in 
+             ['counterflow', 'parallel', 'crossflow approximate', 'crossflow', 
+              'crossflow, mixed 1', 'crossflow, mixed 2', 'crossflow, mixed 1&2']]
+    cases += [(temperature_effectiveness_TEMA_J, {'Ntp': Ntp}) for Ntp in (1, 2, 4)]
+    cases += [(function, {'Ntp': Ntp, 'optimal': optimal}) for Ntp in (1, 2) for optimal in (True, False)
+              for function in (temperature_effectiveness_TEMA_G, temperature_effectiveness_TEMA_H)]
+    cases += [(temperature_effectiveness_TEMA_E, {'Ntp': Ntp, 'optimal': optimal})
+              for Ntp in (1, 2, 3, 4, 6) for optimal in (True, False)]
+    cases += [(temperature_effectiveness_plate, {'Np1': Np1, 'Np2': Np2, 'counterflow': c})
+              for Np1, Np2 in [(1, 1), (1, 2), (3, 1), (2, 2), (2, 3), (4, 2)] for c in (True, False)]
+    cases += [(temperature_effectiveness_air_cooler, {'rows': rows, 'passes': passes}) 
+              for rows, passes in [(1, 1), (3, 1), (2, 2), (3, 3), (4, 4), (5, 5), (4, 2)]]
+    for function, kwargs in cases:
+        for R1 in [0.1, 0.3, 0.7, 1.3, 3.7]:
+            for NTU1 in [0.2, 0.7, 3., 12.]:
+                P1, dNTU1, dR1 = function(R1, NTU1, derivatives=True, **kwargs)
+                assert P1 == function(R1, NTU1, **kwargs)
+                assert_allclose([dNTU1, dR1], central(function, R1, NTU1, kwargs), 
+                                rtol=1E-5, atol=1E-6)
+
+    # Through y = 1 in the counterflow expression, which is evaluated exactly
+    for subtype in ['counterflow', 'crossflow, mixed 1&2']:
+        P1, dNTU1, dR1 = temperature_effectiveness_basic(1., 3., subtype, derivatives=True)
+        assert_allclose([dNTU1, dR1], central(temperature_effectiveness_basic, 1., 3., {'subtype': subtype}), rtol=1E-6)
+    assert_allclose(temperature_effectiveness_TEMA_E(1., 3., Ntp=1, derivatives=True),
+                    [0.75, 0.0625, -0.28125], rtol=1E-13)
+    
+    # At the removable singularities of the formulas; values from mpmath
+    assert_allclose(temperature_effectiveness_TEMA_J(2., 0.7, Ntp=1, derivatives=True)[1:],
+                    [0.1803656264137602666, -0.066994293366431533341], rtol=1E-9)
+    assert_allclose(temperature_effectiveness_TEMA_G(2., 0.7, Ntp=2, derivatives=True)[1:],
+                    [0.20497907923982365651, -0.068730626507766271385], rtol=1E-9)
+    # Just beside them, where the general expressions cancel; finite 
+    # differences of the formulas in mpmath at 80 digits
+    cases = [(temperature_effectiveness_TEMA_E, {'Ntp': 3, 'optimal': True}, 1., 
+              [0.68358513305724068942, -0.014565410350534742502], [0.010077360852433515909, -0.19644555871798479479]),
+             (temperature_effectiveness_TEMA_E, {'Ntp': 2, 'optimal': False}, 2., 
+              [0.56928613828492597613, -0.01297402354185957823], [0.0014792899423362223772, -0.17344674555524725839]),
+             (temperature_effectiveness_TEMA_G, {'Ntp': 2, 'optimal': True}, 2., 
+              [0.58186128284955765101, -0.012683640324048258956], [0.00076906221666707319326, -0.20790001387102857101]),
+             (temperature_effectiveness_TEMA_G, {'Ntp': 2, 'optimal': False}, 2., 
+              [0.55316005772239777656, -0.013437862029026435506], [-0.0080174927109575290221, -0.071246355683267016287]),
+             (temperature_effectiveness_TEMA_H, {'Ntp': 2, 'optimal': True}, 4., 
+              [0.40887995641376544578, -0.010268336721318535148], [5.6374829439955280526e-6, -0.062394958586192969299]),
+             (temperature_effectiveness_TEMA_H, {'Ntp': 2, 'optimal': False}, 4., 
+              [0.37238639442458541747, -0.010557363296559876353], [-0.0040756875720692868597, -0.018541627953781432914]),
+             (temperature_effectiveness_TEMA_J, {'Ntp': 1}, 2., 
+              [0.56928613828492597613, -0.01297402354185957823], [0.0014792899423362223772, -0.17344674555524725839])]
+    for function, kwargs, R1, low, high in cases:
+        for delta in [1E-7, -1E-7, 1E-10, -1E-10]:
+            for NTU1, expect in [(0.2, low), (12., high)]:
+                assert_allclose(function(R1*(1. + delta), NTU1, derivatives=True, **kwargs)[1:],
+                                expect, rtol=1E-6, atol=1E-9)
+    
+    eff, dNTU, dCr = effectiveness_from_NTU(1.3, 0.7, 'S&T', derivatives=True)
+    assert eff == effectiveness_from_NTU(1.3, 0.7, 'S&T')
+    h = 1E-6
+    assert_allclose(dNTU, (effectiveness_from_NTU(1.3+h, 0.7, 'S&T') - effectiveness_from_NTU(1.3-h, 0.7, 'S&T'))/(2*h))
+    assert_allclose(dCr, (effectiveness_from_NTU(1.3, 0.7+h, 'S&T') - effectiveness_from_NTU(1.3, 0.7-h, 'S&T'))/(2*h))
+    # Cr = 1 for counterflow
+    assert_allclose(effectiveness_from_NTU(3., 1., derivatives=True), [0.75, 0.0625, -0.28125], rtol=1E-13)
+
+
+def test_P_NTU_method_derivatives():
+    T = {'T1i': 130., 'T1o': 110.09566643485729, 'T2i': 15., 'T2o': 84.87829918042112}
+    for subtype, kwargs in [('E', {'Ntp': 4}), ('crossflow', {}), ('2/2p', {'optimal': False}), ('G', {'Ntp': 2})]:
+        for given in [('T1i', 'T2i'), ('T1o', 'T2o'), ('T1i', 'T2o'), ('T1o', 'T2i'), ('T1i', 'T1o'), ('T2i', 'T2o')]:
+            args = dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., UA=3041.75, subtype=subtype, **kwargs)
+            args.update({k: T[k] for k in given})
+            res = P_NTU_method(derivatives=True, **args)
+            plain = P_NTU_method(**args)
+            for key, value in plain.items():
+                assert res[key] == value
+            for variable in ('UA', 'm1', 'm2'):
+                h = 1E-6*args[variable]
+                up, down = dict(args), dict(args)
+                up[variable] += h
+                down[variable] -= h
+                up, down = P_NTU_method(**up), P_NTU_method(**down)
+                for key in ('Q', 'T1i', 'T1o', 'T2i', 'T2o'):
+                    assert_allclose(res['d%s_d%s' %(key, variable)], (up[key] - down[key])/(2*h), 
+                                    rtol=1E-6, atol=1E-4*abs(up[key])/args[variable])
+            for key in given:
+                assert res['d%s_dUA' %key] == res['d%s_dm1' %key] == res['d%s_dm2' %key] == 0.0
+
+    with pytest.raises(Exception):
+        P_NTU_method(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900, subtype='E', Ntp=4,
+                     T1i=130, T2i=15, T2o=84.87829918042112, derivatives=True)
+
+
 def test_Pp():
     from ht.hx import Pp, Pc
     # randomly chosen test value
@@ -927,6 +1101,10 @@ def test_Pp():
     assert_allclose(Pc(5, .7), 0.9206703686051108)
     # Test the limit works with a small difference
     assert_allclose(Pc(5, 1), Pc(5, 1-1E-8))
+    # No precision is lost near the limit; values from mpmath
+    assert_allclose(Pc(2, 1-1E-9), 0.6666666668888889, rtol=1E-15)
+    assert_allclose(Pc(2, 1+1E-7), 0.6666666444444444, rtol=1E-15)
+    assert Pc(2, 1) == 2/3.
 
 
 def test_temperature_effectiveness_plate():
@@ -1022,7 +1200,26 @@ def test_temperature_effectiveness_plate():
 
     with pytest.raises(Exception):
         temperature_effectiveness_plate(R1=1/3., NTU1=1., Np1=3, Np2=3)
-        
+
+
+def test_plate_effectiveness_kernel():
+    R1, NTU1 = 0.5, 1.5
+    for Np1 in range(1, 5):
+        for Np2 in range(1, 5):
+            for b1 in [True, False]:
+                for b2 in [True, False]:
+                    try:
+                        P1 = temperature_effectiveness_plate(R1, NTU1, Np1, Np2, counterflow=b1, passes_counterflow=b2)
+                    except Exception:
+                        with pytest.raises(Exception):
+                            plate_effectiveness_kernel(Np1, Np2, counterflow=b1, passes_counterflow=b2)
+                        continue
+                    kernel = plate_effectiveness_kernel(Np1, Np2, counterflow=b1, passes_counterflow=b2)
+                    assert kernel(R1, NTU1) == P1
+    # The same kernel is returned every time
+    assert plate_effectiveness_kernel(4, 2) is plate_effectiveness_kernel(4, 2)
+    assert_allclose(plate_effectiveness_kernel(3, 2, counterflow=False)(R1, NTU1), 0.6105764872072659)
+
     
 @pytest.mark.mpmath
 def test_NTU_from_P_basic():
@@ -1141,6 +1338,23 @@ def test_NTU_from_P_basic():
     P1 = temperature_effectiveness_basic(R1=R1, NTU1=NTU1, subtype='crossflow')
     NTU1_calc = NTU_from_P_basic(P1, R1=R1, subtype='crossflow')
     assert_allclose(NTU1, NTU1_calc)
+
+    # Balanced streams, where the counterflow starting guess is a limit
+    for NTU1 in [0.01, 1., 5., 30.]:
+        P1 = temperature_effectiveness_basic(R1=1., NTU1=NTU1, subtype='crossflow')
+        assert_allclose(NTU_from_P_basic(P1, R1=1., subtype='crossflow'), NTU1, rtol=1E-12)
+    UA = P_NTU_method(m1=1., m2=1., Cp1=1000., Cp2=1000., T1i=100., T1o=60., T2i=20.)['UA']
+    assert_allclose(UA, 1117.829076324098, rtol=1E-9)
+
+    # So close to the limit of P1 at large NTU1 that Newton's method stalls;
+    # the NTU1 found is not unique but reproduces P1
+    for NTU1 in [40., 50.]:
+        P1 = temperature_effectiveness_basic(R1=3., NTU1=NTU1, subtype='crossflow')
+        NTU1_calc = NTU_from_P_basic(P1, R1=3., subtype='crossflow')
+        assert_allclose(NTU1_calc, NTU1, rtol=0.1)
+        assert abs(temperature_effectiveness_basic(R1=3., NTU1=NTU1_calc, subtype='crossflow') - P1) < 1E-15
+    with pytest.raises(ValueError):
+        NTU_from_P_basic(0.34, R1=3., subtype='crossflow')
     
     # bad type of exchanger
     with pytest.raises(Exception):
@@ -1665,6 +1879,89 @@ def test_NTU_from_P_plate():
     with pytest.raises(Exception):
         NTU_from_P_plate(P1=0.5743, R1=1/3., Np1=3, Np2=13415151213) 
 
+
+def test_NTU_from_P_tol():
+    import ht.hx
+    cases = [(NTU_from_P_E, temperature_effectiveness_TEMA_E, {'Ntp': 2, 'optimal': False}),
+             (NTU_from_P_E, temperature_effectiveness_TEMA_E, {'Ntp': 3}),
+             (NTU_from_P_G, temperature_effectiveness_TEMA_G, {'Ntp': 2, 'optimal': False}),
+             (NTU_from_P_H, temperature_effectiveness_TEMA_H, {'Ntp': 1}),
+             (NTU_from_P_J, temperature_effectiveness_TEMA_J, {'Ntp': 4}),
+             (NTU_from_P_plate, temperature_effectiveness_plate, {'Np1': 2, 'Np2': 3, 'counterflow': False}),
+             (NTU_from_P_plate, temperature_effectiveness_plate, {'Np1': 3, 'Np2': 1})]
+    R1s = np.logspace(-2, 1.5, 1000)
+    NTU1s = np.logspace(-2, 1, 1000)
+    seed(0)
+    for solver, function, kwargs in cases:
+        for i in range(50):
+            R1 = float(choice(R1s))
+            NTU1 = float(choice(NTU1s))
+            P1 = function(R1, NTU1, **kwargs)
+            try:
+                NTU1_expect = solver(P1, R1, **kwargs)
+            except ValueError:
+                continue
+            NTU1_calc = solver(P1, R1, tol=1E-13, **kwargs)
+            assert_allclose(function(R1, NTU1_calc, **kwargs), P1, rtol=0, atol=1E-12)
+            if P1 < 0.9/max(R1, 1.):
+                # Away from the plateau at high NTU1, NTU1 is well defined by P1
+                assert_allclose(NTU1_calc, NTU1_expect, rtol=1E-6)
+    key = ('temperature_effectiveness_TEMA_E', (('Ntp', 3), ('optimal', True)))
+    assert key in ht.hx._NTU_from_P_tables
+
+    assert_allclose(NTU_from_P_J(P1=0.5996529947927913, R1=1.1, Ntp=1, tol=1E-14), 3)
+    # Outside the table, the full solver still applies
+    assert_allclose(NTU_from_P_G(P1=1E-5, R1=1E4, Ntp=1, tol=1E-12),
+                    NTU_from_P_G(P1=1E-5, R1=1E4, Ntp=1))
+    with pytest.raises(ValueError):
+        NTU_from_P_G(P1=1, R1=1/3., Ntp=2, tol=1E-12)
+
+    # Arrangements solved through their reverse match P1, not P2 = P1*R1,
+    # within tol
+    for R1 in np.logspace(-1.5, -0.05, 30):
+        for NTU1 in np.logspace(-2, 1, 30):
+            P1 = temperature_effectiveness_plate(R1, NTU1, Np1=3, Np2=1)
+            try:
+                NTU1_calc = NTU_from_P_plate(P1, R1, Np1=3, Np2=1, tol=1E-9)
+            except ValueError:
+                continue
+            assert abs(temperature_effectiveness_plate(R1, NTU1_calc, Np1=3, Np2=1) - P1) <= 1E-9
+
+
+def test_temperature_effectiveness_overflow():
+    import math
+    import ht.hx
+    # Formerly overflowing expressions compared against a copy evaluated
+    # with mpmath
+    cases = [(temperature_effectiveness_basic, {'subtype': 'counterflow'}),
+             (temperature_effectiveness_TEMA_E, {'Ntp': 1}),
+             (temperature_effectiveness_TEMA_E, {'Ntp': 2, 'optimal': False}),
+             (temperature_effectiveness_TEMA_G, {'Ntp': 1}),
+             (temperature_effectiveness_TEMA_G, {'Ntp': 2}),
+             (temperature_effectiveness_TEMA_G, {'Ntp': 2, 'optimal': False}),
+             (temperature_effectiveness_TEMA_H, {'Ntp': 1}),
+             (temperature_effectiveness_TEMA_H, {'Ntp': 2}),
+             (temperature_effectiveness_TEMA_H, {'Ntp': 2, 'optimal': False}),
+             (temperature_effectiveness_TEMA_J, {'Ntp': 1}),
+             (temperature_effectiveness_TEMA_J, {'Ntp': 2}),
+             (temperature_effectiveness_TEMA_J, {'Ntp': 4}),
+             (temperature_effectiveness_plate, {'Np1': 2, 'Np2': 4, 'counterflow': False})]
+    for function, kwargs in cases:
+        function_mp = ht.hx._mpmath_function(function)
+        assert function_mp is not function
+        for R1 in [1E-3, 0.1, 0.3, 0.7, 1.7, 3., 7., 100.]:
+            for NTU1 in [0.1, 5., 50., 800., 1E4]:
+                P1 = function(R1, NTU1, **kwargs)
+                assert_allclose(P1, float(function_mp(R1, NTU1, **kwargs)), rtol=1E-9)
+
+    # The extended precision fallback does not alter the module's functions
+    with pytest.raises(OverflowError):
+        temperature_effectiveness_TEMA_E(R1=100., NTU1=25., Ntp=3)
+    P1 = ht.hx._NTU_from_P_objective(25., 100., 0., temperature_effectiveness_TEMA_E, Ntp=3)
+    assert_allclose(P1, 0.01)
+    assert ht.hx.exp is math.exp
+
+
 def test_DBundle_min():
     assert_allclose(DBundle_min(0.0254), 1)
     assert_allclose(DBundle_min(0.005), .1)
@@ -1698,4 +1995,65 @@ def test_L_unsupported_max():
         L_unsupported_max(Do=.0254, material='BADMATERIAL')
         
     # Terribly pessimistic
-    assert_allclose(L_unsupported_max(Do=10, material='CS'), 3.175)
\ No newline at end of file
+    assert_allclose(L_unsupported_max(Do=10, material='CS'), 3.175)
+
+def test_get_tube_TEMA():
+    tube = (0.75, 16, 0.019049999999999997, 0.015747999999999998, 0.001651)
+    assert get_tube_TEMA(NPS=0.75, BWG=16) == tube
+    assert_allclose(get_tube_TEMA(Do=0.01905, BWG=16), tube)
+    assert_allclose(get_tube_TEMA(BWG=16, Di=0.015748), tube)
+    assert_allclose(get_tube_TEMA(NPS=0.75, Di=0.015748), tube)
+    assert_allclose(get_tube_TEMA(Do=0.01905, Di=0.015748), tube)
+    assert_allclose(get_tube_TEMA(NPS=0.75, tmin=0.0015), tube)
+    assert_allclose(get_tube_TEMA(Do=0.01905, tmin=0.0015), tube)
+    assert get_tube_TEMA(NPS=0.75, tmin=0.0015)[1] == 16
+    assert get_tube_TEMA(NPS=0.75)[1] == 12
+
+    for kwargs in [dict(NPS=2, BWG=22), dict(Do=0.02, BWG=16), dict(NPS=0.75, tmin=0.01),
+                   dict(NPS=0.75, Di=0.016), dict(NPS=0.7), dict(Di=0.015, tmin=0.001), dict()]:
+        with pytest.raises(Exception):
+            get_tube_TEMA(**kwargs)
+
+
+def test_TEMA_tube_catalog():
+    from ht.hx import TEMA_tubing
+    catalog = TEMA_tube_catalog
+    assert len(catalog) == sum(len(BWGs) for BWGs in TEMA_tubing.values())
+    for NPS, BWGs in TEMA_tubing.items():
+        for BWG in BWGs:
+            assert (NPS, BWG) in catalog
+            tube = catalog.lookup(NPS, BWG)
+            assert tube[2] == 0.0254*NPS
+            assert_allclose(tube[3], tube[2] - 2*tube[4])
+            assert catalog.with_thickness(NPS, tube[4]) == tube
+            assert catalog.with_thickness_many(NPS, tube[4])['BWG'] == BWG
+            assert catalog.size_for_Do(tube[2]) == NPS
+    assert (2, 22) not in catalog
+
+    # Batch lookups agree with the scalar ones
+    NPSs = [0.25, 0.75, 0.75, 1.25, 2.]
+    tubes = catalog.lookup_many(NPSs, [24, 12, 20, 10, 14])
+    assert list(tubes['BWG']) == [24, 12, 20, 10, 14]
+    assert_allclose(tubes['Do'], [0.0254*NPS for NPS in NPSs])
+    with pytest.raises(Exception):
+        catalog.lookup_many([0.25, 2.], [24, 22])
+
+    # The thinnest wall at least as thick as specified
+    tmins = np.linspace(0, 0.0035, 36)
+    for NPS in catalog.sizes:
+        ts = sorted(catalog.lookup(NPS, BWG)[4] for BWG in TEMA_tubing[NPS])
+        for tmin in tmins:
+            thicker = [t for t in ts if t >= tmin]
+            if thicker:
+                assert catalog.thinnest(NPS, tmin)[4] == thicker[0]
+                assert catalog.thinnest_many(NPS, tmin)['t'] == thicker[0]
+            else:
+                with pytest.raises(Exception):
+                    catalog.thinnest(NPS, tmin)
+                with pytest.raises(Exception):
+                    catalog.thinnest_many(NPS, tmin)
+    assert list(catalog.thinnest_many([0.75, 1., 2.], 0.0015)['BWG']) == [16, 16, 14]
+
+    assert_allclose(catalog.sizes_for_Do([0.01905, 0.0508, 0.02]), [0.75, 2., np.nan])
+    with pytest.raises(Exception):
+        catalog.size_for_Do(0.02)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, 2017, 2018, 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+from __future__ import division
+from math import pi
+from ht import *
+from ht.hx import TEMA_tubing
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+duty = dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., T1i=130., T2i=15., Q=2E5)
+space = dict(NPSs=[0.75, 1.], pitch_ratios=[1.25, 1.33], DShells=[0.3, 0.4, 0.5, 0.7],
+             Ls=[2.438, 3.658, 4.877], Ntps=[1, 2, 4], baffle_spacing_ratios=[0.3, 0.6])
+
+
+def U_baffles(designs):
+    # Picklable, and dependent on the geometry
+    return 200. + 200.*designs['DShell']/designs['baffle_spacing']/10.
+
+
+def test_shell_and_tube_designs_brute_force():
+    # Every design of the space, rated one at a time without any pruning
+    C1 = duty['m1']*duty['Cp1']
+    expected = []
+    for NPS in space['NPSs']:
+        for BWG in TEMA_tubing[NPS]:
+            Do, Di = get_tube_TEMA(NPS=NPS, BWG=BWG)[2:4]
+            for pitch_ratio in space['pitch_ratios']:
+                for angle in (30, 90):
+                    for Ntp in space['Ntps']:
+                        for DShell in space['DShells']:
+                            DBundle = DShell - shell_clearance(DShell=DShell)
+                            N = Ntubes_Phadkeb(DBundle, Do, pitch_ratio*Do, Ntp, angle)
+                            for L in space['Ls']:
+                                for ratio in space['baffle_spacing_ratios']:
+                                    B = ratio*DShell
+                                    if (N < Ntp or not 3 <= L/DShell <= 15 or B < 0.0508
+                                        or 2*B > L_unsupported_max(Do)):
+                                        continue
+                                    A = N*pi*Do*L
+                                    P1 = temperature_effectiveness_TEMA_E(C1/(duty['m2']*duty['Cp2']),
+                                                                          300.*A/C1, Ntp)
+                                    margin = P1*C1*115./duty['Q'] - 1.
+                                    if margin >= 0:
+                                        expected.append((A, margin, NPS, BWG, Ntp, DShell, L, N))
+
+    designs = shell_and_tube_designs(U=300., Pareto=False, **dict(duty, **space))
+    assert len(designs) == len(expected)
+    expected.sort()
+    assert_allclose(designs['A'], [e[0] for e in expected], rtol=1e-13)
+    assert_allclose(np.sort(designs['margin']), np.sort([e[1] for e in expected]), rtol=1e-12)
+    assert sorted(designs['Ntubes']) == sorted(e[-1] for e in expected)
+    assert np.all(designs['Q'] >= duty['Q'])
+    assert_allclose(designs['UA'], 300.*designs['A'])
+
+
+def test_shell_and_tube_designs_Pareto():
+    designs = shell_and_tube_designs(U=U_baffles, Pareto=False, **dict(duty, **space))
+    front = shell_and_tube_designs(U=U_baffles, **dict(duty, **space))
+    assert 0 < len(front) < len(designs)
+    assert np.all(np.diff(front['A']) > 0)
+    assert np.all(np.diff(front['margin']) > 0)
+    # Every design is dominated by or on the front
+    for A, margin in zip(designs['A'], designs['margin']):
+        assert np.any((front['A'] <= A) & (front['margin'] >= margin))
+
+    # The geometry dependent U is used
+    assert_allclose(front['U'], U_baffles(front))
+
+    # Margins outside the limits are excluded
+    limited = shell_and_tube_designs(U=U_baffles, margin_min=0.1, margin_max=0.5,
+                                     Pareto=False, **dict(duty, **space))
+    assert len(limited) == np.count_nonzero((designs['margin'] >= 0.1) & (designs['margin'] <= 0.5))
+
+
+def test_shell_and_tube_designs_processes():
+    serial = shell_and_tube_designs(U=U_baffles, **duty)
+    parallel = shell_and_tube_designs(U=U_baffles, processes=2, **duty)
+    assert np.array_equal(serial, parallel)
+
+
+def test_shell_and_tube_designs_balanced():
+    # Equal heat capacity rates; the least area is bounded by the limit of
+    # the counterflow solution, and no design is lost to that bound
+    balanced = dict(m1=1.45, m2=1.45, Cp1=1900., Cp2=1900., T1i=130., T2i=15., Q=1E5,
+                    NPSs=[0.75], tmin=1E-3, Ntps=[2], Pareto=False)
+    designs = shell_and_tube_designs(U=300., **balanced)
+    assert len(designs) > 0
+    unbounded = shell_and_tube_designs(U=lambda designs: 300. + 0.*designs['A'], **balanced)
+    assert np.array_equal(designs, unbounded)
+
+
+def test_shell_and_tube_designs_infeasible():
+    # More duty than an infinite exchanger could transfer
+    designs = shell_and_tube_designs(U=300., **dict(duty, Q=1E7))
+    assert len(designs) == 0 and designs.dtype == design_dtype
+
+    with pytest.raises(Exception):
+        shell_and_tube_designs(U=300., NPSs=[0.7], **duty)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, 2017, 2018, 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+
+from __future__ import division
+from math import exp
+from ht import *
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+
+def test_P_NTU_zoned_constant_properties():
+    # Any number of zones gives the P-NTU solution, including where the
+    # temperatures are marched in the direction of fluid 2
+    for subtype in ['counterflow', 'parallel']:
+        for m2 in [0.3, 1.45, 5.2*1860./1900., 20.]:
+            for UA in [3041.75, 1E5]:
+                kwargs = dict(m1=5.2, m2=m2, Cp1=1860., Cp2=1900., T1i=130.,
+                              T2i=15., UA=UA, subtype=subtype)
+                ref = P_NTU_method(**kwargs)
+                for zones in [1, 7, 64]:
+                    res = P_NTU_zoned(zones=zones, **kwargs)
+                    assert res['iterations'] == 1
+                    assert_allclose([res['Q'], res['T1o'], res['T2o'], res['P1']],
+                                    [ref['Q'], ref['T1o'], ref['T2o'], ref['P1']],
+                                    rtol=1E-11)
+                    assert_allclose(res['Q_zones'].sum(), res['Q'], rtol=1E-13)
+
+    # U and A instead of UA
+    res = P_NTU_zoned(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., T1i=130., T2i=15.,
+                      U=300., A=3041.75/300.)
+    ref = P_NTU_method(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., T1i=130., T2i=15.,
+                       UA=3041.75, subtype='counterflow')
+    assert_allclose(res['T1o'], ref['T1o'], rtol=1E-13)
+    assert_allclose(res['UA'], 3041.75, rtol=1E-13)
+
+
+def test_P_NTU_zoned_variable_properties():
+    kwargs = dict(m1=5.2, m2=1.45, Cp1=lambda T: 1500. + 3.*T, Cp2=4180.,
+                  T1i=130., T2i=15., UA=3041.75)
+    res = P_NTU_zoned(**kwargs)
+    assert_allclose([res['Q'], res['T1o'], res['T2o']],
+                    [247964.02416835455, 104.2431137309605, 55.911404746469934],
+                    rtol=1E-10)
+    assert res['T1'].shape == (21,)
+    assert res['Q_zones'].shape == res['C1_zones'].shape == (20,)
+    # The zones balance, and fluid 2 leaves from the end fluid 1 enters
+    assert_allclose(res['Q'], 1.45*4180.*(res['T2o'] - 15.), rtol=1E-12)
+    assert res['T2'][0] == res['T2o'] and res['T2'][-1] == 15.
+    assert_allclose(res['C1_zones'], 5.2*(1500. + 1.5*(res['T1'][1:] + res['T1'][:-1])))
+
+    # Second order in the number of zones
+    Qs = [P_NTU_zoned(zones=zones, **kwargs)['Q'] for zones in [10, 20, 40]]
+    assert_allclose((Qs[1] - Qs[0])/(Qs[2] - Qs[1]), 4., rtol=1E-2)
+
+    # A function of temperature which is constant changes nothing
+    res = P_NTU_zoned(m1=5.2, m2=1.45, Cp1=1860., Cp2=lambda T: 1900. + 0.*T,
+                      U=lambda T1, T2: 300. + 0.*T1, A=3041.75/300., T1i=130., T2i=15.,
+                      subtype='parallel')
+    ref = P_NTU_method(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., T1i=130., T2i=15.,
+                       UA=3041.75, subtype='parallel')
+    assert_allclose(res['T2o'], ref['T2o'], rtol=1E-13)
+    assert res['iterations'] == 2
+
+
+def test_P_NTU_zoned_tabulated():
+    # Fluid 1 condensing at constant temperature in every zone
+    res = P_NTU_zoned(m1=0.5, m2=2., Cp1=[1E12]*10, Cp2=4180., T1i=100.,
+                      T2i=20., UA=5000., zones=10)
+    assert_allclose(res['T1'], 100., atol=1E-6)
+    assert_allclose(res['T2o'], 100. - 80.*exp(-5000./(2.*4180.)), rtol=1E-8)
+
+    # Desuperheating in the first zones and condensing in the rest
+    Cp1 = np.array([2000.]*3 + [1E12]*7)
+    res = P_NTU_zoned(m1=0.5, m2=2., Cp1=Cp1, Cp2=4180., T1i=140., T2i=20.,
+                      UA=5000., zones=10)
+    assert np.all(np.diff(res['T1'][:4]) < 0.)
+    assert_allclose(res['T1'][3:], res['T1'][3], atol=1E-6)
+    assert_allclose(res['Q'], res['Q_zones'].sum())
+
+
+def test_P_NTU_zoned_fails():
+    kwargs = dict(m1=5.2, m2=1.45, Cp1=1860., Cp2=1900., T1i=130., T2i=15.)
+    with pytest.raises(Exception):
+        P_NTU_zoned(UA=3041.75, subtype='crossflow', **kwargs)
+    with pytest.raises(Exception):
+        P_NTU_zoned(U=300., **kwargs)
+    with pytest.raises(Exception):
+        P_NTU_zoned(U=[300.]*5, A=10., zones=4, **kwargs)
+    with pytest.raises(Exception):
+        P_NTU_zoned(m1=5.2, m2=1.45, Cp1=lambda T: 1500. + 3.*T, Cp2=1900.,
+                    T1i=130., T2i=15., UA=3041.75, maxiter=2)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, 2017, 2018, 2019, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+from __future__ import division
+import subprocess
+import sys
+import ht
+import pytest
+
+
+def test_submodule_names_match_all():
+    for module_name in ht._submodules:
+        module = getattr(ht, module_name)
+        assert ht._submodule_names[module_name] == module.__all__
+    assert sorted(ht.__all__) == sorted(set(ht.__all__))
+    for name in ht.__all__:
+        getattr(ht, name)
+    assert sorted(dir(ht)) == sorted(ht.__all__ + ['__version__'])
+    with pytest.raises(AttributeError):
+        ht.not_a_function
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Submodules are imported eagerly')
+def test_import_lazy():
+    code = '''import sys
+import ht
+assert 'ht.conv_tube_bank' not in sys.modules
+ht.LMTD
+assert 'ht.core' in sys.modules and 'ht.hx' not in sys.modules
+'''
+    subprocess.check_call([sys.executable, '-c', code])
+
@@ -22,11 +22,19 @@ SOFTWARE.'''
 
 from __future__ import division
 from ht import *
+import os
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
 
+@pytest.fixture(autouse=True)
+def solar_cache(tmpdir, monkeypatch):
+    # Keep the binary copy of the solar spectrum out of the user's real cache
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.join('cache')))
+    monkeypatch.setenv('LOCALAPPDATA', str(tmpdir.join('cache')))
+
+
 def test_radiation():
     assert_allclose(q_rad(1., 400), 1451.613952, rtol=1e-05)
     assert_allclose(q_rad(.85, 400, 305.), 816.7821722650002, rtol=1e-05)
@@ -37,6 +45,75 @@ def test_radiation():
     assert_allclose(blackbody_spectral_radiance(800., 4E-6), 1311692056.2430143, rtol=1e-05)
 
 
+
+def test_blackbody_fraction():
+    # Checked against numerical integration with mpmath
+    assert_allclose(blackbody_fraction(5778., 380E-9, 750E-9), 0.4380559161133125, rtol=1e-14)
+    assert_allclose(blackbody_fraction(300., 1E-6, 1E-5), 0.27322927122604046, rtol=1e-14)
+    assert_allclose(blackbody_fraction(300., 1E-7, 1.5E-6), 7.20380655831854e-11, rtol=1e-13)
+    assert_allclose(blackbody_fraction(300., 1E-3, 1E-2), 5.555390046265543e-06, rtol=1e-13)
+    assert_allclose(blackbody_fraction(1000., 1E-8, 2E-6), 0.06672994532826886, rtol=1e-14)
+
+    # Both series near where they meet, and complementary fractions
+    for T in (1000., 7194.01, 7195., 20000.):
+        below = blackbody_fraction(T, 0, 2E-6)
+        above = blackbody_fraction(T, 2E-6)
+        assert_allclose(below + above, 1.0, rtol=1e-15)
+    assert 1.0 == blackbody_fraction(300.)
+    assert 0.0 == blackbody_fraction(300., 1E-5, 1E-6)
+    assert 0.0 == blackbody_fraction(300., 0.0, 1E-8)
+    assert 0.0 == blackbody_fraction(0.0, 1E-6, 1E-5)
+
+    # Arrays broadcast against each other, matching the scalar calculation
+    Ts = np.array([[0.0], [300.], [1000.], [7195.], [20000.]])
+    lows = np.array([0.0, 1E-7, 1E-6, 2E-6, 1E-5, 1E-5])
+    highs = [1E-7, 1E-6, 2E-6, 1E-5, 1E-5, 1E-6]
+    ans = blackbody_fraction(Ts, lows, highs)
+    assert ans.shape == (5, 6)
+    expect = [[blackbody_fraction(T, low, high) for low, high in zip(lows, highs)]
+              for T in Ts[:, 0]]
+    assert_allclose(ans, expect, rtol=1e-14, atol=1e-300)
+    assert_allclose(blackbody_fraction(list(Ts[:, 0]), 2E-6),
+                    [blackbody_fraction(T, 2E-6) for T in Ts[:, 0]], rtol=1e-14)
+    assert not isinstance(blackbody_fraction(np.float64(300.), 1E-6), np.ndarray)
+
+
+def test_blackbody_weighted_property():
+    emissivities = [0.95, 0.1]
+    wavelengths = [1E-6, 3E-6]
+    eps = blackbody_weighted_property([400., 5778.], wavelengths, emissivities)
+    assert_allclose(eps, [0.95*blackbody_fraction(400., 0, 2E-6) + 0.1*blackbody_fraction(400., 2E-6),
+                          0.95*blackbody_fraction(5778., 0, 2E-6) + 0.1*blackbody_fraction(5778., 2E-6)], rtol=1e-14)
+    
+    # A grey surface, and broadcasting of temperatures against surfaces
+    Ts = np.array([[300.], [1500.]])
+    surfaces = np.array([[0.3, 0.3, 0.3], [0.95, 0.5, 0.1]])
+    ans = blackbody_weighted_property(Ts, [1E-6, 5E-6, 1E-5], surfaces)
+    assert ans.shape == (2, 2)
+    assert_allclose(ans[:, 0], 0.3, rtol=1e-14)
+    assert_allclose(ans[1, 1], blackbody_weighted_property(1500., [1E-6, 5E-6, 1E-5], surfaces[1]), rtol=1e-15)
+
+
+def test_spectrum_weighted_property():
+    wavelengths, SSI, _ = solar_spectrum()
+    alpha = spectrum_weighted_property([1E-6, 3E-6], [0.95, 0.1], wavelengths, SSI)
+    assert_allclose(alpha, 0.9147021422770992, rtol=1e-13)
+    
+    q = solar_absorbed_flux([1E-6, 3E-6], [0.95, 0.1])
+    assert_allclose(q, 1230.0941651349162, rtol=1e-13)
+    assert_allclose(solar_absorbed_flux([1E-6], [1.0]), np.trapz(SSI, wavelengths), rtol=1e-13)
+    assert_allclose(q/solar_absorbed_flux([1E-6], [1.0]), alpha, rtol=1e-13)
+
+    # Band edges on the spectrum's own points are integrated exactly
+    x = np.array([1.0, 2.0, 3.0, 4.0])
+    y = np.array([1.0, 3.0, 2.0, 2.0])
+    ans = spectrum_weighted_property([2.0, 3.0], [1.0, 0.0], x+0.5, y)
+    assert_allclose(ans, np.trapz(y[:2], x[:2])/np.trapz(y, x), rtol=1e-14)
+
+    qs = solar_absorbed_flux([1E-6, 3E-6], [[0.95, 0.1], [1.0, 1.0]])
+    assert_allclose(qs, [q, 1344.8029782379938], rtol=1e-13)
+
+
 @pytest.mark.slow
 def test_solar_spectrum():
     wavelengths, SSI, uncertainties = solar_spectrum()
@@ -49,4 +126,39 @@ def test_solar_spectrum():
     
 def test_grey_transmittance():
     tau =  grey_transmittance(3.8e-4, molar_density=55300, length=1e-2)
-    assert_allclose(tau, 0.8104707721191062)
\ No newline at end of file
+    assert_allclose(tau, 0.8104707721191062)
+
+def test_solar_spectrum_cached(tmpdir, monkeypatch):
+    import shutil
+    import ht.radiation
+    monkeypatch.setattr(ht.radiation, '_solar_spectrum_cache', {})
+    wavelengths, SSI, uncertainties = solar_spectrum()
+    assert solar_spectrum()[0] is wavelengths
+    for arr in (wavelengths, SSI, uncertainties):
+        assert not arr.flags.writeable
+        with pytest.raises(ValueError):
+            arr[0] = 1.0
+
+    # The binary copy is written to the user's cache on the first load and
+    # used afterwards, never to the installed package
+    src = os.path.join(ht.radiation.folder, 'solar_iss_2018_spectrum.dat')
+    shutil.copy(src, str(tmpdir))
+    # The first call above wrote it to the cache; start again without it
+    os.remove(str(tmpdir.join('cache', 'ht', 'solar_iss_2018_spectrum.npy')))
+    monkeypatch.setattr(ht.radiation, 'folder', str(tmpdir))
+    parsed = ht.radiation._load_solar_spectrum('SOLAR-ISS')
+    assert os.path.exists(str(tmpdir.join('cache', 'ht', 'solar_iss_2018_spectrum.npy')))
+    assert not os.path.exists(str(tmpdir.join('solar_iss_2018_spectrum.npy')))
+    loaded = ht.radiation._load_solar_spectrum('SOLAR-ISS')
+    assert not loaded.flags.writeable
+    assert_allclose(loaded, parsed, rtol=0, atol=0)
+    assert_allclose(loaded[1], SSI, rtol=0, atol=0)
+
+    # Without a writable cache, the text file is parsed every time
+    tmpdir.join('not_a_folder').write('')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.join('not_a_folder')))
+    monkeypatch.setenv('LOCALAPPDATA', str(tmpdir.join('not_a_folder')))
+    assert_allclose(ht.radiation._load_solar_spectrum('SOLAR-ISS'), parsed, rtol=0, atol=0)
+
+    with pytest.raises(Exception):
+        solar_spectrum('Unknown')
@@ -25,9 +25,352 @@ from numpy.testing import assert_allclose
 import ht
 import ht.vectorized
 import numpy as np
+import pytest
 
 
 def test_LMTD_vect():
     dTlms = [ht.LMTD(T, 60., 30., 40.2) for T in [100, 101]]
     dTlms_vect = ht.vectorized.LMTD([100, 101], 60., 30., 40.2)
     assert_allclose(dTlms, dTlms_vect)
+
+
+def check_kernel(name, args, kwargs={}, rtol=1e-12):
+    '''Checks an array kernel against the scalar function evaluated at each
+    point, with all numeric arguments broadcast together; options such as
+    flags, strings and integer counts are passed through unchanged.'''
+    scalar = getattr(ht, name)
+    kernel = getattr(ht.vectorized, name)
+    options = {k: v for k, v in kwargs.items() if isinstance(v, (bool, str, int))}
+    keys = [k for k in kwargs if k not in options]
+    arrays = np.broadcast_arrays(*([np.asarray(a, dtype=float) for a in args]
+                                   + [np.asarray(kwargs[k], dtype=float) for k in keys]))
+    expect = []
+    for point in zip(*[a.ravel() for a in arrays]):
+        point = [float(v) for v in point]
+        point_kwargs = dict(zip(keys, point[len(args):]))
+        point_kwargs.update(options)
+        expect.append(scalar(*point[:len(args)], **point_kwargs))
+    calc = kernel(*args, **kwargs)
+    assert not isinstance(kernel, np.vectorize)
+    assert_allclose(np.ravel(calc), expect, rtol=rtol)
+
+
+def test_LMTD_kernel():
+    assert_allclose(ht.vectorized.LMTD(100., 60., 30., 40.2), 43.200409294131525, rtol=1e-14)
+    check_kernel('LMTD', ([100., 100., 100., 100., 50.], [60., 60., 60., 60., 40.],
+                          [30., 20., 20., 59., 40.], [40.2, 60., 40., 60., 50.]))
+    dTs = ht.vectorized.LMTD([100., 100.], 60., 20., [60., 40.], counterflow=False)
+    assert_allclose(dTs, [ht.LMTD(100., 60., 20., 60., counterflow=False),
+                          ht.LMTD(100., 60., 20., 40., counterflow=False)])
+    # broadcasting
+    Thi = np.linspace(80, 120, 5)
+    Tci = np.linspace(10, 30, 3)
+    assert ht.vectorized.LMTD(Thi[:, None], 60., Tci[None, :], 40.).shape == (5, 3)
+
+
+def test_LMTD_and_F_LMTD_Fakheri_kernel():
+    Tcos = 35. + np.array([-5., -1e-3, -1e-9, 0., 1e-12, 1e-6, 10., 50.])
+    for shells in (1, 2, 3):
+        check_kernel('F_LMTD_Fakheri', (130., 110., 15., Tcos), {'shells': shells}, rtol=1e-13)
+    check_kernel('LMTD', (130., 110., 15., Tcos), rtol=1e-14)
+
+    dTlm, Ft = ht.vectorized.LMTD_and_F_LMTD_Fakheri(130., 110., 15., Tcos[:, None], shells=[1, 2])
+    assert dTlm.shape == (8, 1) and Ft.shape == (8, 2)
+    assert_allclose(Ft[:, 1], ht.vectorized.F_LMTD_Fakheri(130., 110., 15., Tcos, 2), rtol=0)
+    assert_allclose(dTlm[:, 0], ht.vectorized.LMTD(130., 110., 15., Tcos), rtol=0)
+    # Continuous through R = 1, where the scalar function switches formula
+    assert_allclose(np.diff(Ft[2:5, 0]), 0, atol=1e-12)
+
+    # Temperature crosses with no possible solution
+    assert np.isnan(ht.vectorized.F_LMTD_Fakheri(130., 110., 15., 125.))
+
+def test_effectiveness_from_NTU_kernel():
+    NTUs = np.array([1e-3, 0.1, 1.0, 5.0, 20.0])
+    Crs = np.array([0.0, 0.1, 0.5, 0.7, 1.0])
+    for subtype in ['counterflow', 'parallel', 'S&T', '2S&T', '5S&T',
+                    'crossflow, mixed Cmin', 'crossflow, mixed Cmax',
+                    'boiler', 'condenser']:
+        # The multi-shell scalar form is 0/0 at Cr = 1
+        Cr = Crs[1:-1] if subtype[0].isdigit() else Crs[1:] if 'mixed' in subtype else Crs
+        check_kernel('effectiveness_from_NTU', (NTUs[:, None], Cr[None, :]), {'subtype': subtype}, rtol=1e-11)
+    check_kernel('effectiveness_from_NTU', (NTUs, 0.7))
+    eff = ht.vectorized.effectiveness_from_NTU([5., 5.], .7, subtype='crossflow approximate')
+    assert_allclose(eff, ht.effectiveness_from_NTU(5., .7, subtype='crossflow approximate'))
+    eff = ht.vectorized.effectiveness_from_NTU([5., 5.], .7, subtype='crossflow')
+    assert_allclose(eff, 0.8444821799748551)
+    check_kernel('effectiveness_from_NTU', (NTUs[:, None], Crs[None, :]), {'subtype': 'crossflow'})
+
+    with pytest.raises(Exception):
+        ht.vectorized.effectiveness_from_NTU([1., 2.], [0.5, 1.5])
+    with pytest.raises(Exception):
+        ht.vectorized.effectiveness_from_NTU([1., 2.], 0.5, subtype='BADTYPE')
+
+
+def test_conv_internal_kernels():
+    Re = np.array([1E4, 5E4, 1E5, 1E6])
+    Pr = np.array([0.7, 1.2, 10., 100.])
+    fd = np.array([0.03, 0.025, 0.02, 0.012])
+    for name in ['turbulent_Colburn', 'turbulent_Drexel_McAdams',
+                 'turbulent_Gnielinski_smooth_1', 'turbulent_Gnielinski_smooth_2',
+                 'turbulent_ESDU', 'turbulent_Sieder_Tate', 'turbulent_Dittus_Boelter']:
+        check_kernel(name, (Re, Pr))
+    for name in ['turbulent_von_Karman', 'turbulent_Prandtl', 'turbulent_Friend_Metzner',
+                 'turbulent_Petukhov_Kirillov_Popov', 'turbulent_Webb',
+                 'turbulent_Sandall', 'turbulent_Gnielinski', 'turbulent_Churchill_Zajic',
+                 'turbulent_Martinelli', 'turbulent_Gowen_Smith',
+                 'turbulent_Kawase_Ulbrecht', 'turbulent_Kawase_De']:
+        check_kernel(name, (Re, Pr, fd))
+    check_kernel('turbulent_Dittus_Boelter', (Re, Pr), {'heating': False, 'revised': False})
+    check_kernel('turbulent_Sieder_Tate', (Re, Pr), {'mu': [1e-3, 2e-3, 0.0, 1e-3], 'mu_w': 1.2e-3})
+    check_kernel('turbulent_Nunner', (Re, Pr, fd, 0.01))
+    check_kernel('turbulent_Dipprey_Sabersky', (Re, Pr, fd, 1e-4))
+    check_kernel('turbulent_Bhatti_Shah', (Re, Pr, fd, 1e-4))
+    check_kernel('turbulent_entry_Hausen', (Re, Pr, 0.05, [0.1, 1., 2., 5.]))
+    check_kernel('laminar_entry_thermal_Hausen', ([100., 1000.], 1.1, 5., 0.5))
+    check_kernel('laminar_entry_Seider_Tate', ([100., 1000.], 1.1, 5., 0.5), {'mu': 1e-3, 'mu_w': 1.2e-3})
+    check_kernel('laminar_entry_Baehr_Stephan', ([100., 1000.], 1.1, 5., 0.5))
+    check_kernel('helical_turbulent_Nu_Mori_Nakayama', (Re, [0.5, 0.9, 1.0, 2.0], 0.01, 0.2))
+    check_kernel('helical_turbulent_Nu_Schmidt', ([2E4, 2.2E4, 2.3E4, 1E5], 0.7, 0.01, 0.2))
+    check_kernel('helical_turbulent_Nu_Xin_Ebadian', (Re, Pr, 0.01, 0.2))
+    check_kernel('Morimoto_Hotta', (Re, Pr, 0.01, 0.2))
+    check_kernel('Nu_laminar_rectangular_Shan_London', ([0.1, 0.5, 1.0],))
+
+
+def test_conv_external_kernels():
+    Re = np.array([10., 40., 41., 999., 1E3, 1E4, 2E5, 1E6])
+    for name in ['Nu_cylinder_Churchill_Bernstein', 'Nu_cylinder_Sanitjai_Goldstein',
+                 'Nu_cylinder_Fand', 'Nu_cylinder_McAdams', 'Nu_cylinder_Zukauskas',
+                 'Nu_cylinder_Whitaker', 'Nu_cylinder_Perkins_Leppert_1962',
+                 'Nu_cylinder_Perkins_Leppert_1964',
+                 'Nu_horizontal_plate_laminar_Churchill_Ozoe',
+                 'Nu_horizontal_plate_turbulent_Schlichting',
+                 'Nu_horizontal_plate_turbulent_Kreith']:
+        check_kernel(name, (Re, 0.7))
+    check_kernel('Nu_cylinder_Zukauskas', (Re, 20.), {'Prw': 15.})
+    check_kernel('Nu_cylinder_Whitaker', (Re, 0.7), {'mu': 1e-3, 'muw': 2e-3})
+    check_kernel('Nu_horizontal_plate_laminar_Baehr',
+                 (1E5, [0.001, 0.005, 0.01, 0.05, 1., 10., 100.]))
+
+
+def test_conv_free_immersed_kernels():
+    Gr = np.logspace(-4, 13, 30)
+    for name in ['Nu_vertical_plate_Churchill', 'Nu_sphere_Churchill',
+                 'Nu_vertical_cylinder_Griffiths_Davis_Morgan',
+                 'Nu_vertical_cylinder_Jakob_Linke_Morgan',
+                 'Nu_vertical_cylinder_Carne_Morgan',
+                 'Nu_vertical_cylinder_Eigenson_Morgan',
+                 'Nu_vertical_cylinder_Touloukian_Morgan',
+                 'Nu_vertical_cylinder_McAdams_Weiss_Saunders',
+                 'Nu_vertical_cylinder_Kreith_Eckert',
+                 'Nu_vertical_cylinder_Hanesian_Kalish_Morgan',
+                 'Nu_horizontal_cylinder_Churchill_Chu',
+                 'Nu_horizontal_cylinder_Kuehn_Goldstein',
+                 'Nu_horizontal_cylinder_Morgan', 'Nu_coil_Xin_Ebadian',
+                 'Nu_horizontal_plate_McAdams', 'Nu_horizontal_plate_VDI',
+                 'Nu_horizontal_plate_Rohsenow']:
+        check_kernel(name, (0.69, Gr[Gr > 1e-3]))
+    for turbulent in [True, False]:
+        check_kernel('Nu_vertical_cylinder_Eigenson_Morgan', (0.69, Gr[Gr > 1]), {'turbulent': turbulent})
+        check_kernel('Nu_vertical_cylinder_Al_Arabi_Khamis', (0.69, Gr[Gr > 1], 2.5, 1.), {'turbulent': turbulent})
+    for buoyancy in [True, False]:
+        for name in ['Nu_horizontal_plate_McAdams', 'Nu_horizontal_plate_VDI', 'Nu_horizontal_plate_Rohsenow']:
+            check_kernel(name, (0.69, Gr[Gr > 1]), {'buoyancy': buoyancy})
+    check_kernel('Nu_vertical_cylinder_Al_Arabi_Khamis', (0.69, Gr[Gr > 1], 2.5, 1.))
+    check_kernel('Nu_vertical_cylinder_Popiel_Churchill', (0.69, Gr[Gr > 1], 2.5, 1.))
+
+
+def test_conv_supercritical_kernels():
+    Re = np.array([1E4, 1E5, 2E5])
+    for name in ['Nu_McAdams', 'Nu_Bringer_Smith', 'Nu_Gorban', 'Nu_Griem',
+                 'Nu_Jackson', 'Nu_Gupta', 'Nu_Swenson', 'Nu_Xu', 'Nu_Mokry',
+                 'Nu_Zhu', 'Nu_Bishop', 'Nu_Yamagata', 'Nu_Kitoh',
+                 'Nu_Krasnoshchekov_Protopopov', 'Nu_Petukhov', 'Nu_Krasnoshchekov']:
+        check_kernel(name, (Re, 1.2))
+    check_kernel('Nu_Shitsman', (Re, 1.2, [1.0, 1.5, 2.0]))
+    check_kernel('Nu_Ornatsky', (Re, 1.2, [1.0, 1.5, 2.0]), {'rho_w': 330., 'rho_b': 290.})
+    check_kernel('Nu_Griem', (Re, 1.2), {'H': [1E6, 1.6E6, 2E6]})
+    check_kernel('Nu_Gupta', (Re, 1.2), {'rho_w': 330., 'rho_b': 290., 'mu_w': 0.0, 'mu_b': 1e-4})
+    check_kernel('Nu_Xu', (Re, 1.2), {'rho_w': 330., 'rho_b': 290., 'mu_w': 2e-4, 'mu_b': 1e-4})
+    check_kernel('Nu_Zhu', (Re, 1.2), {'rho_w': 330., 'rho_b': 290., 'k_w': 0.6, 'k_b': 0.4})
+    check_kernel('Nu_Bishop', (Re, 1.2), {'rho_w': 330., 'rho_b': 290., 'D': 0.01, 'x': [0.1, 0.0, 1.]})
+    check_kernel('Nu_Kitoh', (Re, 1.2), {'H': [1E6, 2E6, 4E6], 'G': 1500., 'q': 5E5})
+    check_kernel('Nu_Krasnoshchekov_Protopopov', (Re, 1.2), {'Cp_avg': 2080., 'Cp_b': 2040.,
+                 'k_w': 0.6, 'k_b': 0.4, 'mu_w': 2e-4, 'mu_b': 1e-4})
+    check_kernel('Nu_Petukhov', (Re, 1.2), {'rho_w': 330., 'rho_b': 290., 'mu_w': 2e-4, 'mu_b': 1e-4})
+    T_ws = [600., 640., 700., 1000., 700., 600.]
+    T_bs = [580., 590., 600., 620., 800., 650.]
+    for name in ['Nu_Jackson', 'Nu_Krasnoshchekov']:
+        check_kernel(name, (1E5, 1.2), {'rho_w': 330., 'rho_b': 290., 'Cp_avg': 2080.,
+                     'Cp_b': 2040., 'T_b': T_bs, 'T_w': T_ws, 'T_pc': 647.})
+    check_kernel('Nu_Yamagata', (1E5, 1.2), {'Pr_pc': 1.5, 'Cp_avg': 2080.,
+                 'Cp_b': 2040., 'T_b': T_bs, 'T_w': T_ws, 'T_pc': 647.})
+
+
+def test_temperature_effectiveness_basic_kernel():
+    R1s = np.array([0.1, 0.5, 0.9, 1.5, 4.0])
+    NTU1s = np.array([1e-2, 0.5, 1.0, 5.0, 12.0])
+    for subtype in ['counterflow', 'parallel', 'crossflow', 'crossflow approximate',
+                    'crossflow, mixed 1', 'crossflow, mixed 2',
+                    'crossflow, mixed 1&2']:
+        check_kernel('temperature_effectiveness_basic', (R1s[:, None], NTU1s[None, :]),
+                     {'subtype': subtype}, rtol=1e-11)
+        P1s = ht.vectorized.temperature_effectiveness_basic(R1s[:, None], NTU1s[None, :], subtype)
+        if subtype != 'crossflow approximate':
+            # P1 hardly changes at the highest NTU1, so it is not inverted
+            check_kernel('NTU_from_P_basic', (P1s[:, :-1], R1s[:, None]),
+                         {'subtype': subtype}, rtol=1e-6)
+    # Limit of R1 = 1, where the scalar form is 0/0
+    P1 = ht.vectorized.temperature_effectiveness_basic(1., 2., 'counterflow')
+    assert_allclose(P1, 2/3.)
+    assert_allclose(ht.vectorized.NTU_from_P_basic(P1, 1., 'counterflow'), 2.)
+
+
+def test_temperature_effectiveness_TEMA_kernels():
+    # Includes every value of R1 with a separate branch in the scalar functions
+    R1s = np.array([1e-3, 0.25, 0.5, 0.7, 1.0, 1.5, 2.0, 2.5, 4.0, 4.2, 7.0])
+    NTU1s = np.array([1e-3, 0.1, 1.0, 5.0, 30.0])
+    cases = ([('J', {'Ntp': Ntp}) for Ntp in (1, 2, 4)]
+             + [(shell, {'Ntp': Ntp, 'optimal': optimal}) for shell in 'GH'
+                for Ntp in (1, 2) for optimal in (True, False)]
+             + [('E', {'Ntp': Ntp, 'optimal': optimal}) for Ntp in (1, 2, 3, 4, 6)
+                for optimal in (True, False)])
+    for shell, kwargs in cases:
+        # The scalar three pass, unoptimal E shell is 0/0 at R1 = 1
+        R1 = R1s[R1s != 1.0] if kwargs == {'Ntp': 3, 'optimal': False} else R1s
+        check_kernel('temperature_effectiveness_TEMA_' + shell,
+                     (R1[:, None], NTU1s[None, :]), kwargs, rtol=1e-10)
+    assert_allclose(ht.vectorized.temperature_effectiveness_TEMA_H([5.1, 5.1], 8., Ntp=2),
+                    0.19607660396043908, rtol=1e-12)
+    for shell in 'EGHJ':
+        with pytest.raises(Exception):
+            getattr(ht.vectorized, 'temperature_effectiveness_TEMA_' + shell)([1., 2.], 1., Ntp=5)
+
+
+def test_temperature_effectiveness_plate_kernel():
+    R1s = np.array([1e-3, 0.25, 0.5, 1.0, 2.0, 7.0])
+    NTU1s = np.array([1e-3, 0.1, 1.0, 5.0, 30.0])
+    for Np1 in range(1, 5):
+        for Np2 in range(1, 5):
+            if Np1 > 2 and Np2 > 2:
+                continue
+            for counterflow in (True, False):
+                for passes_counterflow in (True, False):
+                    kwargs = {'Np1': Np1, 'Np2': Np2, 'counterflow': counterflow,
+                              'passes_counterflow': passes_counterflow}
+                    # The scalar 1/1 counterflow form is 0/0 at R1 = 1
+                    limit = ((Np1, Np2, counterflow) == (1, 1, True)
+                             or (Np1, Np2, counterflow, passes_counterflow) == (2, 2, True, True))
+                    R1 = R1s[R1s != 1.0] if limit else R1s
+                    # The 2/3 counterflow formula cancels badly at small NTU1
+                    rtol = 1e-6 if {Np1, Np2} == {2, 3} and counterflow else 1e-10
+                    check_kernel('temperature_effectiveness_plate',
+                                 (R1[:, None], NTU1s[None, :]), kwargs, rtol=rtol)
+                    kernel = ht.vectorized.plate_effectiveness_kernel(Np1, Np2, counterflow, passes_counterflow)
+                    assert_allclose(kernel(R1[:, None], NTU1s[None, :]),
+                                    ht.vectorized.temperature_effectiveness_plate(R1[:, None], NTU1s[None, :], **kwargs))
+    assert_allclose(ht.vectorized.temperature_effectiveness_plate(1., [2., 2.], 1, 1), 2/3.)
+    with pytest.raises(Exception):
+        ht.vectorized.temperature_effectiveness_plate([1., 2.], 1., Np1=3, Np2=3)
+
+    P1 = ht.vectorized.temperature_effectiveness_plate(0.5, NTU1s, Np1=3, Np2=2, counterflow=False)
+    NTU1 = ht.vectorized.NTU_from_P_plate(P1, 0.5, Np1=3, Np2=2, counterflow=False)
+    assert_allclose(NTU1, [ht.NTU_from_P_plate(float(P), 0.5, Np1=3, Np2=2, counterflow=False) for P in P1],
+                    rtol=1e-9, atol=1e-10)
+
+
+def test_temperature_effectiveness_air_cooler_kernel():
+    R1s = np.array([1e-3, 0.25, 0.5, 1.0, 2.0, 7.0])
+    NTU1s = np.array([1e-3, 0.1, 1.0, 5.0, 30.0])
+    for rows in (1, 2, 5, 30):
+        check_kernel('temperature_effectiveness_air_cooler',
+                     (R1s[:, None], NTU1s[None, :]), {'rows': rows, 'passes': 1})
+    # The closed forms for several passes cancel at small NTU1
+    for rows in range(1, 8):
+        for passes in range(2, 8):
+            check_kernel('temperature_effectiveness_air_cooler',
+                         (R1s[:, None], NTU1s[None, 1:]),
+                         {'rows': rows, 'passes': passes}, rtol=1e-10)
+    assert_allclose(ht.vectorized.temperature_effectiveness_air_cooler([0., 0.5], 1.1, rows=200, passes=1),
+                    [1. - np.exp(-1.1), 0.5744610145657628], rtol=1e-12)
+
+
+def test_Ntubes_Phadkeb_kernel():
+    DBundles = np.linspace(0.05, 2.0, 1001)
+    for Ntp in (1, 2, 4, 6, 8):
+        for angle in (30, 45, 60, 90):
+            Nts = ht.vectorized.Ntubes_Phadkeb(DBundles, .028, .036, Ntp, angle)
+            assert Nts.dtype.kind == 'i'
+            assert_allclose(Nts, [ht.Ntubes_Phadkeb(D, .028, .036, Ntp, angle) for D in DBundles],
+                            rtol=0, atol=0)
+    # Do and pitch broadcast too
+    Nts = ht.vectorized.Ntubes_Phadkeb(1.2, [.019, .025], [.025, .03125], Ntp=4)
+    assert list(Nts) == [ht.Ntubes_Phadkeb(1.2, .019, .025, 4), ht.Ntubes_Phadkeb(1.2, .025, .03125, 4)]
+    with pytest.raises(Exception):
+        ht.vectorized.Ntubes_Phadkeb([1., 2.], .028, .036, Ntp=3)
+
+
+def test_DBundle_for_Ntubes_Phadkeb_kernel():
+    Ns = np.arange(1, 3000, 7)
+    for Ntp in (1, 2, 4, 6, 8):
+        for angle in (30, 45, 60, 90):
+            Ds = ht.vectorized.DBundle_for_Ntubes_Phadkeb(Ns, .028, .036, Ntp, angle)
+            assert_allclose(Ds, [ht.DBundle_for_Ntubes_Phadkeb(N, .028, .036, Ntp, angle) for N in Ns],
+                            rtol=0, atol=0)
+    Ds = ht.vectorized.DBundle_for_Ntubes_Phadkeb([100, 10**7], .028, .036, 2)
+    assert np.isnan(Ds[1]) and not np.isnan(Ds[0])
+
+    Ns = [300, 500, 1285, 4000]
+    for Method in ('Phadkeb', 'Perry', 'VDI'):
+        Ds = ht.vectorized.size_bundle_from_tubecount(Ns, .025, .03125, Ntp=2, Method=Method)
+        assert_allclose(Ds, [ht.size_bundle_from_tubecount(N, .025, .03125, Ntp=2, Method=Method) for N in Ns],
+                        rtol=0, atol=0)
+    assert np.isnan(ht.vectorized.size_bundle_from_tubecount([10**4], .025, .03125, Method='Perry')[0])
+
+def test_P_NTU_method_kernel():
+    m1s = np.linspace(3., 8., 6)
+    for subtype, Ntp, optimal in [('crossflow, mixed 1&2', 1, True), ('E', 3, True),
+                                  ('E', 4, True), ('G', 2, False), ('H', 2, False),
+                                  ('J', 2, True), ('2/3', 1, False), ('3/1', 1, True)]:
+        kwargs = {'m2': 1.45, 'Cp1': 1860., 'Cp2': 1900, 'subtype': subtype,
+                  'Ntp': Ntp, 'optimal': optimal}
+        rating = ht.vectorized.P_NTU_method(m1s, T2i=15, T1i=130, UA=3041.75, **kwargs)
+        sizing = ht.vectorized.P_NTU_method(m1s, T2i=15, T1i=130, T1o=rating['T1o'], **kwargs)
+        for i, m1 in enumerate(m1s):
+            rated = ht.P_NTU_method(m1, T2i=15, T1i=130, UA=3041.75, **kwargs)
+            sized = ht.P_NTU_method(m1, T2i=15, T1i=130, T1o=rated['T1o'], **kwargs)
+            for k in rated:
+                assert_allclose(rating[k][i], rated[k], rtol=1e-11)
+                assert_allclose(sizing[k][i], sized[k], rtol=1e-9)
+        assert_allclose(sizing['UA'], 3041.75, rtol=1e-9)
+
+    # Results are broadcast to a common shape
+    ans = ht.vectorized.P_NTU_method(m1=[[5.2], [6.]], m2=[1.45, 1.5, 1.55], Cp1=1860.,
+                                     Cp2=1900, subtype='E', Ntp=4, T2i=15, T1i=130, UA=3041.75)
+    for v in ans.values():
+        assert v.shape == (2, 3)
+
+    # Points with no solution are NaN rather than an exception
+    ans = ht.vectorized.P_NTU_method(m1=1., m2=1., Cp1=1., Cp2=1., T1i=[100., 100.],
+                                     T1o=[60., 0.1], T2i=0., subtype='parallel')
+    assert_allclose(ans['UA'][0], ht.P_NTU_method(m1=1., m2=1., Cp1=1., Cp2=1., T1i=100.,
+                    T1o=60., T2i=0., subtype='parallel')['UA'])
+    assert np.isnan(ans['UA'][1])
+    ans = ht.vectorized.NTU_from_P_J([0.3, 0.6], 2.1, Ntp=2)
+    assert_allclose(ans[0], ht.NTU_from_P_J(0.3, 2.1, Ntp=2))
+    assert np.isnan(ans[1])
+
+    with pytest.raises(Exception):
+        ht.vectorized.P_NTU_method(m1s, 1.45, 1860., 1900, UA=3041.75, T1i=130, subtype='K')
+
+
+def test_blackbody_fraction_kernel():
+    Ts = np.array([[0.0], [300.], [1000.], [5778.], [20000.]])
+    lows = np.array([0.0, 1E-7, 1E-6, 2E-6, 1E-5])
+    highs = np.array([1E-7, 1E-6, 2E-6, 1E-5, 1E-5])
+    ans = ht.vectorized.blackbody_fraction(Ts, lows, highs)
+    expect = [[ht.blackbody_fraction(T, low, high) for low, high in zip(lows, highs)]
+              for T in Ts[:, 0]]
+    assert_allclose(ans, expect, rtol=1e-14, atol=1e-300)
+    
+    ans = ht.vectorized.blackbody_fraction(Ts[:, 0], 2E-6)
+    assert_allclose(ans, [ht.blackbody_fraction(T, 2E-6) for T in Ts[:, 0]], rtol=1e-14)